@@ -0,0 +1,54 @@
+"""Add task_events table for replayable task streams.
+
+Revision ID: 20261018_0001
+Revises: 20260119_0001
+Create Date: 2026-10-18 09:00:00.000000
+
+This migration adds the task_events table, an append-only log of the
+status-update and artifact-update events of each task numbered per task.
+Streams use the sequence number as SSE event id, and tasks/resubscribe
+replays the events after a client's Last-Event-ID from this table.
+
+DID schemas created at runtime get the table from the SQLAlchemy metadata
+(schema_manager.initialize_did_schema).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0001"
+down_revision: Union[str, None] = "20260119_0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add task_events table."""
+    op.create_table(
+        "task_events",
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column(
+            "event",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("task_id", "seq", name="pk_task_events"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        comment="Append-only log of task stream events for tasks/resubscribe",
+    )
+
+
+def downgrade() -> None:
+    """Remove task_events table."""
+    op.drop_table("task_events")
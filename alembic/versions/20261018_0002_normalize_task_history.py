@@ -0,0 +1,136 @@
+"""Move task history and artifacts into append-only row tables.
+
+Revision ID: 20261018_0002
+Revises: 20261018_0001
+Create Date: 2026-10-18 12:00:00.000000
+
+tasks.history and tasks.artifacts were JSONB arrays with GIN indexes; every
+appended message rewrote the whole (TOASTed) array and its index entries.
+This migration stores each message in task_messages and each artifact in
+task_artifacts, keyed by (task_id, seq), so appends are single-row inserts
+and the last N messages of a task are an index range scan.
+
+tasks.message_count / tasks.artifact_count hold the number of rows; updating
+them under the task's row lock allocates the sequence numbers of new rows.
+
+The data is moved in every schema that has a tasks table with a history
+column, i.e. ``public`` and the DID schemas created at runtime
+(schema_manager.initialize_did_schema). New DID schemas get the new layout
+from the SQLAlchemy metadata.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0002"
+down_revision: Union[str, None] = "20261018_0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create task_messages/task_artifacts and move the JSONB arrays into them."""
+    op.execute("""
+        DO $$
+        DECLARE
+            s TEXT;
+        BEGIN
+            FOR s IN
+                SELECT table_schema FROM information_schema.columns
+                WHERE table_name = 'tasks' AND column_name = 'history'
+            LOOP
+                EXECUTE format('
+                    CREATE TABLE IF NOT EXISTS %I.task_messages (
+                        task_id UUID NOT NULL REFERENCES %I.tasks(id) ON DELETE CASCADE,
+                        seq INTEGER NOT NULL,
+                        message JSONB NOT NULL,
+                        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                        CONSTRAINT pk_task_messages PRIMARY KEY (task_id, seq)
+                    )', s, s);
+                EXECUTE format('
+                    CREATE TABLE IF NOT EXISTS %I.task_artifacts (
+                        task_id UUID NOT NULL REFERENCES %I.tasks(id) ON DELETE CASCADE,
+                        seq INTEGER NOT NULL,
+                        artifact JSONB NOT NULL,
+                        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                        CONSTRAINT pk_task_artifacts PRIMARY KEY (task_id, seq)
+                    )', s, s);
+
+                EXECUTE format('
+                    INSERT INTO %I.task_messages (task_id, seq, message, created_at)
+                    SELECT t.id, m.seq, m.message, t.created_at
+                    FROM %I.tasks t,
+                         jsonb_array_elements(t.history)
+                             WITH ORDINALITY AS m(message, seq)', s, s);
+                EXECUTE format('
+                    INSERT INTO %I.task_artifacts (task_id, seq, artifact, created_at)
+                    SELECT t.id, a.seq, a.artifact, t.created_at
+                    FROM %I.tasks t,
+                         jsonb_array_elements(COALESCE(t.artifacts, ''[]''::jsonb))
+                             WITH ORDINALITY AS a(artifact, seq)', s, s);
+
+                EXECUTE format('
+                    ALTER TABLE %I.tasks
+                        ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0,
+                        ADD COLUMN IF NOT EXISTS artifact_count INTEGER NOT NULL DEFAULT 0',
+                    s);
+                -- Keep updated_at: the counters are not a task update
+                EXECUTE format('ALTER TABLE %I.tasks DISABLE TRIGGER USER', s);
+                EXECUTE format('
+                    UPDATE %I.tasks SET
+                        message_count = jsonb_array_length(history),
+                        artifact_count = jsonb_array_length(COALESCE(artifacts, ''[]''::jsonb))',
+                    s);
+                EXECUTE format('ALTER TABLE %I.tasks ENABLE TRIGGER USER', s);
+
+                EXECUTE format('DROP INDEX IF EXISTS %I.idx_tasks_history_gin', s);
+                EXECUTE format('DROP INDEX IF EXISTS %I.idx_tasks_artifacts_gin', s);
+                EXECUTE format(
+                    'ALTER TABLE %I.tasks DROP COLUMN history, DROP COLUMN artifacts', s);
+            END LOOP;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    """Fold task_messages/task_artifacts back into JSONB arrays on tasks."""
+    op.execute("""
+        DO $$
+        DECLARE
+            s TEXT;
+        BEGIN
+            FOR s IN
+                SELECT table_schema FROM information_schema.tables
+                WHERE table_name = 'task_messages'
+            LOOP
+                EXECUTE format('
+                    ALTER TABLE %I.tasks
+                        ADD COLUMN history JSONB NOT NULL DEFAULT ''[]''::jsonb,
+                        ADD COLUMN artifacts JSONB DEFAULT ''[]''::jsonb', s);
+                EXECUTE format('ALTER TABLE %I.tasks DISABLE TRIGGER USER', s);
+                EXECUTE format('
+                    UPDATE %I.tasks t SET
+                        history = COALESCE((
+                            SELECT jsonb_agg(m.message ORDER BY m.seq)
+                            FROM %I.task_messages m WHERE m.task_id = t.id
+                        ), ''[]''::jsonb),
+                        artifacts = COALESCE((
+                            SELECT jsonb_agg(a.artifact ORDER BY a.seq)
+                            FROM %I.task_artifacts a WHERE a.task_id = t.id
+                        ), ''[]''::jsonb)', s, s, s);
+                EXECUTE format('ALTER TABLE %I.tasks ENABLE TRIGGER USER', s);
+                EXECUTE format(
+                    'CREATE INDEX idx_tasks_history_gin ON %I.tasks USING gin(history)', s);
+                EXECUTE format(
+                    'CREATE INDEX idx_tasks_artifacts_gin ON %I.tasks USING gin(artifacts)', s);
+                EXECUTE format('
+                    ALTER TABLE %I.tasks
+                        DROP COLUMN message_count,
+                        DROP COLUMN artifact_count', s);
+                EXECUTE format('DROP TABLE %I.task_artifacts', s);
+                EXECUTE format('DROP TABLE %I.task_messages', s);
+            END LOOP;
+        END $$;
+    """)
@@ -0,0 +1,73 @@
+"""Optionally range-partition the tasks table by created_at.
+
+Revision ID: 20261018_0003
+Revises: 20261018_0002
+Create Date: 2026-10-18 15:00:00.000000
+
+Only acts when POSTGRES_PARTITION_TASKS is enabled. Each schema with a tasks
+table (``public`` and the DID schemas) is converted in place: the existing
+heap becomes the partition of all rows before the current period, the new
+parent gets partitions for the upcoming periods and a DEFAULT partition.
+See bindu/server/storage/partitioning.py for the layout, including the
+foreign keys to tasks(id) that have to be dropped.
+
+Running it with partitioning disabled is a no-op, and the storage converts
+the table itself on connect once partitioning is enabled later.
+"""
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from bindu.server.storage.partitioning import (
+    convert_tasks_statement,
+    create_partition_statements,
+)
+from bindu.settings import app_settings
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0003"
+down_revision: Union[str, None] = "20261018_0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Partition the tasks tables if enabled in settings."""
+    settings = app_settings.storage
+    if not settings.postgres_partition_tasks:
+        return
+
+    schemas = [
+        row[0]
+        for row in op.get_bind().execute(
+            sa.text(
+                "SELECT table_schema FROM information_schema.tables "
+                "WHERE table_name = 'tasks'"
+            )
+        )
+    ]
+    now = datetime.now(timezone.utc)
+    for schema in schemas:
+        # Unqualified names in the statements resolve to this schema;
+        # public stays on the path for the updated_at trigger function
+        op.execute(f'SET search_path TO "{schema}", public')
+        op.execute(convert_tasks_statement(settings.postgres_partition_interval))
+        for statement in create_partition_statements(
+            now,
+            settings.postgres_partition_interval,
+            settings.postgres_partition_premake,
+        ):
+            op.execute(statement)
+    op.execute("RESET search_path")
+
+
+def downgrade() -> None:
+    """Leave partitioned tasks tables as they are.
+
+    A partitioned tasks table works with the previous revision's queries;
+    only the foreign keys to tasks(id) are missing. Turning it back into a
+    single heap means copying all rows and is left to the operator.
+    """
@@ -0,0 +1,69 @@
+"""Add indexes for keyset pagination of tasks and contexts.
+
+Revision ID: 20261018_0004
+Revises: 20261018_0003
+Create Date: 2026-10-18 18:00:00.000000
+
+tasks/list and contexts/list page through rows ordered by (created_at, id)
+newest first. These indexes let each page start at the cursor instead of
+scanning and sorting all earlier rows; the context index serves listings
+filtered by context_id.
+
+Created in every schema with a tasks table (``public`` and the DID schemas).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261018_0004"
+down_revision: Union[str, None] = "20261018_0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the keyset pagination indexes."""
+    op.execute("""
+        DO $$
+        DECLARE
+            s TEXT;
+        BEGIN
+            FOR s IN
+                SELECT table_schema FROM information_schema.tables
+                WHERE table_name = 'tasks'
+            LOOP
+                EXECUTE format('
+                    CREATE INDEX IF NOT EXISTS idx_tasks_created_at_id
+                    ON %I.tasks (created_at, id)', s);
+                EXECUTE format('
+                    CREATE INDEX IF NOT EXISTS idx_tasks_context_created_at
+                    ON %I.tasks (context_id, created_at, id)', s);
+                EXECUTE format('
+                    CREATE INDEX IF NOT EXISTS idx_contexts_created_at_id
+                    ON %I.contexts (created_at, id)', s);
+            END LOOP;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    op.execute("""
+        DO $$
+        DECLARE
+            s TEXT;
+        BEGIN
+            FOR s IN
+                SELECT table_schema FROM information_schema.tables
+                WHERE table_name = 'tasks'
+            LOOP
+                EXECUTE format('DROP INDEX IF EXISTS %I.idx_tasks_created_at_id', s);
+                EXECUTE format(
+                    'DROP INDEX IF EXISTS %I.idx_tasks_context_created_at', s);
+                EXECUTE format(
+                    'DROP INDEX IF EXISTS %I.idx_contexts_created_at_id', s);
+            END LOOP;
+        END $$;
+    """)
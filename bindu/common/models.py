@@ -65,7 +65,7 @@ class SchedulerConfig:
     managing asynchronous tasks and workflows.
     """
 
-    type: Literal["redis", "memory"]
+    type: Literal["redis", "redis-streams", "memory"]
     redis_url: str | None = None
     redis_host: str = "localhost"
     redis_port: int = 6379
@@ -75,6 +75,18 @@ class SchedulerConfig:
     max_connections: int = 10
     retry_on_timeout: bool = True
     poll_timeout: int = 1
+    wire_format: Literal["json", "msgpack"] = "json"
+    consumer_group: str = "bindu:workers"
+    read_count: int = 10
+    claim_min_idle_ms: int = 60000
+    stream_maxlen: int | None = None
+    # Memory backend queue bound and fair-share queuing;
+    # None falls back to app_settings.scheduler
+    max_queue_size: int | None = None
+    queue_policy: Literal["fifo", "fair"] | None = None
+    priority_weights: dict[str, int] | None = None
+    max_in_flight_per_key: int | None = None
+    in_flight_lease_seconds: int | None = None
 
 
 @dataclass(frozen=True)
@@ -183,6 +195,7 @@ class AgentManifest:
     num_history_sessions: int
     enable_system_message: bool = True
     enable_context_based_history: bool = False
+    execution_strategy: Literal["inline", "thread", "process"] = "inline"
     extra_data: dict[str, Any] = field(default_factory=dict)
 
     # Global Webhook Configuration (for long-running tasks)
@@ -214,6 +227,10 @@ class AgentManifest:
 
     # Runtime Execution (injected by framework)
     run: Callable[..., Any] | None = field(default=None, init=False)
+    history_summarizer: Callable[..., Any] | None = field(default=None, init=False)
+    """Optional ``(previous_summary, messages) -> str`` summarizing old history."""
+    history_window_turns: int | None = field(default=None, init=False)
+    """Turns of history passed to the handler (None = all)."""
 
     def to_agent_card(self) -> AgentCard:
         """Transform the manifest into a protocol-compliant agent card.
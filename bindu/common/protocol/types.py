@@ -32,6 +32,7 @@ This module contains the complete type system that enables agents to communicate
 
 from __future__ import annotations as _annotations
 
+from datetime import datetime
 from typing import Annotated, Any, Dict, Generic, List, Literal, TypeVar, Union
 from uuid import UUID
 
@@ -101,6 +102,12 @@ IdentityProvider: TypeAlias = Literal[
     "hydra",  # Ory Hydra OAuth2 provider <NotPartOfA2A>
 ]
 
+TaskPriority: TypeAlias = Literal[
+    "high",  # Interactive traffic, dequeued first by weight <NotPartOfA2A>
+    "normal",  # Default priority <NotPartOfA2A>
+    "low",  # Batch traffic, drained in the background <NotPartOfA2A>
+]
+
 CONTACT_ADDRESS_DATA_KEY = "contact_picker.ContactAddress"
 PAYMENT_METHOD_DATA_DATA_KEY = "payment_request.PaymentMethodData"
 CART_MANDATE_DATA_KEY = "ap2.mandates.CartMandate"
@@ -571,6 +578,15 @@ class TaskSendParams(TypedDict):
     metadata: NotRequired[dict[str, Any]]
     """Additional metadata."""
 
+    priority: NotRequired[TaskPriority]
+    """Scheduling priority (fair-share queue policy)."""
+
+    fairness_key: NotRequired[str]
+    """Key the task is fair-queued under, e.g. context ID or client DID."""
+
+    stream: NotRequired[bool]
+    """Publish output chunks to the task event bus (message/stream)."""
+
 
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class TaskIdParams(TypedDict):
@@ -591,17 +607,84 @@ class TaskQueryParams(TaskIdParams):
     """The length of the history."""
 
 
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class TaskQueryManyParams(TypedDict):
+    """Defines parameters for getting several tasks at once. <NotPartOfA2A>."""
+
+    task_ids: Required[list[UUID]]
+    """The IDs of the tasks; unknown IDs are left out of the result."""
+
+    history_length: NotRequired[int]
+    """The length of each task's history (tasks without their own limit)."""
+
+    history_lengths: NotRequired[dict[UUID, int]]
+    """The length of the history per task ID, overriding ``history_length``."""
+
+    metadata: NotRequired[dict[str, Any]]
+    """Additional metadata."""
+
+
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class TaskResubscribeParams(TaskIdParams):
+    """Defines parameters for resubscribing to the event stream of a task."""
+
+    last_event_id: NotRequired[int]
+    """Sequence number of the last event received; later events are replayed. <NotPartOfA2A>."""
+
+
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class ListTasksParams(TypedDict):
-    """Defines parameters for listing tasks. <NotPartOfA2A>."""
+    """Defines parameters for listing tasks. <NotPartOfA2A>.
+
+    Tasks are listed newest first. Passing ``page_size`` or ``cursor``
+    returns a TaskListPage; otherwise the result is a plain list.
+    """
 
     history_length: NotRequired[int]
     """The length of the history."""
 
+    length: NotRequired[int]
+    """Maximum number of tasks in a plain (unpaged) list."""
+
+    page_size: NotRequired[int]
+    """Maximum number of tasks per page."""
+
+    cursor: NotRequired[str]
+    """Cursor returned as ``next_cursor`` by the previous page."""
+
+    state: NotRequired[TaskState]
+    """Only list tasks in this state."""
+
+    context_id: NotRequired[UUID]
+    """Only list tasks of this context."""
+
+    created_after: NotRequired[datetime]
+    """Only list tasks created at or after this time."""
+
+    created_before: NotRequired[datetime]
+    """Only list tasks created before this time."""
+
+    include_history: NotRequired[bool]
+    """Include the message history of each task (default: false)."""
+
+    include_artifacts: NotRequired[bool]
+    """Include the artifacts of each task (default: false)."""
+
     metadata: NotRequired[dict[str, Any]]
     """Additional metadata."""
 
 
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class TaskListPage(TypedDict):
+    """A page of tasks from ``tasks/list``. <NotPartOfA2A>."""
+
+    tasks: Required[list[Task]]
+    """The tasks of the page, newest first."""
+
+    next_cursor: NotRequired[str | None]
+    """Cursor of the next page (None on the last page)."""
+
+
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class TaskFeedbackParams(TypedDict):
     """Defines parameters for providing feedback on a task. <NotPartOfA2A>."""
@@ -642,6 +725,9 @@ class MessageSendConfiguration(TypedDict):
     across server restarts. Defaults to False if not specified.
     """
 
+    priority: NotRequired[TaskPriority]
+    """Scheduling priority of the task. Defaults to "normal". <NotPartOfA2A>"""
+
 
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class MessageSendParams(TypedDict):
@@ -794,15 +880,45 @@ class ContextQueryParams(ContextIdParams):
 
 @pydantic.with_config(ConfigDict(alias_generator=to_camel))
 class ListContextsParams(TypedDict):
-    """Parameters for listing contexts."""
+    """Parameters for listing contexts.
+
+    Contexts are listed newest first. Passing ``page_size`` or ``cursor``
+    returns a ContextListPage; otherwise the result is a plain list.
+    """
 
     history_length: NotRequired[int]
     """The length of the list."""
 
+    length: NotRequired[int]
+    """Maximum number of contexts in a plain (unpaged) list."""
+
+    page_size: NotRequired[int]
+    """Maximum number of contexts per page."""
+
+    cursor: NotRequired[str]
+    """Cursor returned as ``next_cursor`` by the previous page."""
+
+    created_after: NotRequired[datetime]
+    """Only list contexts created at or after this time."""
+
+    created_before: NotRequired[datetime]
+    """Only list contexts created before this time."""
+
     metadata: NotRequired[dict[str, Any]]
     """Additional metadata."""
 
 
+@pydantic.with_config(ConfigDict(alias_generator=to_camel))
+class ContextListPage(TypedDict):
+    """A page of contexts from ``contexts/list``. <NotPartOfA2A>."""
+
+    contexts: Required[list[Context]]
+    """The contexts of the page, newest first."""
+
+    next_cursor: NotRequired[str | None]
+    """Cursor of the next page (None on the last page)."""
+
+
 # -----------------------------------------------------------------------------
 # Agent-to-Agent Negotiation Models <NotPartOfA2A>
 # -----------------------------------------------------------------------------
@@ -1479,6 +1595,16 @@ SkillNotFoundError = JSONRPCError[
     ],
 ]
 
+# Scheduler errors (-32040 to -32049)
+# Bindu-specific load-shedding extensions
+QueueFullError = JSONRPCError[
+    Literal[-32040],
+    Literal[
+        "The agent's task queue is full and the request was not accepted. "
+        "Retry after the interval given in the Retry-After header."
+    ],
+]
+
 # -----------------------------------------------------------------------------
 # JSON-RPC Request & Response Types
 # -----------------------------------------------------------------------------
@@ -1494,6 +1620,9 @@ StreamMessageResponse = JSONRPCResponse[Union[Task, Message], JSONRPCError[Any,
 GetTaskRequest = JSONRPCRequest[Literal["tasks/get"], TaskQueryParams]
 GetTaskResponse = JSONRPCResponse[Task, TaskNotFoundError]
 
+GetTasksRequest = JSONRPCRequest[Literal["tasks/getMany"], TaskQueryManyParams]
+GetTasksResponse = JSONRPCResponse[List[Task], InvalidParamsError]
+
 CancelTaskRequest = JSONRPCRequest[Literal["tasks/cancel"], TaskIdParams]
 CancelTaskResponse = JSONRPCResponse[
     Task, Union[TaskNotCancelableError, TaskNotFoundError]
@@ -1501,7 +1630,8 @@ CancelTaskResponse = JSONRPCResponse[
 
 ListTasksRequest = JSONRPCRequest[Literal["tasks/list"], ListTasksParams]
 ListTasksResponse = JSONRPCResponse[
-    List[Task], Union[TaskNotFoundError, TaskNotCancelableError]
+    Union[List[Task], TaskListPage],
+    Union[TaskNotFoundError, TaskNotCancelableError, InvalidParamsError],
 ]
 
 TaskFeedbackRequest = JSONRPCRequest[Literal["tasks/feedback"], TaskFeedbackParams]
@@ -1509,7 +1639,8 @@ TaskFeedbackResponse = JSONRPCResponse[Dict[str, str], TaskNotFoundError]
 
 ListContextsRequest = JSONRPCRequest[Literal["contexts/list"], ListContextsParams]
 ListContextsResponse = JSONRPCResponse[
-    List[Context], Union[ContextNotFoundError, ContextNotCancelableError]
+    Union[List[Context], ContextListPage],
+    Union[ContextNotFoundError, ContextNotCancelableError, InvalidParamsError],
 ]
 
 ClearContextsRequest = JSONRPCRequest[Literal["contexts/clear"], ContextIdParams]
@@ -1531,7 +1662,9 @@ GetTaskPushNotificationResponse = JSONRPCResponse[
     TaskPushNotificationConfig, PushNotificationNotSupportedError
 ]
 
-ResubscribeTaskRequest = JSONRPCRequest[Literal["tasks/resubscribe"], TaskIdParams]
+ResubscribeTaskRequest = JSONRPCRequest[
+    Literal["tasks/resubscribe"], TaskResubscribeParams
+]
 ResubscribeTaskResponse = JSONRPCResponse[
     Task, Union[TaskNotCancelableError, TaskNotFoundError]
 ]
@@ -1556,6 +1689,7 @@ A2ARequest = Annotated[
         SendMessageRequest,
         StreamMessageRequest,
         GetTaskRequest,
+        GetTasksRequest,
         CancelTaskRequest,
         ListTasksRequest,
         TaskFeedbackRequest,
@@ -1574,6 +1708,7 @@ A2AResponse: TypeAlias = Union[
     SendMessageResponse,
     StreamMessageResponse,
     GetTaskResponse,
+    GetTasksResponse,
     CancelTaskResponse,
     ListTasksResponse,
     TaskFeedbackResponse,
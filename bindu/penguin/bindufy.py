@@ -105,6 +105,7 @@ def bindufy(
     run_server: bool = True,
     key_dir: str | Path | None = None,
     launch: bool = False,
+    history_summarizer: Callable[..., Any] | None = None,
 ) -> AgentManifest:
     """Transform an agent instance and handler into a bindu-compatible agent.
 
@@ -125,7 +126,11 @@ def bindufy(
             - debug_level: Debug verbosity level (default: 1)
             - monitoring: Enable monitoring/metrics (default: False)
             - telemetry: Enable telemetry collection (default: True)
-            - num_history_sessions: Number of conversation histories to maintain (default: 10)
+            - num_history_sessions: Number of conversation histories to maintain (default: 10).
+              Only when set explicitly, also the number of most recent turns passed to
+              the handler (0 = all; overridden by AGENT__HISTORY_WINDOW_MESSAGES)
+            - execution_strategy: Where sync handlers run - 'inline', 'thread' or 'process'
+              (default: "inline"). Use 'thread' for blocking framework calls.
             - documentation_url: URL to agent documentation
             - extra_metadata: Additional metadata dictionary
             - deployment: Deployment configuration dict
@@ -141,6 +146,9 @@ def bindufy(
                 directory (may fail in REPL/notebooks). Falls back to current working directory.
         launch: If True, creates a public tunnel via FRP to expose the server to the internet
                with an auto-generated subdomain (default: False)
+        history_summarizer: Optional ``(previous_summary, messages) -> str`` (sync or
+               async). When set, messages outside the history window are replaced by a
+               rolling summary persisted per context instead of being dropped.
 
     Returns:
         AgentManifest: The manifest for the bindufied agent
@@ -308,7 +316,14 @@ def bindufy(
         extra_metadata=validated_config["extra_metadata"],
         global_webhook_url=validated_config.get("global_webhook_url"),
         global_webhook_token=validated_config.get("global_webhook_token"),
+        execution_strategy=validated_config["execution_strategy"],
     )
+    _manifest.history_summarizer = history_summarizer
+    if "num_history_sessions" in config:
+        # The default (10) must not cut the history of agents that never asked
+        _manifest.history_window_turns = (
+            validated_config["num_history_sessions"] or None
+        )
 
     # Log manifest creation
     skill_count = len(_manifest.skills) if _manifest.skills else 0
@@ -418,8 +433,8 @@ def bindufy(
             # Update BinduApplication URL to use tunnel URL
             bindu_app.url = tunnel_url
 
-            # Invalidate cached agent card so it gets regenerated with new URL
-            bindu_app._agent_card_json_schema = None
+            # Rebuild the agent card and skills payloads with the new URL
+            bindu_app.invalidate_discovery_cache()
 
         except Exception as e:
             logger.error(f"Failed to create tunnel: {e}")
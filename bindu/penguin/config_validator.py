@@ -31,6 +31,7 @@ class ConfigValidator:
         "monitoring": False,
         "telemetry": True,
         "num_history_sessions": 10,
+        "execution_strategy": "inline",
         "documentation_url": None,
         "extra_metadata": {},
         "agent_trust": None,
@@ -161,6 +162,12 @@ class ConfigValidator:
         if config.get("kind") not in ["agent", "team", "workflow"]:
             raise ValueError("Field 'kind' must be one of: agent, team, workflow")
 
+        # Validate execution strategy for sync handlers
+        if config.get("execution_strategy") not in ["inline", "thread", "process"]:
+            raise ValueError(
+                "Field 'execution_strategy' must be one of: inline, thread, process"
+            )
+
     @classmethod
     def _validate_auth_config(cls, auth_config: Dict[str, Any]) -> None:
         """Validate authentication configuration.
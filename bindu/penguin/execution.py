@@ -0,0 +1,129 @@
+#
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""
+Execution strategies for synchronous agent handlers.
+
+Most framework integrations (agno, langgraph, ...) expose blocking, synchronous
+handlers. Calling them directly from the worker or the SSE generator freezes the
+event loop - and with it every other HTTP request - for the duration of the LLM
+call. This module runs such handlers off-loop:
+
+- inline:  call on the event loop (legacy behaviour, zero overhead)
+- thread:  run in a worker thread via anyio's thread pool
+- process: run in a process pool (CPU-bound handlers, must be picklable)
+
+Sync generators are bridged into async iterators chunk-by-chunk for the thread
+strategy, so streaming still works. The process strategy cannot share a live
+generator across processes; it drains the generator in the child and replays
+the chunks on the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator, Literal
+
+import anyio
+
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.penguin.execution")
+
+ExecutionStrategy = Literal["inline", "thread", "process"]
+
+EXECUTION_STRATEGIES: tuple[str, ...] = ("inline", "thread", "process")
+
+_process_pool: ProcessPoolExecutor | None = None
+
+_EXHAUSTED = object()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor()
+        logger.info("Created process pool for agent handler execution")
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool if it was started."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _drain_generator(func: Callable[..., Iterator[Any]], *args: Any) -> list[Any]:
+    """Run a generator function to completion and return all chunks.
+
+    Module-level so it can be pickled into a process pool worker.
+    """
+    return list(func(*args))
+
+
+def _next_chunk(iterator: Iterator[Any]) -> Any:
+    """Advance a sync iterator, returning a sentinel instead of raising."""
+    return next(iterator, _EXHAUSTED)
+
+
+async def run_sync(
+    func: Callable[..., Any], *args: Any, strategy: ExecutionStrategy
+) -> Any:
+    """Call a synchronous function using the given execution strategy.
+
+    Args:
+        func: Blocking callable to execute
+        *args: Positional arguments for func
+        strategy: Where to execute the call (inline, thread or process)
+
+    Returns:
+        The value returned by func
+    """
+    if strategy == "thread":
+        return await anyio.to_thread.run_sync(func, *args)
+    if strategy == "process":
+        future = _get_process_pool().submit(func, *args)
+        return await asyncio.wrap_future(future)
+    return func(*args)
+
+
+async def iterate_sync_generator(
+    func: Callable[..., Iterator[Any]], *args: Any, strategy: ExecutionStrategy
+) -> AsyncIterator[Any]:
+    """Bridge a synchronous generator function into an async iterator.
+
+    Args:
+        func: Generator function to execute
+        *args: Positional arguments for func
+        strategy: Where to execute the generator (inline, thread or process)
+
+    Yields:
+        Chunks produced by the generator, in order
+    """
+    if strategy == "process":
+        for chunk in await run_sync(_drain_generator, func, *args, strategy=strategy):
+            yield chunk
+        return
+
+    iterator = func(*args)
+    try:
+        while True:
+            chunk = await run_sync(_next_chunk, iterator, strategy=strategy)
+            if chunk is _EXHAUSTED:
+                break
+            yield chunk
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
@@ -27,6 +27,12 @@ from bindu.common.protocol.types import (
     AgentTrust,
     Skill,
 )
+from bindu.penguin.execution import (
+    EXECUTION_STRATEGIES,
+    ExecutionStrategy,
+    iterate_sync_generator,
+    run_sync,
+)
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.penguin.manifest")
@@ -106,6 +112,7 @@ def create_manifest(
     extra_metadata: dict[str, Any] | None = None,
     global_webhook_url: str | None = None,
     global_webhook_token: str | None = None,
+    execution_strategy: ExecutionStrategy = "inline",
 ) -> AgentManifest:
     """Create a protocol-compliant AgentManifest from any Python function.
 
@@ -143,14 +150,24 @@ def create_manifest(
         extra_metadata: Additional metadata dictionary to attach to the agent manifest (default: {}).
         global_webhook_url: Default webhook URL for all tasks (optional).
         global_webhook_token: Authentication token for global webhook (optional).
+        execution_strategy: Where synchronous handlers run - 'inline' on the event loop,
+                           'thread' in a thread pool or 'process' in a process pool
+                           (default: 'inline'). Async handlers always run on the loop.
 
     Returns:
         AgentManifest: A protocol-compliant agent manifest with proper execution methods.
 
     Raises:
         ValueError: If agent_function doesn't have required 'input' parameter or has invalid signature.
+        ValueError: If execution_strategy is not one of 'inline', 'thread', 'process'.
 
     """
+    if execution_strategy not in EXECUTION_STRATEGIES:
+        raise ValueError(
+            f"Invalid execution_strategy '{execution_strategy}'. "
+            f"Must be one of: {', '.join(EXECUTION_STRATEGIES)}"
+        )
+
     # Analyze function signature for parameter detection
     func_name = getattr(agent_function, "__name__", "<unknown>")
     logger.debug(f"Creating manifest for agent function: {func_name}")
@@ -205,6 +222,7 @@ def create_manifest(
         negotiation=negotiation,
         global_webhook_url=global_webhook_url,
         global_webhook_token=global_webhook_token,
+        execution_strategy=execution_strategy,
     )
 
     # Create execution method based on function type
@@ -266,19 +284,46 @@ def create_manifest(
 
         # Sync generator function
         elif inspect.isgeneratorfunction(agent_function):
-            logger.debug(f"Creating sync generator run method for '{manifest_name}'")
+            logger.debug(
+                f"Creating sync generator run method for '{manifest_name}' "
+                f"(execution_strategy={execution_strategy})"
+            )
 
-            def run(input_msg: str, **kwargs):
-                params = _resolve_params(input_msg, **kwargs)
-                yield from agent_function(*params)
+            if execution_strategy == "inline":
+
+                def run(input_msg: str, **kwargs):
+                    params = _resolve_params(input_msg, **kwargs)
+                    yield from agent_function(*params)
+
+            else:
+                # Off-loop: bridge chunks into an async generator
+                async def run(input_msg: str, **kwargs):
+                    params = _resolve_params(input_msg, **kwargs)
+                    async for chunk in iterate_sync_generator(
+                        agent_function, *params, strategy=execution_strategy
+                    ):
+                        yield chunk
 
         # Regular sync function
         else:
-            logger.debug(f"Creating sync function run method for '{manifest_name}'")
+            logger.debug(
+                f"Creating sync function run method for '{manifest_name}' "
+                f"(execution_strategy={execution_strategy})"
+            )
 
-            def run(input_msg: str, **kwargs):
-                params = _resolve_params(input_msg, **kwargs)
-                return agent_function(*params)
+            if execution_strategy == "inline":
+
+                def run(input_msg: str, **kwargs):
+                    params = _resolve_params(input_msg, **kwargs)
+                    return agent_function(*params)
+
+            else:
+                # Off-loop: yield the single result once the call completes
+                async def run(input_msg: str, **kwargs):
+                    params = _resolve_params(input_msg, **kwargs)
+                    yield await run_sync(
+                        agent_function, *params, strategy=execution_strategy
+                    )
 
         return run
 
@@ -137,7 +137,7 @@ class BinduApplication(Starlette):
         self.task_manager: TaskManager | None = None
         self._storage: Storage | None = None
         self._scheduler: Scheduler | None = None
-        self._agent_card_json_schema: bytes | None = None
+        self._discovery_cache: Any = None
         self._x402_ext = x402_ext
         self._payment_session_manager = None
         self._payment_requirements = None
@@ -156,6 +156,14 @@ class BinduApplication(Starlette):
         # Register all routes
         self._register_routes()
 
+    def invalidate_discovery_cache(self) -> None:
+        """Rebuild the agent card and skills payloads on their next request.
+
+        Needed after changing the manifest in place; replacing ``manifest`` or
+        ``url`` is detected automatically.
+        """
+        self._discovery_cache = None
+
     def _register_routes(self) -> None:
         """Register all application routes."""
         from .endpoints import (
@@ -389,17 +397,37 @@ class BinduApplication(Starlette):
             if app._payment_session_manager:
                 await app._payment_session_manager.start_cleanup_task()
 
+            # Serialize the agent card and skills payloads once up front
+            if manifest:
+                from .endpoints.discovery import get_discovery_cache
+
+                try:
+                    get_discovery_cache(app)
+                except Exception as e:
+                    # The endpoints build the payloads (and report errors) on request
+                    logger.warning(f"Discovery payloads not prebuilt: {e}")
+
             # Start TaskManager
             if manifest:
                 logger.info("🔧 Starting TaskManager...")
+                from .events import create_event_bus
+
                 task_manager = TaskManager(
-                    scheduler=scheduler, storage=storage, manifest=manifest
+                    scheduler=scheduler,
+                    storage=storage,
+                    manifest=manifest,
+                    event_bus=create_event_bus(scheduler, storage),
                 )
                 async with task_manager:
                     app.task_manager = task_manager
                     logger.info("✅ TaskManager started")
                     yield
                 logger.info("🛑 TaskManager stopped")
+
+                # Stop handler processes of the "process" execution strategy
+                from bindu.penguin.execution import shutdown_process_pool
+
+                shutdown_process_pool()
             else:
                 yield
 
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import uuid
+from typing import Any, Awaitable, Callable
+
 from starlette.requests import Request
 from starlette.responses import Response
 
 from bindu.common.protocol.types import (
     InternalError,
+    InvalidRequestError,
     JSONParseError,
     MethodNotFoundError,
+    QueueFullError,
     a2a_request_ta,
     a2a_response_ta,
 )
@@ -23,6 +30,13 @@ from bindu.extensions.x402.extension import (
 
 logger = get_logger("bindu.server.endpoints.a2a_protocol")
 
+QUEUE_FULL_CODE, _ = extract_error_fields(QueueFullError)
+
+_MESSAGE_METHODS = ("message/send", "message/stream")
+
+# Methods answering with Server-Sent Events, which a batch response cannot hold
+_STREAMING_METHODS = ("message/stream", "tasks/resubscribe")
+
 
 async def agent_run_endpoint(app: BinduApplication, request: Request) -> Response:
     """Handle A2A protocol requests for agent-to-agent communication.
@@ -35,6 +49,9 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
         2.2. The task was "canceled".
         2.3. The task "failed".
     3. The server will send a "working" on the first chunk on `tasks/pushNotification/get`.
+
+    A JSON array body is a JSON-RPC 2.0 batch: its calls are dispatched
+    concurrently and answered with an array of responses.
     """
     client_ip = get_client_ip(request)
     request_id = None
@@ -42,6 +59,9 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
     try:
         data = await request.body()
 
+        if data.lstrip()[:1] == b"[":
+            return await _batch_endpoint(app, request, data, client_ip)
+
         try:
             a2a_request = a2a_request_ta.validate_json(data)
         except Exception as e:
@@ -54,50 +74,26 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
 
         logger.debug(f"A2A request from {client_ip}: method={method}, id={request_id}")
 
-        handler_name = app_settings.agent.method_handlers.get(method)
-        if handler_name is None:
+        handler = _method_handler(app, method)
+        if handler is None:
             logger.warning(f"Unsupported A2A method '{method}' from {client_ip}")
             code, message = extract_error_fields(MethodNotFoundError)
             return jsonrpc_error(
                 code, message, f"Method '{method}' is not implemented", request_id, 404
             )
 
-        handler = getattr(app.task_manager, handler_name)
-
-        # Pass payment details from middleware to handler if available
-        # Payment context is passed through the metadata field in params
-        if hasattr(request.state, "payment_payload") and method == "message/send":
-            # Inject payment context into message metadata
-            if "params" in a2a_request and "message" in a2a_request["params"]:
-                message = a2a_request["params"]["message"]
-                if "metadata" not in message:
-                    message["metadata"] = {}
-
-                # Add payment context to message metadata (internal use only)
-                # Serialize Pydantic models and dataclasses to dicts for JSON compatibility
-                from dataclasses import asdict, is_dataclass
-
-                def serialize_to_dict(obj):
-                    """Serialize Pydantic models or dataclasses to dict."""
-                    if hasattr(obj, "model_dump"):
-                        return obj.model_dump()
-                    elif is_dataclass(obj):
-                        return asdict(obj)
-                    else:
-                        return dict(obj)
-
-                message["metadata"]["_payment_context"] = {
-                    "payment_payload": serialize_to_dict(request.state.payment_payload),
-                    "payment_requirements": serialize_to_dict(
-                        request.state.payment_requirements
-                    ),
-                    "verify_response": serialize_to_dict(request.state.verify_response),
-                }
+        _prepare_request(request, a2a_request)
 
         jsonrpc_response = await handler(a2a_request)
 
         logger.debug(f"A2A response to {client_ip}: method={method}, id={request_id}")
 
+        # message/stream and tasks/resubscribe answer with Server-Sent Events
+        if isinstance(jsonrpc_response, Response):
+            if x402_is_requested(request):
+                jsonrpc_response = x402_add_header(jsonrpc_response)
+            return jsonrpc_response
+
         resp = Response(
             content=a2a_response_ta.dump_json(
                 jsonrpc_response, by_alias=True, serialize_as_any=True
@@ -105,6 +101,14 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
             media_type="application/json",
         )
 
+        # Load shedding: tell the client to back off instead of answering 200
+        error = jsonrpc_response.get("error")
+        if error and error.get("code") == QUEUE_FULL_CODE:
+            resp.status_code = 503
+            resp.headers["Retry-After"] = str(
+                app_settings.scheduler.queue_full_retry_after
+            )
+
         if x402_is_requested(request):
             resp = x402_add_header(resp)
 
@@ -114,3 +118,199 @@ async def agent_run_endpoint(app: BinduApplication, request: Request) -> Respons
         logger.error(f"Error processing A2A request from {client_ip}", exc_info=True)
         code, message = extract_error_fields(InternalError)
         return jsonrpc_error(code, message, str(e), request_id, 500)
+
+
+def _method_handler(
+    app: BinduApplication, method: str | None
+) -> Callable[[Any], Awaitable[Any]] | None:
+    """TaskManager handler of a JSON-RPC method (None if not implemented)."""
+    handler_name = app_settings.agent.method_handlers.get(method or "")
+    if handler_name is None:
+        return None
+    return getattr(app.task_manager, handler_name)
+
+
+def _prepare_request(request: Request, a2a_request: Any) -> None:
+    """Add the request-derived params (payment, fairness key, last event id)."""
+    method = a2a_request.get("method")
+
+    # Pass payment details from middleware to handler if available
+    # Payment context is passed through the metadata field in params
+    if hasattr(request.state, "payment_payload") and method in _MESSAGE_METHODS:
+        # Inject payment context into message metadata
+        if "params" in a2a_request and "message" in a2a_request["params"]:
+            message = a2a_request["params"]["message"]
+            if "metadata" not in message:
+                message["metadata"] = {}
+
+            # Add payment context to message metadata (internal use only)
+            # Serialize Pydantic models and dataclasses to dicts for JSON compatibility
+            from dataclasses import asdict, is_dataclass
+
+            def serialize_to_dict(obj):
+                """Serialize Pydantic models or dataclasses to dict."""
+                if hasattr(obj, "model_dump"):
+                    return obj.model_dump()
+                elif is_dataclass(obj):
+                    return asdict(obj)
+                else:
+                    return dict(obj)
+
+            message["metadata"]["_payment_context"] = {
+                "payment_payload": serialize_to_dict(request.state.payment_payload),
+                "payment_requirements": serialize_to_dict(
+                    request.state.payment_requirements
+                ),
+                "verify_response": serialize_to_dict(request.state.verify_response),
+            }
+
+    # Fair-share queuing: key the task by the authenticated caller if configured.
+    # Unknown params keys are dropped during validation, so clients can't set this.
+    if method in _MESSAGE_METHODS and "params" in a2a_request:
+        if caller_key := _caller_fairness_key(request):
+            a2a_request["params"]["_fairness_key"] = caller_key
+
+    # SSE reconnects send the id of the last event received as a header
+    if method == "tasks/resubscribe" and "last_event_id" not in a2a_request["params"]:
+        last_event_id = request.headers.get("last-event-id", "")
+        if last_event_id.isdigit():
+            a2a_request["params"]["last_event_id"] = int(last_event_id)
+
+
+async def _batch_endpoint(
+    app: BinduApplication, request: Request, data: bytes, client_ip: str
+) -> Response:
+    """Handle a JSON-RPC 2.0 batch: run its calls concurrently, answer in order.
+
+    Notifications (calls without an ``id``) run but get no entry in the
+    response; a batch of only notifications is answered with 204. If any
+    call was refused because the queue is full, the response carries
+    ``Retry-After``.
+    """
+    try:
+        calls = json.loads(data)
+    except ValueError as e:
+        logger.warning(f"Invalid A2A batch from {client_ip}: {e}")
+        code, message = extract_error_fields(JSONParseError)
+        return jsonrpc_error(code, message, str(e))
+
+    max_batch_size = app_settings.agent.max_batch_size
+    code, message = extract_error_fields(InvalidRequestError)
+    if max_batch_size == 0:
+        return jsonrpc_error(code, message, "Batch requests are disabled")
+    if not calls:
+        return jsonrpc_error(code, message, "Batch must contain at least one request")
+    if len(calls) > max_batch_size:
+        return jsonrpc_error(
+            code,
+            message,
+            f"Batch of {len(calls)} requests exceeds the maximum of {max_batch_size}",
+        )
+
+    logger.debug(f"A2A batch from {client_ip}: {len(calls)} requests")
+
+    results = await asyncio.gather(
+        *(_batch_call(app, request, call, client_ip) for call in calls)
+    )
+    responses = [payload for payload, _ in results if payload is not None]
+
+    if responses:
+        resp = Response(
+            content=b"[" + b",".join(responses) + b"]", media_type="application/json"
+        )
+    else:
+        resp = Response(status_code=204)
+    if any(code == QUEUE_FULL_CODE for _, code in results):
+        resp.headers["Retry-After"] = str(app_settings.scheduler.queue_full_retry_after)
+    if x402_is_requested(request):
+        resp = x402_add_header(resp)
+    return resp
+
+
+async def _batch_call(
+    app: BinduApplication, request: Request, call: Any, client_ip: str
+) -> tuple[bytes | None, int | None]:
+    """Run one call of a batch.
+
+    Returns:
+        The serialized response (None for a notification) and its error code
+    """
+    request_id = call.get("id") if isinstance(call, dict) else None
+    notification = isinstance(call, dict) and "id" not in call
+    if notification:
+        # Handlers answer with the request's id; the answer is dropped below
+        call = {**call, "id": str(uuid.uuid4())}
+
+    try:
+        a2a_request = a2a_request_ta.validate_python(call)
+    except Exception as e:
+        # A call that is not a valid request is answered even without an id
+        return _batch_error(InvalidRequestError, str(e), request_id)
+
+    payload, code = await _run_batch_call(
+        app, request, a2a_request, request_id, client_ip
+    )
+    return (None if notification else payload), code
+
+
+async def _run_batch_call(
+    app: BinduApplication,
+    request: Request,
+    a2a_request: Any,
+    request_id: Any,
+    client_ip: str,
+) -> tuple[bytes, int | None]:
+    """Run a validated call of a batch and return its response and error code."""
+    method = a2a_request["method"]
+    if method in _STREAMING_METHODS:
+        return _batch_error(
+            InvalidRequestError,
+            f"Method '{method}' streams its response and cannot be batched",
+            request_id,
+        )
+
+    handler = _method_handler(app, method)
+    if handler is None:
+        return _batch_error(
+            MethodNotFoundError, f"Method '{method}' is not implemented", request_id
+        )
+
+    try:
+        _prepare_request(request, a2a_request)
+        jsonrpc_response = await handler(a2a_request)
+    except Exception as e:
+        logger.error(
+            f"Error processing batched A2A request from {client_ip}: "
+            f"method={method}, id={request_id}",
+            exc_info=True,
+        )
+        return _batch_error(InternalError, str(e), request_id)
+
+    code = (jsonrpc_response.get("error") or {}).get("code")
+    return a2a_response_ta.dump_json(
+        jsonrpc_response, by_alias=True, serialize_as_any=True
+    ), code
+
+
+def _batch_error(error_type: Any, data: str, request_id: Any) -> tuple[bytes, int]:
+    """Serialized JSON-RPC error response for one call of a batch, and its code."""
+    code, message = extract_error_fields(error_type)
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "error": {"code": code, "message": message, "data": data},
+            "id": request_id,
+        }
+    ).encode(), code
+
+
+def _caller_fairness_key(request: Request) -> str | None:
+    """Fairness key of the authenticated caller (None falls back to context_id)."""
+    source = app_settings.scheduler.fairness_key
+    user = getattr(request.state, "user", None)
+    if source == "context_id" or not isinstance(user, dict):
+        return None
+    if source == "client_did":
+        client_id = user.get("client_id") or ""
+        return client_id if client_id.startswith("did:") else None
+    return user.get("sub") or None
@@ -14,6 +14,7 @@ from bindu.extensions.x402.extension import (
     add_activation_header as x402_add_header,
 )
 from bindu.server.applications import BinduApplication
+from bindu.server.endpoints.discovery import CachedPayload, get_discovery_cache
 from bindu.utils.request_utils import handle_endpoint_errors
 from bindu.utils.logging import get_logger
 from bindu.utils.request_utils import get_client_ip
@@ -113,17 +114,21 @@ async def agent_card_endpoint(app: BinduApplication, request: Request) -> Respon
     """Serve the agent card JSON schema.
 
     This endpoint provides W3C-compliant agent discovery information.
+    The card is serialized once per manifest and served with an ETag.
     """
     client_ip = get_client_ip(request)
 
-    # Lazy initialization of agent card schema
-    if app._agent_card_json_schema is None:
+    cache = get_discovery_cache(app)
+    if cache.agent_card is None:
+        # Not buildable when the cache was filled; raises the actual error
         logger.debug("Generating agent card schema")
-        agent_card = create_agent_card(app)
-        app._agent_card_json_schema = agent_card_ta.dump_json(agent_card, by_alias=True)
+        cache.agent_card = CachedPayload.build(
+            agent_card_ta.dump_json(create_agent_card(app), by_alias=True),
+            "application/json",
+        )
 
     logger.debug(f"Serving agent card to {client_ip}")
-    resp = Response(content=app._agent_card_json_schema, media_type="application/json")
+    resp = cache.agent_card.response(request)
     if x402_is_requested(request):
         resp = x402_add_header(resp)
     return resp
@@ -0,0 +1,243 @@
+"""Pre-serialized discovery payloads (agent card and skills).
+
+The agent card, the skills list and each skill's detail and documentation
+only change with the manifest, but registry crawlers and peer agents fetch
+them far more often than anything else. They are serialized once, with a
+strong ETag and gzip (and brotli, if installed) variants, and served as-is:
+
+- ``If-None-Match`` with a current ETag is answered with 304 Not Modified.
+- ``Accept-Encoding`` picks the compressed variant (br, then gzip).
+
+The payloads are built at startup and rebuilt when the application's
+manifest or URL is replaced; in-place changes to the manifest need
+``BinduApplication.invalidate_discovery_cache()``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any
+
+import orjson
+from starlette.requests import Request
+from starlette.responses import Response
+
+from bindu.settings import app_settings
+from bindu.utils.logging import get_logger
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None  # type: ignore[assignment]
+    BROTLI_AVAILABLE = False
+
+logger = get_logger("bindu.server.endpoints.discovery")
+
+# Smaller payloads are not worth compressing
+_MIN_COMPRESS_SIZE = 256
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Content codings accepted by an Accept-Encoding header (q=0 excluded)."""
+    accepted = set()
+    for item in header.split(","):
+        coding, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding.strip() and quality > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    """A serialized response body with its ETag and compressed variants."""
+
+    body: bytes
+    media_type: str
+    etag: str
+    encoded: dict[str, bytes] = field(default_factory=dict)
+    """Compressed bodies by content coding (``br``, ``gzip``)."""
+
+    @classmethod
+    def build(cls, body: bytes, media_type: str) -> CachedPayload:
+        """Hash and compress a body."""
+        encoded = {}
+        if len(body) >= _MIN_COMPRESS_SIZE:
+            if BROTLI_AVAILABLE:
+                encoded["br"] = brotli.compress(body)
+            encoded["gzip"] = gzip.compress(body, mtime=0)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return cls(body=body, media_type=media_type, etag=etag, encoded=encoded)
+
+    @classmethod
+    def from_json(cls, content: Any) -> CachedPayload:
+        """Serialize JSON content."""
+        return cls.build(orjson.dumps(content), "application/json")
+
+    def variant_etag(self, coding: str | None) -> str:
+        """Strong ETag of the identity or a compressed representation."""
+        return self.etag if coding is None else f'{self.etag[:-1]}-{coding}"'
+
+    def _not_modified(self, if_none_match: str) -> bool:
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match uses the weak comparison
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return any(
+            self.variant_etag(coding) in tags for coding in (None, *self.encoded)
+        )
+
+    def response(self, request: Request) -> Response:
+        """Respond with the best accepted variant, or 304 if the client has it."""
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        coding = next(
+            (c for c in ("br", "gzip") if c in self.encoded and c in accepted), None
+        )
+
+        headers = {
+            "ETag": self.variant_etag(coding),
+            "Cache-Control": f"public, max-age={app_settings.agent.discovery_max_age}",
+            "Vary": "Accept-Encoding",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self._not_modified(if_none_match):
+            return Response(status_code=304, headers=headers)
+
+        if coding is None:
+            return Response(self.body, media_type=self.media_type, headers=headers)
+        headers["Content-Encoding"] = coding
+        return Response(
+            self.encoded[coding], media_type=self.media_type, headers=headers
+        )
+
+
+def skill_summary(skill: dict[str, Any]) -> dict[str, Any]:
+    """Summary of a skill for the skills list."""
+    summary = {
+        "id": skill.get("id"),
+        "name": skill.get("name"),
+        "description": skill.get("description"),
+        "version": skill.get("version", "unknown"),
+        "tags": skill.get("tags", []),
+        "input_modes": skill.get("input_modes", []),
+        "output_modes": skill.get("output_modes", []),
+    }
+
+    # Add optional fields if present
+    if "examples" in skill:
+        summary["examples"] = skill["examples"]
+
+    if "documentation_path" in skill:
+        summary["documentation_path"] = skill["documentation_path"]
+
+    return summary
+
+
+def skill_detail(skill: dict[str, Any]) -> dict[str, Any]:
+    """Full skill data without the (large) documentation content.
+
+    Clients use /agent/skills/{skill_id}/documentation for that.
+    """
+    detail = dict(skill)
+    detail["has_documentation"] = "documentation_content" in detail
+    detail.pop("documentation_content", None)
+    return detail
+
+
+@dataclass
+class DiscoveryCache:
+    """Discovery payloads of one manifest and URL."""
+
+    manifest: Any
+    url: str | None
+    skills_list: CachedPayload
+    skill_details: dict[str, CachedPayload]
+    """Skill details by skill ID and name (like ``find_skill_by_id``)."""
+    skill_docs: dict[str, CachedPayload]
+    """Skill documentation by skill ID and name (skills with documentation only)."""
+    agent_card: CachedPayload | None = None
+    """Agent card (None if the manifest cannot produce one yet)."""
+
+    @classmethod
+    def build(cls, app: Any) -> DiscoveryCache:
+        """Serialize all discovery payloads of an application."""
+        # Imported here: the agent card endpoint itself uses this cache
+        from bindu.common.protocol.types import agent_card_ta
+
+        from .agent_card import create_agent_card
+
+        manifest = app.manifest
+        skills = manifest.skills or []
+
+        skill_details: dict[str, CachedPayload] = {}
+        skill_docs: dict[str, CachedPayload] = {}
+        for skill in skills:
+            detail = CachedPayload.from_json(skill_detail(skill))
+            documentation = skill.get("documentation_content")
+            doc = None
+            if documentation:
+                if isinstance(documentation, str):
+                    documentation = documentation.encode("utf-8")
+                doc = CachedPayload.build(documentation, "application/yaml")
+            # The first skill matching an ID or name wins
+            for key in (skill.get("id"), skill.get("name")):
+                if key is None or key in skill_details:
+                    continue
+                skill_details[key] = detail
+                if doc is not None:
+                    skill_docs[key] = doc
+
+        summaries = [skill_summary(skill) for skill in skills]
+        cache = cls(
+            manifest=manifest,
+            url=getattr(app, "url", None),
+            skills_list=CachedPayload.from_json(
+                {"skills": summaries, "total": len(summaries)}
+            ),
+            skill_details=skill_details,
+            skill_docs=skill_docs,
+        )
+
+        try:
+            cache.agent_card = CachedPayload.build(
+                agent_card_ta.dump_json(create_agent_card(app), by_alias=True),
+                "application/json",
+            )
+        except Exception as e:
+            # Served through the endpoint's error handling on request
+            logger.debug(f"Agent card not cached: {e}")
+
+        logger.debug(f"Discovery payloads built for {len(skills)} skills")
+        return cache
+
+
+def get_discovery_cache(app: Any) -> DiscoveryCache:
+    """Discovery payloads of an application, rebuilt if its manifest or URL changed.
+
+    Args:
+        app: Application with a manifest
+
+    Returns:
+        Current discovery cache
+    """
+    cache: DiscoveryCache | None = getattr(app, "_discovery_cache", None)
+    if (
+        cache is None
+        or cache.manifest is not app.manifest
+        or cache.url != getattr(app, "url", None)
+    ):
+        cache = DiscoveryCache.build(app)
+        app._discovery_cache = cache
+    return cache
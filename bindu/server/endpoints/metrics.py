@@ -53,6 +53,38 @@ async def _update_agent_metrics(app: BinduApplication) -> None:
             logger.debug(f"Failed to update agent metrics: {e}")
 
 
+async def _update_scheduler_metrics(app: BinduApplication) -> None:
+    """Update scheduler queue gauges if the scheduler backend reports them.
+
+    Args:
+        app: BinduApplication instance
+    """
+    get_queue_stats = getattr(app._scheduler, "get_queue_stats", None)
+    if get_queue_stats is None:
+        return
+
+    try:
+        get_metrics().set_scheduler_queue_stats(await get_queue_stats())
+    except Exception as e:
+        logger.debug(f"Failed to update scheduler metrics: {e}")
+
+
+async def _update_storage_metrics(app: BinduApplication) -> None:
+    """Update storage memory gauges if the storage backend reports them.
+
+    Args:
+        app: BinduApplication instance
+    """
+    get_memory_stats = getattr(app._storage, "get_memory_stats", None)
+    if get_memory_stats is None:
+        return
+
+    try:
+        get_metrics().set_storage_memory_stats(get_memory_stats())
+    except Exception as e:
+        logger.debug(f"Failed to update storage metrics: {e}")
+
+
 async def metrics_endpoint(app: BinduApplication, request: Request) -> Response:
     """Prometheus metrics endpoint.
 
@@ -63,11 +95,15 @@ async def metrics_endpoint(app: BinduApplication, request: Request) -> Response:
     - http_request_duration_seconds: HTTP request latency histogram
     - agent_tasks_active: Currently active tasks per agent
     - agent_tasks_completed_total: Total completed tasks per agent and status
+    - scheduler_queue_*: Queue depth/pending/lag (schedulers that report them)
+    - storage_memory_*: Retained tasks/contexts, payload bytes, evictions (memory storage)
     """
     logger.debug("Metrics endpoint called")
 
     # Update agent metrics from current state
     await _update_agent_metrics(app)
+    await _update_scheduler_metrics(app)
+    await _update_storage_metrics(app)
 
     # Get metrics instance and generate Prometheus text
     metrics = get_metrics()
@@ -149,13 +149,11 @@ async def negotiation_endpoint(app: BinduApplication, request: Request) -> Respo
     queue_depth = None
     if app.task_manager and app.task_manager.storage:
         try:
-            tasks = await app.task_manager.storage.list_tasks()
+            storage = app.task_manager.storage
             # Count tasks in non-terminal states (from agent settings)
-            queue_depth = sum(
-                1
-                for task in tasks
-                if task.get("state") in app_settings.agent.non_terminal_states
-            )
+            queue_depth = 0
+            for state in app_settings.agent.non_terminal_states:
+                queue_depth += await storage.count_tasks(status=state)
         except Exception as e:
             logger.warning(f"Failed to get queue depth from storage: {e}")
 
@@ -15,10 +15,10 @@ from bindu.extensions.x402.extension import (
     add_activation_header as x402_add_header,
 )
 from bindu.server.applications import BinduApplication
+from bindu.server.endpoints.discovery import get_discovery_cache
 from bindu.utils.request_utils import handle_endpoint_errors
 from bindu.utils.logging import get_logger
 from bindu.utils.request_utils import extract_error_fields, get_client_ip, jsonrpc_error
-from bindu.utils.skill_utils import find_skill_by_id
 
 logger = get_logger("bindu.server.endpoints.skills")
 
@@ -38,34 +38,7 @@ async def skills_list_endpoint(app: BinduApplication, request: Request) -> Respo
             content={"error": "Agent manifest not configured"}, status_code=500
         )
 
-    # Get skills from manifest
-    skills = app.manifest.skills or []
-
-    # Build summary response
-    skills_summary = []
-    for skill in skills:
-        skill_summary = {
-            "id": skill.get("id"),
-            "name": skill.get("name"),
-            "description": skill.get("description"),
-            "version": skill.get("version", "unknown"),
-            "tags": skill.get("tags", []),
-            "input_modes": skill.get("input_modes", []),
-            "output_modes": skill.get("output_modes", []),
-        }
-
-        # Add optional fields if present
-        if "examples" in skill:
-            skill_summary["examples"] = skill["examples"]
-
-        if "documentation_path" in skill:
-            skill_summary["documentation_path"] = skill["documentation_path"]
-
-        skills_summary.append(skill_summary)
-
-    response_data = {"skills": skills_summary, "total": len(skills_summary)}
-
-    resp = JSONResponse(content=response_data)
+    resp = get_discovery_cache(app).skills_list.response(request)
     if x402_is_requested(request):
         resp = x402_add_header(resp)
     return resp
@@ -76,7 +49,9 @@ async def skill_detail_endpoint(app: BinduApplication, request: Request) -> Resp
     """Get detailed information about a specific skill.
 
     Returns full skill metadata including documentation, capabilities,
-    requirements, and performance characteristics.
+    requirements, and performance characteristics. The documentation
+    content itself is left out; clients use
+    /agent/skills/{skill_id}/documentation for that.
     """
     client_ip = get_client_ip(request)
     skill_id = request.path_params.get("skill_id")
@@ -93,26 +68,14 @@ async def skill_detail_endpoint(app: BinduApplication, request: Request) -> Resp
         return jsonrpc_error(code, "Agent manifest not configured", status=500)
 
     # Find skill in manifest
-    skills = app.manifest.skills or []
-    skill = find_skill_by_id(skills, skill_id)
+    payload = get_discovery_cache(app).skill_details.get(skill_id)
 
-    if not skill:
+    if payload is None:
         logger.warning(f"Skill not found: {skill_id}")
         code, message = extract_error_fields(SkillNotFoundError)
         return jsonrpc_error(code, f"Skill not found: {skill_id}", status=404)
 
-    # Return full skill data (excluding documentation_content for size)
-    skill_detail = dict(skill)
-
-    # Remove documentation_content from response (too large)
-    # Clients should use /agent/skills/{skill_id}/documentation for that
-    if "documentation_content" in skill_detail:
-        skill_detail["has_documentation"] = True
-        del skill_detail["documentation_content"]
-    else:
-        skill_detail["has_documentation"] = False
-
-    resp = JSONResponse(content=skill_detail)
+    resp = payload.response(request)
     if x402_is_requested(request):
         resp = x402_add_header(resp)
     return resp
@@ -141,19 +104,16 @@ async def skill_documentation_endpoint(
         code, message = extract_error_fields(SkillNotFoundError)
         return jsonrpc_error(code, "Agent manifest not configured", status=500)
 
-    # Find skill in manifest
-    skills = app.manifest.skills or []
-    skill = find_skill_by_id(skills, skill_id)
+    cache = get_discovery_cache(app)
 
-    if not skill:
+    if skill_id not in cache.skill_details:
         logger.warning(f"Skill not found: {skill_id}")
         code, message = extract_error_fields(SkillNotFoundError)
         return jsonrpc_error(code, f"Skill not found: {skill_id}", status=404)
 
-    # Get documentation content
-    documentation = skill.get("documentation_content")
+    payload = cache.skill_docs.get(skill_id)
 
-    if not documentation:
+    if payload is None:
         logger.warning(f"No documentation available for skill: {skill_id}")
         code, message = extract_error_fields(SkillNotFoundError)
         return jsonrpc_error(
@@ -161,7 +121,7 @@ async def skill_documentation_endpoint(
         )
 
     # Return as YAML
-    resp = Response(content=documentation, media_type="application/yaml")
+    resp = payload.response(request)
     if x402_is_requested(request):
         resp = x402_add_header(resp)
     return resp
@@ -0,0 +1,84 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""EVENT BUS MODULE EXPORTS.
+
+This module provides the task event bus for the bindu framework. Workers
+publish task events and streaming responses subscribe to them.
+
+BURGER STORE ANALOGY:
+
+Think of this as the kitchen's order-status screen:
+
+1. EVENT BUS INTERFACE (EventBus):
+   - Abstract base class defining publish/subscribe per order (task)
+   - The cook posts updates, the waiter watching that order relays them
+
+2. EVENT BUS IMPLEMENTATIONS:
+   - InMemoryEventBus: Screen in a single kitchen (memory scheduler)
+   - RedisEventBus: Shared screen across kitchens (Redis pub/sub)
+
+3. EVENT LOG (EventLog):
+   - Numbered history of each order's updates, so a waiter who stepped away
+     can catch up from the last update they saw (tasks/resubscribe)
+
+AVAILABLE EVENT BUS OPTIONS:
+- InMemoryEventBus: In-process delivery for single-process deployments
+- RedisEventBus: Redis pub/sub delivery for multi-process deployments
+
+AVAILABLE EVENT LOG OPTIONS:
+- InMemoryEventLog: Per-process log with TTL and per-task cap
+- RedisEventLog: Redis lists shared by all processes
+- PostgresEventLog: task_events table of the Postgres storage
+"""
+
+from __future__ import annotations as _annotations
+
+from .base import (
+    INTERRUPTED_STATES,
+    EventBus,
+    TaskEvent,
+    artifact_update_event,
+    status_update_event,
+)
+from .factory import create_event_bus
+from .log import EventLog
+from .memory_bus import InMemoryEventBus
+from .memory_log import InMemoryEventLog
+
+try:
+    from .redis_bus import RedisEventBus
+    from .redis_log import RedisEventLog
+except ImportError:
+    RedisEventBus = None  # type: ignore[assignment,misc]  # redis not installed
+    RedisEventLog = None  # type: ignore[assignment,misc]
+
+try:
+    from .postgres_log import PostgresEventLog
+except ImportError:
+    PostgresEventLog = None  # type: ignore[assignment,misc]  # sqlalchemy not installed
+
+__all__ = [
+    # Base interface
+    "EventBus",
+    "INTERRUPTED_STATES",
+    "TaskEvent",
+    "artifact_update_event",
+    "status_update_event",
+    # Event bus implementations
+    "InMemoryEventBus",
+    "RedisEventBus",
+    # Event logs
+    "EventLog",
+    "InMemoryEventLog",
+    "RedisEventLog",
+    "PostgresEventLog",
+    # Factory
+    "create_event_bus",
+]
@@ -0,0 +1,121 @@
+"""Base event bus module.
+
+Workers publish task events (status changes, streamed output chunks, final
+artifacts) to a per-task channel; ``message/stream`` responses subscribe to the
+channel of their task and relay the events to the client as Server-Sent Events.
+This decouples streaming from the node that executes the task.
+"""
+
+from __future__ import annotations as _annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from .log import EventLog
+
+TaskEvent = dict[str, Any]
+"""A JSON-serializable ``status-update`` or ``artifact-update`` event."""
+
+INTERRUPTED_STATES = frozenset({"input-required", "auth-required", "suspended"})
+"""Non-terminal states that still end a stream (the task waits on something)."""
+
+
+class EventBus(ABC):
+    """Publish/subscribe channel of task events, one channel per task.
+
+    With an event log, every published event is first appended to the log and
+    carries its sequence number under ``seq``, so that missed events can be
+    replayed (``tasks/resubscribe``).
+    """
+
+    event_log: EventLog | None = None
+
+    @abstractmethod
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        ...
+
+    @abstractmethod
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Exit async context manager."""
+        ...
+
+    async def publish(self, task_id: UUID, event: TaskEvent) -> None:
+        """Publish an event to the subscribers of a task.
+
+        Events published while nobody is subscribed are dropped (but logged).
+        """
+        if self.event_log is not None:
+            seq = await self.event_log.append(task_id, event)
+            if seq is not None:
+                event = {**event, "seq": seq}
+        await self._broadcast(task_id, event)
+
+    async def replay(self, task_id: UUID, after: int = 0) -> list[TaskEvent]:
+        """Read the logged events of a task after a sequence number.
+
+        Subscribe first and replay then, so no event falls in between; events
+        received both ways are recognized by their ``seq``.
+        """
+        if self.event_log is None:
+            return []
+        return await self.event_log.read(task_id, after)
+
+    @abstractmethod
+    async def _broadcast(self, task_id: UUID, event: TaskEvent) -> None:
+        """Deliver an event to the current subscribers of a task."""
+
+    @abstractmethod
+    def subscribe(
+        self, task_id: UUID
+    ) -> AbstractAsyncContextManager[AsyncIterator[TaskEvent]]:
+        """Subscribe to the events of a task.
+
+        The subscription is active once the context manager is entered, so it
+        must be entered before the task is scheduled to not miss events.
+        """
+
+
+def status_update_event(
+    task_id: UUID, context_id: UUID, state: str, final: bool
+) -> TaskEvent:
+    """Build a ``status-update`` event.
+
+    ``final`` is also set for states that wait on the client (input-required,
+    auth-required) or on a resume (suspended), since the stream ends there.
+    """
+    return {
+        "kind": "status-update",
+        "task_id": str(task_id),
+        "context_id": str(context_id),
+        "status": {
+            "state": state,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "final": final or state in INTERRUPTED_STATES,
+    }
+
+
+def artifact_update_event(
+    task_id: UUID,
+    context_id: UUID,
+    artifact: Any,
+    append: bool = False,
+    last_chunk: bool = False,
+) -> TaskEvent:
+    """Build an ``artifact-update`` event."""
+    return {
+        "kind": "artifact-update",
+        "task_id": str(task_id),
+        "context_id": str(context_id),
+        "artifact": artifact,
+        "append": append,
+        "last_chunk": last_chunk,
+    }
@@ -0,0 +1,113 @@
+"""Event bus factory.
+
+The event bus uses the same transport as the scheduler: in-process for the
+memory scheduler, Redis pub/sub for the Redis schedulers. Every worker that can
+receive a task can then publish its events to the node streaming them.
+
+The event log that makes events replayable follows ``scheduler.event_log``:
+by default in Redis next to the channels for Redis schedulers and in memory
+otherwise; ``postgres`` logs to the agent's Postgres storage.
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import Any
+
+from bindu.server.scheduler.base import Scheduler
+from bindu.settings import app_settings
+from bindu.utils.logging import get_logger
+
+from .base import EventBus
+from .log import EventLog
+from .memory_bus import InMemoryEventBus
+from .memory_log import InMemoryEventLog
+
+logger = get_logger("bindu.server.events.factory")
+
+try:
+    from bindu.server.scheduler.redis_scheduler import RedisScheduler
+
+    from .redis_bus import RedisEventBus
+    from .redis_log import RedisEventLog
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    RedisScheduler = None  # type: ignore[assignment,misc]
+    RedisEventBus = None  # type: ignore[assignment,misc]
+    RedisEventLog = None  # type: ignore[assignment,misc]
+
+try:
+    from bindu.server.storage.postgres_storage import PostgresStorage
+
+    from .postgres_log import PostgresEventLog
+
+    POSTGRES_AVAILABLE = True
+except ImportError:
+    POSTGRES_AVAILABLE = False
+    PostgresStorage = None  # type: ignore[assignment,misc]
+    PostgresEventLog = None  # type: ignore[assignment,misc]
+
+
+def create_event_bus(scheduler: Scheduler, storage: Any = None) -> EventBus:
+    """Create the event bus matching a scheduler's transport.
+
+    Args:
+        scheduler: The scheduler tasks are distributed with
+        storage: The agent's storage (used by the ``postgres`` event log)
+
+    Returns:
+        RedisEventBus for Redis schedulers (same Redis instance, channels under
+        ``<queue_name>:events``), InMemoryEventBus otherwise
+
+    Raises:
+        ValueError: If the configured event log does not fit the deployment
+    """
+    is_redis = REDIS_AVAILABLE and isinstance(scheduler, RedisScheduler)
+    event_log = _create_event_log(scheduler, storage, is_redis)
+
+    if is_redis:
+        logger.info("Using Redis pub/sub event bus")
+        return RedisEventBus(
+            redis_url=scheduler.redis_url,
+            channel_prefix=f"{scheduler.queue_name}:events",
+            max_connections=scheduler.max_connections,
+            event_log=event_log,
+        )
+
+    logger.info("Using in-memory event bus")
+    return InMemoryEventBus(event_log=event_log)
+
+
+def _create_event_log(
+    scheduler: Scheduler, storage: Any, is_redis: bool
+) -> EventLog | None:
+    settings = app_settings.scheduler
+    kind = settings.event_log
+    if kind == "auto":
+        kind = "redis" if is_redis else "memory"
+
+    if kind == "none":
+        logger.info("Task events are not logged (tasks/resubscribe tails only)")
+        return None
+
+    if kind == "redis":
+        if not is_redis:
+            raise ValueError("The redis event log requires a Redis scheduler")
+        return RedisEventLog(
+            redis_url=scheduler.redis_url,
+            key_prefix=f"{scheduler.queue_name}:log",
+            ttl_seconds=settings.event_log_ttl_seconds,
+            max_events=settings.event_log_max_events,
+            max_connections=scheduler.max_connections,
+        )
+
+    if kind == "postgres":
+        if not (POSTGRES_AVAILABLE and isinstance(storage, PostgresStorage)):
+            raise ValueError("The postgres event log requires Postgres storage")
+        return PostgresEventLog(storage, max_events=settings.event_log_max_events)
+
+    return InMemoryEventLog(
+        ttl_seconds=settings.event_log_ttl_seconds,
+        max_events=settings.event_log_max_events,
+    )
@@ -0,0 +1,49 @@
+"""Base event log module.
+
+The event log keeps the events of each task, in publish order, with a
+per-task sequence number. Streams send the sequence number as the SSE event
+id, so a client that lost its connection can reconnect with
+``tasks/resubscribe`` and the last id it received: the missed events are
+replayed from the log before the live events are relayed.
+"""
+
+from __future__ import annotations as _annotations
+
+from abc import ABC, abstractmethod
+from typing import Any
+from uuid import UUID
+
+from typing_extensions import Self
+
+from .base import TaskEvent
+
+
+class EventLog(ABC):
+    """Append-only, per-task log of task events with sequence numbers.
+
+    Sequence numbers start at 1 and increase by one per event of a task.
+    Events of a task are appended by the worker executing it, one at a time.
+    """
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Exit async context manager."""
+
+    @abstractmethod
+    async def append(self, task_id: UUID, event: TaskEvent) -> int | None:
+        """Append an event to the task's log.
+
+        Returns:
+            The sequence number of the event, or None if it could not be logged
+            (the event is then delivered to live subscribers only)
+        """
+
+    @abstractmethod
+    async def read(self, task_id: UUID, after: int = 0) -> list[TaskEvent]:
+        """Read the logged events of a task with a sequence number above ``after``.
+
+        Each returned event carries its sequence number under ``seq``.
+        """
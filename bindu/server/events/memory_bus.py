@@ -0,0 +1,68 @@
+"""In-memory event bus implementation."""
+
+from __future__ import annotations as _annotations
+
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from uuid import UUID
+
+import anyio
+from anyio.streams.memory import MemoryObjectSendStream
+
+from .base import EventBus, TaskEvent
+from .log import EventLog
+
+
+class InMemoryEventBus(EventBus):
+    """Event bus for single-process deployments (memory scheduler)."""
+
+    def __init__(self, event_log: EventLog | None = None):
+        """Initialize with no subscribers.
+
+        Args:
+            event_log: Optional log making the published events replayable
+        """
+        self.event_log = event_log
+        self._subscribers: defaultdict[UUID, set[MemoryObjectSendStream[TaskEvent]]] = (
+            defaultdict(set)
+        )
+
+    async def __aenter__(self):
+        """Enter async context manager."""
+        if self.event_log is not None:
+            await self.event_log.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Close all subscriptions."""
+        for subscribers in self._subscribers.values():
+            for send_stream in subscribers:
+                send_stream.close()
+        self._subscribers.clear()
+        if self.event_log is not None:
+            await self.event_log.__aexit__(exc_type, exc_value, traceback)
+
+    async def _broadcast(self, task_id: UUID, event: TaskEvent) -> None:
+        """Deliver an event to every subscriber of the task."""
+        for send_stream in tuple(self._subscribers.get(task_id, ())):
+            send_stream.send_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(self, task_id: UUID) -> AsyncIterator[AsyncIterator[TaskEvent]]:
+        """Subscribe to the events of a task."""
+        send_stream, receive_stream = anyio.create_memory_object_stream[TaskEvent](
+            max_buffer_size=float("inf")
+        )
+        self._subscribers[task_id].add(send_stream)
+        try:
+            async with receive_stream:
+                yield receive_stream
+        finally:
+            subscribers = self._subscribers.get(task_id)
+            if subscribers is not None:
+                subscribers.discard(send_stream)
+                if not subscribers:
+                    del self._subscribers[task_id]
+            send_stream.close()
@@ -0,0 +1,69 @@
+"""In-memory event log implementation."""
+
+from __future__ import annotations as _annotations
+
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from .base import TaskEvent
+from .log import EventLog
+
+
+@dataclass
+class _TaskLog:
+    events: deque[TaskEvent]
+    seq: int = 0
+    updated_at: float = field(default_factory=time.monotonic)
+
+
+class InMemoryEventLog(EventLog):
+    """Event log for single-process deployments.
+
+    At most ``max_events`` events are kept per task. The log of a task is
+    dropped ``ttl_seconds`` after its last event; expired logs are pruned
+    while appending.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600, max_events: int = 10000):
+        """Initialize an empty log.
+
+        Args:
+            ttl_seconds: Seconds a task's log is kept after its last event
+            max_events: Maximum events kept per task (oldest are dropped)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_events = max_events
+        # Ordered by last append, so expired logs are at the front
+        self._logs: OrderedDict[str, _TaskLog] = OrderedDict()
+
+    async def append(self, task_id: UUID, event: TaskEvent) -> int:
+        """Append an event to the task's log."""
+        now = time.monotonic()
+        self._prune(now)
+
+        key = str(task_id)
+        log = self._logs.get(key)
+        if log is None:
+            log = self._logs[key] = _TaskLog(events=deque(maxlen=self.max_events))
+        else:
+            self._logs.move_to_end(key)
+        log.seq += 1
+        log.updated_at = now
+        log.events.append({**event, "seq": log.seq})
+        return log.seq
+
+    async def read(self, task_id: UUID, after: int = 0) -> list[TaskEvent]:
+        """Read the logged events of a task after a sequence number."""
+        log = self._logs.get(str(task_id))
+        if log is None:
+            return []
+        return [event for event in log.events if event["seq"] > after]
+
+    def _prune(self, now: float) -> None:
+        while self._logs:
+            key, log = next(iter(self._logs.items()))
+            if now - log.updated_at < self.ttl_seconds:
+                break
+            del self._logs[key]
@@ -0,0 +1,48 @@
+"""PostgreSQL-backed event log implementation."""
+
+from __future__ import annotations as _annotations
+
+from uuid import UUID
+
+from bindu.server.storage.postgres_storage import PostgresStorage
+from bindu.utils.logging import get_logger
+
+from .base import TaskEvent
+from .log import EventLog
+
+logger = get_logger("bindu.server.events.postgres_log")
+
+
+class PostgresEventLog(EventLog):
+    """Event log in the ``task_events`` table of the agent's Postgres storage.
+
+    Events are kept as long as their task, up to ``max_events`` per task.
+    Nothing cascades (a partitioned tasks table has no foreign keys), so the
+    rows are removed by explicit deletes: PostgresStorage's ``clear_context``
+    and ``clear_all``, and ``archive_task_partitions`` (run by
+    ``maintain_partitions``) for expired partitions.
+    """
+
+    def __init__(self, storage: PostgresStorage, max_events: int = 10000):
+        """Initialize the Postgres event log.
+
+        Args:
+            storage: Connected Postgres storage of the agent
+            max_events: Maximum events kept per task (oldest are dropped)
+        """
+        self.storage = storage
+        self.max_events = max_events
+
+    async def append(self, task_id: UUID, event: TaskEvent) -> int | None:
+        """Append an event (errors are logged, not raised)."""
+        try:
+            return await self.storage.append_task_event(
+                task_id, event, max_events=self.max_events
+            )
+        except Exception as e:
+            logger.warning(f"Failed to log event for task {task_id}: {e}")
+            return None
+
+    async def read(self, task_id: UUID, after: int = 0) -> list[TaskEvent]:
+        """Read the logged events of a task after a sequence number."""
+        return await self.storage.load_task_events(task_id, after)
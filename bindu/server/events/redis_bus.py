@@ -0,0 +1,191 @@
+"""Redis pub/sub event bus implementation."""
+
+from __future__ import annotations as _annotations
+
+import json
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any
+from uuid import UUID
+
+import anyio
+import redis.asyncio as redis
+from anyio.streams.memory import MemoryObjectSendStream
+from redis.utils import str_if_bytes
+
+from bindu.utils.logging import get_logger
+
+from .base import EventBus, TaskEvent
+from .log import EventLog
+
+logger = get_logger("bindu.server.events.redis_bus")
+
+
+class RedisEventBus(EventBus):
+    """Event bus over Redis pub/sub for multi-process deployments.
+
+    Events of a task are published on ``<channel_prefix>:<task_id>``. All
+    subscriptions of a process share a single pub/sub connection: channels are
+    subscribed while at least one local subscriber listens, and a background
+    reader dispatches incoming events to the local subscribers.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        channel_prefix: str = "bindu:tasks:events",
+        max_connections: int = 10,
+        subscribe_timeout: float = 5.0,
+        event_log: EventLog | None = None,
+    ):
+        """Initialize the Redis event bus.
+
+        Args:
+            redis_url: Redis connection URL
+            channel_prefix: Prefix of the per-task channels
+            max_connections: Maximum connections in the pool
+            subscribe_timeout: Seconds to wait for Redis to confirm a subscription
+            event_log: Optional log making the published events replayable
+        """
+        self.redis_url = redis_url
+        self.channel_prefix = channel_prefix
+        self.max_connections = max_connections
+        self.subscribe_timeout = subscribe_timeout
+        self.event_log = event_log
+        self._redis_client: redis.Redis | None = None
+        self._pubsub: Any = None
+        self._subscribers: defaultdict[str, set[MemoryObjectSendStream[TaskEvent]]] = (
+            defaultdict(set)
+        )
+        self._confirmations: dict[str, anyio.Event] = {}
+        self._exit_stack: AsyncExitStack | None = None
+
+    async def __aenter__(self):
+        """Connect and start the pub/sub reader."""
+        self._redis_client = redis.from_url(
+            self.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=self.max_connections,
+        )
+        try:
+            await self._redis_client.ping()
+        except redis.RedisError as e:
+            logger.error(f"Failed to connect to Redis: {e}")
+            raise ConnectionError(
+                f"Unable to connect to Redis at {self.redis_url}: {e}"
+            )
+
+        self._pubsub = self._redis_client.pubsub()
+        # Keeps the pub/sub connection open while no task is subscribed
+        await self._pubsub.subscribe(self.channel_prefix)
+
+        self._exit_stack = AsyncExitStack()
+        await self._exit_stack.__aenter__()
+        if self.event_log is not None:
+            await self._exit_stack.enter_async_context(self.event_log)
+        task_group = await self._exit_stack.enter_async_context(
+            anyio.create_task_group()
+        )
+        self._exit_stack.callback(task_group.cancel_scope.cancel)
+        task_group.start_soon(self._read_loop)
+        logger.info(f"Redis event bus connected to {self.redis_url}")
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Stop the reader and close the connections."""
+        if self._exit_stack is not None:
+            await self._exit_stack.__aexit__(exc_type, exc_value, traceback)
+            self._exit_stack = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+        for subscribers in self._subscribers.values():
+            for send_stream in subscribers:
+                send_stream.close()
+        self._subscribers.clear()
+
+    def _channel(self, task_id: UUID) -> str:
+        return f"{self.channel_prefix}:{task_id}"
+
+    async def _broadcast(self, task_id: UUID, event: TaskEvent) -> None:
+        """Publish an event on the task's channel (errors are logged, not raised)."""
+        assert self._redis_client is not None
+        try:
+            await self._redis_client.publish(
+                self._channel(task_id), json.dumps(event, default=str)
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to publish event for task {task_id}: {e}")
+
+    @asynccontextmanager
+    async def subscribe(self, task_id: UUID) -> AsyncIterator[AsyncIterator[TaskEvent]]:
+        """Subscribe to the events of a task."""
+        assert self._pubsub is not None
+        channel = self._channel(task_id)
+        send_stream, receive_stream = anyio.create_memory_object_stream[TaskEvent](
+            max_buffer_size=float("inf")
+        )
+        first = channel not in self._subscribers
+        self._subscribers[channel].add(send_stream)
+        try:
+            if first:
+                confirmed = self._confirmations[channel] = anyio.Event()
+                await self._pubsub.subscribe(channel)
+                # Events published before Redis processed SUBSCRIBE would be lost
+                with anyio.move_on_after(self.subscribe_timeout):
+                    await confirmed.wait()
+            async with receive_stream:
+                yield receive_stream
+        finally:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is not None:
+                subscribers.discard(send_stream)
+                if not subscribers:
+                    del self._subscribers[channel]
+                    self._confirmations.pop(channel, None)
+                    await self._unsubscribe(channel)
+            send_stream.close()
+
+    async def _unsubscribe(self, channel: str) -> None:
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(channel)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to unsubscribe from {channel}: {e}")
+
+    async def _read_loop(self) -> None:
+        """Dispatch pub/sub messages to local subscribers."""
+        while True:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except redis.RedisError as e:
+                logger.error(f"Redis error in event bus reader: {e}")
+                await anyio.sleep(1)
+                continue
+            if message is None:
+                continue
+            self._dispatch(message)
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        channel = str_if_bytes(message["channel"])
+        if message["type"] == "subscribe":
+            confirmed = self._confirmations.pop(channel, None)
+            if confirmed is not None:
+                confirmed.set()
+            return
+        if message["type"] != "message":
+            return
+
+        try:
+            event = json.loads(message["data"])
+        except ValueError as e:
+            logger.warning(f"Dropping malformed event on {channel}: {e}")
+            return
+        for send_stream in tuple(self._subscribers.get(channel, ())):
+            send_stream.send_nowait(event)
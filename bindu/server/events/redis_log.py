@@ -0,0 +1,109 @@
+"""Redis-backed event log implementation."""
+
+from __future__ import annotations as _annotations
+
+import json
+from typing import Any
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from bindu.utils.logging import get_logger
+
+from .base import TaskEvent
+from .log import EventLog
+
+logger = get_logger("bindu.server.events.redis_log")
+
+# KEYS: sequence counter, event list. ARGV: JSON object, max events, TTL.
+# The sequence number is spliced into the JSON object so that numbering and
+# appending are atomic across processes.
+_APPEND_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+local event = '{"seq":' .. seq .. ',' .. string.sub(ARGV[1], 2)
+redis.call('RPUSH', KEYS[2], event)
+redis.call('LTRIM', KEYS[2], -tonumber(ARGV[2]), -1)
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return seq
+"""
+
+
+class RedisEventLog(EventLog):
+    """Event log in Redis lists, shared by all processes of an agent.
+
+    The events of a task are kept in ``<key_prefix>:<task_id>`` and numbered
+    by ``<key_prefix>:<task_id>:seq``. Both keys expire ``ttl_seconds`` after
+    the task's last event; at most ``max_events`` events are kept per task.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        key_prefix: str = "bindu:tasks:log",
+        ttl_seconds: int = 3600,
+        max_events: int = 10000,
+        max_connections: int = 10,
+    ):
+        """Initialize the Redis event log.
+
+        Args:
+            redis_url: Redis connection URL
+            key_prefix: Prefix of the per-task keys
+            ttl_seconds: Seconds a task's log is kept after its last event
+            max_events: Maximum events kept per task (oldest are dropped)
+            max_connections: Maximum connections in the pool
+        """
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+        self.max_events = max_events
+        self.max_connections = max_connections
+        self._redis_client: redis.Redis | None = None
+        self._append: Any = None
+
+    async def __aenter__(self):
+        """Connect to Redis."""
+        self._redis_client = redis.from_url(
+            self.redis_url,
+            encoding="utf-8",
+            decode_responses=True,
+            max_connections=self.max_connections,
+        )
+        self._append = self._redis_client.register_script(_APPEND_SCRIPT)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Close the connection pool."""
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+
+    def _key(self, task_id: UUID) -> str:
+        return f"{self.key_prefix}:{task_id}"
+
+    async def append(self, task_id: UUID, event: TaskEvent) -> int | None:
+        """Append an event (errors are logged, not raised)."""
+        key = self._key(task_id)
+        try:
+            seq = await self._append(
+                keys=[f"{key}:seq", key],
+                args=[
+                    json.dumps(event, default=str),
+                    self.max_events,
+                    self.ttl_seconds,
+                ],
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Failed to log event for task {task_id}: {e}")
+            return None
+        return int(seq)
+
+    async def read(self, task_id: UUID, after: int = 0) -> list[TaskEvent]:
+        """Read the logged events of a task after a sequence number."""
+        assert self._redis_client is not None
+        events = [
+            json.loads(raw)
+            for raw in await self._redis_client.lrange(self._key(task_id), 0, -1)
+        ]
+        return [event for event in events if event["seq"] > after]
@@ -16,12 +16,14 @@ listing and clearing contexts.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
+from uuid import UUID
 
 from bindu.common.protocol.types import (
     ClearContextsRequest,
     ClearContextsResponse,
     ContextNotFoundError,
+    InvalidParamsError,
     ListContextsRequest,
     ListContextsResponse,
 )
@@ -37,21 +39,49 @@ class ContextHandlers:
 
     storage: Storage[Any]
     error_response_creator: Any = None
+    context_cleared_callback: Callable[[UUID], None] | None = None
+    """Called with the ID of a cleared context (drops cached worker history)."""
 
     @trace_context_operation("list_contexts")
     async def list_contexts(self, request: ListContextsRequest) -> ListContextsResponse:
-        """List all contexts in storage."""
-        # Support both 'length' and 'history_length' for backwards compatibility
-        params = request.get("params", {})
-        length = params.get("length") or params.get("history_length")
+        """List contexts newest first.
 
-        contexts = await self.storage.list_contexts(length)
+        With ``page_size`` or ``cursor`` the result is a page with a
+        ``next_cursor``; otherwise it is a plain list.
+        """
+        params = request.get("params", {})
+        paged = "page_size" in params or "cursor" in params
+        if paged:
+            page_size = params.get("page_size")
+        else:
+            # Support both 'length' and 'history_length' for backwards compatibility
+            page_size = params.get("length") or params.get("history_length")
+
+        if page_size is not None and page_size < 1:
+            return self.error_response_creator(
+                ListContextsResponse,
+                request["id"],
+                InvalidParamsError,
+                "page_size must be at least 1",
+            )
 
-        # Return empty list if no contexts, not an error
-        if contexts is None:
-            contexts = []
+        try:
+            page = await self.storage.list_contexts_page(
+                page_size,
+                params.get("cursor"),
+                created_after=params.get("created_after"),
+                created_before=params.get("created_before"),
+            )
+        except ValueError as e:
+            return self.error_response_creator(
+                ListContextsResponse, request["id"], InvalidParamsError, str(e)
+            )
 
-        return ListContextsResponse(jsonrpc="2.0", id=request["id"], result=contexts)
+        return ListContextsResponse(
+            jsonrpc="2.0",
+            id=request["id"],
+            result=page if paged else page["contexts"],
+        )
 
     @trace_context_operation("clear_context")
     async def clear_context(
@@ -70,6 +100,9 @@ class ContextHandlers:
                 ClearContextsResponse, request["id"], ContextNotFoundError, str(e)
             )
 
+        if self.context_cleared_callback is not None:
+            self.context_cleared_callback(context_id)
+
         return ClearContextsResponse(
             jsonrpc="2.0",
             id=request["id"],
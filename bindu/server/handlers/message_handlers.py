@@ -10,31 +10,48 @@
 """Message handlers for Bindu server.
 
 This module handles message-related RPC requests including
-sending messages and streaming responses.
+sending messages, streaming responses and resubscribing to streams.
 """
 
 from __future__ import annotations
 
-import inspect
 import json
-import uuid
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any
 
+from starlette.responses import StreamingResponse
+
 from bindu.common.protocol.types import (
+    MessageSendParams,
+    QueueFullError,
+    ResubscribeTaskRequest,
+    ResubscribeTaskResponse,
     SendMessageRequest,
     SendMessageResponse,
     StreamMessageRequest,
     Task,
+    TaskNotFoundError,
     TaskSendParams,
 )
+from bindu.settings import app_settings
 
+from bindu.utils.logging import get_logger
+from bindu.utils.request_utils import extract_error_fields
 from bindu.utils.task_telemetry import trace_task_operation, track_active_task
 
-from bindu.server.scheduler import Scheduler
+from bindu.server.events import (
+    INTERRUPTED_STATES,
+    EventBus,
+    TaskEvent,
+    status_update_event,
+)
+from bindu.server.scheduler import Scheduler, SchedulerQueueFullError
 from bindu.server.storage import Storage
 
+logger = get_logger("bindu.server.handlers.message_handlers")
+
 
 @dataclass
 class MessageHandlers:
@@ -42,8 +59,7 @@ class MessageHandlers:
 
     scheduler: Scheduler
     storage: Storage[Any]
-    manifest: Any | None = None
-    workers: list[Any] | None = None
+    event_bus: EventBus | None = None
     context_id_parser: Any = None
     push_manager: Any | None = None
 
@@ -56,11 +72,117 @@ class MessageHandlers:
         If the request reaches here, payment has already been verified.
         Settlement will be handled by ManifestWorker when task completes.
         """
-        message = request["params"]["message"]
+        task, scheduler_params = await self._submit_task(request["params"])
+
+        try:
+            await self.scheduler.run_task(scheduler_params)
+        except SchedulerQueueFullError as e:
+            return await self._reject_queue_full(request, task, e)
+        return SendMessageResponse(jsonrpc="2.0", id=request["id"], result=task)
+
+    async def stream_message(
+        self, request: StreamMessageRequest
+    ) -> StreamingResponse | SendMessageResponse:
+        """Stream messages using Server-Sent Events.
+
+        The task is scheduled like ``message/send`` and executed by a worker,
+        which publishes status changes and output chunks to the event bus. The
+        response subscribes to the task's events before scheduling it and
+        relays them until the final event. Disconnecting does not cancel the
+        task.
+
+        Returns:
+            StreamingResponse of SSE events, or a QueueFullError response if
+            the scheduler rejected the task
+        """
+        assert self.event_bus is not None, "message/stream requires an event bus"
+        task, scheduler_params = await self._submit_task(request["params"])
+        scheduler_params["stream"] = True
+
+        subscription = AsyncExitStack()
+        events = await subscription.enter_async_context(
+            self.event_bus.subscribe(task["id"])
+        )
+        try:
+            # The submitted event was published before the subscription existed
+            backlog = await self.event_bus.replay(task["id"]) or [
+                status_update_event(task["id"], task["context_id"], "submitted", False)
+            ]
+            await self.scheduler.run_task(scheduler_params)
+        except SchedulerQueueFullError as e:
+            await subscription.aclose()
+            return await self._reject_queue_full(request, task, e)
+        except BaseException:
+            await subscription.aclose()
+            raise
+
+        return StreamingResponse(
+            self._relay_events(task, events, backlog, 0, subscription),
+            media_type="text/event-stream",
+        )
+
+    async def resubscribe_task(
+        self, request: ResubscribeTaskRequest
+    ) -> StreamingResponse | ResubscribeTaskResponse:
+        """Reconnect to the event stream of a task using Server-Sent Events.
+
+        Events after ``last_event_id`` (the SSE id of the last event received,
+        also taken from the Last-Event-ID header) are replayed from the event
+        log, then live events are relayed until the final event. For a task
+        that already ended, the stream ends with its final status.
+
+        Returns:
+            StreamingResponse of SSE events, or a TaskNotFoundError response
+        """
+        assert self.event_bus is not None, "tasks/resubscribe requires an event bus"
+        task_id = request["params"]["task_id"]
+        after = request["params"].get("last_event_id", 0)
+
+        subscription = AsyncExitStack()
+        events = await subscription.enter_async_context(
+            self.event_bus.subscribe(task_id)
+        )
+        try:
+            task = await self.storage.load_task(
+                task_id, include_history=False, include_artifacts=False
+            )
+            if task is None:
+                await subscription.aclose()
+                code, message = extract_error_fields(TaskNotFoundError)
+                return ResubscribeTaskResponse(
+                    jsonrpc="2.0",
+                    id=request["id"],
+                    error=TaskNotFoundError(code=code, message=message),
+                )
+            backlog = await self.event_bus.replay(task_id, after)
+        except BaseException:
+            await subscription.aclose()
+            raise
+
+        return StreamingResponse(
+            self._relay_events(task, events, backlog, after, subscription),
+            media_type="text/event-stream",
+        )
+
+    async def _submit_task(
+        self, params: MessageSendParams
+    ) -> tuple[Task, TaskSendParams]:
+        """Store a new task for the message and build its scheduler parameters."""
+        message = params["message"]
         context_id = self.context_id_parser(message.get("context_id"))
 
+        # Pass payment context from message metadata to worker if available
+        # This is injected by the endpoint when x402 middleware verifies payment.
+        # Removed before storing, storage keeps its own copy of the message.
+        payment_context = message.get("metadata", {}).pop("_payment_context", None)
+
         # Submit task to storage
         task: Task = await self.storage.submit_task(context_id, message)
+        if self.event_bus is not None:
+            await self.event_bus.publish(
+                task["id"],
+                status_update_event(task["id"], context_id, "submitted", False),
+            )
 
         # Schedule task for execution
         scheduler_params: TaskSendParams = TaskSendParams(
@@ -70,9 +192,18 @@ class MessageHandlers:
         )
 
         # Add optional configuration parameters
-        config = request["params"].get("configuration", {})
+        config = params.get("configuration", {})
         if history_length := config.get("history_length"):
             scheduler_params["history_length"] = history_length
+        if priority := config.get("priority"):
+            scheduler_params["priority"] = priority
+
+        if payment_context is not None:
+            scheduler_params["payment_context"] = payment_context
+
+        # Set by the endpoint from the authenticated caller (fair-share queuing)
+        if fairness_key := params.pop("_fairness_key", None):
+            scheduler_params["fairness_key"] = fairness_key
 
         # A2A Protocol: Register push notification config if provided inline
         # Supports both inline (in message/send) and separate RPC registration
@@ -84,134 +215,80 @@ class MessageHandlers:
                 task["id"], push_config, persist=is_long_running
             )
 
-        # Pass payment context from message metadata to worker if available
-        # This is injected by the endpoint when x402 middleware verifies payment
-        message_metadata = message.get("metadata", {})
-        if "_payment_context" in message_metadata:
-            scheduler_params["payment_context"] = message_metadata["_payment_context"]
-            # Remove from message metadata to keep it clean (internal use only)
-            del message["metadata"]["_payment_context"]
-
-        await self.scheduler.run_task(scheduler_params)
-        return SendMessageResponse(jsonrpc="2.0", id=request["id"], result=task)
+        return task, scheduler_params
 
-    async def stream_message(self, request: StreamMessageRequest):
-        """Stream messages using Server-Sent Events.
+    async def _reject_queue_full(
+        self, request: SendMessageRequest, task: Task, error: SchedulerQueueFullError
+    ) -> SendMessageResponse:
+        """Mark a task that could not be queued as rejected and report overload.
+
+        The endpoint turns the QueueFullError into HTTP 503 with Retry-After.
+        """
+        logger.warning(f"Rejecting task {task['id']}: {error}")
+        await self.storage.update_task(task["id"], state="rejected")
+        if self.event_bus is not None:
+            await self.event_bus.publish(
+                task["id"],
+                status_update_event(task["id"], task["context_id"], "rejected", True),
+            )
+        code, message = extract_error_fields(QueueFullError)
+        return SendMessageResponse(
+            jsonrpc="2.0",
+            id=request["id"],
+            error=QueueFullError(code=code, message=message, data=str(error)),
+        )
 
-        This method returns a StreamingResponse directly to support SSE,
-        which will be handled at the application layer.
+    async def _relay_events(
+        self,
+        task: Task,
+        events: AsyncIterator[TaskEvent],
+        backlog: list[TaskEvent],
+        after: int,
+        subscription: AsyncExitStack,
+    ) -> AsyncIterator[str]:
+        """Yield replayed, then live events as SSE frames until the final one.
 
-        Note: Not fully implemented yet. #TODO
+        Live events already replayed (same or lower ``seq``) are skipped.
         """
-        from starlette.responses import StreamingResponse
+        last_seq = after
+        try:
+            for event in backlog:
+                last_seq = event.get("seq", last_seq)
+                yield self._format_sse(event)
+                if event.get("final"):
+                    return
 
-        message = request["params"]["message"]
-        context_id = self.context_id_parser(message.get("context_id"))
+            state = task["status"]["state"]
+            if (
+                state in app_settings.agent.terminal_states
+                or state in INTERRUPTED_STATES
+            ):
+                # Ended before the log caught up (or its events expired)
+                yield self._format_sse(
+                    status_update_event(task["id"], task["context_id"], state, True)
+                )
+                return
 
-        # similar to the "messages/send flow submit the task to the configured storage"
-        task: Task = await self.storage.submit_task(context_id, message)
+            async for event in events:
+                seq = event.get("seq")
+                if seq is not None:
+                    if seq <= last_seq:
+                        continue
+                    last_seq = seq
+                yield self._format_sse(event)
+                if event.get("final"):
+                    break
+        finally:
+            await subscription.aclose()
 
-        async def stream_generator():
-            """Generate a consumable stream based on the function which was decorated using pebblify."""
-            try:
-                await self.storage.update_task(task["id"], state="working")
-                # yield the initial status update event to indicate processing of the task has started
-                status_event = {
-                    "kind": "status-update",
-                    "task_id": str(task["id"]),
-                    "context_id": str(context_id),
-                    "status": {
-                        "state": "working",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                    "final": False,
-                }
-                yield f"data: {json.dumps(status_event)}\n\n"
-
-                if self.workers and self.manifest:
-                    worker = self.workers[0]
-                    message_history = await worker._build_complete_message_history(task)
-                    manifest_result = self.manifest.run(message_history)
-
-                    if inspect.isasyncgen(manifest_result):
-                        async for chunk in manifest_result:
-                            if chunk:
-                                artifact_event = {
-                                    "kind": "artifact-update",
-                                    "task_id": str(task["id"]),
-                                    "context_id": str(context_id),
-                                    "artifact": {
-                                        "artifact_id": str(uuid.uuid4()),
-                                        "name": "streaming_response",
-                                        "parts": [{"kind": "text", "text": str(chunk)}],
-                                    },
-                                    "append": True,
-                                    "last_chunk": False,
-                                }
-                                yield f"data: {json.dumps(artifact_event)}\n\n"
-
-                    elif inspect.isgenerator(manifest_result):
-                        for chunk in manifest_result:
-                            if chunk:
-                                artifact_event = {
-                                    "kind": "artifact-update",
-                                    "task_id": str(task["id"]),
-                                    "context_id": str(context_id),
-                                    "artifact": {
-                                        "artifact_id": str(uuid.uuid4()),
-                                        "name": "streaming_response",
-                                        "parts": [{"kind": "text", "text": str(chunk)}],
-                                    },
-                                    "append": True,
-                                    "last_chunk": False,
-                                }
-                                yield f"data: {json.dumps(artifact_event)}\n\n"
-
-                    else:
-                        if manifest_result:
-                            artifact_event = {
-                                "kind": "artifact-update",
-                                "task_id": str(task["id"]),
-                                "context_id": str(context_id),
-                                "artifact": {
-                                    "artifact_id": str(uuid.uuid4()),
-                                    "name": "response",
-                                    "parts": [
-                                        {"kind": "text", "text": str(manifest_result)}
-                                    ],
-                                },
-                                "last_chunk": True,
-                            }
-                            yield f"data: {json.dumps(artifact_event)}\n\n"
-
-                # Send completion status
-                completion_event = {
-                    "kind": "status-update",
-                    "task_id": str(task["id"]),
-                    "context_id": str(context_id),
-                    "status": {
-                        "state": "completed",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                    "final": True,
-                }
-                yield f"data: {json.dumps(completion_event)}\n\n"
-
-                # Update task state in storage
-                await self.storage.update_task(task["id"], state="completed")
-            except Exception as e:
-                error_event = {
-                    "kind": "status-update",
-                    "task_id": str(task["id"]),
-                    "context_id": str(context_id),
-                    "status": {
-                        "state": "failed",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    },
-                    "final": True,
-                    "error": str(e),
-                }
-                yield f"data: {json.dumps(error_event)}\n\n"
-                await self.storage.update_task(task["id"], state="failed")
-
-        return StreamingResponse(stream_generator(), media_type="text/event-stream")
+    @staticmethod
+    def _format_sse(event: TaskEvent) -> str:
+        """Encode a task event as a Server-Sent Events frame.
+
+        Logged events carry their sequence number as SSE id, which clients send
+        back as Last-Event-ID to resume with ``tasks/resubscribe``.
+        """
+        data = f"data: {json.dumps(event, default=str)}\n\n"
+        if "seq" in event:
+            return f"id: {event['seq']}\n{data}"
+        return data
@@ -24,6 +24,9 @@ from bindu.common.protocol.types import (
     CancelTaskResponse,
     GetTaskRequest,
     GetTaskResponse,
+    GetTasksRequest,
+    GetTasksResponse,
+    InvalidParamsError,
     ListTasksRequest,
     ListTasksResponse,
     TaskFeedbackRequest,
@@ -61,12 +64,42 @@ class TaskHandlers:
 
         return GetTaskResponse(jsonrpc="2.0", id=request["id"], result=task)
 
+    @trace_task_operation("get_tasks", include_params=False)
+    async def get_tasks(self, request: GetTasksRequest) -> GetTasksResponse:
+        """Get several tasks with one storage read.
+
+        Tasks are returned in the order of ``task_ids``; unknown IDs are left
+        out, so clients find missing tasks by comparing IDs. Each task's
+        history is limited by its entry in ``history_lengths``, else by
+        ``history_length``.
+        """
+        params = request["params"]
+        task_ids = list(dict.fromkeys(params["task_ids"]))
+        max_tasks = app_settings.agent.get_many_max_tasks
+
+        if len(task_ids) > max_tasks:
+            return self.error_response_creator(
+                GetTasksResponse,
+                request["id"],
+                InvalidParamsError,
+                f"At most {max_tasks} task IDs can be requested at once",
+            )
+
+        tasks = await self.storage.load_tasks(
+            task_ids,
+            params.get("history_length"),
+            history_lengths=params.get("history_lengths"),
+        )
+        return GetTasksResponse(jsonrpc="2.0", id=request["id"], result=tasks)
+
     @trace_task_operation("cancel_task")
     @track_active_task
     async def cancel_task(self, request: CancelTaskRequest) -> CancelTaskResponse:
         """Cancel a running task."""
         task_id = request["params"]["task_id"]
-        task = await self.storage.load_task(task_id)
+        task = await self.storage.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
 
         if task is None:
             return self.error_response_creator(
@@ -93,21 +126,51 @@ class TaskHandlers:
 
     @trace_task_operation("list_tasks", include_params=False)
     async def list_tasks(self, request: ListTasksRequest) -> ListTasksResponse:
-        """List all tasks in storage."""
-        tasks = await self.storage.list_tasks(request["params"].get("length"))
+        """List tasks newest first, as task summaries unless history is requested.
 
-        if tasks is None:
+        With ``page_size`` or ``cursor`` the result is a page with a
+        ``next_cursor``; otherwise it is a plain list of up to ``length`` tasks.
+        """
+        params = request["params"]
+        paged = "page_size" in params or "cursor" in params
+        page_size = params.get("page_size") if paged else params.get("length")
+
+        if page_size is not None and page_size < 1:
             return self.error_response_creator(
-                ListTasksResponse, request["id"], TaskNotFoundError, "No tasks found"
+                ListTasksResponse,
+                request["id"],
+                InvalidParamsError,
+                "page_size must be at least 1",
             )
 
-        return ListTasksResponse(jsonrpc="2.0", id=request["id"], result=tasks)
+        try:
+            page = await self.storage.list_tasks_page(
+                page_size,
+                params.get("cursor"),
+                state=params.get("state"),
+                context_id=params.get("context_id"),
+                created_after=params.get("created_after"),
+                created_before=params.get("created_before"),
+                include_history=params.get("include_history", False),
+                include_artifacts=params.get("include_artifacts", False),
+                history_length=params.get("history_length"),
+            )
+        except ValueError as e:
+            return self.error_response_creator(
+                ListTasksResponse, request["id"], InvalidParamsError, str(e)
+            )
+
+        return ListTasksResponse(
+            jsonrpc="2.0", id=request["id"], result=page if paged else page["tasks"]
+        )
 
     @trace_task_operation("task_feedback")
     async def task_feedback(self, request: TaskFeedbackRequest) -> TaskFeedbackResponse:
         """Submit feedback for a completed task."""
         task_id = request["params"]["task_id"]
-        task = await self.storage.load_task(task_id)
+        task = await self.storage.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
 
         if task is None:
             return self.error_response_creator(
@@ -60,6 +60,12 @@ class PrometheusMetrics:
         self._http_response_size_count = 0
         self._http_requests_in_flight = 0
 
+        # Scheduler queue gauges: {stat_name: value} (length, pending, lag, ...)
+        self._scheduler_queue: dict[str, int] = {}
+
+        # Storage memory gauges: {stat_name: value} (tasks, payload_bytes, ...)
+        self._storage_memory: dict[str, int] = {}
+
     def record_http_request(
         self,
         method: str,
@@ -162,6 +168,26 @@ class PrometheusMetrics:
         with self._lock:
             self._http_requests_in_flight = max(0, self._http_requests_in_flight - 1)
 
+    def set_scheduler_queue_stats(self, stats: dict[str, int]) -> None:
+        """Set scheduler queue gauges (depth, pending, lag) for autoscaling.
+
+        Args:
+            stats: Mapping of stat name to value, e.g. from
+                RedisStreamsScheduler.get_queue_stats()
+        """
+        with self._lock:
+            self._scheduler_queue = dict(stats)
+
+    def set_storage_memory_stats(self, stats: dict[str, int]) -> None:
+        """Set storage memory gauges (retained items, payload size, evictions).
+
+        Args:
+            stats: Mapping of stat name to value, e.g. from
+                InMemoryStorage.get_memory_stats()
+        """
+        with self._lock:
+            self._storage_memory = dict(stats)
+
     def generate_prometheus_text(self) -> str:
         """Generate Prometheus text format metrics.
 
@@ -281,6 +307,20 @@ class PrometheusMetrics:
                     f"http_response_size_bytes_count {self._http_response_size_count}"
                 )
 
+            # Scheduler queue gauges
+            for stat, value in sorted(self._scheduler_queue.items()):
+                lines.append("")
+                lines.append(f"# HELP scheduler_queue_{stat} Scheduler queue {stat}")
+                lines.append(f"# TYPE scheduler_queue_{stat} gauge")
+                lines.append(f"scheduler_queue_{stat} {value}")
+
+            # Storage memory gauges
+            for stat, value in sorted(self._storage_memory.items()):
+                lines.append("")
+                lines.append(f"# HELP storage_memory_{stat} In-memory storage {stat}")
+                lines.append(f"# TYPE storage_memory_{stat} gauge")
+                lines.append(f"storage_memory_{stat} {value}")
+
             # Requests in flight
             lines.append("")
             lines.append(
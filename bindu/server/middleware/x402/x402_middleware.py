@@ -32,7 +32,9 @@ from x402.types import (
     x402PaymentRequiredResponse,
 )
 
+from bindu.common.protocol.types import InvalidRequestError
 from bindu.utils.logging import get_logger
+from bindu.utils.request_utils import extract_error_fields, jsonrpc_error
 from bindu.extensions.x402 import X402AgentExtension
 from bindu.settings import app_settings
 
@@ -167,7 +169,6 @@ class X402Middleware(BaseHTTPMiddleware):
         try:
             body = await request.body()
             request_data = json.loads(body.decode("utf-8"))
-            method = request_data.get("method", "")
 
             # Recreate request with consumed body
             from starlette.requests import Request as StarletteRequest
@@ -177,6 +178,26 @@ class X402Middleware(BaseHTTPMiddleware):
 
             request = StarletteRequest(request.scope, receive)
 
+            # A batch cannot carry one payment per call, so paid methods
+            # have to be sent as single requests
+            if isinstance(request_data, list):
+                methods = {
+                    item.get("method")
+                    for item in request_data
+                    if isinstance(item, dict)
+                }
+                paid = sorted(methods.intersection(app_settings.x402.protected_methods))
+                if paid:
+                    code, message = extract_error_fields(InvalidRequestError)
+                    return jsonrpc_error(
+                        code,
+                        message,
+                        f"Payment-protected methods cannot be batched: {', '.join(paid)}",
+                    )
+                return await call_next(request)
+
+            method = request_data.get("method", "")
+
             # Check if method requires payment (configured in settings)
             if method not in app_settings.x402.protected_methods:
                 logger.debug(
@@ -24,6 +24,8 @@ Think of this as the restaurant's order board system catalog:
 2. SCHEDULER IMPLEMENTATIONS:
    - InMemoryScheduler: Simple whiteboard system (development/testing)
    - RedisScheduler: Distributed cloud system (production/multi-process)
+   - RedisStreamsScheduler: Distributed system with order receipts - an order
+     stays on the board until the cook confirms it is done
 
 3. TASK OPERATIONS:
    - TaskOperation: Union type for all task operations (run, cancel, pause, resume)
@@ -37,22 +39,31 @@ Think of this as the restaurant's order board system catalog:
 AVAILABLE SCHEDULER OPTIONS:
 - InMemoryScheduler: Fast in-memory task queue for single-process deployments
 - RedisScheduler: Distributed task queue using Redis for multi-process systems
+- RedisStreamsScheduler: Redis Streams consumer groups with acknowledged,
+  at-least-once delivery and reclaiming of stalled tasks
 """
 
 from __future__ import annotations as _annotations
 
 # Export the base scheduler interface
-from .base import Scheduler, TaskOperation
+from .base import Scheduler, SchedulerQueueFullError, TaskOperation
+from .fair_queue import FairQueue, FairSharePolicy
 
 # Export all scheduler implementations
 from .memory_scheduler import InMemoryScheduler
 from .redis_scheduler import RedisScheduler
+from .redis_streams_scheduler import RedisStreamsScheduler
 
 __all__ = [
     # Base interface
     "Scheduler",
+    "SchedulerQueueFullError",
     "TaskOperation",
+    # Fair-share queuing
+    "FairQueue",
+    "FairSharePolicy",
     # Scheduler implementations
     "InMemoryScheduler",
     "RedisScheduler",
+    "RedisStreamsScheduler",
 ]
@@ -3,21 +3,40 @@
 from __future__ import annotations as _annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from typing import Annotated, Any, Generic, Literal, TypeVar
+from uuid import UUID
 
 from opentelemetry.trace import Span, get_tracer
 from pydantic import Discriminator
-from typing_extensions import Self, TypedDict
+from typing_extensions import NotRequired, Self, TypedDict
 
 from bindu.common.protocol.types import TaskIdParams, TaskSendParams
 from bindu.utils.logging import get_logger
 
 tracer = get_tracer(__name__)
+
+InterruptKind = Literal["cancel", "pause"]
+
+TaskInterrupt = tuple[InterruptKind, UUID]
+"""Broadcast request to interrupt a running task: (kind, task_id)."""
 logger = get_logger("bindu.server.scheduler.base")
 
 
+class SchedulerQueueFullError(Exception):
+    """Raised by ``run_task`` when a bounded scheduler queue is at capacity.
+
+    The task is not queued; callers should reject the request and ask the
+    client to retry later instead of waiting for a free slot.
+    """
+
+    def __init__(self, max_queue_size: int):
+        """Initialize with the capacity of the full queue."""
+        super().__init__(f"Scheduler queue is full ({max_queue_size} operations)")
+        self.max_queue_size = max_queue_size
+
+
 @dataclass
 class Scheduler(ABC):
     """The scheduler class is in charge of scheduling the tasks."""
@@ -60,6 +79,40 @@ class Scheduler(ABC):
         between the workers.
         """
 
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Acknowledge that a received task operation has been handled.
+
+        Called by the worker once an operation finished (successfully or not).
+        Brokers with at-least-once delivery override this to drop the operation
+        from their pending list; operations that are never acknowledged (e.g.
+        the worker crashed) are redelivered. Default is a no-op.
+        """
+
+    def set_consumer_capacity(self, free_slots: Callable[[], int]) -> None:
+        """Tell the scheduler how many operations its worker can start right now.
+
+        Called once by the worker before it starts receiving. ``free_slots()``
+        is evaluated whenever the next operation is requested. Brokers that
+        fetch several entries per round trip use it to avoid reserving work a
+        saturated worker cannot start. Default ignores it.
+        """
+
+    async def receive_interrupts(self) -> AsyncIterator[TaskInterrupt]:
+        """Receive cancel/pause requests for tasks anywhere in the deployment.
+
+        A cancel or pause operation is consumed by a single worker, which may
+        not be the one executing the task - or it may wait behind the task it
+        should interrupt. Schedulers override this to broadcast interrupts so
+        every worker can act on its in-flight executions. Default yields nothing.
+        """
+        return
+        yield  # pragma: no cover - makes this an async generator
+
+
+def fairness_key(params: TaskSendParams) -> str:
+    """Key a run operation is fair-queued under (defaults to its context)."""
+    return params.get("fairness_key") or str(params["context_id"])
+
 
 OperationT = TypeVar("OperationT")
 ParamsT = TypeVar("ParamsT")
@@ -71,6 +124,12 @@ class _TaskOperation(TypedDict, Generic[OperationT, ParamsT]):
     operation: OperationT
     params: ParamsT
     _current_span: Span
+    _enqueued_at: NotRequired[float]
+    """Wall-clock time (epoch seconds) the operation was scheduled."""
+    _delivery_id: NotRequired[str]
+    """Broker-specific delivery handle used to acknowledge the operation."""
+    _fair_key: NotRequired[str]
+    """Fairness key the operation was dequeued under (fair-share policy)."""
 
 
 _RunTask = _TaskOperation[Literal["run"], TaskSendParams]
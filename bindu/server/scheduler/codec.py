@@ -0,0 +1,221 @@
+"""Typed wire codec for scheduler task operations.
+
+Task operations cross process boundaries (Redis) as bytes. Encoding used to copy
+the whole params tree to stringify UUIDs, and decoding tried ``UUID(s)`` on every
+string - including message text. This codec instead compiles, once, a schema of
+where UUIDs live in ``TaskSendParams``/``TaskIdParams`` (from the protocol
+TypedDicts) and only touches those fields.
+
+Wire formats:
+- json:    orjson (serializes UUIDs natively, no pre-walk); human-readable
+- msgpack: compact binary, UUIDs as 16-byte ext values (requires ``msgpack``)
+"""
+
+from __future__ import annotations as _annotations
+
+import types
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+import orjson
+from typing_extensions import NotRequired, Required, is_typeddict
+
+from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None  # type: ignore[assignment]
+    MSGPACK_AVAILABLE = False
+
+WireFormat = Literal["json", "msgpack"]
+
+WIRE_FORMATS: tuple[str, ...] = ("json", "msgpack")
+
+_UUID_EXT_CODE = 1
+
+
+class _UUIDField:
+    """Schema marker: the value is a UUID."""
+
+
+class _UUIDListField:
+    """Schema marker: the value is a list of UUIDs."""
+
+
+UUID_FIELD = _UUIDField()
+UUID_LIST_FIELD = _UUIDListField()
+
+FieldSchema = _UUIDField | _UUIDListField | dict[str, Any]
+
+
+def _unwrap(annotation: Any) -> Any:
+    """Strip Required/NotRequired/Annotated wrappers from an annotation."""
+    while get_origin(annotation) in (Required, NotRequired) or hasattr(
+        annotation, "__metadata__"
+    ):
+        annotation = get_args(annotation)[0]
+    return annotation
+
+
+def _compile_field(annotation: Any, seen: frozenset[type]) -> FieldSchema | None:
+    annotation = _unwrap(annotation)
+
+    if annotation is UUID:
+        return UUID_FIELD
+
+    origin = get_origin(annotation)
+    if origin is list:
+        (item,) = get_args(annotation) or (Any,)
+        return UUID_LIST_FIELD if _unwrap(item) is UUID else None
+
+    if origin in (Union, types.UnionType):
+        # Merge UUID locations of all TypedDict members (e.g. Part variants)
+        merged: dict[str, Any] = {}
+        for member in get_args(annotation):
+            sub = _compile_field(member, seen)
+            if isinstance(sub, dict):
+                merged.update(sub)
+        return merged or None
+
+    if is_typeddict(annotation) and annotation not in seen:
+        return compile_uuid_schema(annotation, seen) or None
+
+    return None
+
+
+def compile_uuid_schema(
+    typed_dict: type, seen: frozenset[type] = frozenset()
+) -> dict[str, FieldSchema]:
+    """Compile the locations of UUID fields in a TypedDict.
+
+    Args:
+        typed_dict: Protocol TypedDict class (e.g. TaskSendParams)
+        seen: TypedDicts already on the path (guards recursive types)
+
+    Returns:
+        Nested mapping of field name to UUID marker or sub-schema. Fields that
+        cannot contain UUIDs are omitted.
+    """
+    seen = seen | {typed_dict}
+    schema: dict[str, FieldSchema] = {}
+    for name, annotation in get_type_hints(typed_dict, include_extras=True).items():
+        field_schema = _compile_field(annotation, seen)
+        if field_schema is not None:
+            schema[name] = field_schema
+    return schema
+
+
+def _to_uuid(value: Any) -> Any:
+    """Convert a string to UUID, leaving values that are not valid UUIDs as-is."""
+    if isinstance(value, str):
+        try:
+            return UUID(value)
+        except ValueError:
+            return value
+    return value
+
+
+def restore_uuids(data: dict[str, Any], schema: dict[str, FieldSchema]) -> None:
+    """Convert UUID strings back to UUIDs in place, visiting schema fields only."""
+    for name, field_schema in schema.items():
+        value = data.get(name)
+        if value is None:
+            continue
+        if field_schema is UUID_FIELD:
+            data[name] = _to_uuid(value)
+        elif field_schema is UUID_LIST_FIELD:
+            if isinstance(value, list):
+                data[name] = [_to_uuid(item) for item in value]
+        elif isinstance(value, dict):
+            restore_uuids(value, field_schema)  # type: ignore[arg-type]
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    restore_uuids(item, field_schema)  # type: ignore[arg-type]
+
+
+TASK_SEND_PARAMS_SCHEMA = compile_uuid_schema(TaskSendParams)
+TASK_ID_PARAMS_SCHEMA = compile_uuid_schema(TaskIdParams)
+
+PARAMS_SCHEMAS: dict[str, dict[str, FieldSchema]] = {
+    "run": TASK_SEND_PARAMS_SCHEMA,
+    "cancel": TASK_ID_PARAMS_SCHEMA,
+    "pause": TASK_ID_PARAMS_SCHEMA,
+    "resume": TASK_ID_PARAMS_SCHEMA,
+}
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, UUID):
+        return msgpack.ExtType(_UUID_EXT_CODE, obj.bytes)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == _UUID_EXT_CODE:
+        return UUID(bytes=data)
+    return msgpack.ExtType(code, data)
+
+
+class TaskOperationCodec:
+    """Encode/decode task operation envelopes for the scheduler wire.
+
+    The envelope is a plain dict ``{"operation", "params", ...}``; any extra keys
+    (e.g. trace context) are carried through unchanged.
+    """
+
+    def __init__(self, wire_format: WireFormat = "json"):
+        """Initialize the codec.
+
+        Args:
+            wire_format: "json" (default) or "msgpack" (compact binary)
+
+        Raises:
+            ValueError: If the wire format is unknown or msgpack is not installed
+        """
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(
+                f"Unknown wire format: {wire_format}. "
+                f"Supported formats: {', '.join(WIRE_FORMATS)}"
+            )
+        if wire_format == "msgpack" and not MSGPACK_AVAILABLE:
+            raise ValueError(
+                "msgpack wire format requires msgpack package. "
+                "Install with: pip install msgpack"
+            )
+        self.wire_format = wire_format
+
+    @property
+    def is_binary(self) -> bool:
+        """Whether encoded payloads are arbitrary bytes (not UTF-8 text)."""
+        return self.wire_format == "msgpack"
+
+    def encode(self, envelope: dict[str, Any]) -> bytes:
+        """Serialize an envelope; UUIDs are handled natively, without a pre-walk."""
+        if self.wire_format == "msgpack":
+            return msgpack.packb(envelope, default=_msgpack_default)
+        return orjson.dumps(envelope)
+
+    def decode(self, payload: bytes | str) -> dict[str, Any]:
+        """Deserialize an envelope and restore UUID fields of its params.
+
+        Raises:
+            ValueError: If the payload cannot be decoded
+        """
+        if self.wire_format == "msgpack":
+            try:
+                envelope = msgpack.unpackb(payload, ext_hook=_msgpack_ext_hook)
+            except Exception as e:
+                raise ValueError(f"Invalid msgpack payload: {e}") from e
+            # UUIDs round-trip as ext values - nothing left to restore
+            return envelope
+
+        envelope = orjson.loads(payload)  # JSONDecodeError is a ValueError
+        schema = PARAMS_SCHEMAS.get(envelope.get("operation"))
+        params = envelope.get("params")
+        if schema and isinstance(params, dict):
+            restore_uuids(params, schema)
+        return envelope
@@ -16,19 +16,24 @@ Usage:
 
 from __future__ import annotations as _annotations
 
+from typing import Any
+
 from bindu.common.models import SchedulerConfig
 from bindu.utils.logging import get_logger
 
 from .base import Scheduler
+from .fair_queue import FairSharePolicy
 from .memory_scheduler import InMemoryScheduler
 
 # Import RedisScheduler conditionally
 try:
     from .redis_scheduler import RedisScheduler
+    from .redis_streams_scheduler import RedisStreamsScheduler
 
     REDIS_AVAILABLE = True
 except ImportError:
     RedisScheduler = None  # type: ignore[assignment]  # redis not installed
+    RedisStreamsScheduler = None  # type: ignore[assignment]
     REDIS_AVAILABLE = False
 
 logger = get_logger("bindu.server.scheduler.factory")
@@ -43,6 +48,7 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
     Supported backends:
     - "memory": InMemoryScheduler (default, single-process)
     - "redis": RedisScheduler (distributed, multi-process)
+    - "redis-streams": RedisStreamsScheduler (distributed, acknowledged delivery)
 
     Args:
         config: Scheduler configuration. If None, uses app_settings.scheduler.
@@ -68,11 +74,14 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
         logger.info(f"No scheduler config provided, using settings: {backend}")
 
         if backend == "memory":
-            return InMemoryScheduler()
-        elif backend == "redis":
+            return InMemoryScheduler(
+                fair_share=_fair_share_policy(),
+                max_queue_size=_config_or_setting(None, "max_queue_size"),
+            )
+        elif backend in ("redis", "redis-streams"):
             # Build config from settings
             config = SchedulerConfig(
-                type="redis",
+                type=backend,
                 redis_url=scheduler_settings.redis_url,
                 redis_host=scheduler_settings.redis_host or "localhost",
                 redis_port=scheduler_settings.redis_port or 6379,
@@ -82,6 +91,11 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
                 max_connections=scheduler_settings.max_connections,
                 retry_on_timeout=scheduler_settings.retry_on_timeout,
                 poll_timeout=scheduler_settings.poll_timeout,
+                wire_format=scheduler_settings.wire_format,
+                consumer_group=scheduler_settings.consumer_group,
+                read_count=scheduler_settings.read_count,
+                claim_min_idle_ms=scheduler_settings.claim_min_idle_ms,
+                stream_maxlen=scheduler_settings.stream_maxlen,
             )
         else:
             raise ValueError(f"Unknown scheduler backend in settings: {backend}")
@@ -90,35 +104,46 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
 
     logger.info(f"Creating scheduler backend: {backend}")
 
+    fair_share = _fair_share_policy(config)
+
     if backend == "memory":
         logger.info("Using in-memory scheduler (single-process)")
-        return InMemoryScheduler()
+        return InMemoryScheduler(
+            fair_share=fair_share,
+            max_queue_size=_config_or_setting(config, "max_queue_size"),
+        )
 
-    elif backend == "redis":
+    elif backend in ("redis", "redis-streams"):
         if not REDIS_AVAILABLE or RedisScheduler is None:
             raise ValueError(
                 "Redis scheduler requires redis package. "
                 "Install with: pip install redis[hiredis]"
             )
 
-        logger.info("Using Redis scheduler (distributed, multi-process)")
+        redis_url = _resolve_redis_url(config)
 
-        # Validate redis_url is provided
-        redis_url = config.redis_url
-        if not redis_url:
-            # Try to construct URL from individual components if provided
-            if (
-                config.redis_host
-                and config.redis_port is not None
-                and config.redis_db is not None
-            ):
-                auth = f":{config.redis_password}@" if config.redis_password else ""
-                redis_url = f"redis://{auth}{config.redis_host}:{config.redis_port}/{config.redis_db}"
-            else:
-                raise ValueError(
-                    "Redis scheduler requires a Redis URL. "
-                    "Please provide it via REDIS_URL environment variable or config."
+        if backend == "redis-streams":
+            logger.info(
+                "Using Redis Streams scheduler (distributed, acknowledged delivery)"
+            )
+            if fair_share:
+                logger.warning(
+                    "queue_policy=fair is not supported by redis-streams, using FIFO"
                 )
+            return RedisStreamsScheduler(
+                redis_url=redis_url,
+                queue_name=config.queue_name,
+                max_connections=config.max_connections,
+                retry_on_timeout=config.retry_on_timeout,
+                poll_timeout=config.poll_timeout,
+                wire_format=config.wire_format,
+                consumer_group=config.consumer_group,
+                read_count=config.read_count,
+                claim_min_idle_ms=config.claim_min_idle_ms,
+                stream_maxlen=config.stream_maxlen,
+            )
+
+        logger.info("Using Redis scheduler (distributed, multi-process)")
 
         scheduler = RedisScheduler(
             redis_url=redis_url,
@@ -126,15 +151,60 @@ async def create_scheduler(config: SchedulerConfig | None = None) -> Scheduler:
             max_connections=config.max_connections,
             retry_on_timeout=config.retry_on_timeout,
             poll_timeout=config.poll_timeout,
+            wire_format=config.wire_format,
+            fair_share=fair_share,
         )
 
         return scheduler
 
     else:
         raise ValueError(
-            f"Unknown scheduler backend: {backend}. Supported backends: memory, redis"
+            f"Unknown scheduler backend: {backend}. Supported backends: memory, redis, redis-streams"
+        )
+
+
+def _fair_share_policy(
+    config: SchedulerConfig | None = None,
+) -> FairSharePolicy | None:
+    """Build the fair-share policy (None for FIFO); unset config fields use settings."""
+    if _config_or_setting(config, "queue_policy") != "fair":
+        return None
+    return FairSharePolicy(
+        priority_weights=_config_or_setting(config, "priority_weights"),
+        max_in_flight_per_key=_config_or_setting(config, "max_in_flight_per_key"),
+        in_flight_lease_seconds=_config_or_setting(config, "in_flight_lease_seconds"),
+    )
+
+
+def _config_or_setting(config: SchedulerConfig | None, name: str) -> Any:
+    """Return a SchedulerConfig field, falling back to the scheduler settings."""
+    from bindu.settings import app_settings
+
+    value = getattr(config, name, None) if config else None
+    return getattr(app_settings.scheduler, name) if value is None else value
+
+
+def _resolve_redis_url(config: SchedulerConfig) -> str:
+    """Return the Redis URL from config, building it from components if needed."""
+    if config.redis_url:
+        return config.redis_url
+
+    # Try to construct URL from individual components if provided
+    if (
+        config.redis_host
+        and config.redis_port is not None
+        and config.redis_db is not None
+    ):
+        auth = f":{config.redis_password}@" if config.redis_password else ""
+        return (
+            f"redis://{auth}{config.redis_host}:{config.redis_port}/{config.redis_db}"
         )
 
+    raise ValueError(
+        "Redis scheduler requires a Redis URL. "
+        "Please provide it via REDIS_URL environment variable or config."
+    )
+
 
 async def close_scheduler(scheduler: Scheduler) -> None:
     """Close scheduler connection gracefully.
@@ -0,0 +1,175 @@
+"""Priority and fair-share queuing for scheduler backends.
+
+A plain FIFO lets one tenant bursting thousands of ``message/send`` calls starve
+everyone else. With the ``fair`` queue policy, run operations are queued per
+(priority, fairness key):
+
+- Priorities (high/normal/low) are served by smooth weighted round-robin, so
+  interactive traffic keeps low latency while batch traffic is still drained.
+- Within a priority, fairness keys (context ID, client DID or OAuth subject)
+  take turns: one operation per key per round.
+- Optionally, each key may only have ``max_in_flight_per_key`` operations
+  running at once; keys at their cap are skipped until an operation is acked.
+
+The Redis scheduler implements the same algorithm server-side in Lua.
+"""
+
+from __future__ import annotations as _annotations
+
+from collections import Counter, OrderedDict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Generic, Literal, TypeVar, get_args
+
+from bindu.common.protocol.types import TaskPriority
+
+QueuePolicy = Literal["fifo", "fair"]
+
+FairnessKeySource = Literal["context_id", "client_did", "subject"]
+
+PRIORITIES: tuple[str, ...] = get_args(TaskPriority)
+
+DEFAULT_PRIORITY: TaskPriority = "normal"
+
+DEFAULT_PRIORITY_WEIGHTS: Mapping[str, int] = MappingProxyType(
+    {"high": 8, "normal": 4, "low": 1}
+)
+
+ItemT = TypeVar("ItemT")
+
+
+@dataclass(frozen=True)
+class FairSharePolicy:
+    """Dequeue policy of the fair-share queue."""
+
+    priority_weights: Mapping[str, int] = field(
+        default_factory=lambda: dict(DEFAULT_PRIORITY_WEIGHTS)
+    )
+    """Relative share of dequeues per priority level."""
+
+    max_in_flight_per_key: int | None = None
+    """Maximum operations running at once per fairness key (None = unlimited)."""
+
+    in_flight_lease_seconds: int = 3600
+    """Distributed backends: an unacked operation stops counting against its
+    key's cap after this long (covers workers that crashed mid-task)."""
+
+    def __post_init__(self) -> None:
+        """Validate weights and caps."""
+        unknown = set(self.priority_weights) - set(PRIORITIES)
+        if unknown:
+            raise ValueError(
+                f"Unknown priorities {sorted(unknown)}. "
+                f"Supported priorities: {', '.join(PRIORITIES)}"
+            )
+        if any(weight < 1 for weight in self.priority_weights.values()):
+            raise ValueError("Priority weights must be >= 1")
+        if self.max_in_flight_per_key is not None and self.max_in_flight_per_key < 1:
+            raise ValueError("max_in_flight_per_key must be >= 1")
+        if self.in_flight_lease_seconds < 1:
+            raise ValueError("in_flight_lease_seconds must be >= 1")
+
+    def weight(self, priority: str) -> int:
+        """Weight of a priority level (1 if not configured)."""
+        return self.priority_weights.get(priority, 1)
+
+
+def normalize_priority(priority: str | None) -> str:
+    """Return a known priority, falling back to the default."""
+    return priority if priority in PRIORITIES else DEFAULT_PRIORITY
+
+
+class FairQueue(Generic[ItemT]):
+    """In-memory priority queue with per-key round-robin and concurrency caps.
+
+    Not thread-safe; meant to be used from a single event loop.
+    """
+
+    def __init__(self, policy: FairSharePolicy | None = None):
+        """Initialize an empty queue.
+
+        Args:
+            policy: Dequeue policy (default weights, no per-key cap)
+        """
+        self.policy = policy or FairSharePolicy()
+        # priority -> key -> pending items; dict order is the round-robin ring
+        self._queues: dict[str, OrderedDict[str, deque[ItemT]]] = {
+            priority: OrderedDict() for priority in PRIORITIES
+        }
+        self._current_weights: dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self._in_flight: Counter[str] = Counter()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of queued (not yet dequeued) items."""
+        return self._size
+
+    def push(self, item: ItemT, key: str, priority: str | None = None) -> None:
+        """Queue an item under a fairness key and priority."""
+        ring = self._queues[normalize_priority(priority)]
+        ring.setdefault(key, deque()).append(item)
+        self._size += 1
+
+    def pop(self) -> tuple[ItemT, str] | None:
+        """Dequeue the next item.
+
+        Returns:
+            (item, fairness key), or None if nothing is eligible - the queue is
+            empty or every key with pending items is at its concurrency cap
+        """
+        eligible = {
+            priority: key
+            for priority in PRIORITIES
+            if (key := self._next_eligible_key(priority)) is not None
+        }
+        if not eligible:
+            return None
+
+        priority = self._select_priority(eligible)
+        key = eligible[priority]
+        ring = self._queues[priority]
+        pending = ring[key]
+        item = pending.popleft()
+        if pending:
+            ring.move_to_end(key)
+        else:
+            del ring[key]
+
+        self._size -= 1
+        self._in_flight[key] += 1
+        return item, key
+
+    def release(self, key: str) -> None:
+        """Mark an item dequeued under ``key`` as finished."""
+        if self._in_flight[key] <= 1:
+            self._in_flight.pop(key, None)
+        else:
+            self._in_flight[key] -= 1
+
+    def in_flight(self, key: str) -> int:
+        """Number of dequeued, unreleased items for a key."""
+        return self._in_flight[key]
+
+    def _next_eligible_key(self, priority: str) -> str | None:
+        cap = self.policy.max_in_flight_per_key
+        for key in self._queues[priority]:
+            if cap is None or self._in_flight[key] < cap:
+                return key
+        return None
+
+    def _select_priority(self, eligible: Mapping[str, str]) -> str:
+        """Smooth weighted round-robin over priorities that can be served."""
+        total = 0
+        best: str | None = None
+        for priority in eligible:
+            weight = self.policy.weight(priority)
+            total += weight
+            self._current_weights[priority] += weight
+            if best is None or (
+                self._current_weights[priority] > self._current_weights[best]
+            ):
+                best = priority
+        assert best is not None
+        self._current_weights[best] -= total
+        return best
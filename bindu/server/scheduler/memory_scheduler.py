@@ -2,39 +2,73 @@
 
 from __future__ import annotations as _annotations
 
+import time
+from collections import deque
 from collections.abc import AsyncIterator
 from contextlib import AsyncExitStack
+from dataclasses import dataclass
 from typing import Any
+from uuid import UUID
 
 import anyio
+from anyio.streams.memory import MemoryObjectSendStream
 from opentelemetry.trace import get_current_span
 
 from bindu.common.protocol.types import TaskIdParams, TaskSendParams
 from bindu.server.scheduler.base import (
+    InterruptKind,
     Scheduler,
+    SchedulerQueueFullError,
+    TaskInterrupt,
     TaskOperation,
     _CancelTask,
     _PauseTask,
     _ResumeTask,
     _RunTask,
+    fairness_key,
 )
+from bindu.server.scheduler.fair_queue import FairQueue, FairSharePolicy
 from bindu.utils.logging import get_logger
 from bindu.utils.retry import retry_scheduler_operation
 
 logger = get_logger("bindu.server.scheduler.memory_scheduler")
 
 
+@dataclass
 class InMemoryScheduler(Scheduler):
-    """A scheduler that schedules tasks in memory."""
+    """A scheduler that schedules tasks in memory.
+
+    By default operations are handed over to the worker one at a time (FIFO,
+    enqueue waits for a free worker). With a ``fair_share`` policy, run
+    operations are buffered in a FairQueue instead and dequeued by priority and
+    fairness key; control operations (cancel/pause/resume) always go first.
+
+    With ``max_queue_size`` set, up to that many run operations are buffered
+    and ``run_task`` returns immediately; once the buffer is full it raises
+    SchedulerQueueFullError instead of waiting, so callers can shed load.
+    """
+
+    fair_share: FairSharePolicy | None = None
+    """Priority/fair-share dequeue policy (None keeps strict FIFO)."""
+
+    max_queue_size: int | None = None
+    """Maximum buffered run operations (None = hand over to the worker directly)."""
 
     async def __aenter__(self):
         """Enter async context manager."""
+        self._interrupt_listeners: set[MemoryObjectSendStream[TaskInterrupt]] = set()
+        self._fair_queue: FairQueue[TaskOperation] | None = (
+            FairQueue(self.fair_share) if self.fair_share else None
+        )
+        self._control_queue: deque[TaskOperation] = deque()
+        self._wakeup = anyio.Event()
+        self._rejected = 0
         self.aexit_stack = AsyncExitStack()
         await self.aexit_stack.__aenter__()
 
         self._write_stream, self._read_stream = anyio.create_memory_object_stream[
             TaskOperation
-        ]()
+        ](max_buffer_size=self.max_queue_size or 0)
         await self.aexit_stack.enter_async_context(self._read_stream)
         await self.aexit_stack.enter_async_context(self._write_stream)
 
@@ -48,27 +82,44 @@ class InMemoryScheduler(Scheduler):
     async def run_task(self, params: TaskSendParams) -> None:
         """Schedule a task for execution."""
         logger.debug(f"Running task: {params}")
-        await self._write_stream.send(
-            _RunTask(operation="run", params=params, _current_span=get_current_span())
+        await self._enqueue(
+            _RunTask(
+                operation="run",
+                params=params,
+                _current_span=get_current_span(),
+                _enqueued_at=time.time(),
+            )
         )
 
     @retry_scheduler_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def cancel_task(self, params: TaskIdParams) -> None:
-        """Cancel a scheduled task."""
+        """Cancel a scheduled task.
+
+        Listeners are notified immediately, so a worker whose slots are all busy
+        can still interrupt the running task before the cancel op is pulled.
+        """
         logger.debug(f"Canceling task: {params}")
-        await self._write_stream.send(
+        self._broadcast_interrupt("cancel", params["task_id"])
+        await self._enqueue(
             _CancelTask(
-                operation="cancel", params=params, _current_span=get_current_span()
+                operation="cancel",
+                params=params,
+                _current_span=get_current_span(),
+                _enqueued_at=time.time(),
             )
         )
 
     @retry_scheduler_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def pause_task(self, params: TaskIdParams) -> None:
-        """Pause a running task."""
+        """Pause a running task (listeners are notified immediately)."""
         logger.debug(f"Pausing task: {params}")
-        await self._write_stream.send(
+        self._broadcast_interrupt("pause", params["task_id"])
+        await self._enqueue(
             _PauseTask(
-                operation="pause", params=params, _current_span=get_current_span()
+                operation="pause",
+                params=params,
+                _current_span=get_current_span(),
+                _enqueued_at=time.time(),
             )
         )
 
@@ -76,13 +127,106 @@ class InMemoryScheduler(Scheduler):
     async def resume_task(self, params: TaskIdParams) -> None:
         """Resume a paused task."""
         logger.debug(f"Resuming task: {params}")
-        await self._write_stream.send(
+        await self._enqueue(
             _ResumeTask(
-                operation="resume", params=params, _current_span=get_current_span()
+                operation="resume",
+                params=params,
+                _current_span=get_current_span(),
+                _enqueued_at=time.time(),
             )
         )
 
+    async def _enqueue(self, task_operation: TaskOperation) -> None:
+        is_run = task_operation["operation"] == "run"
+        if self._fair_queue is None:
+            if is_run and self.max_queue_size:
+                try:
+                    self._write_stream.send_nowait(task_operation)
+                except anyio.WouldBlock:
+                    self._reject()
+                return
+            # Control operations wait for room rather than being dropped
+            await self._write_stream.send(task_operation)
+            return
+
+        if is_run:
+            if self.max_queue_size and len(self._fair_queue) >= self.max_queue_size:
+                self._reject()
+            params = task_operation["params"]
+            self._fair_queue.push(
+                task_operation, fairness_key(params), params.get("priority")
+            )
+        else:
+            self._control_queue.append(task_operation)
+        self._wakeup.set()
+
+    def _reject(self) -> None:
+        assert self.max_queue_size is not None
+        self._rejected += 1
+        raise SchedulerQueueFullError(self.max_queue_size)
+
+    def _dequeue(self) -> TaskOperation | None:
+        if self._control_queue:
+            return self._control_queue.popleft()
+        assert self._fair_queue is not None
+        entry = self._fair_queue.pop()
+        if entry is None:
+            return None
+        task_operation, key = entry
+        task_operation["_fair_key"] = key
+        return task_operation
+
     async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
         """Receive task operations from the scheduler."""
-        async for task_operation in self._read_stream:
+        if self._fair_queue is None:
+            async for task_operation in self._read_stream:
+                yield task_operation
+            return
+
+        while True:
+            task_operation = self._dequeue()
+            if task_operation is None:
+                # Wait for a new operation or for a capped key to free up
+                self._wakeup = anyio.Event()
+                await self._wakeup.wait()
+                continue
             yield task_operation
+
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Release the fairness key's concurrency slot of a finished operation."""
+        key = task_operation.get("_fair_key")
+        if self._fair_queue is not None and key is not None:
+            self._fair_queue.release(key)
+            self._wakeup.set()
+
+    async def get_queue_length(self) -> int:
+        """Number of buffered operations (always 0 in FIFO hand-over mode)."""
+        if self._fair_queue is None:
+            return self._read_stream.statistics().current_buffer_used
+        return len(self._control_queue) + len(self._fair_queue)
+
+    async def get_queue_stats(self) -> dict[str, int]:
+        """Queue depth, capacity and rejected run operations for /metrics."""
+        return {
+            "length": await self.get_queue_length(),
+            "max_size": self.max_queue_size or 0,
+            "rejected": self._rejected,
+        }
+
+    def _broadcast_interrupt(self, kind: InterruptKind, task_id: UUID) -> None:
+        for listener in tuple(self._interrupt_listeners):
+            listener.send_nowait((kind, task_id))
+
+    async def receive_interrupts(self) -> AsyncIterator[TaskInterrupt]:
+        """Receive cancel/pause requests issued through this scheduler."""
+        send_stream, receive_stream = anyio.create_memory_object_stream[TaskInterrupt](
+            max_buffer_size=float("inf")
+        )
+        self._interrupt_listeners.add(send_stream)
+        try:
+            async with receive_stream:
+                async for interrupt in receive_stream:
+                    yield interrupt
+        finally:
+            self._interrupt_listeners.discard(send_stream)
+            send_stream.close()
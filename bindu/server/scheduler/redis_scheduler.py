@@ -3,33 +3,139 @@
 from __future__ import annotations as _annotations
 
 import json
+import time
 from collections.abc import AsyncIterator
 from typing import Any
+from uuid import UUID, uuid4
 
+import anyio
 import redis.asyncio as redis
 from opentelemetry.trace import get_current_span
+from redis.utils import str_if_bytes
 
 from bindu.common.protocol.types import TaskIdParams, TaskSendParams
 from bindu.utils.logging import get_logger
 from bindu.utils.retry import retry_scheduler_operation
 
 from .base import (
+    InterruptKind,
     Scheduler,
+    TaskInterrupt,
     TaskOperation,
     _CancelTask,
     _PauseTask,
     _ResumeTask,
     _RunTask,
+    fairness_key,
 )
+from .codec import TaskOperationCodec, WireFormat
+from .fair_queue import PRIORITIES, FairSharePolicy, normalize_priority
+from .trace_context import format_traceparent, span_from_traceparent
 
 logger = get_logger("bindu.server.scheduler.redis_scheduler")
 
 
+# Fair-share queue layout under "<queue_name>:fair" (see fair_queue.py):
+#   :control            FIFO list of cancel/pause/resume operations (served first)
+#   :<priority>:ring    round-robin list of fairness keys with pending operations
+#   :<priority>:q:<key> pending run operations of one key
+#   :wrr                smooth weighted round-robin state per priority
+#   :lease:<key>        in-flight operations of a key (zset token -> expiry)
+#   :size               number of pending operations
+#   :signal             doorbell list that idle consumers block on
+_FAIR_ENQUEUE_SCRIPT = """
+local prefix, priority, key, payload = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+if priority == '' then
+  redis.call('RPUSH', prefix .. ':control', payload)
+else
+  local queue = prefix .. ':' .. priority .. ':q:' .. key
+  if redis.call('RPUSH', queue, payload) == 1 then
+    redis.call('RPUSH', prefix .. ':' .. priority .. ':ring', key)
+  end
+end
+redis.call('INCR', prefix .. ':size')
+redis.call('LPUSH', prefix .. ':signal', '1')
+redis.call('LTRIM', prefix .. ':signal', 0, 127)
+return 1
+"""
+
+_FAIR_DEQUEUE_SCRIPT = """
+local prefix, cap, lease, token = ARGV[1], tonumber(ARGV[2]), tonumber(ARGV[3]), ARGV[4]
+
+local control = redis.call('LPOP', prefix .. ':control')
+if control then
+  redis.call('DECR', prefix .. ':size')
+  return {control, ''}
+end
+
+local now = tonumber(redis.call('TIME')[1])
+
+local function eligible_key(priority)
+  local ring = prefix .. ':' .. priority .. ':ring'
+  if cap == 0 then
+    return redis.call('LINDEX', ring, 0)
+  end
+  for _, key in ipairs(redis.call('LRANGE', ring, 0, -1)) do
+    local lease_key = prefix .. ':lease:' .. key
+    redis.call('ZREMRANGEBYSCORE', lease_key, '-inf', now)
+    if redis.call('ZCARD', lease_key) < cap then
+      return key
+    end
+  end
+  return false
+end
+
+local wrr = prefix .. ':wrr'
+local best, best_key, best_weight, total = nil, nil, nil, 0
+for i = 5, #ARGV, 2 do
+  local priority = ARGV[i]
+  local key = eligible_key(priority)
+  if key then
+    local weight = tonumber(ARGV[i + 1])
+    total = total + weight
+    local current = redis.call('HINCRBY', wrr, priority, weight)
+    if best == nil or current > best_weight then
+      best, best_key, best_weight = priority, key, current
+    end
+  end
+end
+if best == nil then
+  return false
+end
+redis.call('HINCRBY', wrr, best, -total)
+
+local ring = prefix .. ':' .. best .. ':ring'
+local queue = prefix .. ':' .. best .. ':q:' .. best_key
+local payload = redis.call('LPOP', queue)
+redis.call('LREM', ring, 1, best_key)
+if redis.call('LLEN', queue) > 0 then
+  redis.call('RPUSH', ring, best_key)
+end
+redis.call('DECR', prefix .. ':size')
+if cap > 0 then
+  local lease_key = prefix .. ':lease:' .. best_key
+  redis.call('ZADD', lease_key, now + lease, token)
+  redis.call('EXPIRE', lease_key, lease)
+end
+return {payload, best_key}
+"""
+
+
+def _enqueued_at(data: dict[str, Any]) -> dict[str, float]:
+    """Return the optional _enqueued_at field for a decoded envelope."""
+    enqueued_at = data.get("enqueued_at")
+    return {"_enqueued_at": enqueued_at} if enqueued_at is not None else {}
+
+
 class RedisScheduler(Scheduler):
     """A Redis-based scheduler for distributed task operations.
 
     Uses Redis lists for queue operations with blocking pop for efficient task distribution.
     Suitable for multi-process and multi-worker deployments.
+
+    With a ``fair_share`` policy, operations are queued per priority and
+    fairness key instead and dequeued atomically by a Lua script (weighted
+    round-robin across priorities, round-robin across keys, per-key caps).
     """
 
     def __init__(
@@ -39,6 +145,8 @@ class RedisScheduler(Scheduler):
         max_connections: int = 10,
         retry_on_timeout: bool = True,
         poll_timeout: int = 1,
+        wire_format: WireFormat = "json",
+        fair_share: FairSharePolicy | None = None,
     ):
         """Initialize Redis scheduler.
 
@@ -49,12 +157,19 @@ class RedisScheduler(Scheduler):
             retry_on_timeout: Whether to retry on Redis timeout
             poll_timeout: Timeout in seconds for blpop operations (default: 1s)
                 Higher values reduce API calls but slightly increase task start latency.
+            wire_format: Payload encoding - "json" (default) or "msgpack" (compact binary)
+            fair_share: Priority/fair-share dequeue policy (None keeps strict FIFO)
         """
         self.redis_url = redis_url
         self.queue_name = queue_name
         self.max_connections = max_connections
         self.retry_on_timeout = retry_on_timeout
         self.poll_timeout = poll_timeout
+        self.wire_format = wire_format
+        self._codec = TaskOperationCodec(wire_format)
+        self.interrupt_channel = f"{queue_name}:interrupts"
+        self.fair_share = fair_share
+        self.fair_prefix = f"{queue_name}:fair"
         self._redis_client: redis.Redis | None = None
 
     async def __aenter__(self):
@@ -62,7 +177,8 @@ class RedisScheduler(Scheduler):
         self._redis_client = redis.from_url(
             self.redis_url,
             encoding="utf-8",
-            decode_responses=True,
+            # Binary payloads must not be decoded as UTF-8
+            decode_responses=not self._codec.is_binary,
             max_connections=self.max_connections,
             retry_on_timeout=self.retry_on_timeout,
         )
@@ -77,6 +193,14 @@ class RedisScheduler(Scheduler):
                 f"Unable to connect to Redis at {self.redis_url}: {e}"
             )
 
+        if self.fair_share:
+            self._fair_enqueue = self._redis_client.register_script(
+                _FAIR_ENQUEUE_SCRIPT
+            )
+            self._fair_dequeue = self._redis_client.register_script(
+                _FAIR_DEQUEUE_SCRIPT
+            )
+
         return self
 
     async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
@@ -91,34 +215,52 @@ class RedisScheduler(Scheduler):
         """Send a run task operation to Redis queue."""
         logger.debug(f"Scheduling run task: {params}")
         task_operation = _RunTask(
-            operation="run", params=params, _current_span=get_current_span()
+            operation="run",
+            params=params,
+            _current_span=get_current_span(),
+            _enqueued_at=time.time(),
         )
         await self._push_task_operation(task_operation)
 
     @retry_scheduler_operation()
     async def cancel_task(self, params: TaskIdParams) -> None:
-        """Send a cancel task operation to Redis queue."""
+        """Send a cancel task operation to Redis queue and broadcast it.
+
+        The queued operation records the canceled state; the pub/sub broadcast
+        reaches whichever worker is currently executing the task.
+        """
         logger.debug(f"Scheduling cancel task: {params}")
         task_operation = _CancelTask(
-            operation="cancel", params=params, _current_span=get_current_span()
+            operation="cancel",
+            params=params,
+            _current_span=get_current_span(),
+            _enqueued_at=time.time(),
         )
         await self._push_task_operation(task_operation)
+        await self._publish_interrupt("cancel", params["task_id"])
 
     @retry_scheduler_operation()
     async def pause_task(self, params: TaskIdParams) -> None:
-        """Send a pause task operation to Redis queue."""
+        """Send a pause task operation to Redis queue and broadcast it."""
         logger.debug(f"Scheduling pause task: {params}")
         task_operation = _PauseTask(
-            operation="pause", params=params, _current_span=get_current_span()
+            operation="pause",
+            params=params,
+            _current_span=get_current_span(),
+            _enqueued_at=time.time(),
         )
         await self._push_task_operation(task_operation)
+        await self._publish_interrupt("pause", params["task_id"])
 
     @retry_scheduler_operation()
     async def resume_task(self, params: TaskIdParams) -> None:
         """Send a resume task operation to Redis queue."""
         logger.debug(f"Scheduling resume task: {params}")
         task_operation = _ResumeTask(
-            operation="resume", params=params, _current_span=get_current_span()
+            operation="resume",
+            params=params,
+            _current_span=get_current_span(),
+            _enqueued_at=time.time(),
         )
         await self._push_task_operation(task_operation)
 
@@ -133,6 +275,11 @@ class RedisScheduler(Scheduler):
             f"Starting to receive task operations from queue: {self.queue_name}"
         )
 
+        if self.fair_share:
+            async for task_operation in self._receive_fair_task_operations():
+                yield task_operation
+            return
+
         while True:
             try:
                 # Blocking pop with configurable timeout (reduces API calls for free tier)
@@ -162,6 +309,61 @@ class RedisScheduler(Scheduler):
                 logger.error(f"Unexpected error in receive_task_operations: {e}")
                 continue
 
+    async def _receive_fair_task_operations(self) -> AsyncIterator[TaskOperation]:
+        """Dequeue by priority and fairness key; block on the doorbell when idle."""
+        assert self._redis_client is not None and self.fair_share is not None
+        cap = self.fair_share.max_in_flight_per_key or 0
+        weights: list[Any] = []
+        for priority in PRIORITIES:
+            weights += [priority, self.fair_share.weight(priority)]
+
+        while True:
+            try:
+                token = uuid4().hex
+                result = await self._fair_dequeue(
+                    args=[
+                        self.fair_prefix,
+                        cap,
+                        self.fair_share.in_flight_lease_seconds,
+                        token,
+                        *weights,
+                    ]
+                )
+                if not result:
+                    # Nothing eligible: wait for an enqueue or a released slot
+                    await self._redis_client.blpop(
+                        f"{self.fair_prefix}:signal", timeout=self.poll_timeout
+                    )
+                    continue
+
+                task_data, key = result
+                task_operation = self._deserialize_task_operation(task_data)
+                key = str_if_bytes(key)
+                if key:
+                    task_operation["_fair_key"] = key
+                    task_operation["_delivery_id"] = token
+                yield task_operation
+
+            except redis.RedisError as e:
+                logger.error(f"Redis error in receive_task_operations: {e}")
+                await anyio.sleep(self.poll_timeout)
+            except ValueError as e:
+                logger.error(f"Failed to deserialize task operation: {e}")
+
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Release the in-flight lease of a fair-queued operation."""
+        key = task_operation.get("_fair_key")
+        token = task_operation.get("_delivery_id")
+        if not (self.fair_share and self._redis_client and key and token):
+            return
+        if self.fair_share.max_in_flight_per_key:
+            async with self._redis_client.pipeline(transaction=False) as pipe:
+                pipe.zrem(f"{self.fair_prefix}:lease:{key}", token)
+                # Wake a consumer that may be waiting on the capped key
+                pipe.lpush(f"{self.fair_prefix}:signal", "1")
+                pipe.ltrim(f"{self.fair_prefix}:signal", 0, 127)
+                await pipe.execute()
+
     async def _push_task_operation(self, task_operation: TaskOperation) -> None:
         """Push a task operation to Redis queue."""
         if not self._redis_client:
@@ -171,7 +373,10 @@ class RedisScheduler(Scheduler):
 
         try:
             serialized_task = self._serialize_task_operation(task_operation)
-            await self._redis_client.rpush(self.queue_name, serialized_task)
+            if self.fair_share:
+                await self._push_fair_task_operation(task_operation, serialized_task)
+            else:
+                await self._redis_client.rpush(self.queue_name, serialized_task)
             logger.debug(
                 f"Pushed task operation to queue: {task_operation['operation']}"
             )
@@ -182,101 +387,75 @@ class RedisScheduler(Scheduler):
             logger.error(f"Failed to serialize task operation: {e}")
             raise
 
-    def _serialize_task_operation(self, task_operation: TaskOperation) -> str:
-        """Serialize task operation to JSON string for Redis storage."""
-        from uuid import UUID
+    async def _push_fair_task_operation(
+        self, task_operation: TaskOperation, serialized_task: bytes
+    ) -> None:
+        """Queue a run operation under its priority and fairness key.
 
-        # Convert span to string representation (spans are not JSON serializable)
-        span = task_operation["_current_span"]
-
-        # Try to get span context - handle both real spans and mocks
-        span_id = None
-        trace_id = None
-
-        try:
-            if hasattr(span, "get_span_context"):
-                # Mock span with get_span_context method
-                span_context = span.get_span_context()
-                span_id = span_context.span_id
-                trace_id = span_context.trace_id
-            elif hasattr(span, "_context"):
-                # Real OpenTelemetry _Span object
-                span_context = span._context
-                span_id = span_context.span_id
-                trace_id = span_context.trace_id
-        except Exception:
-            # If we can't get span context, just use None values
-            pass
-
-        # Convert UUIDs to strings in params
-        def convert_uuids(obj):
-            """Recursively convert UUIDs to strings in nested structures."""
-            if isinstance(obj, UUID):
-                return str(obj)
-            elif isinstance(obj, dict):
-                return {k: convert_uuids(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_uuids(item) for item in obj]
-            return obj
+        Control operations go to a separate FIFO that is always served first.
+        """
+        if task_operation["operation"] == "run":
+            params = task_operation["params"]
+            priority = normalize_priority(params.get("priority"))
+            key = fairness_key(params)
+        else:
+            priority, key = "", ""
+        await self._fair_enqueue(
+            args=[self.fair_prefix, priority, key, serialized_task]
+        )
 
+    def _serialize_task_operation(self, task_operation: TaskOperation) -> bytes:
+        """Serialize task operation to the configured wire format for Redis storage."""
+        # Spans are not serializable - carry the W3C traceparent instead.
+        # UUIDs are encoded natively by the codec - no recursive pre-walk.
         serializable_task = {
             "operation": task_operation["operation"],
-            "params": convert_uuids(task_operation["params"]),
-            "span_id": format(span_id, "016x") if span_id else None,
-            "trace_id": format(trace_id, "032x") if trace_id else None,
+            "params": task_operation["params"],
+            "traceparent": format_traceparent(task_operation["_current_span"]),
+            "enqueued_at": task_operation.get("_enqueued_at"),
         }
-        return json.dumps(serializable_task)
-
-    def _deserialize_task_operation(self, task_data: str) -> TaskOperation:
-        """Deserialize task operation from JSON string."""
-        from uuid import UUID
-
-        data = json.loads(task_data)
-
-        # Convert string UUIDs back to UUID objects in params
-        def convert_strings_to_uuids(obj):
-            """Recursively convert UUID strings back to UUID objects."""
-            if isinstance(obj, str):
-                # Try to parse as UUID
-                try:
-                    return UUID(obj)
-                except (ValueError, AttributeError):
-                    return obj
-            elif isinstance(obj, dict):
-                return {k: convert_strings_to_uuids(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_strings_to_uuids(item) for item in obj]
-            return obj
-
-        # Reconstruct the task operation (span will be recreated by the worker)
-        # TODO: Properly propagate span context using trace_id/span_id
+        return self._codec.encode(serializable_task)
+
+    def _deserialize_task_operation(self, task_data: bytes | str) -> TaskOperation:
+        """Deserialize task operation from its wire format.
+
+        Only fields the params schema declares as UUIDs are converted back to
+        UUID objects; free text such as message parts is left untouched.
+        """
+        data = self._codec.decode(task_data)
+
+        # Resume the originating trace; the worker starts its span under it
         operation_type = data["operation"]
-        params = convert_strings_to_uuids(data["params"])
-        current_span = get_current_span()
+        params = data["params"]
+        current_span = span_from_traceparent(data.get("traceparent"))
 
         if operation_type == "run":
             return _RunTask(
                 operation="run",
                 params=params,
                 _current_span=current_span,
+                **_enqueued_at(data),
             )
         elif operation_type == "cancel":
             return _CancelTask(
                 operation="cancel",
                 params=params,
                 _current_span=current_span,
+                **_enqueued_at(data),
             )
         elif operation_type == "pause":
             return _PauseTask(
                 operation="pause",
                 params=params,
                 _current_span=current_span,
+                **_enqueued_at(data),
             )
         elif operation_type == "resume":
             return _ResumeTask(
                 operation="resume",
                 params=params,
                 _current_span=current_span,
+                **_enqueued_at(data),
             )
         else:
             raise ValueError(f"Unknown operation type: {operation_type}")
@@ -288,6 +467,8 @@ class RedisScheduler(Scheduler):
                 "Redis client not initialized. Use async context manager."
             )
 
+        if self.fair_share:
+            return int(await self._redis_client.get(f"{self.fair_prefix}:size") or 0)
         return await self._redis_client.llen(self.queue_name)
 
     async def clear_queue(self) -> int:
@@ -297,8 +478,70 @@ class RedisScheduler(Scheduler):
                 "Redis client not initialized. Use async context manager."
             )
 
+        if self.fair_share:
+            keys = [
+                key
+                async for key in self._redis_client.scan_iter(
+                    match=f"{self.fair_prefix}:*"
+                )
+            ]
+            size = await self.get_queue_length()
+            if keys:
+                await self._redis_client.delete(*keys)
+            return size
         return await self._redis_client.delete(self.queue_name)
 
+    async def _publish_interrupt(self, kind: InterruptKind, task_id: Any) -> None:
+        """Broadcast a cancel/pause request to all workers."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+        await self._redis_client.publish(self.interrupt_channel, f"{kind}:{task_id}")
+
+    @staticmethod
+    def _parse_interrupt(data: Any) -> TaskInterrupt | None:
+        """Parse a "<kind>:<task_id>" broadcast message (None if invalid)."""
+        text = data.decode() if isinstance(data, bytes) else str(data)
+        kind, _, task_id = text.partition(":")
+        if kind not in ("cancel", "pause"):
+            return None
+        try:
+            return kind, UUID(task_id)  # type: ignore[return-value]
+        except ValueError:
+            return None
+
+    async def receive_interrupts(self) -> AsyncIterator[TaskInterrupt]:
+        """Receive broadcast cancel/pause requests via Redis pub/sub."""
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+
+        while True:
+            pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.interrupt_channel)
+                logger.info(
+                    f"Listening for task interrupts on: {self.interrupt_channel}"
+                )
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    interrupt = self._parse_interrupt(message["data"])
+                    if interrupt is None:
+                        logger.warning(
+                            f"Ignoring invalid interrupt: {message['data']!r}"
+                        )
+                        continue
+                    yield interrupt
+            except redis.RedisError as e:
+                logger.error(f"Redis error in receive_interrupts: {e}")
+                await anyio.sleep(self.poll_timeout)
+            finally:
+                with anyio.CancelScope(shield=True):
+                    await pubsub.aclose()
+
     async def health_check(self) -> bool:
         """Check if Redis connection is healthy."""
         try:
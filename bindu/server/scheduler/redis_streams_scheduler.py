@@ -0,0 +1,382 @@
+"""Redis Streams scheduler implementation with consumer groups and acknowledgements.
+
+Unlike the list-based RedisScheduler (RPUSH/BLPOP), an entry read from a stream
+stays in the consumer group's pending entries list (PEL) until the worker
+acknowledges it. A worker crash therefore never loses a task: once the entry has
+been idle for ``claim_min_idle_ms`` another consumer reclaims it with XAUTOCLAIM
+and runs it again (at-least-once delivery).
+
+Round trips:
+- XADD        enqueue one operation
+- XREADGROUP  fetch up to ``read_count`` new entries per call (blocking)
+- XAUTOCLAIM  fetch up to ``read_count`` stalled entries per call
+
+Both fetches are also capped by the worker's free slots: every fetched entry
+sits in this consumer's pending list (and is kept fresh by the heartbeat), so
+a saturated worker must not take more than it can start.
+- XACK + XDEL acknowledge a handled entry and delete it (one pipeline), so the
+              stream only holds queued and in-progress entries
+
+Long-running tasks keep their entries "fresh" through a heartbeat that re-claims
+them for the owning consumer, so they are not stolen while still executing.
+"""
+
+from __future__ import annotations as _annotations
+
+import json
+import os
+import socket
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AsyncExitStack
+from typing import Any
+from uuid import uuid4
+
+import anyio
+import redis.asyncio as redis
+from redis.utils import str_if_bytes
+
+from bindu.utils.logging import get_logger
+
+from .base import TaskOperation
+from .codec import WireFormat
+from .redis_scheduler import RedisScheduler
+
+logger = get_logger("bindu.server.scheduler.redis_streams_scheduler")
+
+
+class RedisStreamsScheduler(RedisScheduler):
+    """A Redis Streams-based scheduler with reliable, acknowledged delivery.
+
+    All workers join the same consumer group; each entry is delivered to exactly
+    one consumer and removed from the pending list only after XACK. Suitable for
+    multi-process deployments that cannot afford to lose tasks on worker crashes.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        queue_name: str = "bindu:tasks",
+        max_connections: int = 10,
+        retry_on_timeout: bool = True,
+        poll_timeout: int = 1,
+        consumer_group: str = "bindu:workers",
+        consumer_name: str | None = None,
+        read_count: int = 10,
+        claim_min_idle_ms: int = 60000,
+        stream_maxlen: int | None = None,
+        wire_format: WireFormat = "json",
+    ):
+        """Initialize Redis Streams scheduler.
+
+        Args:
+            redis_url: Redis URL (redis://[password@]host:port/db)
+            queue_name: Redis stream key for task operations
+            max_connections: Maximum Redis connection pool size
+            retry_on_timeout: Whether to retry on Redis timeout
+            poll_timeout: Block timeout in seconds for XREADGROUP (default: 1s)
+            consumer_group: Consumer group shared by all workers
+            consumer_name: Unique consumer name (default: hostname-pid-random)
+            read_count: Maximum entries fetched per XREADGROUP/XAUTOCLAIM call
+            claim_min_idle_ms: Idle time after which pending entries of other
+                consumers are reclaimed. Must exceed the heartbeat interval.
+            stream_maxlen: Approximate maximum stream length (None = unbounded).
+                Handled entries are deleted, so this only caps the backlog;
+                entries trimmed before delivery are lost.
+            wire_format: Payload encoding - "json" (default) or "msgpack" (compact binary)
+        """
+        super().__init__(
+            redis_url=redis_url,
+            queue_name=queue_name,
+            max_connections=max_connections,
+            retry_on_timeout=retry_on_timeout,
+            poll_timeout=poll_timeout,
+            wire_format=wire_format,
+        )
+        self.consumer_group = consumer_group
+        self.consumer_name = (
+            consumer_name or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        )
+        self.read_count = read_count
+        self.claim_min_idle_ms = claim_min_idle_ms
+        self.stream_maxlen = stream_maxlen
+
+        # Entry IDs delivered to this consumer and not yet acknowledged
+        self._unacked: set[str] = set()
+        # Free worker slots, set by the consuming worker (None = unbounded)
+        self._free_slots: Callable[[], int] | None = None
+        self._aexit_stack: AsyncExitStack | None = None
+
+    @property
+    def heartbeat_interval(self) -> float:
+        """Seconds between idle-time refreshes of this consumer's pending entries."""
+        return self.claim_min_idle_ms / 3000
+
+    async def __aenter__(self):
+        """Connect, create the consumer group and start the pending-entries heartbeat."""
+        await super().__aenter__()
+        await self._ensure_consumer_group()
+
+        self._aexit_stack = AsyncExitStack()
+        await self._aexit_stack.__aenter__()
+        task_group = await self._aexit_stack.enter_async_context(
+            anyio.create_task_group()
+        )
+        self._aexit_stack.callback(task_group.cancel_scope.cancel)
+        task_group.start_soon(self._heartbeat_loop)
+
+        logger.info(
+            f"Redis Streams consumer '{self.consumer_name}' joined group "
+            f"'{self.consumer_group}' on stream '{self.queue_name}'"
+        )
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any):
+        """Stop the heartbeat and close the connection pool.
+
+        Unacknowledged entries stay pending and are reclaimed by other consumers.
+        """
+        if self._aexit_stack is not None:
+            await self._aexit_stack.__aexit__(exc_type, exc_value, traceback)
+            self._aexit_stack = None
+        await super().__aexit__(exc_type, exc_value, traceback)
+
+    async def _ensure_consumer_group(self) -> None:
+        """Create the consumer group (and stream) if it does not exist yet."""
+        client = self._require_client()
+        try:
+            await client.xgroup_create(
+                self.queue_name, self.consumer_group, id="0", mkstream=True
+            )
+            logger.info(f"Created consumer group '{self.consumer_group}'")
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def _require_client(self) -> redis.Redis:
+        if not self._redis_client:
+            raise RuntimeError(
+                "Redis client not initialized. Use async context manager."
+            )
+        return self._redis_client
+
+    async def _push_task_operation(self, task_operation: TaskOperation) -> None:
+        """Append a task operation to the stream with XADD."""
+        client = self._require_client()
+
+        try:
+            serialized_task = self._serialize_task_operation(task_operation)
+            kwargs: dict[str, Any] = {}
+            if self.stream_maxlen is not None:
+                kwargs = {"maxlen": self.stream_maxlen, "approximate": True}
+            await client.xadd(self.queue_name, {"data": serialized_task}, **kwargs)
+            logger.debug(
+                f"Added task operation to stream: {task_operation['operation']}"
+            )
+        except redis.RedisError as e:
+            logger.error(f"Failed to add task operation to Redis stream: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to serialize task operation: {e}")
+            raise
+
+    def set_consumer_capacity(self, free_slots: Callable[[], int]) -> None:
+        """Cap each fetch at the worker's free slots."""
+        self._free_slots = free_slots
+
+    def _fetch_count(self) -> int:
+        """Entries to fetch in the next round trip."""
+        if self._free_slots is None:
+            return self.read_count
+        return max(1, min(self.read_count, self._free_slots()))
+
+    async def receive_task_operations(self) -> AsyncIterator[TaskOperation]:
+        """Receive task operations from the consumer group.
+
+        Stalled entries of crashed consumers are reclaimed (XAUTOCLAIM) at most
+        once per ``claim_min_idle_ms``; otherwise new entries are read in batches
+        of up to ``read_count`` (and the worker's free slots) with a blocking
+        XREADGROUP.
+        """
+        client = self._require_client()
+
+        logger.info(
+            f"Starting to receive task operations from stream: {self.queue_name}"
+        )
+
+        next_reclaim = 0.0
+        while True:
+            try:
+                entries: list[tuple[str, dict[Any, Any]]] = []
+
+                now = time.monotonic()
+                if now >= next_reclaim:
+                    entries = await self._reclaim_stalled_entries()
+                    next_reclaim = now + self.claim_min_idle_ms / 1000
+
+                if not entries:
+                    response = await client.xreadgroup(
+                        self.consumer_group,
+                        self.consumer_name,
+                        {self.queue_name: ">"},
+                        count=self._fetch_count(),
+                        block=self.poll_timeout * 1000,
+                    )
+                    for _stream, stream_entries in response or []:
+                        entries.extend(
+                            (str_if_bytes(entry_id), fields)
+                            for entry_id, fields in stream_entries
+                        )
+
+                self._unacked.update(entry_id for entry_id, _ in entries)
+
+                for entry_id, fields in entries:
+                    task_operation = await self._decode_entry(entry_id, fields)
+                    if task_operation is not None:
+                        logger.debug(
+                            f"Received task operation: {task_operation['operation']} "
+                            f"(entry {entry_id})"
+                        )
+                        yield task_operation
+
+            except redis.ResponseError as e:
+                if "NOGROUP" in str(e):
+                    # Stream or group was deleted (e.g. clear_queue) - recreate
+                    logger.warning(f"Consumer group missing, recreating: {e}")
+                    await self._ensure_consumer_group()
+                    continue
+                logger.error(f"Redis error in receive_task_operations: {e}")
+                continue
+            except redis.RedisError as e:
+                logger.error(f"Redis error in receive_task_operations: {e}")
+                continue
+            except Exception as e:
+                logger.error(f"Unexpected error in receive_task_operations: {e}")
+                continue
+
+    async def _reclaim_stalled_entries(self) -> list[tuple[str, dict[Any, Any]]]:
+        """Take over entries that other consumers left pending for too long."""
+        client = self._require_client()
+        response = await client.xautoclaim(
+            self.queue_name,
+            self.consumer_group,
+            self.consumer_name,
+            min_idle_time=self.claim_min_idle_ms,
+            start_id="0-0",
+            count=self._fetch_count(),
+        )
+        # [next_start_id, claimed_entries, deleted_ids (Redis >= 7)]
+        claimed = [
+            (str_if_bytes(entry_id), fields)
+            for entry_id, fields in response[1]
+            if fields is not None
+        ]
+        if claimed:
+            logger.warning(
+                f"Reclaimed {len(claimed)} stalled task operation(s) from stream "
+                f"'{self.queue_name}'"
+            )
+        return claimed
+
+    async def _decode_entry(
+        self, entry_id: str, fields: dict[Any, Any]
+    ) -> TaskOperation | None:
+        """Deserialize a stream entry, acknowledging (dropping) malformed ones."""
+        # Field names are bytes when the client runs without decode_responses
+        payload = fields.get("data", fields.get(b"data"))
+        try:
+            if payload is None:
+                raise KeyError("data")
+            task_operation = self._deserialize_task_operation(payload)
+        except (KeyError, ValueError, json.JSONDecodeError) as e:
+            # Redelivering a poison entry would fail forever - drop it
+            logger.error(f"Dropping malformed stream entry {entry_id}: {e}")
+            await self._ack_entry(entry_id)
+            return None
+
+        task_operation["_delivery_id"] = entry_id
+        return task_operation
+
+    async def ack_task_operation(self, task_operation: TaskOperation) -> None:
+        """Acknowledge a handled operation with XACK."""
+        entry_id = task_operation.get("_delivery_id")
+        if entry_id:
+            await self._ack_entry(entry_id)
+
+    async def _ack_entry(self, entry_id: str) -> None:
+        client = self._require_client()
+        # Acknowledged entries are never read again - delete them too, otherwise
+        # the stream grows with every task ever scheduled
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.xack(self.queue_name, self.consumer_group, entry_id)
+            pipe.xdel(self.queue_name, entry_id)
+            await pipe.execute()
+        self._unacked.discard(entry_id)
+
+    async def _heartbeat_loop(self) -> None:
+        """Periodically reset the idle time of entries this consumer still owns."""
+        while True:
+            await anyio.sleep(self.heartbeat_interval)
+            try:
+                await self._refresh_unacked_entries()
+            except Exception as e:
+                logger.warning(f"Failed to refresh pending stream entries: {e}")
+
+    async def _refresh_unacked_entries(self) -> None:
+        """Re-claim own pending entries (XCLAIM JUSTID) so they are not stolen."""
+        if not self._unacked:
+            return
+        client = self._require_client()
+        await client.xclaim(
+            self.queue_name,
+            self.consumer_group,
+            self.consumer_name,
+            min_idle_time=0,
+            message_ids=list(self._unacked),
+            justid=True,
+        )
+
+    async def get_queue_stats(self) -> dict[str, int]:
+        """Return queue depth and consumer group lag for monitoring/autoscaling.
+
+        All values come from XINFO GROUPS, so they count the consumer group's
+        work rather than whatever entries the stream still holds.
+
+        Returns:
+            Dict with:
+            - length: operations not yet handled (lag + pending)
+            - pending: delivered but not yet acknowledged entries
+            - lag: entries not yet delivered to any consumer
+            - consumers: number of consumers in the group
+        """
+        client = self._require_client()
+
+        group: dict[str, Any] = {}
+        for info in await client.xinfo_groups(self.queue_name):
+            if str_if_bytes(info.get("name")) == self.consumer_group:
+                group = info
+                break
+
+        pending = int(group.get("pending") or 0)
+        lag = group.get("lag")
+        if lag is None:
+            # Redis < 7 does not report lag. Handled entries are deleted, so
+            # the stream holds exactly the undelivered and pending ones.
+            lag = max(await client.xlen(self.queue_name) - pending, 0)
+
+        return {
+            "length": int(lag) + pending,
+            "pending": pending,
+            "lag": int(lag),
+            "consumers": int(group.get("consumers") or 0),
+        }
+
+    async def get_queue_length(self) -> int:
+        """Get the number of operations waiting to be delivered (group lag)."""
+        return (await self.get_queue_stats())["lag"]
+
+    async def clear_queue(self) -> int:
+        """Delete the stream (and its consumer group). Returns number of keys removed."""
+        client = self._require_client()
+        self._unacked.clear()
+        return await client.delete(self.queue_name)
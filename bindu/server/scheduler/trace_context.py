@@ -0,0 +1,110 @@
+"""W3C Trace Context propagation for scheduler payloads.
+
+Spans cannot cross a process boundary, so distributed schedulers carry the
+originating span as a ``traceparent`` header value
+(https://www.w3.org/TR/trace-context/#traceparent-header):
+
+    00-<32 hex trace-id>-<16 hex parent-id>-<2 hex trace-flags>
+
+On the worker side the header is turned back into a non-recording remote span,
+which the worker activates before starting its own span - so worker spans become
+children of the HTTP request span instead of starting orphaned traces.
+"""
+
+from __future__ import annotations as _annotations
+
+import re
+from typing import Any
+
+from opentelemetry.trace import Span, get_current_span
+
+from bindu.utils.logging import get_logger
+
+logger = get_logger("bindu.server.scheduler.trace_context")
+
+TRACEPARENT_VERSION = "00"
+
+_TRACEPARENT_RE = re.compile(
+    r"^(?P<version>[0-9a-f]{2})-(?P<trace_id>[0-9a-f]{32})-"
+    r"(?P<span_id>[0-9a-f]{16})-(?P<flags>[0-9a-f]{2})(-.*)?$"
+)
+
+
+def format_traceparent(span: Any) -> str | None:
+    """Build a traceparent header value for a span.
+
+    Args:
+        span: OpenTelemetry span (or any object exposing get_span_context())
+
+    Returns:
+        The traceparent string, or None if the span carries no valid context
+    """
+    try:
+        span_context = span.get_span_context()
+        trace_id = int(span_context.trace_id)
+        span_id = int(span_context.span_id)
+        flags = int(getattr(span_context, "trace_flags", 0) or 0)
+    except Exception:
+        return None
+
+    if not trace_id or not span_id:
+        return None
+    return f"{TRACEPARENT_VERSION}-{trace_id:032x}-{span_id:016x}-{flags & 0xFF:02x}"
+
+
+def parse_traceparent(traceparent: str | None) -> tuple[int, int, int] | None:
+    """Parse a traceparent header value.
+
+    Args:
+        traceparent: Header value
+
+    Returns:
+        (trace_id, span_id, trace_flags), or None if the value is invalid
+    """
+    if not traceparent:
+        return None
+    match = _TRACEPARENT_RE.match(traceparent.strip().lower())
+    if match is None:
+        return None
+
+    version = match.group("version")
+    # Version 00 must not carry extra fields; ff is forbidden
+    if version == "ff" or (version == TRACEPARENT_VERSION and match.group(5)):
+        return None
+
+    trace_id = int(match.group("trace_id"), 16)
+    span_id = int(match.group("span_id"), 16)
+    if not trace_id or not span_id:
+        return None
+    return trace_id, span_id, int(match.group("flags"), 16)
+
+
+def span_from_traceparent(traceparent: str | None) -> Span:
+    """Rebuild the originating span from a traceparent header value.
+
+    Args:
+        traceparent: Header value carried in the scheduler payload
+
+    Returns:
+        A non-recording remote span to use as parent, or the current span if
+        the header is missing/invalid or OpenTelemetry is unavailable
+    """
+    parsed = parse_traceparent(traceparent)
+    if parsed is None:
+        return get_current_span()
+
+    trace_id, span_id, flags = parsed
+    try:
+        from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
+
+        return NonRecordingSpan(
+            SpanContext(
+                trace_id=trace_id,
+                span_id=span_id,
+                is_remote=True,
+                trace_flags=TraceFlags(flags),
+            )
+        )
+    except ImportError:
+        logger.debug("OpenTelemetry span context API unavailable, trace not resumed")
+        return get_current_span()
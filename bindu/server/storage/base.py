@@ -3,6 +3,7 @@
 from __future__ import annotations as _annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any, Generic
 from uuid import UUID
 
@@ -10,9 +11,11 @@ from typing_extensions import TypeVar
 
 from bindu.common.protocol.types import (
     Artifact,
+    ContextListPage,
     Message,
     PushNotificationConfig,
     Task,
+    TaskListPage,
     TaskState,
 )
 
@@ -43,13 +46,20 @@ class Storage(ABC, Generic[ContextT]):
 
     @abstractmethod
     async def load_task(
-        self, task_id: UUID, history_length: int | None = None
+        self,
+        task_id: UUID,
+        history_length: int | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> Task | None:
         """Load a task from storage.
 
         Args:
             task_id: Unique identifier of the task
             history_length: Optional limit on message history length
+            include_history: Load the message history (empty list if False)
+            include_artifacts: Load the artifacts (empty list if False)
 
         Returns:
             Task object if found, None otherwise
@@ -75,6 +85,9 @@ class Storage(ABC, Generic[ContextT]):
         new_artifacts: list[Artifact] | None = None,
         new_messages: list[Message] | None = None,
         metadata: dict[str, Any] | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> Task:
         """Update task state and append new content.
 
@@ -84,6 +97,8 @@ class Storage(ABC, Generic[ContextT]):
             new_artifacts: Optional artifacts to append
             new_messages: Optional messages to append to history
             metadata: Optional metadata to update/merge with task metadata
+            include_history: Return the history with the task (empty list if False)
+            include_artifacts: Return the artifacts with the task (empty list if False)
 
         Returns:
             Updated task object
@@ -100,6 +115,44 @@ class Storage(ABC, Generic[ContextT]):
             List of tasks
         """
 
+    @abstractmethod
+    async def list_tasks_page(
+        self,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        *,
+        state: TaskState | None = None,
+        context_id: UUID | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        include_history: bool = False,
+        include_artifacts: bool = False,
+        history_length: int | None = None,
+    ) -> TaskListPage:
+        """List tasks newest first, one page at a time.
+
+        Pages are keyset-paginated on (created_at, id): the cursor is the
+        position of the last task of the previous page, so pages stay
+        stable while new tasks are added.
+
+        Args:
+            page_size: Maximum number of tasks in the page (None = all)
+            cursor: ``next_cursor`` of the previous page
+            state: Only list tasks in this state
+            context_id: Only list tasks of this context
+            created_after: Only list tasks created at or after this time
+            created_before: Only list tasks created before this time
+            include_history: Include message histories (empty lists if False)
+            include_artifacts: Include artifacts (empty lists if False)
+            history_length: Limit included histories to the last N messages
+
+        Returns:
+            Page with the tasks and the cursor of the next page (None if last)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+
     async def count_tasks(self, status: str | None = None) -> int:
         """Count number of tasks, optionally filtered by status.
 
@@ -115,15 +168,81 @@ class Storage(ABC, Generic[ContextT]):
             return sum(1 for t in tasks if t["status"]["state"] == status)
         return len(tasks)
 
+    async def load_tasks(
+        self,
+        task_ids: list[UUID],
+        history_length: int | None = None,
+        *,
+        history_lengths: dict[UUID, int] | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+    ) -> list[Task]:
+        """Load several tasks at once.
+
+        Args:
+            task_ids: IDs of the tasks to load
+            history_length: Optional limit on each task's message history
+            history_lengths: Per-task history limits, overriding history_length
+            include_history: Load the message histories (empty lists if False)
+            include_artifacts: Load the artifacts (empty lists if False)
+
+        Returns:
+            Found tasks in the order of ``task_ids`` (missing ones are skipped)
+        """
+        # Default one-by-one implementation - override in subclasses
+        tasks = []
+        for task_id in task_ids:
+            task = await self.load_task(
+                task_id,
+                (history_lengths or {}).get(task_id, history_length),
+                include_history=include_history,
+                include_artifacts=include_artifacts,
+            )
+            if task is not None:
+                tasks.append(task)
+        return tasks
+
+    async def transition_task_state(
+        self, task_id: UUID, expected_state: TaskState, state: TaskState
+    ) -> bool:
+        """Set a task's state only if it is currently ``expected_state``.
+
+        Args:
+            task_id: Task to update
+            expected_state: State the task must be in
+            state: New task state
+
+        Returns:
+            True if the task was in ``expected_state`` and is now in ``state``
+        """
+        # Default check-then-update implementation - override in subclasses
+        # with an atomic compare-and-set
+        task = await self.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
+        if task is None or task["status"]["state"] != expected_state:
+            return False
+        await self.update_task(
+            task_id, state=state, include_history=False, include_artifacts=False
+        )
+        return True
+
     @abstractmethod
     async def list_tasks_by_context(
-        self, context_id: UUID, length: int | None = None
+        self,
+        context_id: UUID,
+        length: int | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> list[Task]:
         """List tasks belonging to a specific context.
 
         Args:
             context_id: Context to filter tasks by
             length: Optional limit on number of tasks to return (most recent)
+            include_history: Load the message histories (empty lists if False)
+            include_artifacts: Load the artifacts (empty lists if False)
 
         Returns:
             List of tasks in the context
@@ -177,6 +296,33 @@ class Storage(ABC, Generic[ContextT]):
             List of context objects
         """
 
+    @abstractmethod
+    async def list_contexts_page(
+        self,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        *,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> ContextListPage:
+        """List contexts newest first, one page at a time.
+
+        Keyset-paginated on (created_at, id) like list_tasks_page().
+
+        Args:
+            page_size: Maximum number of contexts in the page (None = all)
+            cursor: ``next_cursor`` of the previous page
+            created_after: Only list contexts created at or after this time
+            created_before: Only list contexts created before this time
+
+        Returns:
+            Page with context summaries (context_id, task_count, task_ids)
+            and the cursor of the next page (None if last)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+
     # -------------------------------------------------------------------------
     # Utility Operations
     # -------------------------------------------------------------------------
@@ -229,6 +375,34 @@ class Storage(ABC, Generic[ContextT]):
         # Optional - override in subclass if feedback retrieval is needed
         return None
 
+    # -------------------------------------------------------------------------
+    # History Summary Operations (Optional)
+    # -------------------------------------------------------------------------
+
+    async def save_history_summary(
+        self, context_id: UUID, summary: dict[str, Any]
+    ) -> None:
+        """Store the rolling summary of a context's earlier conversation.
+
+        Args:
+            context_id: Context the summary belongs to
+            summary: Summary record (text and number of messages it covers)
+        """
+        # Optional - override in subclass to keep summaries across restarts
+        pass
+
+    async def load_history_summary(self, context_id: UUID) -> dict[str, Any] | None:
+        """Load the rolling summary of a context.
+
+        Args:
+            context_id: Context to get the summary for
+
+        Returns:
+            Summary record or None if the context has none
+        """
+        # Optional - override in subclass if summaries are stored
+        return None
+
     # -------------------------------------------------------------------------
     # Webhook Persistence Operations (for long-running tasks)
     # -------------------------------------------------------------------------
@@ -67,7 +67,14 @@ async def create_storage(did: str | None = None) -> Storage:
 
     if backend == "memory":
         logger.info("Using in-memory storage (non-persistent)")
-        return InMemoryStorage()
+        settings = app_settings.storage
+        return InMemoryStorage(
+            max_tasks=settings.memory_max_tasks,
+            max_contexts=settings.memory_max_contexts,
+            terminal_task_ttl=settings.memory_terminal_task_ttl,
+            spill_path=settings.memory_spill_path,
+            spill_max_tasks=settings.memory_spill_max_tasks,
+        )
 
     elif backend == "postgres":
         if not POSTGRES_AVAILABLE or PostgresStorage is None:
@@ -122,5 +129,7 @@ async def close_storage(storage: Storage) -> None:
     ):
         await storage.disconnect()
         logger.info("PostgreSQL storage connection closed")
+    elif isinstance(storage, InMemoryStorage):
+        storage.close()
     else:
         logger.debug(f"Storage {type(storage).__name__} does not require cleanup")
@@ -5,14 +5,18 @@ This package provides reusable helper functions for:
 - JSONB serialization
 - Security (password masking, SQL injection prevention)
 - Database operations (timestamps, JSONB preparation)
+- Keyset pagination cursors
 """
 
 from .normalization import normalize_message_uuids, normalize_uuid
+from .pagination import decode_cursor, encode_cursor
 from .security import mask_database_url, sanitize_identifier
 from .serialization import serialize_for_jsonb
 from .validation import validate_uuid_type
 
 __all__ = [
+    "decode_cursor",
+    "encode_cursor",
     "normalize_message_uuids",
     "normalize_uuid",
     "mask_database_url",
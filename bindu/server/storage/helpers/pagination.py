@@ -0,0 +1,42 @@
+"""Opaque cursors for keyset pagination of tasks and contexts."""
+
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+Cursor = tuple[datetime, UUID]
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """Encode the position after an item as an opaque cursor string.
+
+    Args:
+        created_at: Creation time of the last item of a page
+        item_id: ID of the last item of a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([created_at.isoformat(), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decode a cursor created by :func:`encode_cursor`.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        (created_at, id) of the last item of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
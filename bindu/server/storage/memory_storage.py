@@ -11,23 +11,44 @@ Hybrid Agent Pattern Support:
 - Supports incremental message history updates
 - Enables task refinements through context-based task lookup
 
+Copy-on-write task records:
+- Messages and artifacts are copied once when stored and never modified afterwards
+- History and artifacts are tuples, appending replaces the tuple
+- Reads build a new Task around the shared records, slicing history first, so a
+  read costs O(returned messages) instead of a deep copy of the whole task
+
+Retention (all optional, off by default):
+- max_tasks / max_contexts: least recently used contexts whose tasks have all
+  ended are evicted, with their tasks, feedback and webhook configs
+- terminal_task_ttl: ended tasks are dropped this long after they ended
+- spill: evicted tasks are written to a SQLite file and stay readable
+- get_memory_stats(): gauges for sizing (exported on /metrics)
+
 Note: All data is lost when the application stops. Use persistent storage for production.
 """
 
 from __future__ import annotations as _annotations
 
 import copy
-from datetime import datetime, timezone
-from typing import Any, cast
+import json
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Literal
 from uuid import UUID
 
 from typing_extensions import TypeVar
 
 from bindu.common.protocol.types import (
     Artifact,
+    ContextListPage,
     Message,
     PushNotificationConfig,
     Task,
+    TaskListPage,
     TaskState,
     TaskStatus,
 )
@@ -36,40 +57,173 @@ from bindu.utils.logging import get_logger
 from bindu.utils.retry import retry_storage_operation
 
 from .base import Storage
+from .helpers import decode_cursor, encode_cursor
+from .spill import SQLiteTaskSpill
 
 logger = get_logger("bindu.server.storage.memory_storage")
 
 ContextT = TypeVar("ContextT", default=Any)
 
+_Key = tuple[datetime, UUID]
+"""Keyset position of a task or context: (created_at, id)."""
+
+
+def _remove_key(keys: list[_Key], key: _Key) -> None:
+    """Remove a key from a sorted key list (no-op if absent)."""
+    i = bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        del keys[i]
+
+
+def _page_range(
+    keys: list[Any],
+    after: _Key | None,
+    created_after: datetime | None,
+    created_before: datetime | None,
+    key: Any = None,
+) -> tuple[int, int]:
+    """Index range [lo, hi) of an ascending key list left by a cursor and time filters.
+
+    A bare ``(created_at,)`` sorts before every key with that creation time,
+    so it bisects to the first key created at or after it.
+    """
+    lo = 0 if created_after is None else bisect_left(keys, (created_after,), key=key)
+    hi = len(keys)
+    if created_before is not None:
+        hi = bisect_left(keys, (created_before,), key=key)
+    if after is not None:
+        hi = min(hi, bisect_left(keys, after, key=key))
+    return lo, max(lo, hi)
+
+
+@dataclass(slots=True)
+class _StoredTask:
+    """Copy-on-write record of a stored task.
+
+    Fields are replaced, never mutated in place, so snapshots handed out by
+    ``snapshot()`` share messages and artifacts with the record safely. The
+    messages and artifacts of returned tasks must be treated as read-only.
+    """
+
+    id: UUID
+    context_id: UUID
+    kind: Literal["task"]
+    status: TaskStatus
+    history: tuple[Message, ...] = ()
+    artifacts: tuple[Artifact, ...] | None = None
+    metadata: dict[str, Any] | None = None
+    size_bytes: int = 0
+    """Approximate JSON size of the stored messages and artifacts."""
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def snapshot(
+        self,
+        history_length: int | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+    ) -> Task:
+        """Build a Task from the record, keeping only the last messages if limited."""
+        history = self.history if include_history else ()
+        if history_length is not None and 0 < history_length < len(history):
+            history = history[-history_length:]
+
+        task = Task(
+            id=self.id,
+            context_id=self.context_id,
+            kind=self.kind,
+            status=TaskStatus(**self.status),
+            history=list(history),
+        )
+        if self.artifacts is not None:
+            task["artifacts"] = list(self.artifacts) if include_artifacts else []
+        if self.metadata is not None:
+            task["metadata"] = dict(self.metadata)
+        return task
+
 
 class InMemoryStorage(Storage[ContextT]):
     """In-memory storage implementation for tasks and contexts.
 
     Storage Structure:
-    - tasks: Dict[UUID, Task] - All tasks indexed by task_id
-    - contexts: Dict[UUID, list[UUID]] - Task IDs grouped by context_id
+    - tasks: Dict[UUID, _StoredTask] - Copy-on-write task records by task_id,
+      in submission order (recency index for list_tasks)
+    - _task_keys: List[(created_at, id)] - All tasks, sorted (list_tasks_page)
+    - _task_keys_by_state: Dict[str, List[(created_at, id)]] - Tasks per state,
+      sorted (count_tasks, list_tasks_page)
+    - contexts: OrderedDict[UUID, list[UUID]] - Task IDs grouped by context_id
+      in submission order, least recently used context first
+    - _context_created_at: Dict[UUID, datetime] - Creation time per context
+    - _context_keys: List[(created_at, id)] - All contexts, sorted
+      (list_contexts_page)
+
+    The sorted key lists let the paged listings bisect to the cursor, so a
+    page costs O(log n + page_size).
     - task_feedback: Dict[UUID, List[dict]] - Optional feedback storage
+    - _terminal_since: OrderedDict[UUID, float] - Ended tasks by end time (TTL)
+    - _running_counts: Dict[UUID, int] - Unfinished tasks per context
+    - _idle_contexts: OrderedDict[UUID, None] - Contexts whose tasks have all
+      ended, least recently used (or ended) first: the eviction candidates
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_tasks: int | None = None,
+        max_contexts: int | None = None,
+        terminal_task_ttl: float | None = None,
+        spill_path: str | None = None,
+        spill_max_tasks: int = 100000,
+    ):
         """Initialize in-memory storage.
 
-        Note: This is an __init__ method.
+        Args:
+            max_tasks: Evict idle contexts beyond this many tasks (None = unlimited)
+            max_contexts: Evict idle contexts beyond this many (None = unlimited)
+            terminal_task_ttl: Seconds ended tasks are kept (None = forever)
+            spill_path: SQLite file receiving evicted tasks (None = discard them)
+            spill_max_tasks: Maximum tasks kept in the spill file
         """
-        self.tasks: dict[UUID, Task] = {}
-        self.contexts: dict[UUID, list[UUID]] = {}
+        self.max_tasks = max_tasks
+        self.max_contexts = max_contexts
+        self.terminal_task_ttl = terminal_task_ttl
+        self._spill = (
+            SQLiteTaskSpill(spill_path, max_tasks=spill_max_tasks)
+            if spill_path
+            else None
+        )
+
+        self.tasks: dict[UUID, _StoredTask] = {}
+        self._task_keys: list[_Key] = []
+        self._task_keys_by_state: defaultdict[str, list[_Key]] = defaultdict(list)
+        self.contexts: OrderedDict[UUID, list[UUID]] = OrderedDict()
+        self._context_created_at: dict[UUID, datetime] = {}
+        self._context_keys: list[_Key] = []
+        self._history_summaries: dict[UUID, dict[str, Any]] = {}
+        self._last_created_at = datetime.min.replace(tzinfo=timezone.utc)
         self.task_feedback: dict[UUID, list[dict[str, Any]]] = {}
         self._webhook_configs: dict[UUID, PushNotificationConfig] = {}
+        self._terminal_since: OrderedDict[UUID, float] = OrderedDict()
+        self._running_counts: dict[UUID, int] = {}
+        self._idle_contexts: OrderedDict[UUID, None] = OrderedDict()
+        self._payload_bytes = 0
+        self._evicted = 0
+        self._expired = 0
 
     @retry_storage_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def load_task(
-        self, task_id: UUID, history_length: int | None = None
+        self,
+        task_id: UUID,
+        history_length: int | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> Task | None:
         """Load a task from memory.
 
         Args:
             task_id: Unique identifier of the task
             history_length: Optional limit on message history length
+            include_history: Include the message history (empty list if False)
+            include_artifacts: Include the artifacts (empty list if False)
 
         Returns:
             Task object if found, None otherwise
@@ -77,18 +231,18 @@ class InMemoryStorage(Storage[ContextT]):
         if not isinstance(task_id, UUID):
             raise TypeError(f"task_id must be UUID, got {type(task_id).__name__}")
 
-        task = self.tasks.get(task_id)
-        if task is None:
-            return None
+        record = self.tasks.get(task_id)
+        if record is None:
+            task = await self._load_spilled_task(task_id, history_length)
+            if task is not None:
+                if not include_history:
+                    task["history"] = []
+                if not include_artifacts and "artifacts" in task:
+                    task["artifacts"] = []
+            return task
 
-        # Always return a deep copy to prevent mutations affecting stored task
-        task_copy = cast(Task, copy.deepcopy(task))
-
-        # Limit history if requested
-        if history_length is not None and history_length > 0 and "history" in task:
-            task_copy["history"] = task["history"][-history_length:]
-
-        return task_copy
+        self._touch_context(record.context_id)
+        return record.snapshot(history_length, include_history, include_artifacts)
 
     @retry_storage_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def submit_task(self, context_id: UUID, message: Message) -> Task:
@@ -155,12 +309,16 @@ class InMemoryStorage(Storage[ContextT]):
                         )
                 message["reference_task_ids"] = normalized_refs
 
+        # Stored messages are never modified, so later changes by the caller
+        # must not reach them
+        message = copy.deepcopy(message)
+
         # Check if task already exists
         existing_task = self.tasks.get(task_id)
 
         if existing_task:
             # Task exists - check if it's mutable
-            current_state = existing_task["status"]["state"]
+            current_state = existing_task.status["state"]
 
             # Check if task is in terminal state (immutable)
             if current_state in app_settings.agent.terminal_states:
@@ -174,36 +332,44 @@ class InMemoryStorage(Storage[ContextT]):
                 f"Continuing existing task {task_id} from state '{current_state}'"
             )
 
-            if "history" not in existing_task:
-                existing_task["history"] = []
-            existing_task["history"].append(message)
+            existing_task.history = (*existing_task.history, message)
+            self._add_size(existing_task, message)
 
             # Reset to submitted state for re-execution
-            existing_task["status"] = TaskStatus(
-                state="submitted", timestamp=datetime.now(timezone.utc).isoformat()
-            )
+            self._set_status(existing_task, "submitted")
+            self._touch_context(existing_task.context_id)
 
-            return existing_task
+            return existing_task.snapshot()
 
         # Task doesn't exist - create new task
         task_status = TaskStatus(
             state="submitted", timestamp=datetime.now(timezone.utc).isoformat()
         )
-        task = Task(
+        record = _StoredTask(
             id=task_id,
             context_id=context_id,
             kind="task",
             status=task_status,
-            history=[message],
+            history=(message,),
+            created_at=self._next_created_at(),
         )
-        self.tasks[task_id] = task
+        self.tasks[task_id] = record
+        # created_at is the newest so far: appending keeps the key lists sorted
+        self._task_keys.append((record.created_at, task_id))
+        insort(self._task_keys_by_state["submitted"], (record.created_at, task_id))
+        self._add_size(record, message)
 
         # Add task to context
         if context_id not in self.contexts:
             self.contexts[context_id] = []
+            self._context_created_at[context_id] = record.created_at
+            self._context_keys.append((record.created_at, context_id))
         self.contexts[context_id].append(task_id)
+        self._count_running(context_id, 1)
+        self._touch_context(context_id)
 
-        return task
+        self._enforce_retention()
+        return record.snapshot()
 
     @retry_storage_operation(max_attempts=3, min_wait=0.1, max_wait=1)
     async def update_task(
@@ -213,6 +379,9 @@ class InMemoryStorage(Storage[ContextT]):
         new_artifacts: list[Artifact] | None = None,
         new_messages: list[Message] | None = None,
         metadata: dict[str, Any] | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> Task:
         """Update task state and append new content.
 
@@ -226,6 +395,8 @@ class InMemoryStorage(Storage[ContextT]):
             new_artifacts: Optional artifacts to append (for completion)
             new_messages: Optional messages to append to history
             metadata: Optional metadata to update/merge with task metadata
+            include_history: Return the history with the task (empty list if False)
+            include_artifacts: Return the artifacts with the task (empty list if False)
 
         Returns:
             Updated task object
@@ -240,24 +411,9 @@ class InMemoryStorage(Storage[ContextT]):
         if task_id not in self.tasks:
             raise KeyError(f"Task {task_id} not found")
 
-        task = self.tasks[task_id]
-        task["status"] = TaskStatus(
-            state=state, timestamp=datetime.now(timezone.utc).isoformat()
-        )
-
-        if metadata:
-            if "metadata" not in task:
-                task["metadata"] = {}
-            task["metadata"].update(metadata)
-
-        if new_artifacts:
-            if "artifacts" not in task:
-                task["artifacts"] = []
-            task["artifacts"].extend(new_artifacts)
+        record = self.tasks[task_id]
 
         if new_messages:
-            if "history" not in task:
-                task["history"] = []
             # Add IDs to messages for consistency
             for message in new_messages:
                 if not isinstance(message, dict):
@@ -265,11 +421,226 @@ class InMemoryStorage(Storage[ContextT]):
                         f"Message must be dict, got {type(message).__name__}"
                     )
                 message["task_id"] = task_id
-                message["context_id"] = task["context_id"]
-                task["history"].append(message)
+                message["context_id"] = record.context_id
+
+        self._set_status(record, state)
+
+        # Replace rather than mutate: earlier snapshots share these fields
+        if metadata:
+            record.metadata = {**(record.metadata or {}), **metadata}
+
+        if new_artifacts:
+            record.artifacts = (
+                *(record.artifacts or ()),
+                *copy.deepcopy(new_artifacts),
+            )
+            self._add_size(record, *new_artifacts)
+
+        if new_messages:
+            record.history = (*record.history, *copy.deepcopy(new_messages))
+            self._add_size(record, *new_messages)
+
+        self._enforce_retention()
+        return record.snapshot(
+            include_history=include_history, include_artifacts=include_artifacts
+        )
 
+    async def transition_task_state(
+        self, task_id: UUID, expected_state: TaskState, state: TaskState
+    ) -> bool:
+        """Set a task's state only if it is currently ``expected_state``.
+
+        The check and the update run without yielding to the event loop, so
+        concurrent transitions of the same task cannot both succeed.
+
+        Args:
+            task_id: Task to update
+            expected_state: State the task must be in
+            state: New task state
+
+        Returns:
+            True if the task was in ``expected_state`` and is now in ``state``
+
+        Raises:
+            TypeError: If task_id is not UUID
+        """
+        if not isinstance(task_id, UUID):
+            raise TypeError(f"task_id must be UUID, got {type(task_id).__name__}")
+
+        record = self.tasks.get(task_id)
+        if record is None or record.status["state"] != expected_state:
+            return False
+        self._set_status(record, state)
+        return True
+
+    def _set_status(self, record: _StoredTask, state: TaskState) -> None:
+        """Set a task's status and move it between the state indexes."""
+        previous = record.status["state"]
+        if previous != state:
+            self._unindex_state(record, previous)
+            insort(self._task_keys_by_state[state], (record.created_at, record.id))
+            terminal_states = app_settings.agent.terminal_states
+            if state in terminal_states:
+                self._terminal_since[record.id] = time.monotonic()
+            else:
+                self._terminal_since.pop(record.id, None)
+            ended = (state in terminal_states) - (previous in terminal_states)
+            if ended:
+                self._count_running(record.context_id, -ended)
+        record.status = TaskStatus(
+            state=state, timestamp=datetime.now(timezone.utc).isoformat()
+        )
+
+    def _unindex_state(self, record: _StoredTask, state: str) -> None:
+        keys = self._task_keys_by_state.get(state)
+        if keys is not None:
+            _remove_key(keys, (record.created_at, record.id))
+            if not keys:
+                del self._task_keys_by_state[state]
+
+    def _forget_context(self, context_id: UUID) -> None:
+        """Drop a context's creation time, sort key, history summary and counts."""
+        created_at = self._context_created_at.pop(context_id, None)
+        if created_at is not None:
+            _remove_key(self._context_keys, (created_at, context_id))
+        self._history_summaries.pop(context_id, None)
+        self._running_counts.pop(context_id, None)
+        self._idle_contexts.pop(context_id, None)
+
+    def _add_size(self, record: _StoredTask, *items: Any) -> None:
+        size = sum(len(json.dumps(item, default=str)) for item in items)
+        record.size_bytes += size
+        self._payload_bytes += size
+
+    def _next_created_at(self) -> datetime:
+        """Creation time after all earlier ones, so (created_at, id) is insertion order."""
+        now = datetime.now(timezone.utc)
+        if now <= self._last_created_at:
+            now = self._last_created_at + timedelta(microseconds=1)
+        self._last_created_at = now
+        return now
+
+    def _task_key(self, task_id: UUID) -> _Key:
+        """Sort key of a stored task (for bisecting a context's task IDs)."""
+        return self.tasks[task_id].created_at, task_id
+
+    def _touch_context(self, context_id: UUID) -> None:
+        """Mark a context as most recently used."""
+        if context_id in self.contexts:
+            self.contexts.move_to_end(context_id)
+            if context_id in self._idle_contexts:
+                self._idle_contexts.move_to_end(context_id)
+
+    def _count_running(self, context_id: UUID, delta: int) -> None:
+        """Adjust a context's unfinished task count and its idle membership."""
+        running = self._running_counts.get(context_id, 0) + delta
+        self._running_counts[context_id] = running
+        if running:
+            self._idle_contexts.pop(context_id, None)
+        else:
+            self._idle_contexts[context_id] = None
+
+    # -------------------------------------------------------------------------
+    # Retention
+    # -------------------------------------------------------------------------
+
+    def _enforce_retention(self) -> None:
+        """Expire ended tasks past their TTL, then evict LRU contexts over the caps.
+
+        Only contexts whose tasks have all ended are evicted; if every context
+        still has running tasks the caps are exceeded until some end.
+        """
+        if self.terminal_task_ttl is not None:
+            cutoff = time.monotonic() - self.terminal_task_ttl
+            while self._terminal_since:
+                task_id, ended_at = next(iter(self._terminal_since.items()))
+                if ended_at > cutoff:
+                    break
+                self._remove_task(task_id)
+                self._expired += 1
+
+        while self._over_capacity():
+            if not self._idle_contexts:
+                logger.warning(
+                    "InMemoryStorage over capacity but all contexts have running tasks"
+                )
+                return
+            self._evict_context(next(iter(self._idle_contexts)))
+
+    def _over_capacity(self) -> bool:
+        return (self.max_tasks is not None and len(self.tasks) > self.max_tasks) or (
+            self.max_contexts is not None and len(self.contexts) > self.max_contexts
+        )
+
+    def _evict_context(self, context_id: UUID) -> None:
+        """Evict a context with its tasks, spilling them if configured."""
+        task_ids = self.contexts.pop(context_id)
+        self._forget_context(context_id)
+        records = [self.tasks[task_id] for task_id in task_ids if task_id in self.tasks]
+        if self._spill is not None and records:
+            self._spill.put_many([record.snapshot() for record in records])
+        for record in records:
+            self._forget_task(record)
+        self._evicted += len(records)
+        logger.debug(f"Evicted context {context_id} with {len(records)} tasks")
+
+    def _remove_task(self, task_id: UUID) -> None:
+        """Drop a single task (TTL expiry), and its context once empty."""
+        record = self.tasks.get(task_id)
+        if record is None:
+            self._terminal_since.pop(task_id, None)
+            return
+        self._forget_task(record)
+        task_ids = self.contexts.get(record.context_id)
+        if task_ids is not None:
+            task_ids.remove(task_id)
+            if not task_ids:
+                del self.contexts[record.context_id]
+                self._forget_context(record.context_id)
+
+    def _forget_task(self, record: _StoredTask) -> None:
+        del self.tasks[record.id]
+        _remove_key(self._task_keys, (record.created_at, record.id))
+        self._unindex_state(record, record.status["state"])
+        self._terminal_since.pop(record.id, None)
+        self.task_feedback.pop(record.id, None)
+        self._webhook_configs.pop(record.id, None)
+        self._payload_bytes -= record.size_bytes
+
+    async def _load_spilled_task(
+        self, task_id: UUID, history_length: int | None
+    ) -> Task | None:
+        if self._spill is None:
+            return None
+        task = await self._spill.get(task_id)
+        if task is not None and history_length is not None and history_length > 0:
+            task["history"] = task["history"][-history_length:]
         return task
 
+    def close(self) -> None:
+        """Close the spill file, if any."""
+        if self._spill is not None:
+            self._spill.close()
+
+    def get_memory_stats(self) -> dict[str, int]:
+        """Retained data sizes and eviction counters (memory gauges).
+
+        ``payload_bytes`` approximates the JSON size of stored messages and
+        artifacts, the bulk of the storage's memory.
+        """
+        stats = {
+            "tasks": len(self.tasks),
+            "contexts": len(self.contexts),
+            "feedback": len(self.task_feedback),
+            "webhook_configs": len(self._webhook_configs),
+            "payload_bytes": self._payload_bytes,
+            "evicted_tasks": self._evicted,
+            "expired_tasks": self._expired,
+        }
+        if self._spill is not None:
+            stats["spilled_tasks"] = self._spill.count()
+        return stats
+
     async def update_context(self, context_id: UUID, context: ContextT) -> None:
         """Store or update context metadata.
 
@@ -338,12 +709,83 @@ class InMemoryStorage(Storage[ContextT]):
         Returns:
             List of tasks
         """
-        if length is None:
-            return list(self.tasks.values())
+        if length is None or length <= 0 or length >= len(self.tasks):
+            return [record.snapshot() for record in self.tasks.values()]
+
+        # Walk the submission order from the end: O(length), not O(all tasks)
+        recent = list(islice(reversed(self.tasks.values()), length))
+        return [record.snapshot() for record in reversed(recent)]
+
+    async def list_tasks_page(
+        self,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        *,
+        state: TaskState | None = None,
+        context_id: UUID | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        include_history: bool = False,
+        include_artifacts: bool = False,
+        history_length: int | None = None,
+    ) -> TaskListPage:
+        """List tasks newest first, one page at a time.
+
+        Bisects the narrowest sorted index (the context's tasks, the state's
+        keys, else all keys) to the cursor and creation time bounds, then
+        reads the page backwards from there: O(log n + page_size). Only a
+        state filter combined with a context skips non-matching tasks.
 
-        # Optimize: Only convert to list what we need
-        all_tasks = list(self.tasks.values())
-        return all_tasks[-length:] if length < len(all_tasks) else all_tasks
+        Args:
+            page_size: Maximum number of tasks in the page (None = all)
+            cursor: ``next_cursor`` of the previous page
+            state: Only list tasks in this state
+            context_id: Only list tasks of this context
+            created_after: Only list tasks created at or after this time
+            created_before: Only list tasks created before this time
+            include_history: Include message histories (empty lists if False)
+            include_artifacts: Include artifacts (empty lists if False)
+            history_length: Limit included histories to the last N messages
+
+        Returns:
+            Page with the tasks and the cursor of the next page (None if last)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+
+        # Each index is in ascending (created_at, id) order
+        index: list[Any]
+        key = None
+        if context_id is not None:
+            index = self.contexts.get(context_id, [])
+            key = self._task_key
+        elif state is not None:
+            index = self._task_keys_by_state.get(state, [])
+        else:
+            index = self._task_keys
+        lo, hi = _page_range(index, after, created_after, created_before, key=key)
+
+        records: list[_StoredTask] = []
+        has_more = False
+        for i in range(hi - 1, lo - 1, -1):
+            record = self.tasks[index[i] if key else index[i][1]]
+            if state is not None and record.status["state"] != state:
+                continue
+            if page_size is not None and len(records) >= page_size:
+                has_more = True
+                break
+            records.append(record)
+
+        last = records[-1] if has_more else None
+        return TaskListPage(
+            tasks=[
+                record.snapshot(history_length, include_history, include_artifacts)
+                for record in records
+            ],
+            next_cursor=encode_cursor(last.created_at, last.id) if last else None,
+        )
 
     async def count_tasks(self, status: str | None = None) -> int:
         """Count number of tasks, optionally filtered by status.
@@ -357,10 +799,15 @@ class InMemoryStorage(Storage[ContextT]):
         if status is None:
             return len(self.tasks)
 
-        return sum(1 for t in self.tasks.values() if t["status"]["state"] == status)
+        return len(self._task_keys_by_state.get(status, ()))
 
     async def list_tasks_by_context(
-        self, context_id: UUID, length: int | None = None
+        self,
+        context_id: UUID,
+        length: int | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> list[Task]:
         """List tasks belonging to a specific context.
 
@@ -369,6 +816,8 @@ class InMemoryStorage(Storage[ContextT]):
         Args:
             context_id: Context to filter tasks by
             length: Optional limit on number of tasks to return (most recent)
+            include_history: Include the message histories (empty lists if False)
+            include_artifacts: Include the artifacts (empty lists if False)
 
         Returns:
             List of tasks in the context
@@ -381,9 +830,23 @@ class InMemoryStorage(Storage[ContextT]):
 
         # Get task IDs from context
         task_ids = self.contexts.get(context_id, [])
-        tasks: list[Task] = [
-            self.tasks[task_id] for task_id in task_ids if task_id in self.tasks
+        self._touch_context(context_id)
+        tasks = [
+            self.tasks[task_id].snapshot(
+                include_history=include_history, include_artifacts=include_artifacts
+            )
+            for task_id in task_ids
+            if task_id in self.tasks
         ]
+        if self._spill is not None:
+            # Evicted earlier tasks of the conversation come first
+            spilled = await self._spill.list_context(context_id)
+            for task in spilled:
+                if not include_history:
+                    task["history"] = []
+                if not include_artifacts and "artifacts" in task:
+                    task["artifacts"] = []
+            tasks = spilled + tasks
 
         if length is not None and length > 0 and length < len(tasks):
             return tasks[-length:]
@@ -407,6 +870,50 @@ class InMemoryStorage(Storage[ContextT]):
             return contexts[-length:]
         return contexts
 
+    async def list_contexts_page(
+        self,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        *,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> ContextListPage:
+        """List contexts newest first, one page at a time.
+
+        Args:
+            page_size: Maximum number of contexts in the page (None = all)
+            cursor: ``next_cursor`` of the previous page
+            created_after: Only list contexts created at or after this time
+            created_before: Only list contexts created before this time
+
+        Returns:
+            Page with context summaries and the cursor of the next page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+
+        # self.contexts is in LRU order; _context_keys is in creation order
+        lo, hi = _page_range(self._context_keys, after, created_after, created_before)
+        if page_size is not None and hi - lo > page_size:
+            has_more, start = True, hi - page_size
+        else:
+            has_more, start = False, lo
+        keys = self._context_keys[start:hi][::-1]
+
+        return ContextListPage(
+            contexts=[
+                {
+                    "context_id": ctx_id,
+                    "task_count": len(self.contexts[ctx_id]),
+                    "task_ids": self.contexts[ctx_id],
+                }
+                for _, ctx_id in keys
+            ],
+            next_cursor=encode_cursor(*keys[-1]) if has_more else None,
+        )
+
     async def clear_context(self, context_id: UUID) -> None:
         """Clear all tasks associated with a specific context.
 
@@ -424,6 +931,8 @@ class InMemoryStorage(Storage[ContextT]):
 
         # Check if context exists
         if context_id not in self.contexts:
+            if self._spill is not None and await self._spill.delete_context(context_id):
+                return
             raise ValueError(f"Context {context_id} not found")
 
         # Get task IDs from the context
@@ -432,13 +941,20 @@ class InMemoryStorage(Storage[ContextT]):
         # Remove all tasks associated with this context
         for task_id in task_ids:
             if task_id in self.tasks:
-                del self.tasks[task_id]
+                record = self.tasks.pop(task_id)
+                _remove_key(self._task_keys, (record.created_at, task_id))
+                self._unindex_state(record, record.status["state"])
+                self._terminal_since.pop(task_id, None)
+                self._payload_bytes -= record.size_bytes
             # Also clear feedback for these tasks
             if task_id in self.task_feedback:
                 del self.task_feedback[task_id]
 
         # Remove the context itself
         del self.contexts[context_id]
+        self._forget_context(context_id)
+        if self._spill is not None:
+            await self._spill.delete_context(context_id)
 
         logger.info(f"Cleared context {context_id}: removed {len(task_ids)} tasks")
 
@@ -448,9 +964,20 @@ class InMemoryStorage(Storage[ContextT]):
         Warning: This is a destructive operation.
         """
         self.tasks.clear()
+        self._task_keys.clear()
+        self._task_keys_by_state.clear()
+        self._terminal_since.clear()
+        self._running_counts.clear()
+        self._idle_contexts.clear()
+        self._payload_bytes = 0
         self.contexts.clear()
+        self._context_created_at.clear()
+        self._context_keys.clear()
+        self._history_summaries.clear()
         self.task_feedback.clear()
         self._webhook_configs.clear()
+        if self._spill is not None:
+            await self._spill.clear()
 
     async def store_task_feedback(
         self, task_id: UUID, feedback_data: dict[str, Any]
@@ -493,6 +1020,32 @@ class InMemoryStorage(Storage[ContextT]):
 
         return self.task_feedback.get(task_id)
 
+    # -------------------------------------------------------------------------
+    # History Summary Operations
+    # -------------------------------------------------------------------------
+
+    async def save_history_summary(
+        self, context_id: UUID, summary: dict[str, Any]
+    ) -> None:
+        """Store the rolling summary of a context (dropped with the context).
+
+        Args:
+            context_id: Context the summary belongs to
+            summary: Summary record (text and number of messages it covers)
+        """
+        self._history_summaries[context_id] = summary
+
+    async def load_history_summary(self, context_id: UUID) -> dict[str, Any] | None:
+        """Load the rolling summary of a context.
+
+        Args:
+            context_id: Context to get the summary for
+
+        Returns:
+            Summary record or None if the context has none
+        """
+        return self._history_summaries.get(context_id)
+
     # -------------------------------------------------------------------------
     # Webhook Persistence Operations (for long-running tasks)
     # -------------------------------------------------------------------------
@@ -0,0 +1,321 @@
+"""Range partitioning of the tasks table by ``created_at``.
+
+Optional (``POSTGRES_PARTITION_TASKS``). When enabled, ``tasks`` becomes a
+table partitioned by ``created_at`` with one partition per day/week/month:
+
+- The existing heap is kept as the partition of everything created before the
+  conversion (``tasks_legacy``, from MINVALUE), so converting needs no copy.
+- Partitions for the current and the next ``premake`` periods are created
+  ahead of time; a DEFAULT partition catches rows outside them.
+- Old partitions are detached once all their tasks are older than the
+  retention period, and either dropped or moved to an archive schema together
+  with the messages, artifacts, events and feedback of their tasks. The
+  detach and the batched removal of those rows run in separate transactions.
+
+A unique constraint on a partitioned table must include the partition key, so
+the primary key becomes ``(id, created_at)`` and the foreign keys from
+task_messages, task_artifacts, task_events, task_feedback and webhook_configs
+to ``tasks.id`` are dropped; PostgresStorage deletes those rows itself.
+
+All statements use unqualified table names: they act on the schema of the
+connection's search_path (``public`` or a DID schema).
+"""
+
+from __future__ import annotations as _annotations
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from bindu.utils.logging import get_logger
+
+from .helpers import sanitize_identifier
+
+logger = get_logger("bindu.server.storage.partitioning")
+
+PartitionInterval = Literal["day", "week", "month"]
+
+# Tables holding rows of a task, removed/archived with the task's partition
+TASK_CHILD_TABLES = (
+    "task_messages",
+    "task_artifacts",
+    "task_events",
+    "task_feedback",
+    "webhook_configs",
+)
+
+_CONVERT_TASKS_SQL = """
+DO $$
+DECLARE
+    r RECORD;
+    cutover TIMESTAMPTZ := date_trunc('{interval}', NOW(), 'UTC') + INTERVAL '1 {interval}';
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = to_regclass('tasks')) <> 'r' THEN
+        RETURN;  -- missing or already partitioned
+    END IF;
+
+    -- Foreign keys to tasks(id) cannot reference a partitioned tasks table
+    FOR r IN
+        SELECT conrelid::regclass AS tbl, conname FROM pg_constraint
+        WHERE confrelid = to_regclass('tasks') AND contype = 'f'
+    LOOP
+        EXECUTE format('ALTER TABLE %s DROP CONSTRAINT %I', r.tbl, r.conname);
+    END LOOP;
+
+    -- The current heap becomes the partition of all rows before the cutover
+    ALTER TABLE tasks RENAME TO tasks_legacy;
+    FOR r IN
+        SELECT indexname FROM pg_indexes
+        WHERE schemaname = current_schema() AND tablename = 'tasks_legacy'
+    LOOP
+        EXECUTE format(
+            'ALTER INDEX %I RENAME TO %I', r.indexname, left(r.indexname, 55) || '_legacy'
+        );
+    END LOOP;
+    DROP TRIGGER IF EXISTS update_tasks_updated_at ON tasks_legacy;
+
+    CREATE TABLE tasks (LIKE tasks_legacy INCLUDING DEFAULTS INCLUDING COMMENTS)
+        PARTITION BY RANGE (created_at);
+    ALTER TABLE tasks ADD CONSTRAINT tasks_pkey PRIMARY KEY (id, created_at);
+    ALTER TABLE tasks ADD CONSTRAINT fk_tasks_context FOREIGN KEY (context_id)
+        REFERENCES contexts(id) ON DELETE CASCADE;
+    CREATE INDEX idx_tasks_context_id ON tasks (context_id);
+    CREATE INDEX idx_tasks_state ON tasks (state);
+    CREATE INDEX idx_tasks_created_at ON tasks (created_at);
+    CREATE INDEX idx_tasks_updated_at ON tasks (updated_at);
+    CREATE INDEX idx_tasks_created_at_id ON tasks (created_at, id);
+    CREATE INDEX idx_tasks_context_created_at ON tasks (context_id, created_at, id);
+    CREATE INDEX idx_tasks_metadata_gin ON tasks USING gin (metadata);
+    IF to_regproc('update_updated_at_column') IS NOT NULL THEN
+        CREATE TRIGGER update_tasks_updated_at BEFORE UPDATE ON tasks
+            FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+    END IF;
+
+    EXECUTE format(
+        'ALTER TABLE tasks ATTACH PARTITION tasks_legacy FOR VALUES FROM (MINVALUE) TO (%L)',
+        cutover
+    );
+    CREATE TABLE tasks_default PARTITION OF tasks DEFAULT;
+END $$;
+"""
+
+# Creating a range partition fails if it overlaps tasks_legacy (42P17) or if
+# the default partition already holds rows of its range (23514); both leave
+# the rows where they are.
+_CREATE_PARTITION_SQL = """
+DO $$
+BEGIN
+    CREATE TABLE IF NOT EXISTS {name} PARTITION OF tasks
+        FOR VALUES FROM ('{start}') TO ('{end}');
+EXCEPTION WHEN invalid_object_definition OR check_violation THEN
+    RAISE NOTICE 'Partition {name} not created: %', SQLERRM;
+END $$;
+"""
+
+_LIST_PARTITIONS_SQL = """
+SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bound
+FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+WHERE i.inhparent = to_regclass('tasks')
+ORDER BY c.relname
+"""
+
+_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+
+def partition_bounds(
+    moment: datetime, interval: PartitionInterval
+) -> tuple[datetime, datetime]:
+    """Return the start and end (exclusive) of the period containing a moment.
+
+    Periods are aligned like PostgreSQL's ``date_trunc`` in UTC (weeks start
+    on Monday).
+    """
+    moment = moment.astimezone(timezone.utc)
+    start = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == "day":
+        return start, start + timedelta(days=1)
+    if interval == "week":
+        start -= timedelta(days=start.weekday())
+        return start, start + timedelta(weeks=1)
+    start = start.replace(day=1)
+    if start.month == 12:
+        return start, start.replace(year=start.year + 1, month=1)
+    return start, start.replace(month=start.month + 1)
+
+
+def partition_name(start: datetime) -> str:
+    """Name of the partition starting at ``start``."""
+    return f"tasks_p{start:%Y%m%d}"
+
+
+def convert_tasks_statement(interval: PartitionInterval) -> str:
+    """SQL converting an unpartitioned tasks table in place (no-op otherwise)."""
+    return _CONVERT_TASKS_SQL.format(interval=interval)
+
+
+def create_partition_statements(
+    now: datetime, interval: PartitionInterval, premake: int
+) -> list[str]:
+    """SQL creating the partitions of the current and next ``premake`` periods."""
+    statements = []
+    moment = now
+    for _ in range(premake + 1):
+        start, end = partition_bounds(moment, interval)
+        statements.append(
+            _CREATE_PARTITION_SQL.format(
+                name=partition_name(start), start=start.isoformat(), end=end.isoformat()
+            )
+        )
+        moment = end
+    return statements
+
+
+def partition_upper_bound(bound: str) -> datetime | None:
+    """Parse the exclusive upper bound of a range partition (None for DEFAULT)."""
+    match = _UPPER_BOUND.search(bound)
+    return datetime.fromisoformat(match.group(1)) if match else None
+
+
+async def is_partitioned(conn: AsyncConnection) -> bool:
+    """Whether the tasks table of the current schema is partitioned."""
+    result = await conn.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass('tasks')")
+    )
+    return result.scalar() == "p"
+
+
+async def partition_tasks_table(
+    conn: AsyncConnection,
+    interval: PartitionInterval = "month",
+    premake: int = 3,
+) -> None:
+    """Convert the tasks table to range partitions and create upcoming partitions.
+
+    Safe to run repeatedly: conversion only happens once, existing partitions
+    are kept.
+    """
+    await conn.execute(text(convert_tasks_statement(interval)))
+    await ensure_task_partitions(conn, interval, premake)
+
+
+async def ensure_task_partitions(
+    conn: AsyncConnection,
+    interval: PartitionInterval = "month",
+    premake: int = 3,
+    now: datetime | None = None,
+) -> None:
+    """Create the partitions of the current and next ``premake`` periods."""
+    for statement in create_partition_statements(
+        now or datetime.now(timezone.utc), interval, premake
+    ):
+        await conn.execute(text(statement))
+
+
+async def archive_task_partitions(
+    engine: AsyncEngine,
+    before: datetime,
+    archive_schema: str | None = None,
+    batch_size: int = 1000,
+) -> list[str]:
+    """Detach the partitions whose tasks were all created before ``before``.
+
+    Each step runs in its own transaction so ``tasks`` is never locked for
+    longer than the detach itself: the partition is detached first
+    (``CONCURRENTLY`` where possible, see ``_detach_partition``), then the
+    child rows of its tasks are deleted in batches of ``batch_size``. With an
+    archive schema, each batch is copied to ``<partition>_<table>`` by the
+    same statement that deletes it and the partition is moved there;
+    otherwise it is dropped.
+
+    Args:
+        engine: Engine whose connections' search_path is the tasks' schema
+        before: Detach partitions ending at or before this moment
+        archive_schema: Schema receiving detached partitions (None to drop them)
+        batch_size: Child rows deleted (and copied) per transaction
+
+    Returns:
+        Names of the detached partitions
+    """
+    async with engine.begin() as conn:
+        result = await conn.execute(text(_LIST_PARTITIONS_SQL))
+        partitions = result.fetchall()
+        expired = [
+            row.name
+            for row in partitions
+            if (upper := partition_upper_bound(row.bound)) is not None
+            and upper <= before
+        ]
+        if not expired:
+            return []
+        if archive_schema:
+            archive_schema = sanitize_identifier(archive_schema)
+            await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))
+        # PostgreSQL refuses concurrent detaches while a DEFAULT partition exists
+        concurrently = conn.dialect.server_version_info >= (14,) and not any(
+            row.bound == "DEFAULT" for row in partitions
+        )
+
+    for name in expired:
+        await _detach_partition(engine, name, concurrently)
+        for child in TASK_CHILD_TABLES:
+            await _remove_child_rows(engine, name, child, archive_schema, batch_size)
+        async with engine.begin() as conn:
+            if archive_schema:
+                await conn.execute(
+                    text(f'ALTER TABLE "{name}" SET SCHEMA "{archive_schema}"')
+                )
+            else:
+                await conn.execute(text(f'DROP TABLE "{name}"'))
+        logger.info(
+            f"Detached task partition {name}"
+            + (f" into schema '{archive_schema}'" if archive_schema else " (dropped)")
+        )
+    return expired
+
+
+async def _detach_partition(engine: AsyncEngine, name: str, concurrently: bool) -> None:
+    """Detach a partition from tasks outside of any transaction block.
+
+    ``DETACH PARTITION ... CONCURRENTLY`` (PostgreSQL 14+) only takes a SHARE
+    UPDATE EXCLUSIVE lock on tasks, so reads and writes continue while it
+    runs. Otherwise the plain detach holds ACCESS EXCLUSIVE for just this
+    statement.
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        suffix = " CONCURRENTLY" if concurrently else ""
+        await conn.execute(text(f'ALTER TABLE tasks DETACH PARTITION "{name}"{suffix}'))
+
+
+async def _remove_child_rows(
+    engine: AsyncEngine,
+    partition: str,
+    child: str,
+    archive_schema: str | None,
+    batch_size: int,
+) -> None:
+    """Delete a detached partition's rows from a child table in batches."""
+    batch = (
+        f"DELETE FROM {child} WHERE ctid IN ("
+        f"SELECT ctid FROM {child} WHERE task_id IN "
+        f'(SELECT id FROM "{partition}") LIMIT {int(batch_size)})'
+    )
+    if archive_schema:
+        archive_table = f'"{archive_schema}"."{partition}_{child}"'
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {archive_table} "
+                    f"(LIKE {child} INCLUDING DEFAULTS)"
+                )
+            )
+        batch = f"WITH batch AS ({batch} RETURNING *) INSERT INTO {archive_table} SELECT * FROM batch"
+
+    while True:
+        async with engine.begin() as conn:
+            result = await conn.execute(text(batch))
+        if result.rowcount < batch_size:
+            return
@@ -19,25 +19,52 @@ Features:
 - Connection pooling for performance
 - Automatic retry logic for transient failures
 - JSONB for efficient storage of A2A protocol objects
+- Append-only history/artifact rows (no rewrite of the task on each message)
+- Optional group commit of task updates (postgres_write_batch_ms)
+- Optional range partitioning of tasks by created_at, with retention
 - Transaction support for data consistency
 - Indexed queries for fast lookups
 """
 
 from __future__ import annotations as _annotations
 
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, update, cast
-from sqlalchemy.dialects.postgresql import insert, JSONB, JSON
+from sqlalchemy import (
+    Integer,
+    String,
+    any_,
+    cast,
+    column,
+    delete,
+    func,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy import values as values_clause
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    JSON,
+    JSONB,
+    UUID as PG_UUID,
+    insert,
+)
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from typing_extensions import TypeVar
 
 from bindu.common.protocol.types import (
     Artifact,
+    ContextListPage,
     Message,
     PushNotificationConfig,
     Task,
+    TaskListPage,
     TaskState,
     TaskStatus,
 )
@@ -46,6 +73,8 @@ from bindu.utils.logging import get_logger
 
 from .base import Storage
 from .helpers import (
+    decode_cursor,
+    encode_cursor,
     mask_database_url,
     normalize_message_uuids,
     normalize_uuid,
@@ -54,9 +83,18 @@ from .helpers import (
     validate_uuid_type,
 )
 from .helpers.db_operations import get_current_utc_timestamp
+from .partitioning import (
+    archive_task_partitions,
+    ensure_task_partitions,
+    is_partitioned,
+    partition_tasks_table,
+)
 from .schema import (
     contexts_table,
+    task_artifacts_table,
+    task_events_table,
     task_feedback_table,
+    task_messages_table,
     tasks_table,
     webhook_configs_table,
 )
@@ -66,11 +104,30 @@ logger = get_logger("bindu.server.storage.postgres_storage")
 ContextT = TypeVar("ContextT", default=Any)
 
 
+@dataclass(slots=True)
+class _PendingUpdate:
+    """An update_task call waiting for the next group commit."""
+
+    task_id: UUID
+    state: TaskState
+    new_artifacts: list[Artifact]
+    new_messages: list[Message]
+    metadata: dict[str, Any]
+    future: asyncio.Future = field(repr=False)
+
+
+def _event_lock_key(task_id: UUID) -> int:
+    """Advisory lock key serializing event appends of one task (signed bigint)."""
+    return int.from_bytes(task_id.bytes[:8], "big", signed=True)
+
+
 class PostgresStorage(Storage[ContextT]):
     """PostgreSQL storage implementation using SQLAlchemy imperative mapping.
 
     Storage Structure:
-    - tasks_table: All tasks with JSONB history and artifacts
+    - tasks_table: All tasks (state, metadata, history/artifact counters)
+    - task_messages_table / task_artifacts_table: History and artifacts, one
+      row per item keyed by (task_id, seq)
     - contexts_table: Context metadata and message history
     - task_feedback_table: Optional feedback storage
 
@@ -90,6 +147,8 @@ class PostgresStorage(Storage[ContextT]):
         timeout: int | None = None,
         command_timeout: int | None = None,
         did: str | None = None,
+        write_batch_ms: float | None = None,
+        write_batch_max: int | None = None,
     ):
         """Initialize PostgreSQL storage with SQLAlchemy.
 
@@ -102,6 +161,10 @@ class PostgresStorage(Storage[ContextT]):
             did: Decentralized Identifier for schema-based multi-tenancy isolation.
                 If provided, all operations will be scoped to this DID's schema.
                 If None, uses the 'public' schema (legacy behavior).
+            write_batch_ms: Group-commit window for task updates, 0 to disable
+                (defaults to settings)
+            write_batch_max: Flush a batch early at this many updates
+                (defaults to settings)
         """
         # Use database URL from settings or parameter
         db_url = database_url or app_settings.storage.postgres_url
@@ -121,8 +184,20 @@ class PostgresStorage(Storage[ContextT]):
             command_timeout or app_settings.storage.postgres_command_timeout
         )
 
+        self.write_batch_ms = (
+            write_batch_ms
+            if write_batch_ms is not None
+            else app_settings.storage.postgres_write_batch_ms
+        )
+        self.write_batch_max = (
+            write_batch_max or app_settings.storage.postgres_write_batch_max
+        )
+
         self._engine = None
         self._session_factory = None
+        self._pending_updates: list[_PendingUpdate] = []
+        self._flush_task: asyncio.Task | None = None
+        self._maintenance_task: asyncio.Task | None = None
         self.did = did
         self.schema_name: str | None = None
 
@@ -181,14 +256,34 @@ class PostgresStorage(Storage[ContextT]):
                 logger.info(
                     f"Initializing schema '{self.schema_name}' for DID '{self.did}'..."
                 )
+                storage_settings = app_settings.storage
                 await initialize_did_schema(
-                    self._engine, self.schema_name, create_tables=True
+                    self._engine,
+                    self.schema_name,
+                    create_tables=True,
+                    partition_interval=(
+                        storage_settings.postgres_partition_interval
+                        if storage_settings.postgres_partition_tasks
+                        else None
+                    ),
+                    partition_premake=storage_settings.postgres_partition_premake,
                 )
                 logger.info(f"Schema '{self.schema_name}' initialized successfully")
             else:
                 # Test connection if no DID schema initialization
                 async with self._engine.begin() as conn:
                     await conn.execute(select(1))
+                    if app_settings.storage.postgres_partition_tasks:
+                        await partition_tasks_table(
+                            conn,
+                            app_settings.storage.postgres_partition_interval,
+                            app_settings.storage.postgres_partition_premake,
+                        )
+
+            if app_settings.storage.postgres_partition_tasks:
+                self._maintenance_task = asyncio.create_task(
+                    self._partition_maintenance_loop()
+                )
 
             logger.info(
                 f"PostgreSQL storage connected to {masked_url} (pool_size={self.pool_max})"
@@ -201,7 +296,11 @@ class PostgresStorage(Storage[ContextT]):
 
     async def disconnect(self) -> None:
         """Close SQLAlchemy engine and connection pool."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
         if self._engine:
+            await self._flush_updates()
             await self._engine.dispose()
             logger.info("PostgreSQL connection pool closed")
             self._engine = None
@@ -260,11 +359,18 @@ class PostgresStorage(Storage[ContextT]):
             **kwargs,
         )
 
-    def _row_to_task(self, row) -> Task:
+    def _row_to_task(
+        self,
+        row,
+        history: list[Message] | None = None,
+        artifacts: list[Artifact] | None = None,
+    ) -> Task:
         """Convert database row to Task protocol type.
 
         Args:
-            row: SQLAlchemy Row object
+            row: SQLAlchemy Row object of tasks_table
+            history: Messages of the task, in order
+            artifacts: Artifacts of the task, in order
 
         Returns:
             Task TypedDict from protocol
@@ -276,23 +382,177 @@ class PostgresStorage(Storage[ContextT]):
             status=TaskStatus(
                 state=row.state, timestamp=row.state_timestamp.isoformat()
             ),
-            history=row.history or [],
-            artifacts=row.artifacts or [],
+            history=history or [],
+            artifacts=artifacts or [],
             metadata=row.metadata or {},
         )
 
+    async def _load_history(
+        self, session: AsyncSession, task_id: UUID, history_length: int | None = None
+    ) -> list[Message]:
+        """Load a task's messages, the last ``history_length`` ones if given."""
+        stmt = (
+            select(task_messages_table.c.message)
+            .where(task_messages_table.c.task_id == task_id)
+            .order_by(task_messages_table.c.seq.desc())
+        )
+        if history_length is not None and history_length > 0:
+            stmt = stmt.limit(history_length)
+        result = await session.execute(stmt)
+        return [row.message for row in result.fetchall()][::-1]
+
+    async def _load_artifacts(
+        self, session: AsyncSession, task_id: UUID
+    ) -> list[Artifact]:
+        """Load a task's artifacts in order."""
+        stmt = (
+            select(task_artifacts_table.c.artifact)
+            .where(task_artifacts_table.c.task_id == task_id)
+            .order_by(task_artifacts_table.c.seq.asc())
+        )
+        result = await session.execute(stmt)
+        return [row.artifact for row in result.fetchall()]
+
+    async def _rows_to_tasks(
+        self,
+        session: AsyncSession,
+        rows,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+        history_length: int | None = None,
+        history_lengths: dict[UUID, int] | None = None,
+    ) -> list[Task]:
+        """Convert task rows to Tasks, loading their contents in two queries.
+
+        With ``history_length``, only the last N messages of each task are
+        read (ranked per task in the query). ``history_lengths`` sets the
+        limit per task; the limits are joined into the query from two
+        unnested arrays.
+        """
+        task_ids = [row.id for row in rows]
+        if not task_ids:
+            return []
+
+        limits: dict[UUID, int] = {}
+        if history_lengths or (history_length is not None and history_length > 0):
+            for task_id in task_ids:
+                limit = (history_lengths or {}).get(task_id, history_length)
+                if limit is not None and limit > 0:
+                    limits[task_id] = limit
+
+        messages: dict[UUID, list[Message]] | None = None
+        if include_history:
+            messages = defaultdict(list)
+            stmt = select(
+                task_messages_table.c.task_id, task_messages_table.c.message
+            ).where(task_messages_table.c.task_id.in_(task_ids))
+            if limits:
+                ranked = stmt.add_columns(
+                    task_messages_table.c.seq,
+                    func.row_number()
+                    .over(
+                        partition_by=task_messages_table.c.task_id,
+                        order_by=task_messages_table.c.seq.desc(),
+                    )
+                    .label("rank"),
+                ).subquery()
+                stmt = select(ranked.c.task_id, ranked.c.message).order_by(
+                    ranked.c.task_id, ranked.c.seq
+                )
+                if history_lengths:
+                    per_task = (
+                        func.unnest(
+                            cast(list(limits), ARRAY(PG_UUID(as_uuid=True))),
+                            cast(list(limits.values()), ARRAY(Integer)),
+                        )
+                        .table_valued("task_id", "max_messages")
+                        .render_derived(name="limits")
+                    )
+                    # Tasks without a limit have no row in per_task: keep all
+                    stmt = stmt.select_from(
+                        ranked.outerjoin(
+                            per_task, per_task.c.task_id == ranked.c.task_id
+                        )
+                    ).where(
+                        per_task.c.max_messages.is_(None)
+                        | (ranked.c.rank <= per_task.c.max_messages)
+                    )
+                else:
+                    stmt = stmt.where(ranked.c.rank <= history_length)
+            else:
+                stmt = stmt.order_by(
+                    task_messages_table.c.task_id, task_messages_table.c.seq
+                )
+            result = await session.execute(stmt)
+            for item in result.fetchall():
+                messages[item.task_id].append(item.message)
+
+        artifacts: dict[UUID, list[Artifact]] | None = None
+        if include_artifacts:
+            artifacts = defaultdict(list)
+            result = await session.execute(
+                select(task_artifacts_table.c.task_id, task_artifacts_table.c.artifact)
+                .where(task_artifacts_table.c.task_id.in_(task_ids))
+                .order_by(task_artifacts_table.c.task_id, task_artifacts_table.c.seq)
+            )
+            for item in result.fetchall():
+                artifacts[item.task_id].append(item.artifact)
+
+        return [
+            self._row_to_task(
+                row,
+                messages.get(row.id) if messages is not None else None,
+                artifacts.get(row.id) if artifacts is not None else None,
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _numbered_rows(
+        column: str, task_id: UUID, last_seq: int, items
+    ) -> list[dict[str, Any]]:
+        """Build content rows numbered up to ``last_seq`` (the new count)."""
+        first_seq = last_seq - len(items) + 1
+        return [
+            {"task_id": task_id, "seq": first_seq + i, column: item}
+            for i, item in enumerate(items)
+        ]
+
+    @staticmethod
+    async def _append_rows(
+        session: AsyncSession, table, column: str, task_id: UUID, last_seq: int, items
+    ) -> None:
+        """Insert items as rows numbered up to ``last_seq`` (the new count)."""
+        await session.execute(
+            insert(table).values(
+                PostgresStorage._numbered_rows(column, task_id, last_seq, items)
+            )
+        )
+
     # -------------------------------------------------------------------------
     # Task Operations
     # -------------------------------------------------------------------------
 
     async def load_task(
-        self, task_id: UUID, history_length: int | None = None
+        self,
+        task_id: UUID,
+        history_length: int | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> Task | None:
         """Load a task from PostgreSQL using SQLAlchemy.
 
+        The task row, the history and the artifacts are separate queries;
+        only the requested ones are run. With ``history_length`` only the last
+        messages are read from the database.
+
         Args:
             task_id: Unique identifier of the task
             history_length: Optional limit on message history length
+            include_history: Load the message history (empty list if False)
+            include_artifacts: Load the artifacts (empty list if False)
 
         Returns:
             Task object if found, None otherwise
@@ -313,13 +573,19 @@ class PostgresStorage(Storage[ContextT]):
                 if row is None:
                     return None
 
-                task = self._row_to_task(row)
-
-                # Limit history if requested
-                if history_length is not None and history_length > 0:
-                    task["history"] = task["history"][-history_length:]
-
-                return task
+                # Only the requested tail of the history is read (index scan
+                # on (task_id, seq) backwards)
+                history = (
+                    await self._load_history(session, task_id, history_length)
+                    if include_history
+                    else None
+                )
+                artifacts = (
+                    await self._load_artifacts(session, task_id)
+                    if include_artifacts
+                    else None
+                )
+                return self._row_to_task(row, history, artifacts)
 
         return await self._retry_on_connection_error(_load)
 
@@ -372,15 +638,11 @@ class PostgresStorage(Storage[ContextT]):
                             f"Continuing existing task {task_id} from state '{current_state}'"
                         )
 
-                        serialized_message = serialize_for_jsonb(message)
                         stmt = (
                             update(tasks_table)
                             .where(tasks_table.c.id == task_id)
                             .values(
-                                history=func.jsonb_concat(
-                                    tasks_table.c.history,
-                                    cast([serialized_message], JSONB),
-                                ),
+                                message_count=tasks_table.c.message_count + 1,
                                 state="submitted",
                                 state_timestamp=get_current_utc_timestamp(),
                                 updated_at=get_current_utc_timestamp(),
@@ -390,7 +652,19 @@ class PostgresStorage(Storage[ContextT]):
                         result = await session.execute(stmt)
                         updated_row = result.first()
 
-                        return self._row_to_task(updated_row)
+                        await self._append_rows(
+                            session,
+                            task_messages_table,
+                            "message",
+                            task_id,
+                            updated_row.message_count,
+                            [serialize_for_jsonb(message)],
+                        )
+                        return self._row_to_task(
+                            updated_row,
+                            await self._load_history(session, task_id),
+                            await self._load_artifacts(session, task_id),
+                        )
 
                     # Ensure context exists BEFORE creating task (foreign key constraint)
                     stmt = insert(contexts_table).values(
@@ -411,8 +685,8 @@ class PostgresStorage(Storage[ContextT]):
                             kind="task",
                             state="submitted",
                             state_timestamp=now,
-                            history=[serialized_message],
-                            artifacts=[],
+                            message_count=1,
+                            artifact_count=0,
                             metadata={},
                         )
                         .returning(tasks_table)
@@ -420,7 +694,15 @@ class PostgresStorage(Storage[ContextT]):
                     result = await session.execute(stmt)
                     new_row = result.first()
 
-                    return self._row_to_task(new_row)
+                    await self._append_rows(
+                        session,
+                        task_messages_table,
+                        "message",
+                        task_id,
+                        1,
+                        [serialized_message],
+                    )
+                    return self._row_to_task(new_row, [serialized_message])
 
         return await self._retry_on_connection_error(_submit)
 
@@ -431,15 +713,33 @@ class PostgresStorage(Storage[ContextT]):
         new_artifacts: list[Artifact] | None = None,
         new_messages: list[Message] | None = None,
         metadata: dict[str, Any] | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+        durable: bool | None = None,
     ) -> Task:
         """Update task state and append new content using SQLAlchemy.
 
+        The task row is updated with a single ``UPDATE ... RETURNING`` (no
+        prior SELECT); a missing row means the task does not exist. New
+        messages and artifacts are then inserted, and the history/artifacts
+        of the returned task are only read if requested.
+
+        With group commit enabled (``write_batch_ms``), updates that do not
+        need the history or artifacts back join a batch that is written in
+        one transaction when the window ends; the call returns once the batch
+        is committed. Durable updates flush the batch immediately.
+
         Args:
             task_id: Task to update
             state: New task state
             new_artifacts: Optional artifacts to append
             new_messages: Optional messages to append to history
             metadata: Optional metadata to update/merge
+            include_history: Return the history with the task (empty list if False)
+            include_artifacts: Return the artifacts with the task (empty list if False)
+            durable: Commit without waiting for the batch window
+                (defaults to True for terminal states)
 
         Returns:
             Updated task object
@@ -450,67 +750,257 @@ class PostgresStorage(Storage[ContextT]):
         """
         task_id = validate_uuid_type(task_id, "task_id")
 
+        if new_messages:
+            for message in new_messages:
+                if not isinstance(message, dict):
+                    raise TypeError(
+                        f"Message must be dict, got {type(message).__name__}"
+                    )
+
         self._ensure_connected()
 
+        if self.write_batch_ms > 0 and not include_history and not include_artifacts:
+            if durable is None:
+                durable = state in app_settings.agent.terminal_states
+            return await self._buffer_update(
+                _PendingUpdate(
+                    task_id=task_id,
+                    state=state,
+                    new_artifacts=list(new_artifacts or []),
+                    new_messages=list(new_messages or []),
+                    metadata=dict(metadata or {}),
+                    future=asyncio.get_running_loop().create_future(),
+                ),
+                durable,
+            )
+
+        now = get_current_utc_timestamp()
+        update_values = {
+            "state": state,
+            "state_timestamp": now,
+            "updated_at": now,
+        }
+
+        if metadata:
+            serialized_metadata = serialize_for_jsonb(metadata)
+            update_values["metadata"] = func.jsonb_concat(
+                tasks_table.c.metadata, cast(serialized_metadata, JSONB)
+            )
+
+        # Counters allocate the sequence numbers of the appended rows
+        if new_artifacts:
+            update_values["artifact_count"] = tasks_table.c.artifact_count + len(
+                new_artifacts
+            )
+        if new_messages:
+            update_values["message_count"] = tasks_table.c.message_count + len(
+                new_messages
+            )
+
         async def _update():
             async with self._get_session_with_schema() as session:
                 async with session.begin():
-                    # Check if task exists
-                    stmt = select(tasks_table).where(tasks_table.c.id == task_id)
+                    stmt = (
+                        update(tasks_table)
+                        .where(tasks_table.c.id == task_id)
+                        .values(**update_values)
+                        .returning(tasks_table)
+                    )
                     result = await session.execute(stmt)
-                    task_row = result.first()
+                    updated_row = result.first()
 
-                    if task_row is None:
+                    if updated_row is None:
                         raise KeyError(f"Task {task_id} not found")
 
-                    now = get_current_utc_timestamp()
-                    update_values = {
-                        "state": state,
-                        "state_timestamp": now,
-                        "updated_at": now,
-                    }
-
-                    if metadata:
-                        serialized_metadata = serialize_for_jsonb(metadata)
-                        update_values["metadata"] = func.jsonb_concat(
-                            tasks_table.c.metadata, cast(serialized_metadata, JSONB)
-                        )
-
-                    if new_artifacts:
-                        serialized_artifacts = serialize_for_jsonb(new_artifacts)
-                        update_values["artifacts"] = func.jsonb_concat(
-                            tasks_table.c.artifacts, cast(serialized_artifacts, JSONB)
-                        )
-
+                    # Append-only inserts; existing history is not rewritten
                     if new_messages:
                         for message in new_messages:
-                            if not isinstance(message, dict):
-                                raise TypeError(
-                                    f"Message must be dict, got {type(message).__name__}"
-                                )
                             normalize_message_uuids(
-                                message, task_id=task_id, context_id=task_row.context_id
+                                message,
+                                task_id=task_id,
+                                context_id=updated_row.context_id,
                             )
-
-                        serialized_messages = serialize_for_jsonb(new_messages)
-                        update_values["history"] = func.jsonb_concat(
-                            tasks_table.c.history, cast(serialized_messages, JSONB)
+                        await self._append_rows(
+                            session,
+                            task_messages_table,
+                            "message",
+                            task_id,
+                            updated_row.message_count,
+                            serialize_for_jsonb(new_messages),
+                        )
+                    if new_artifacts:
+                        await self._append_rows(
+                            session,
+                            task_artifacts_table,
+                            "artifact",
+                            task_id,
+                            updated_row.artifact_count,
+                            serialize_for_jsonb(new_artifacts),
                         )
 
-                    # Execute update
-                    stmt = (
-                        update(tasks_table)
-                        .where(tasks_table.c.id == task_id)
-                        .values(**update_values)
-                        .returning(tasks_table)
+                    history = (
+                        await self._load_history(session, task_id)
+                        if include_history
+                        else None
                     )
-                    result = await session.execute(stmt)
-                    updated_row = result.first()
-
-                    return self._row_to_task(updated_row)
+                    artifacts = (
+                        await self._load_artifacts(session, task_id)
+                        if include_artifacts
+                        else None
+                    )
+                    return self._row_to_task(updated_row, history, artifacts)
 
         return await self._retry_on_connection_error(_update)
 
+    # -------------------------------------------------------------------------
+    # Group Commit (write_batch_ms)
+    # -------------------------------------------------------------------------
+
+    async def _buffer_update(self, pending: _PendingUpdate, durable: bool) -> Task:
+        """Queue an update for the next batch and wait for its commit."""
+        self._pending_updates.append(pending)
+        if durable or len(self._pending_updates) >= self.write_batch_max:
+            await self._flush_updates()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await pending.future
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.write_batch_ms / 1000)
+        self._flush_task = None
+        await self._flush_updates()
+
+    async def _flush_updates(self) -> None:
+        """Write all queued updates in one transaction and resolve their callers."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        batch, self._pending_updates = self._pending_updates, []
+        if not batch:
+            return
+
+        try:
+            rows = await self._retry_on_connection_error(self._write_batch, batch)
+        except Exception as e:
+            logger.error(f"Failed to write batch of {len(batch)} task updates: {e}")
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            return
+
+        for pending in batch:
+            if pending.future.done():
+                continue
+            row = rows.get(pending.task_id)
+            if row is None:
+                pending.future.set_exception(
+                    KeyError(f"Task {pending.task_id} not found")
+                )
+            else:
+                pending.future.set_result(self._row_to_task(row))
+
+    async def _write_batch(self, batch: list[_PendingUpdate]) -> dict[UUID, Any]:
+        """Apply a batch of updates with one UPDATE and one INSERT per table.
+
+        Updates of the same task are merged in arrival order: the last state
+        wins, messages and artifacts are concatenated, metadata is merged.
+
+        Returns:
+            Updated task rows by task id (missing tasks are absent)
+        """
+        merged: dict[UUID, _PendingUpdate] = {}
+        for pending in batch:
+            task = merged.get(pending.task_id)
+            if task is None:
+                merged[pending.task_id] = _PendingUpdate(
+                    task_id=pending.task_id,
+                    state=pending.state,
+                    new_artifacts=list(pending.new_artifacts),
+                    new_messages=list(pending.new_messages),
+                    metadata=dict(pending.metadata),
+                    future=pending.future,
+                )
+            else:
+                task.state = pending.state
+                task.new_artifacts.extend(pending.new_artifacts)
+                task.new_messages.extend(pending.new_messages)
+                task.metadata.update(pending.metadata)
+
+        changes = values_clause(
+            column("id", PG_UUID(as_uuid=True)),
+            column("state", String),
+            column("metadata", JSONB),
+            column("message_delta", Integer),
+            column("artifact_delta", Integer),
+            name="changes",
+        ).data(
+            [
+                (
+                    task.task_id,
+                    task.state,
+                    serialize_for_jsonb(task.metadata),
+                    len(task.new_messages),
+                    len(task.new_artifacts),
+                )
+                for task in merged.values()
+            ]
+        )
+        now = get_current_utc_timestamp()
+
+        async with self._get_session_with_schema() as session:
+            async with session.begin():
+                stmt = (
+                    update(tasks_table)
+                    .where(tasks_table.c.id == changes.c.id)
+                    .values(
+                        state=changes.c.state,
+                        state_timestamp=now,
+                        updated_at=now,
+                        metadata=func.jsonb_concat(
+                            tasks_table.c.metadata, changes.c.metadata
+                        ),
+                        message_count=tasks_table.c.message_count
+                        + changes.c.message_delta,
+                        artifact_count=tasks_table.c.artifact_count
+                        + changes.c.artifact_delta,
+                    )
+                    .returning(tasks_table)
+                )
+                result = await session.execute(stmt)
+                rows = {row.id: row for row in result.fetchall()}
+
+                message_rows: list[dict[str, Any]] = []
+                artifact_rows: list[dict[str, Any]] = []
+                for task_id, row in rows.items():
+                    task = merged[task_id]
+                    for message in task.new_messages:
+                        normalize_message_uuids(
+                            message, task_id=task_id, context_id=row.context_id
+                        )
+                    message_rows += self._numbered_rows(
+                        "message",
+                        task_id,
+                        row.message_count,
+                        serialize_for_jsonb(task.new_messages),
+                    )
+                    artifact_rows += self._numbered_rows(
+                        "artifact",
+                        task_id,
+                        row.artifact_count,
+                        serialize_for_jsonb(task.new_artifacts),
+                    )
+
+                if message_rows:
+                    await session.execute(
+                        insert(task_messages_table).values(message_rows)
+                    )
+                if artifact_rows:
+                    await session.execute(
+                        insert(task_artifacts_table).values(artifact_rows)
+                    )
+                return rows
+
     async def list_tasks(self, length: int | None = None) -> list[Task]:
         """List all tasks using SQLAlchemy.
 
@@ -530,9 +1020,95 @@ class PostgresStorage(Storage[ContextT]):
                     stmt = stmt.limit(length)
 
                 result = await session.execute(stmt)
-                rows = result.fetchall()
+                return await self._rows_to_tasks(session, result.fetchall())
+
+        return await self._retry_on_connection_error(_list)
+
+    async def list_tasks_page(
+        self,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        *,
+        state: TaskState | None = None,
+        context_id: UUID | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        include_history: bool = False,
+        include_artifacts: bool = False,
+        history_length: int | None = None,
+    ) -> TaskListPage:
+        """List tasks newest first, one page at a time.
+
+        A keyset query: ``WHERE (created_at, id) < cursor ORDER BY
+        created_at DESC, id DESC LIMIT page_size + 1``, served by
+        idx_tasks_created_at_id (idx_tasks_context_created_at with a
+        context filter), so deep pages cost the same as the first one.
+
+        Args:
+            page_size: Maximum number of tasks in the page (None = all)
+            cursor: ``next_cursor`` of the previous page
+            state: Only list tasks in this state
+            context_id: Only list tasks of this context
+            created_after: Only list tasks created at or after this time
+            created_before: Only list tasks created before this time
+            include_history: Include message histories (empty lists if False)
+            include_artifacts: Include artifacts (empty lists if False)
+            history_length: Limit included histories to the last N messages
+
+        Returns:
+            Page with the tasks and the cursor of the next page (None if last)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        if context_id is not None:
+            context_id = validate_uuid_type(context_id, "context_id")
 
-                return [self._row_to_task(row) for row in rows]
+        self._ensure_connected()
+
+        async def _list():
+            async with self._get_session_with_schema() as session:
+                stmt = select(tasks_table).order_by(
+                    tasks_table.c.created_at.desc(), tasks_table.c.id.desc()
+                )
+                if state is not None:
+                    stmt = stmt.where(tasks_table.c.state == state)
+                if context_id is not None:
+                    stmt = stmt.where(tasks_table.c.context_id == context_id)
+                if created_after is not None:
+                    stmt = stmt.where(tasks_table.c.created_at >= created_after)
+                if created_before is not None:
+                    stmt = stmt.where(tasks_table.c.created_at < created_before)
+                if after is not None:
+                    stmt = stmt.where(
+                        tuple_(tasks_table.c.created_at, tasks_table.c.id)
+                        < tuple_(*after)
+                    )
+                if page_size is not None:
+                    stmt = stmt.limit(page_size + 1)
+
+                result = await session.execute(stmt)
+                rows = result.fetchall()
+                has_more = page_size is not None and len(rows) > page_size
+                if has_more:
+                    rows = rows[:page_size]
+
+                tasks = await self._rows_to_tasks(
+                    session,
+                    rows,
+                    include_history=include_history,
+                    include_artifacts=include_artifacts,
+                    history_length=history_length,
+                )
+                return TaskListPage(
+                    tasks=tasks,
+                    next_cursor=(
+                        encode_cursor(rows[-1].created_at, rows[-1].id)
+                        if has_more
+                        else None
+                    ),
+                )
 
         return await self._retry_on_connection_error(_list)
 
@@ -559,14 +1135,115 @@ class PostgresStorage(Storage[ContextT]):
 
         return await self._retry_on_connection_error(_count)
 
+    async def load_tasks(
+        self,
+        task_ids: list[UUID],
+        history_length: int | None = None,
+        *,
+        history_lengths: dict[UUID, int] | None = None,
+        include_history: bool = True,
+        include_artifacts: bool = True,
+    ) -> list[Task]:
+        """Load several tasks with one query per table.
+
+        Args:
+            task_ids: IDs of the tasks to load
+            history_length: Optional limit on each task's message history
+            history_lengths: Per-task history limits, overriding history_length
+            include_history: Load the message histories (empty lists if False)
+            include_artifacts: Load the artifacts (empty lists if False)
+
+        Returns:
+            Found tasks in the order of ``task_ids`` (missing ones are skipped)
+
+        Raises:
+            TypeError: If a task ID is not a UUID
+        """
+        task_ids = [validate_uuid_type(task_id, "task_id") for task_id in task_ids]
+        if not task_ids:
+            return []
+
+        self._ensure_connected()
+
+        async def _load():
+            async with self._get_session_with_schema() as session:
+                # One array parameter whatever the number of IDs
+                stmt = select(tasks_table).where(
+                    tasks_table.c.id
+                    == any_(cast(task_ids, ARRAY(PG_UUID(as_uuid=True))))
+                )
+                result = await session.execute(stmt)
+                rows_by_id = {row.id: row for row in result.fetchall()}
+                rows = [
+                    rows_by_id[task_id] for task_id in task_ids if task_id in rows_by_id
+                ]
+                return await self._rows_to_tasks(
+                    session,
+                    rows,
+                    include_history=include_history,
+                    include_artifacts=include_artifacts,
+                    history_length=history_length,
+                    history_lengths=history_lengths,
+                )
+
+        return await self._retry_on_connection_error(_load)
+
+    async def transition_task_state(
+        self, task_id: UUID, expected_state: TaskState, state: TaskState
+    ) -> bool:
+        """Set a task's state only if it is currently ``expected_state``.
+
+        One ``UPDATE ... WHERE state = expected_state``: of concurrent
+        transitions of the same task, only the first matches the row.
+
+        Args:
+            task_id: Task to update
+            expected_state: State the task must be in
+            state: New task state
+
+        Returns:
+            True if the task was in ``expected_state`` and is now in ``state``
+
+        Raises:
+            TypeError: If task_id is not UUID
+        """
+        task_id = validate_uuid_type(task_id, "task_id")
+
+        self._ensure_connected()
+
+        async def _transition():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    now = get_current_utc_timestamp()
+                    stmt = (
+                        update(tasks_table)
+                        .where(
+                            tasks_table.c.id == task_id,
+                            tasks_table.c.state == expected_state,
+                        )
+                        .values(state=state, state_timestamp=now, updated_at=now)
+                        .returning(tasks_table.c.id)
+                    )
+                    result = await session.execute(stmt)
+                    return result.scalar_one_or_none() is not None
+
+        return await self._retry_on_connection_error(_transition)
+
     async def list_tasks_by_context(
-        self, context_id: UUID, length: int | None = None
+        self,
+        context_id: UUID,
+        length: int | None = None,
+        *,
+        include_history: bool = True,
+        include_artifacts: bool = True,
     ) -> list[Task]:
         """List tasks belonging to a specific context.
 
         Args:
             context_id: Context to filter tasks by
             length: Optional limit on number of tasks to return
+            include_history: Load the message histories (empty lists if False)
+            include_artifacts: Load the artifacts (empty lists if False)
 
         Returns:
             List of tasks in the context
@@ -590,9 +1267,12 @@ class PostgresStorage(Storage[ContextT]):
                     stmt = stmt.limit(length)
 
                 result = await session.execute(stmt)
-                rows = result.fetchall()
-
-                return [self._row_to_task(row) for row in rows]
+                return await self._rows_to_tasks(
+                    session,
+                    result.fetchall(),
+                    include_history=include_history,
+                    include_artifacts=include_artifacts,
+                )
 
         return await self._retry_on_connection_error(_list)
 
@@ -758,6 +1438,90 @@ class PostgresStorage(Storage[ContextT]):
 
         return await self._retry_on_connection_error(_list)
 
+    async def list_contexts_page(
+        self,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        *,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> ContextListPage:
+        """List contexts newest first, keyset-paginated on (created_at, id).
+
+        Args:
+            page_size: Maximum number of contexts in the page (None = all)
+            cursor: ``next_cursor`` of the previous page
+            created_after: Only list contexts created at or after this time
+            created_before: Only list contexts created before this time
+
+        Returns:
+            Page with context summaries and the cursor of the next page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+
+        self._ensure_connected()
+
+        async def _list():
+            async with self._get_session_with_schema() as session:
+                stmt = (
+                    select(
+                        contexts_table.c.id.label("context_id"),
+                        contexts_table.c.created_at,
+                        func.count(tasks_table.c.id).label("task_count"),
+                        func.coalesce(
+                            func.json_agg(tasks_table.c.id).filter(
+                                tasks_table.c.id.isnot(None)
+                            ),
+                            cast("[]", JSON),
+                        ).label("task_ids"),
+                    )
+                    .outerjoin(
+                        tasks_table, contexts_table.c.id == tasks_table.c.context_id
+                    )
+                    .group_by(contexts_table.c.id)
+                    .order_by(
+                        contexts_table.c.created_at.desc(), contexts_table.c.id.desc()
+                    )
+                )
+                if created_after is not None:
+                    stmt = stmt.where(contexts_table.c.created_at >= created_after)
+                if created_before is not None:
+                    stmt = stmt.where(contexts_table.c.created_at < created_before)
+                if after is not None:
+                    stmt = stmt.where(
+                        tuple_(contexts_table.c.created_at, contexts_table.c.id)
+                        < tuple_(*after)
+                    )
+                if page_size is not None:
+                    stmt = stmt.limit(page_size + 1)
+
+                result = await session.execute(stmt)
+                rows = result.fetchall()
+                has_more = page_size is not None and len(rows) > page_size
+                if has_more:
+                    rows = rows[:page_size]
+
+                return ContextListPage(
+                    contexts=[
+                        {
+                            "context_id": row.context_id,
+                            "task_count": row.task_count,
+                            "task_ids": row.task_ids,
+                        }
+                        for row in rows
+                    ],
+                    next_cursor=(
+                        encode_cursor(rows[-1].created_at, rows[-1].context_id)
+                        if has_more
+                        else None
+                    ),
+                )
+
+        return await self._retry_on_connection_error(_list)
+
     # -------------------------------------------------------------------------
     # Utility Operations
     # -------------------------------------------------------------------------
@@ -791,7 +1555,22 @@ class PostgresStorage(Storage[ContextT]):
                     if context is None:
                         raise ValueError(f"Context {context_id} not found")
 
-                    # Delete tasks (cascade will delete feedback)
+                    # Delete the tasks' rows explicitly: with a partitioned
+                    # tasks table there are no cascading foreign keys
+                    task_ids = select(tasks_table.c.id).where(
+                        tasks_table.c.context_id == context_id
+                    )
+                    for table in (
+                        task_messages_table,
+                        task_artifacts_table,
+                        task_events_table,
+                        task_feedback_table,
+                        webhook_configs_table,
+                    ):
+                        await session.execute(
+                            delete(table).where(table.c.task_id.in_(task_ids))
+                        )
+
                     stmt = delete(tasks_table).where(
                         tasks_table.c.context_id == context_id
                     )
@@ -822,6 +1601,9 @@ class PostgresStorage(Storage[ContextT]):
                 async with session.begin():
                     await session.execute(delete(webhook_configs_table))
                     await session.execute(delete(task_feedback_table))
+                    await session.execute(delete(task_events_table))
+                    await session.execute(delete(task_messages_table))
+                    await session.execute(delete(task_artifacts_table))
                     await session.execute(delete(tasks_table))
                     await session.execute(delete(contexts_table))
                     logger.info(
@@ -830,6 +1612,48 @@ class PostgresStorage(Storage[ContextT]):
 
         await self._retry_on_connection_error(_clear)
 
+    # -------------------------------------------------------------------------
+    # Partition Maintenance (postgres_partition_tasks)
+    # -------------------------------------------------------------------------
+
+    async def maintain_partitions(self) -> list[str]:
+        """Create upcoming task partitions and detach those past retention.
+
+        Returns:
+            Names of the detached partitions
+        """
+        self._ensure_connected()
+        settings = app_settings.storage
+
+        async with self._engine.begin() as conn:
+            if not await is_partitioned(conn):
+                return []
+            await ensure_task_partitions(
+                conn,
+                settings.postgres_partition_interval,
+                settings.postgres_partition_premake,
+            )
+        if settings.postgres_task_retention_days is None:
+            return []
+        return await archive_task_partitions(
+            self._engine,
+            datetime.now(timezone.utc)
+            - timedelta(days=settings.postgres_task_retention_days),
+            settings.postgres_archive_schema,
+            settings.postgres_archive_batch_size,
+        )
+
+    async def _partition_maintenance_loop(self) -> None:
+        """Run maintain_partitions periodically until disconnected."""
+        while True:
+            await asyncio.sleep(
+                app_settings.storage.postgres_partition_maintenance_interval
+            )
+            try:
+                await self.maintain_partitions()
+            except Exception as e:
+                logger.error(f"Task partition maintenance failed: {e}")
+
     # -------------------------------------------------------------------------
     # Feedback Operations
     # -------------------------------------------------------------------------
@@ -899,6 +1723,168 @@ class PostgresStorage(Storage[ContextT]):
 
         return await self._retry_on_connection_error(_get)
 
+    # -------------------------------------------------------------------------
+    # History Summary Operations
+    # -------------------------------------------------------------------------
+
+    async def save_history_summary(
+        self, context_id: UUID, summary: dict[str, Any]
+    ) -> None:
+        """Store the rolling summary under ``history_summary`` in context_data.
+
+        Args:
+            context_id: Context the summary belongs to
+            summary: Summary record (text and number of messages it covers)
+
+        Raises:
+            TypeError: If context_id is not UUID
+        """
+        context_id = validate_uuid_type(context_id, "context_id")
+
+        self._ensure_connected()
+
+        async def _save():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    stmt = (
+                        update(contexts_table)
+                        .where(contexts_table.c.id == context_id)
+                        .values(
+                            context_data=func.jsonb_concat(
+                                contexts_table.c.context_data,
+                                cast(
+                                    serialize_for_jsonb({"history_summary": summary}),
+                                    JSONB,
+                                ),
+                            )
+                        )
+                    )
+                    await session.execute(stmt)
+
+        await self._retry_on_connection_error(_save)
+
+    async def load_history_summary(self, context_id: UUID) -> dict[str, Any] | None:
+        """Load the rolling summary of a context.
+
+        Args:
+            context_id: Context to get the summary for
+
+        Returns:
+            Summary record or None if the context has none
+
+        Raises:
+            TypeError: If context_id is not UUID
+        """
+        context_id = validate_uuid_type(context_id, "context_id")
+
+        self._ensure_connected()
+
+        async def _load():
+            async with self._get_session_with_schema() as session:
+                stmt = select(contexts_table.c.context_data["history_summary"]).where(
+                    contexts_table.c.id == context_id
+                )
+                result = await session.execute(stmt)
+                return result.scalar()
+
+        return await self._retry_on_connection_error(_load)
+
+    # -------------------------------------------------------------------------
+    # Task Event Log Operations (tasks/resubscribe replay)
+    # -------------------------------------------------------------------------
+
+    async def append_task_event(
+        self, task_id: UUID, event: dict[str, Any], max_events: int | None = None
+    ) -> int:
+        """Append a stream event to a task's event log.
+
+        The sequence number is max + 1 of the task's events, allocated under a
+        transaction-scoped advisory lock on the task: events of one task may
+        be appended concurrently (a cancel racing the running operation)
+        and would otherwise get the same number.
+
+        Args:
+            task_id: Task the event belongs to
+            event: status-update or artifact-update event
+            max_events: Keep at most this many events of the task
+
+        Returns:
+            Sequence number of the event
+
+        Raises:
+            TypeError: If task_id is not UUID
+        """
+        task_id = validate_uuid_type(task_id, "task_id")
+
+        self._ensure_connected()
+
+        async def _append():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    await session.execute(
+                        select(func.pg_advisory_xact_lock(_event_lock_key(task_id)))
+                    )
+                    next_seq = (
+                        select(func.coalesce(func.max(task_events_table.c.seq), 0) + 1)
+                        .where(task_events_table.c.task_id == task_id)
+                        .scalar_subquery()
+                    )
+                    stmt = (
+                        insert(task_events_table)
+                        .values(
+                            task_id=task_id,
+                            seq=next_seq,
+                            event=serialize_for_jsonb(event),
+                        )
+                        .returning(task_events_table.c.seq)
+                    )
+                    seq = (await session.execute(stmt)).scalar_one()
+
+                    if max_events is not None and seq > max_events:
+                        await session.execute(
+                            delete(task_events_table).where(
+                                task_events_table.c.task_id == task_id,
+                                task_events_table.c.seq <= seq - max_events,
+                            )
+                        )
+                    return seq
+
+        return await self._retry_on_connection_error(_append)
+
+    async def load_task_events(
+        self, task_id: UUID, after: int = 0
+    ) -> list[dict[str, Any]]:
+        """Load the logged events of a task after a sequence number.
+
+        Args:
+            task_id: Task to load events for
+            after: Only events with a higher sequence number are returned
+
+        Returns:
+            Events in sequence order, each with its ``seq``
+
+        Raises:
+            TypeError: If task_id is not UUID
+        """
+        task_id = validate_uuid_type(task_id, "task_id")
+
+        self._ensure_connected()
+
+        async def _load():
+            async with self._get_session_with_schema() as session:
+                stmt = (
+                    select(task_events_table.c.seq, task_events_table.c.event)
+                    .where(
+                        task_events_table.c.task_id == task_id,
+                        task_events_table.c.seq > after,
+                    )
+                    .order_by(task_events_table.c.seq.asc())
+                )
+                result = await session.execute(stmt)
+                return [{**row.event, "seq": row.seq} for row in result.fetchall()]
+
+        return await self._retry_on_connection_error(_load)
+
     # -------------------------------------------------------------------------
     # Webhook Persistence Operations (for long-running tasks)
     # -------------------------------------------------------------------------
@@ -24,6 +24,7 @@ from sqlalchemy import (
     Index,
     Integer,
     MetaData,
+    PrimaryKeyConstraint,
     String,
     Table,
     func,
@@ -53,9 +54,10 @@ tasks_table = Table(
     Column("kind", String(50), nullable=False, default="task"),
     Column("state", String(50), nullable=False),
     Column("state_timestamp", TIMESTAMP(timezone=True), nullable=False),
-    # JSONB columns for A2A protocol data
-    Column("history", JSONB, nullable=False, server_default="[]"),
-    Column("artifacts", JSONB, nullable=True, server_default="[]"),
+    # History and artifacts live in task_messages / task_artifacts; the
+    # counters allocate their sequence numbers under the task's row lock.
+    Column("message_count", Integer, nullable=False, server_default="0"),
+    Column("artifact_count", Integer, nullable=False, server_default="0"),
     Column("metadata", JSONB, nullable=True, server_default="{}"),
     # Timestamps
     Column(
@@ -76,11 +78,64 @@ tasks_table = Table(
     Index("idx_tasks_state", "state"),
     Index("idx_tasks_created_at", "created_at"),
     Index("idx_tasks_updated_at", "updated_at"),
-    Index("idx_tasks_history_gin", "history", postgresql_using="gin"),
+    # Keyset pagination of list_tasks_page on (created_at, id)
+    Index("idx_tasks_created_at_id", "created_at", "id"),
+    Index("idx_tasks_context_created_at", "context_id", "created_at", "id"),
     Index("idx_tasks_metadata_gin", "metadata", postgresql_using="gin"),
-    Index("idx_tasks_artifacts_gin", "artifacts", postgresql_using="gin"),
     # Table comment
-    comment="A2A protocol tasks with JSONB history and artifacts",
+    comment="A2A protocol tasks (history and artifacts in their own tables)",
+)
+
+# -----------------------------------------------------------------------------
+# Task Messages / Artifacts Tables (append-only task history)
+# -----------------------------------------------------------------------------
+
+task_messages_table = Table(
+    "task_messages",
+    metadata,
+    Column(
+        "task_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    # Position in the task's history, starting at 1
+    Column("seq", Integer, nullable=False),
+    Column("message", JSONB, nullable=False),
+    # Timestamp
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    PrimaryKeyConstraint("task_id", "seq", name="pk_task_messages"),
+    # Table comment
+    comment="Task history messages, one row per message",
+)
+
+task_artifacts_table = Table(
+    "task_artifacts",
+    metadata,
+    Column(
+        "task_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    # Position in the task's artifacts, starting at 1
+    Column("seq", Integer, nullable=False),
+    Column("artifact", JSONB, nullable=False),
+    # Timestamp
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    PrimaryKeyConstraint("task_id", "seq", name="pk_task_artifacts"),
+    # Table comment
+    comment="Task artifacts, one row per artifact",
 )
 
 # -----------------------------------------------------------------------------
@@ -111,6 +166,7 @@ contexts_table = Table(
     ),
     # Indexes
     Index("idx_contexts_created_at", "created_at"),
+    Index("idx_contexts_created_at_id", "created_at", "id"),
     Index("idx_contexts_updated_at", "updated_at"),
     Index("idx_contexts_data_gin", "context_data", postgresql_using="gin"),
     Index("idx_contexts_history_gin", "message_history", postgresql_using="gin"),
@@ -187,6 +243,35 @@ webhook_configs_table = Table(
     comment="Webhook configurations for long-running task notifications",
 )
 
+# -----------------------------------------------------------------------------
+# Task Events Table (replayable stream events)
+# -----------------------------------------------------------------------------
+
+task_events_table = Table(
+    "task_events",
+    metadata,
+    Column(
+        "task_id",
+        PG_UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    # Per-task sequence number (SSE event id)
+    Column("seq", Integer, nullable=False),
+    # status-update / artifact-update event
+    Column("event", JSONB, nullable=False),
+    # Timestamp
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    PrimaryKeyConstraint("task_id", "seq", name="pk_task_events"),
+    # Table comment
+    comment="Append-only log of task stream events for tasks/resubscribe",
+)
+
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
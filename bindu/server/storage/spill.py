@@ -0,0 +1,174 @@
+"""SQLite spill tier for tasks evicted from InMemoryStorage.
+
+When InMemoryStorage evicts contexts to stay within its task/context caps, the
+evicted tasks are written here so that recent conversations can still be read
+(``load_task``, ``list_tasks_by_context``) without keeping them in RAM. The
+spill keeps the most recently evicted ``max_tasks`` tasks.
+
+All SQLite calls run on one spill thread, in submission order, so the event
+loop never waits on the file: ``put_many`` only queues the write, and a read
+queued after it sees the spilled tasks. The file uses WAL with
+``synchronous=NORMAL``, so commits do not fsync.
+"""
+
+from __future__ import annotations as _annotations
+
+import asyncio
+import json
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+from uuid import UUID
+
+from bindu.common.protocol.types import Task
+from bindu.utils.logging import get_logger
+
+from .helpers import normalize_message_uuids, serialize_for_jsonb
+
+logger = get_logger("bindu.server.storage.spill")
+
+
+class SQLiteTaskSpill:
+    """Evicted tasks in a SQLite file, keyed by task and context."""
+
+    def __init__(self, path: str, max_tasks: int = 100000):
+        """Open (or create) the spill file.
+
+        Args:
+            path: SQLite database file (``:memory:`` for tests)
+            max_tasks: Keep at most this many tasks, oldest evictions first out
+        """
+        self.path = path
+        self.max_tasks = max_tasks
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="bindu-spill"
+        )
+        self._db: sqlite3.Connection
+        self._run(self._open).result()
+
+    def _open(self) -> None:
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS spilled_tasks ("
+            " task_id TEXT PRIMARY KEY,"
+            " context_id TEXT NOT NULL,"
+            " evicted_at REAL NOT NULL,"
+            " data TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_spilled_tasks_context"
+            " ON spilled_tasks (context_id, evicted_at)"
+        )
+        self._db.commit()
+
+    def _run(self, func: Callable[..., Any], *args: Any) -> Future:
+        """Queue a call on the spill thread."""
+        return self._executor.submit(func, *args)
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a call on the spill thread and wait for it without blocking."""
+        return await asyncio.wrap_future(self._run(func, *args))
+
+    def put_many(self, tasks: list[Task]) -> None:
+        """Queue evicted tasks for storage; the oldest beyond ``max_tasks`` are dropped.
+
+        Returns immediately: the tasks are serialized and written on the spill
+        thread, before any read queued later.
+        """
+        future = self._run(self._put_many, tasks, time.time())
+        future.add_done_callback(_log_write_error)
+
+    def _put_many(self, tasks: list[Task], now: float) -> None:
+        self._db.executemany(
+            "INSERT OR REPLACE INTO spilled_tasks VALUES (?, ?, ?, ?)",
+            [
+                (
+                    str(task["id"]),
+                    str(task["context_id"]),
+                    now + i * 1e-6,  # keeps the context's task order
+                    json.dumps(serialize_for_jsonb(task)),
+                )
+                for i, task in enumerate(tasks)
+            ],
+        )
+        self._db.execute(
+            "DELETE FROM spilled_tasks WHERE task_id IN ("
+            " SELECT task_id FROM spilled_tasks"
+            " ORDER BY evicted_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_tasks,),
+        )
+        self._db.commit()
+
+    async def get(self, task_id: UUID) -> Task | None:
+        """Load a spilled task."""
+        return await self._call(self._get, task_id)
+
+    def _get(self, task_id: UUID) -> Task | None:
+        row = self._db.execute(
+            "SELECT data FROM spilled_tasks WHERE task_id = ?", (str(task_id),)
+        ).fetchone()
+        return self._to_task(row[0]) if row else None
+
+    async def list_context(self, context_id: UUID) -> list[Task]:
+        """Load the spilled tasks of a context, oldest first."""
+        return await self._call(self._list_context, context_id)
+
+    def _list_context(self, context_id: UUID) -> list[Task]:
+        rows = self._db.execute(
+            "SELECT data FROM spilled_tasks WHERE context_id = ? ORDER BY evicted_at",
+            (str(context_id),),
+        ).fetchall()
+        return [self._to_task(row[0]) for row in rows]
+
+    async def delete_context(self, context_id: UUID) -> int:
+        """Delete the spilled tasks of a context.
+
+        Returns:
+            Number of deleted tasks
+        """
+        return await self._call(self._delete_context, context_id)
+
+    def _delete_context(self, context_id: UUID) -> int:
+        cursor = self._db.execute(
+            "DELETE FROM spilled_tasks WHERE context_id = ?", (str(context_id),)
+        )
+        self._db.commit()
+        return cursor.rowcount
+
+    async def clear(self) -> None:
+        """Delete all spilled tasks."""
+        await self._call(self._clear)
+
+    def _clear(self) -> None:
+        self._db.execute("DELETE FROM spilled_tasks")
+        self._db.commit()
+
+    def count(self) -> int:
+        """Number of spilled tasks (waits for the queued writes)."""
+        return self._run(self._count).result()
+
+    def _count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM spilled_tasks").fetchone()[0]
+
+    def close(self) -> None:
+        """Finish the queued writes and close the spill file."""
+        self._run(self._db.close)
+        self._executor.shutdown(wait=True)
+
+    @staticmethod
+    def _to_task(data: str) -> Task:
+        task = json.loads(data)
+        task["id"] = UUID(task["id"])
+        task["context_id"] = UUID(task["context_id"])
+        task["history"] = [
+            normalize_message_uuids(message) for message in task.get("history", [])
+        ]
+        return task
+
+
+def _log_write_error(future: Future) -> None:
+    if (error := future.exception()) is not None:
+        logger.error(f"Failed to spill evicted tasks: {error}")
@@ -70,6 +70,7 @@ from typing import Any
 
 
 from ..utils.logging import get_logger
+from .events import EventBus, InMemoryEventBus
 from .handlers import ContextHandlers, MessageHandlers, TaskHandlers
 from .notifications import PushNotificationManager
 from .scheduler import Scheduler
@@ -86,6 +87,7 @@ class TaskManager:
     scheduler: Scheduler
     storage: Storage[Any]
     manifest: Any | None = None  # AgentManifest for creating workers
+    event_bus: EventBus = field(default_factory=InMemoryEventBus)
 
     _aexit_stack: AsyncExitStack | None = field(default=None, init=False)
     _workers: list[ManifestWorker] = field(default_factory=list, init=False)
@@ -106,6 +108,7 @@ class TaskManager:
         self._aexit_stack = AsyncExitStack()
         await self._aexit_stack.__aenter__()
         await self._aexit_stack.enter_async_context(self.scheduler)
+        await self._aexit_stack.enter_async_context(self.event_bus)
 
         # Initialize push notification manager (loads persisted webhook configs)
         await self._push_manager.initialize()
@@ -116,6 +119,7 @@ class TaskManager:
                 storage=self.storage,
                 manifest=self.manifest,
                 lifecycle_notifier=self._push_manager.notify_lifecycle,
+                event_bus=self.event_bus,
             )
             self._workers.append(worker)
             await self._aexit_stack.enter_async_context(worker.run())
@@ -124,8 +128,7 @@ class TaskManager:
         self._message_handlers = MessageHandlers(
             scheduler=self.scheduler,
             storage=self.storage,
-            manifest=self.manifest,
-            workers=self._workers,
+            event_bus=self.event_bus,
             context_id_parser=self._parse_context_id,
             push_manager=self._push_manager,
         )
@@ -137,6 +140,7 @@ class TaskManager:
         self._context_handlers = ContextHandlers(
             storage=self.storage,
             error_response_creator=self._create_error_response,
+            context_cleared_callback=self._forget_context_history,
         )
 
         return self
@@ -163,6 +167,11 @@ class TaskManager:
             error=error_class(code=-32001, message=message),
         )
 
+    def _forget_context_history(self, context_id: uuid.UUID) -> None:
+        """Drop the workers' cached history of a cleared context."""
+        for worker in self._workers:
+            worker.history_cache.invalidate_context(context_id)
+
     def _parse_context_id(self, context_id: Any) -> uuid.UUID:
         """Parse and validate context_id, generating a new one if needed.
 
@@ -208,11 +217,17 @@ class TaskManager:
         # ----------------------------
 
         # Message handler methods
-        if name in ("send_message", "stream_message"):
+        if name in ("send_message", "stream_message", "resubscribe_task"):
             return getattr(self._message_handlers, name)
 
         # Task handler methods
-        if name in ("get_task", "list_tasks", "cancel_task", "task_feedback"):
+        if name in (
+            "get_task",
+            "get_tasks",
+            "list_tasks",
+            "cancel_task",
+            "task_feedback",
+        ):
             return getattr(self._task_handlers, name)
 
         # Context handler methods
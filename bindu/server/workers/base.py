@@ -20,22 +20,33 @@ Workers implement the hybrid pattern by:
 
 from __future__ import annotations as _annotations
 
+import time
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, AsyncIterator
+from uuid import UUID
 
 import anyio
+from opentelemetry.metrics import get_meter
 from opentelemetry.trace import get_tracer, use_span
 
 from bindu.common.protocol.types import Artifact, Message, TaskIdParams, TaskSendParams
 from bindu.server.scheduler.base import Scheduler
 from bindu.server.storage.base import Storage
+from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
 
 tracer = get_tracer(__name__)
+meter = get_meter(__name__)
 logger = get_logger(__name__)
 
+queue_wait_histogram = meter.create_histogram(
+    "bindu_task_queue_wait_seconds",
+    description="Time task operations spend in the scheduler queue (enqueue to dequeue)",
+    unit="s",
+)
+
 
 @dataclass
 class Worker(ABC):
@@ -67,6 +78,19 @@ class Worker(ABC):
     storage: Storage[Any]
     """Storage backend for task and context persistence."""
 
+    max_concurrency: int = field(
+        default_factory=lambda: app_settings.worker.max_concurrency, kw_only=True
+    )
+    """Maximum number of task operations executed concurrently by this worker."""
+
+    _in_flight: dict[UUID, anyio.CancelScope] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """Cancel scopes of currently running tasks, keyed by task_id."""
+
+    _pause_requested: set[UUID] = field(default_factory=set, init=False, repr=False)
+    """In-flight tasks asked to suspend at their next checkpoint."""
+
     # -------------------------------------------------------------------------
     # Worker Lifecycle
     # -------------------------------------------------------------------------
@@ -88,17 +112,181 @@ class Worker(ABC):
         """
         async with anyio.create_task_group() as tg:
             tg.start_soon(self._loop)
+            tg.start_soon(self._listen_for_interrupts)
             yield
             tg.cancel_scope.cancel()
 
     async def _loop(self) -> None:
         """Process task operations continuously.
 
-        Receives task operations from scheduler and dispatches them to handlers.
+        Receives task operations from scheduler and dispatches them to handlers,
+        running up to ``max_concurrency`` operations at the same time.
+
+        Backpressure:
+        A slot is acquired *before* the next operation is pulled, so once the
+        limit is reached the worker stops consuming from the scheduler and
+        leaves queued work for other workers/nodes.
+
         Runs until cancelled by the task group.
         """
-        async for task_operation in self.scheduler.receive_task_operations():
-            await self._handle_task_operation(task_operation)
+        slots = anyio.Semaphore(self.max_concurrency)
+        # The slot for the requested operation is already held when the
+        # scheduler fetches, hence the + 1
+        self.scheduler.set_consumer_capacity(lambda: slots.value + 1)
+        task_operations = aiter(self.scheduler.receive_task_operations())
+
+        async with anyio.create_task_group() as tg:
+            while True:
+                await slots.acquire()
+                try:
+                    task_operation = await anext(task_operations)
+                except StopAsyncIteration:
+                    slots.release()
+                    break
+                tg.start_soon(self._run_in_slot, task_operation, slots)
+
+    async def _run_in_slot(
+        self, task_operation: dict[str, Any], slots: anyio.Semaphore
+    ) -> None:
+        """Execute a single task operation inside its own cancel scope.
+
+        Run operations register their scope in ``_in_flight`` so they can be
+        interrupted individually without affecting other in-flight tasks.
+        Errors escaping the operation (e.g. from its failure handling) are
+        logged here: the slots share a task group, and an exception reaching
+        it would cancel every other in-flight task.
+
+        Args:
+            task_operation: Operation received from the scheduler
+            slots: Semaphore guarding the worker's concurrency limit
+        """
+        task_id = self._parse_task_id(task_operation["params"].get("task_id"))
+        try:
+            with anyio.CancelScope() as scope:
+                track = task_id is not None and task_operation["operation"] in (
+                    "run",
+                    "resume",
+                )
+                if track:
+                    self._in_flight[task_id] = scope
+                try:
+                    await self._handle_task_operation(task_operation)
+                except Exception as e:
+                    logger.error(
+                        f"Unhandled error in {task_operation['operation']} operation "
+                        f"for task {task_id}: {e}",
+                        exc_info=True,
+                    )
+                finally:
+                    if track and self._in_flight.get(task_id) is scope:
+                        del self._in_flight[task_id]
+                        self._pause_requested.discard(task_id)
+
+            # Not reached on worker shutdown, so unfinished operations stay
+            # pending in the broker and get redelivered.
+            await self._ack(task_operation)
+        finally:
+            slots.release()
+
+    async def _ack(self, task_operation: dict[str, Any]) -> None:
+        """Acknowledge a handled operation, logging (not raising) broker errors."""
+        try:
+            await self.scheduler.ack_task_operation(task_operation)  # type: ignore[arg-type]
+        except Exception as e:
+            logger.warning(
+                f"Failed to acknowledge {task_operation['operation']} operation: {e}"
+            )
+
+    async def _listen_for_interrupts(self) -> None:
+        """Act on cancel/pause requests broadcast from any node."""
+        try:
+            async for kind, task_id in self.scheduler.receive_interrupts():
+                if kind == "cancel":
+                    self.interrupt_task(task_id)
+                elif kind == "pause":
+                    self.request_pause(task_id)
+        except Exception as e:
+            logger.error(f"Interrupt listener stopped: {e}")
+
+    def interrupt_task(self, task_id: UUID) -> bool:
+        """Cancel the in-flight execution of a task on this worker.
+
+        The task's cancel scope is cancelled, so the running agent call is
+        interrupted at its next checkpoint and no result is written.
+
+        Args:
+            task_id: Task to interrupt
+
+        Returns:
+            True if the task was running on this worker
+        """
+        scope = self._in_flight.get(task_id)
+        if scope is None:
+            return False
+        logger.info(f"Interrupting in-flight execution of task {task_id}")
+        scope.cancel()
+        return True
+
+    def request_pause(self, task_id: UUID) -> bool:
+        """Ask an in-flight task on this worker to suspend at its next checkpoint.
+
+        Checkpoints are worker-specific (e.g. between streamed chunks); work that
+        cannot be checkpointed simply runs to completion.
+
+        Args:
+            task_id: Task to pause
+
+        Returns:
+            True if the task was running on this worker
+        """
+        if task_id not in self._in_flight:
+            return False
+        logger.info(f"Pause requested for in-flight task {task_id}")
+        self._pause_requested.add(task_id)
+        return True
+
+    def pause_requested(self, task_id: UUID) -> bool:
+        """Whether the task should suspend at its next checkpoint."""
+        return task_id in self._pause_requested
+
+    async def _is_canceled(self, task_id: UUID) -> bool:
+        """Check whether a task has been canceled (guards terminal-state writes)."""
+        task = await self.storage.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
+        return task is not None and task["status"]["state"] == "canceled"
+
+    @staticmethod
+    def _parse_task_id(task_id_raw: Any) -> UUID | None:
+        """Normalize a task_id from operation params to a UUID (None if invalid)."""
+        if isinstance(task_id_raw, UUID):
+            return task_id_raw
+        try:
+            return UUID(str(task_id_raw))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _queue_wait_seconds(task_operation: dict[str, Any]) -> float | None:
+        """Seconds between enqueue and dequeue (None if not stamped by the scheduler).
+
+        Uses wall-clock time since operations may cross hosts; clamped at zero
+        to tolerate small clock skew between producer and worker.
+        """
+        enqueued_at = task_operation.get("_enqueued_at")
+        if enqueued_at is None:
+            return None
+        return max(time.time() - float(enqueued_at), 0.0)
+
+    async def _notify_lifecycle(
+        self, task_id: UUID, context_id: UUID, state: str, final: bool
+    ) -> None:
+        """Announce a task state change (event bus, webhooks). Default is a no-op."""
+
+    @property
+    def in_flight_count(self) -> int:
+        """Number of run operations currently executing on this worker."""
+        return len(self._in_flight)
 
     async def _handle_task_operation(self, task_operation: dict[str, Any]) -> None:
         """Dispatch task operation to appropriate handler.
@@ -108,13 +296,18 @@ class Worker(ABC):
 
         Supported Operations:
         - run: Execute a task
-        - cancel: Cancel a running task
-        - pause: Pause task execution (future)
-        - resume: Resume paused task (future)
+        - cancel: Interrupt local execution (if any) and cancel the task
+        - pause: Suspend the task at its next checkpoint
+        - resume: Continue a suspended task from its checkpoint
 
         Error Handling:
-        - Any exception during execution marks task as 'failed'
+        - Any exception during execution marks task as 'failed' and announces
+          it (``_notify_lifecycle``), unless the handler already did so
         - Preserves OpenTelemetry trace context
+
+        Observability:
+        - Queue wait (enqueue to dequeue) is recorded as span attribute
+          ``bindu.queue_wait_seconds`` and histogram ``bindu_task_queue_wait_seconds``
         """
         operation_handlers: dict[str, Any] = {
             "run": self.run_task,
@@ -123,13 +316,29 @@ class Worker(ABC):
             "resume": self._handle_resume,
         }
 
+        attributes: dict[str, Any] = {"logfire.tags": ["bindu"]}
+        queue_wait = self._queue_wait_seconds(task_operation)
+        if queue_wait is not None:
+            attributes["bindu.queue_wait_seconds"] = queue_wait
+            queue_wait_histogram.record(
+                queue_wait, {"operation": task_operation["operation"]}
+            )
+
         try:
-            # Preserve trace context from scheduler
+            # Resume the originating trace (remote parent for Redis schedulers)
             with use_span(task_operation["_current_span"]):
                 with tracer.start_as_current_span(
                     f"{task_operation['operation']} task",
-                    attributes={"logfire.tags": ["bindu"]},
+                    attributes=attributes,
                 ):
+                    if task_operation["operation"] == "cancel":
+                        # Stop local execution before recording the canceled state
+                        task_id = self._parse_task_id(
+                            task_operation["params"].get("task_id")
+                        )
+                        if task_id is not None:
+                            self.interrupt_task(task_id)
+
                     handler = operation_handlers.get(task_operation["operation"])
                     if handler:
                         await handler(task_operation["params"])
@@ -144,7 +353,19 @@ class Worker(ABC):
             task_id_raw = task_operation["params"]["task_id"]
             task_id = UUID(task_id_raw) if isinstance(task_id_raw, str) else task_id_raw
             logger.error(f"Task {task_id} failed: {e}", exc_info=True)
-            await self.storage.update_task(task_id, state="failed")
+            task = await self.storage.load_task(
+                task_id, include_history=False, include_artifacts=False
+            )
+            if task is None:
+                return
+            if task["status"]["state"] in ("canceled", "failed"):
+                # Never overwrite a cancellation; a failure was already announced
+                return
+            await self.storage.update_task(
+                task_id, state="failed", include_history=False, include_artifacts=False
+            )
+            # Streams and webhooks would otherwise wait for a final event forever
+            await self._notify_lifecycle(task_id, task["context_id"], "failed", True)
 
     # -------------------------------------------------------------------------
     # Abstract Methods (Must Implement)
@@ -215,25 +436,68 @@ class Worker(ABC):
         ...
 
     # -------------------------------------------------------------------------
-    # Future Operations (Not Yet Implemented)
+    # Pause / Resume
     # -------------------------------------------------------------------------
 
     async def _handle_pause(self, params: TaskIdParams) -> None:
         """Handle pause operation.
 
-        TODO: Implement task pause functionality
-        - Save current execution state
-        - Update task to 'suspended' state
-        - Release resources while preserving context
+        - Running on this worker: suspend at the next checkpoint; the concrete
+          worker persists its execution state and releases the slot
+        - Running elsewhere: that worker got the scheduler's pause broadcast
+        - Not started yet: mark 'suspended' so the queued run is skipped
+
+        Args:
+            params: Task identification parameters
         """
-        raise NotImplementedError("Pause operation not yet implemented")
+        task_id = self._parse_task_id(params["task_id"])
+        if task_id is None or self.request_pause(task_id):
+            return
+
+        task = await self.storage.load_task(
+            task_id, include_history=False, include_artifacts=False
+        )
+        if task is None:
+            logger.warning(f"Cannot pause task {task_id}: not found")
+            return
+        if task["status"]["state"] == "submitted":
+            logger.info(f"Suspending queued task {task_id}")
+            await self.storage.update_task(
+                task_id,
+                state="suspended",
+                include_history=False,
+                include_artifacts=False,
+            )
 
     async def _handle_resume(self, params: TaskIdParams) -> None:
         """Handle resume operation.
 
-        TODO: Implement task resume functionality
-        - Restore execution state
-        - Update task to 'resumed' state
-        - Continue from last checkpoint
+        Marks a suspended task 'resumed' and runs it again on this worker; the
+        concrete worker continues from the checkpoint stored with the task, so
+        a task paused on one node can resume on any other. The transition is
+        a compare-and-set in storage, so of concurrent resumes of a task only
+        one runs it.
+
+        Args:
+            params: Task identification parameters
         """
-        raise NotImplementedError("Resume operation not yet implemented")
+        task_id = self._parse_task_id(params["task_id"])
+        task = (
+            await self.storage.load_task(
+                task_id, history_length=1, include_artifacts=False
+            )
+            if task_id
+            else None
+        )
+        if task is None or not await self.storage.transition_task_state(
+            task["id"], "suspended", "resumed"
+        ):
+            state = task["status"]["state"] if task else "not found"
+            logger.warning(f"Cannot resume task {params['task_id']}: {state}")
+            return
+
+        history = task.get("history") or []
+        run_params = TaskSendParams(task_id=task["id"], context_id=task["context_id"])
+        if history:
+            run_params["message"] = history[-1]
+        await self.run_task(run_params)
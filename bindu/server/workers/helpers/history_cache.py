@@ -0,0 +1,71 @@
+"""Chat-format history cache for ManifestWorker.
+
+Building the agent input for a conversation turn converts the messages of all
+earlier tasks of the context (or of the referenced tasks). Finished tasks are
+immutable, so their converted messages are cached by task ID and each turn
+only loads and converts the tasks it has not seen before.
+
+The cache is per process: entries are dropped when the worker updates a task
+and when a context is cleared through this process.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from uuid import UUID
+
+from bindu.utils.worker_utils import ChatMessage
+
+
+class HistoryCache:
+    """LRU cache of chat-format messages of finished tasks, by task ID."""
+
+    def __init__(self, max_tasks: int = 10000):
+        """Initialize the cache.
+
+        Args:
+            max_tasks: Maximum number of cached tasks (0 disables the cache)
+        """
+        self.max_tasks = max_tasks
+        self._messages: OrderedDict[UUID, list[ChatMessage]] = OrderedDict()
+        self._task_ids_by_context: dict[UUID, set[UUID]] = {}
+        self._context_by_task: dict[UUID, UUID] = {}
+
+    def __len__(self) -> int:
+        """Number of cached tasks."""
+        return len(self._messages)
+
+    def get(self, task_id: UUID) -> list[ChatMessage] | None:
+        """Chat messages of a cached task (None if not cached)."""
+        messages = self._messages.get(task_id)
+        if messages is not None:
+            self._messages.move_to_end(task_id)
+        return messages
+
+    def put(self, task_id: UUID, context_id: UUID, messages: list[ChatMessage]) -> None:
+        """Cache the chat messages of a finished task."""
+        if self.max_tasks <= 0:
+            return
+        self._messages[task_id] = messages
+        self._messages.move_to_end(task_id)
+        self._context_by_task[task_id] = context_id
+        self._task_ids_by_context.setdefault(context_id, set()).add(task_id)
+        while len(self._messages) > self.max_tasks:
+            oldest = next(iter(self._messages))
+            self.invalidate_task(oldest)
+
+    def invalidate_task(self, task_id: UUID) -> None:
+        """Drop a task's entry."""
+        self._messages.pop(task_id, None)
+        context_id = self._context_by_task.pop(task_id, None)
+        if context_id is not None:
+            task_ids = self._task_ids_by_context[context_id]
+            task_ids.discard(task_id)
+            if not task_ids:
+                del self._task_ids_by_context[context_id]
+
+    def invalidate_context(self, context_id: UUID) -> None:
+        """Drop the entries of all tasks of a context."""
+        for task_id in self._task_ids_by_context.pop(context_id, set()):
+            self._messages.pop(task_id, None)
+            self._context_by_task.pop(task_id, None)
@@ -0,0 +1,290 @@
+"""History reduction for ManifestWorker.
+
+The conversation history rebuilt for a task grows with every turn of its
+context. Before the agent runs, the history passes through a pipeline of
+reducers, each returning a (usually shorter) list of chat messages:
+
+- ``MessageWindow`` keeps the last N messages, or the last N turns (a turn
+  starts with a user message).
+- ``TokenBudget`` drops the oldest messages until an approximate token count
+  fits the budget.
+- ``RollingSummary`` replaces the messages that fall out of the window with a
+  summary produced by a user-supplied summarizer. The summary is persisted
+  per context and extended incrementally, so each turn only summarizes the
+  messages that dropped out since the previous one.
+
+The pipeline is built from the manifest (``history_window_turns``,
+``history_summarizer``) and the agent settings by ``build_history_reducers``.
+Without configuration it is empty and the full history reaches the agent.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import math
+from typing import Any, Callable, Protocol
+from uuid import UUID
+
+from bindu.penguin.execution import ExecutionStrategy, run_sync
+from bindu.server.storage.base import Storage
+from bindu.settings import app_settings
+from bindu.utils.logging import get_logger
+from bindu.utils.worker_utils import ChatMessage
+
+logger = get_logger("bindu.server.workers.helpers.history_reducer")
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+# Approximate tokens added per message for role and formatting
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class HistoryReducer(Protocol):
+    """A stage of the history reduction pipeline."""
+
+    async def reduce(
+        self, messages: list[ChatMessage], context_id: UUID
+    ) -> list[ChatMessage]:
+        """Return the messages to pass on to the next stage."""
+        ...
+
+
+def _is_summary(message: ChatMessage) -> bool:
+    return message.get("role") == "system" and message.get("content", "").startswith(
+        SUMMARY_PREFIX
+    )
+
+
+class MessageWindow:
+    """Keep the last ``max_messages`` messages or ``max_turns`` turns.
+
+    A turn starts with a user message and includes the replies up to the
+    next one. None or 0 keeps all messages.
+    """
+
+    def __init__(
+        self, max_messages: int | None = None, *, max_turns: int | None = None
+    ):
+        """Initialize the window.
+
+        Args:
+            max_messages: Number of messages to keep
+            max_turns: Number of turns to keep (used if max_messages is unset)
+        """
+        self.max_messages = max_messages
+        self.max_turns = max_turns
+
+    def start(self, messages: list[ChatMessage]) -> int:
+        """Index of the first message inside the window."""
+        if self.max_messages:
+            return max(len(messages) - self.max_messages, 0)
+        if self.max_turns:
+            turns = 0
+            for i in range(len(messages) - 1, -1, -1):
+                if messages[i].get("role") == "user":
+                    turns += 1
+                    if turns == self.max_turns:
+                        return i
+        return 0
+
+    async def reduce(
+        self, messages: list[ChatMessage], context_id: UUID
+    ) -> list[ChatMessage]:
+        """Drop the messages before the window."""
+        start = self.start(messages)
+        return messages[start:] if start else messages
+
+
+class TokenBudget:
+    """Keep the newest messages that fit an approximate token budget.
+
+    Tokens are estimated from the content length (``chars_per_token``) plus a
+    small per-message overhead. A leading summary message and the last
+    message (the current request) are always kept.
+    """
+
+    def __init__(self, max_tokens: int, chars_per_token: float = 4.0):
+        """Initialize the budget.
+
+        Args:
+            max_tokens: Approximate token budget for the whole history
+            chars_per_token: Characters per token used for the estimate
+        """
+        self.max_tokens = max_tokens
+        self.chars_per_token = chars_per_token
+
+    def estimate_tokens(self, message: ChatMessage) -> int:
+        """Approximate token count of a message."""
+        content = message.get("content") or ""
+        return math.ceil(len(content) / self.chars_per_token) + _MESSAGE_OVERHEAD_TOKENS
+
+    async def reduce(
+        self, messages: list[ChatMessage], context_id: UUID
+    ) -> list[ChatMessage]:
+        """Drop the oldest messages until the rest fits the budget."""
+        if not messages:
+            return messages
+
+        head = messages[:1] if _is_summary(messages[0]) else []
+        body = messages[len(head) :]
+        budget = self.max_tokens - sum(self.estimate_tokens(m) for m in head)
+
+        kept = 0
+        for message in reversed(body):
+            cost = self.estimate_tokens(message)
+            if kept and cost > budget:
+                break
+            budget -= cost
+            kept += 1
+
+        if kept == len(body):
+            return messages
+        return head + body[len(body) - kept :]
+
+
+class RollingSummary:
+    """Replace the messages outside the window with a persisted summary.
+
+    The summarizer is called as ``summarizer(previous_summary, messages)``
+    (sync or async) and returns the new summary text; ``previous_summary`` is
+    None for the first call. A sync summarizer runs off the event loop with
+    the given execution strategy. The summary record stored for the context keeps
+    the number of leading messages it covers and a digest of them: when the
+    history no longer starts with those messages (e.g. a turn built from
+    referenced tasks), the summary is rebuilt from scratch.
+
+    If the summarizer fails, the turn falls back to the plain window.
+    """
+
+    def __init__(
+        self,
+        summarizer: Callable[[str | None, list[ChatMessage]], Any],
+        storage: Storage,
+        keep_messages: int | None = None,
+        *,
+        keep_turns: int | None = None,
+        strategy: ExecutionStrategy = "thread",
+    ):
+        """Initialize the summary stage.
+
+        Args:
+            summarizer: Callable producing the summary text
+            storage: Storage persisting the summary per context
+            keep_messages: Number of newest messages kept verbatim
+            keep_turns: Number of newest turns kept verbatim (used if
+                keep_messages is unset)
+            strategy: Where a sync summarizer runs (thread or process)
+        """
+        self.summarizer = summarizer
+        self.storage = storage
+        self.window = MessageWindow(keep_messages, max_turns=keep_turns)
+        self.strategy = strategy
+        self._is_async = inspect.iscoroutinefunction(
+            summarizer
+        ) or inspect.iscoroutinefunction(getattr(summarizer, "__call__", None))
+
+    @staticmethod
+    def _digest(messages: list[ChatMessage]) -> str:
+        return hashlib.sha256(
+            json.dumps(messages, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    async def _summarize(
+        self, previous: str | None, messages: list[ChatMessage]
+    ) -> str:
+        if self._is_async:
+            result = self.summarizer(previous, messages)
+        else:
+            result = await run_sync(
+                self.summarizer, previous, messages, strategy=self.strategy
+            )
+        if inspect.isawaitable(result):
+            result = await result
+        return str(result)
+
+    async def reduce(
+        self, messages: list[ChatMessage], context_id: UUID
+    ) -> list[ChatMessage]:
+        """Summarize the messages outside the window and keep the rest."""
+        dropped_count = self.window.start(messages)
+        if dropped_count <= 0:
+            return messages
+        dropped, kept = messages[:dropped_count], messages[dropped_count:]
+
+        record = await self.storage.load_history_summary(context_id)
+        text: str | None = None
+        covered = 0
+        if (
+            record
+            and 0 < record.get("covered", 0) <= dropped_count
+            and record.get("digest") == self._digest(dropped[: record["covered"]])
+        ):
+            text, covered = record.get("text"), record["covered"]
+
+        if covered < dropped_count:
+            try:
+                text = await self._summarize(text, dropped[covered:])
+            except Exception as e:
+                logger.warning(
+                    f"History summarizer failed for context {context_id}: {e}"
+                )
+                return kept
+            await self.storage.save_history_summary(
+                context_id,
+                {
+                    "text": text,
+                    "covered": dropped_count,
+                    "digest": self._digest(dropped),
+                },
+            )
+
+        return [{"role": "system", "content": SUMMARY_PREFIX + (text or "")}] + kept
+
+
+def build_history_reducers(manifest: Any, storage: Storage) -> list[HistoryReducer]:
+    """Build the history reduction pipeline for an agent.
+
+    The window is ``history_window_messages`` messages from the agent
+    settings, else ``history_window_turns`` turns from the manifest (set when
+    ``num_history_sessions`` is configured explicitly). Without either the
+    history is not windowed. With a ``history_summarizer`` on the manifest the
+    messages outside the window are summarized instead of dropped (in a
+    worker thread, or the process pool for ``process`` agents). A token
+    budget (``history_max_tokens``) is applied last.
+
+    Args:
+        manifest: Agent manifest
+        storage: Storage persisting rolling summaries
+
+    Returns:
+        Reducers in the order they run
+    """
+    settings = app_settings.agent
+    messages = settings.history_window_messages or None
+    turns = None if messages else getattr(manifest, "history_window_turns", None)
+
+    reducers: list[HistoryReducer] = []
+    summarizer = getattr(manifest, "history_summarizer", None)
+    if messages or turns:
+        if summarizer is not None:
+            # Summarizers are usually blocking LLM calls: never run them on the
+            # event loop, even for agents whose handler runs inline
+            strategy: ExecutionStrategy = (
+                "process"
+                if getattr(manifest, "execution_strategy", None) == "process"
+                else "thread"
+            )
+            reducers.append(
+                RollingSummary(
+                    summarizer, storage, messages, keep_turns=turns, strategy=strategy
+                )
+            )
+        else:
+            reducers.append(MessageWindow(messages, max_turns=turns))
+    if settings.history_max_tokens:
+        reducers.append(
+            TokenBudget(settings.history_max_tokens, settings.history_chars_per_token)
+        )
+    return reducers
@@ -7,7 +7,7 @@ different data structures.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from bindu.utils.logging import get_logger
 
@@ -66,6 +66,58 @@ class ResultProcessor:
         else:
             return raw_results
 
+    @staticmethod
+    async def collect_chunks(
+        raw_results: Any,
+        should_stop: Callable[[], bool],
+        on_chunk: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> tuple[list[Any], bool]:
+        """Collect results chunk by chunk, stopping early when requested.
+
+        ``should_stop`` is checked after every chunk (the checkpoint boundary).
+        When it returns True the generator is closed and the chunks collected
+        so far are returned. Direct return values cannot be interrupted.
+
+        Args:
+            raw_results: Raw result from manifest.run()
+            should_stop: Callable checked at every chunk boundary
+            on_chunk: Optional callback awaited with each yielded chunk
+
+        Returns:
+            Tuple of (collected chunks, whether collection stopped early)
+        """
+        collected: list[Any] = []
+
+        if hasattr(raw_results, "__anext__"):
+            try:
+                async for chunk in raw_results:
+                    collected.append(chunk)
+                    if on_chunk is not None:
+                        await on_chunk(chunk)
+                    if should_stop():
+                        return collected, True
+            finally:
+                aclose = getattr(raw_results, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            return collected, False
+
+        if hasattr(raw_results, "__next__"):
+            try:
+                for chunk in raw_results:
+                    collected.append(chunk)
+                    if on_chunk is not None:
+                        await on_chunk(chunk)
+                    if should_stop():
+                        return collected, True
+            finally:
+                close = getattr(raw_results, "close", None)
+                if close is not None:
+                    close()
+            return collected, False
+
+        return ([] if raw_results is None else [raw_results]), False
+
     @staticmethod
     def normalize_result(result: Any) -> Any:
         """Intelligently normalize agent result to extract final response.
@@ -29,8 +29,9 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
-from uuid import UUID
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID, uuid4
 
 from opentelemetry.trace import Status, StatusCode, get_tracer
 
@@ -45,15 +46,30 @@ from bindu.common.protocol.types import (
     TaskState,
 )
 from bindu.penguin.manifest import AgentManifest
+from bindu.server.events import EventBus, artifact_update_event, status_update_event
 from bindu.server.workers.base import Worker
-from bindu.server.workers.helpers import ResponseDetector, ResultProcessor
+from bindu.server.workers.helpers import (
+    HistoryCache,
+    HistoryReducer,
+    ResponseDetector,
+    ResultProcessor,
+    build_history_reducers,
+)
 from bindu.utils.logging import get_logger
 from bindu.utils.retry import retry_worker_operation
-from bindu.utils.worker_utils import ArtifactBuilder, MessageConverter, TaskStateManager
+from bindu.utils.worker_utils import (
+    ArtifactBuilder,
+    ChatMessage,
+    MessageConverter,
+    TaskStateManager,
+)
 
 tracer = get_tracer("bindu.server.workers.manifest_worker")
 logger = get_logger("bindu.server.workers.manifest_worker")
 
+CHECKPOINT_METADATA_KEY = "checkpoint"
+"""Task metadata key holding the execution checkpoint of a suspended task."""
+
 
 @dataclass
 class ManifestWorker(Worker):
@@ -86,6 +102,17 @@ class ManifestWorker(Worker):
     )
     """Optional callback for task lifecycle notifications (task_id, context_id, state, final)."""
 
+    event_bus: EventBus | None = None
+    """Optional bus that task events are published to (consumed by message/stream)."""
+
+    history_cache: HistoryCache = field(
+        default_factory=lambda: HistoryCache(app_settings.agent.history_cache_max_tasks)
+    )
+    """Chat-format history of finished tasks, reused across conversation turns."""
+
+    history_reducers: list[HistoryReducer] | None = None
+    """History reduction pipeline (built from manifest and settings if None)."""
+
     @retry_worker_operation()
     async def run_task(self, params: TaskSendParams) -> None:
         """Execute a task using the AgentManifest.
@@ -114,10 +141,29 @@ class ManifestWorker(Worker):
         if task is None:
             raise ValueError(f"Task {params['task_id']} not found")
 
+        # The task's history is about to change
+        self.history_cache.invalidate_task(task["id"])
+
+        current_state = task["status"]["state"]
+        if current_state in ("canceled", "suspended"):
+            # Canceled or paused while still queued - nothing to execute now
+            logger.info(f"Skipping {current_state} task {task['id']}")
+            return
+
+        # Resuming: continue from the checkpoint persisted at pause time
+        checkpoint: dict[str, Any] | None = None
+        if current_state == "resumed":
+            checkpoint = (task.get("metadata") or {}).get(CHECKPOINT_METADATA_KEY)
+
         # Extract payment context if available (from x402 middleware)
-        payment_context = params.get("payment_context")
+        payment_context = params.get("payment_context") or (checkpoint or {}).get(
+            "payment_context"
+        )
 
-        await TaskStateManager.validate_task_state(task)
+        await TaskStateManager.validate_task_state(
+            task,
+            expected_state="resumed" if current_state == "resumed" else "submitted",
+        )
 
         # Add span event for state transition
         from opentelemetry.trace import get_current_span
@@ -128,12 +174,25 @@ class ManifestWorker(Worker):
                 "task.state_changed", attributes={"to_state": "working"}
             )
 
-        # Transition to working
-        await self.storage.update_task(task["id"], state="working")
+        # Transition to working (a consumed checkpoint is cleared)
+        await self.storage.update_task(
+            task["id"],
+            state="working",
+            metadata={CHECKPOINT_METADATA_KEY: None} if checkpoint else None,
+            include_history=False,
+            include_artifacts=False,
+        )
         await self._notify_lifecycle(task["id"], task["context_id"], "working", False)
 
         # Step 2: Build conversation history (A2A Protocol)
-        message_history = await self._build_complete_message_history(task)
+        if checkpoint:
+            message_history = self._restore_message_history(checkpoint)
+        else:
+            message_history = await self._build_complete_message_history(task)
+            message_history = await self._reduce_history(
+                task["context_id"], message_history
+            )
+        agent_history = message_history
 
         try:
             # Step 3: Execute manifest with system prompt (if enabled)
@@ -167,9 +226,20 @@ class ManifestWorker(Worker):
                     # Pass message history as structured list of dicts
                     raw_results = self.manifest.run(message_history or [])
 
-                    # Handle generator/async generator responses
-                    collected_results = await ResultProcessor.collect_results(
-                        raw_results
+                    # Handle generator/async generator responses; a pause
+                    # request stops collection at the next chunk boundary
+                    chunks, paused = await ResultProcessor.collect_chunks(
+                        raw_results,
+                        lambda: self.pause_requested(task["id"]),
+                        on_chunk=self._chunk_publisher(task)
+                        if params.get("stream")
+                        else None,
+                    )
+                    previous_output = (checkpoint or {}).get("partial_output") or []
+                    collected_results = (
+                        chunks[-1]
+                        if chunks
+                        else (previous_output[-1] if previous_output else None)
                     )
 
                     # Normalize result to extract final response (intelligent extraction)
@@ -195,6 +265,15 @@ class ManifestWorker(Worker):
                     agent_span.set_status(Status(StatusCode.ERROR, str(agent_error)))
                     raise
 
+            # Guard: a cancellation that raced with completion wins
+            if await self._is_canceled(task["id"]):
+                logger.info(f"Task {task['id']} was canceled, discarding result")
+                return
+
+            if paused:
+                await self._suspend_task(task, agent_history, chunks, payment_context)
+                return
+
             # Step 4: Parse response and detect state
             structured_response = ResponseDetector.parse_structured_response(results)
 
@@ -239,7 +318,8 @@ class ManifestWorker(Worker):
                         "error": str(e),
                     },
                 )
-            await self._handle_task_failure(task, str(e))
+            if not await self._is_canceled(task["id"]):
+                await self._handle_task_failure(task, str(e))
             raise
         return
 
@@ -247,11 +327,25 @@ class ManifestWorker(Worker):
     async def cancel_task(self, params: TaskIdParams) -> None:
         """Cancel a running task.
 
+        The in-flight execution (if on this worker) has already been interrupted
+        by the base worker; this records the canceled state. Tasks that reached
+        a terminal state in the meantime are left untouched.
+
         Args:
             params: Task identification parameters containing task_id
         """
-        task = await self.storage.load_task(params["task_id"])
+        task = await self.storage.load_task(
+            params["task_id"], include_history=False, include_artifacts=False
+        )
+        if task and task["status"]["state"] in app_settings.agent.terminal_states:
+            # Finished (or already canceled) before the cancel arrived
+            logger.debug(
+                f"Task {params['task_id']} already {task['status']['state']}, "
+                "not canceling"
+            )
+            return
         if task:
+            self.history_cache.invalidate_task(task["id"])
             # Add span event for cancellation
             from opentelemetry.trace import get_current_span
 
@@ -264,11 +358,114 @@ class ManifestWorker(Worker):
                         "to_state": "canceled",
                     },
                 )
-            await self.storage.update_task(params["task_id"], state="canceled")
+            await self.storage.update_task(
+                params["task_id"],
+                state="canceled",
+                include_history=False,
+                include_artifacts=False,
+            )
             await self._notify_lifecycle(
                 params["task_id"], task["context_id"], "canceled", True
             )
 
+    # -------------------------------------------------------------------------
+    # Checkpointing (pause / resume)
+    # -------------------------------------------------------------------------
+
+    async def _suspend_task(
+        self,
+        task: dict[str, Any],
+        message_history: list[dict[str, str]],
+        chunks: list[Any],
+        payment_context: dict[str, Any] | None,
+    ) -> None:
+        """Persist a checkpoint and suspend the task, releasing the worker slot.
+
+        The checkpoint is stored in task metadata, so any node can resume it.
+
+        Args:
+            task: Task being executed
+            message_history: Agent input (without the system prompt)
+            chunks: Output chunks collected before the pause
+            payment_context: Optional payment details to settle on completion
+        """
+        checkpoint: dict[str, Any] = {
+            "message_history": message_history,
+            "partial_output": [self._checkpoint_chunk(chunk) for chunk in chunks],
+            "suspended_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if payment_context:
+            checkpoint["payment_context"] = payment_context
+
+        await self.storage.update_task(
+            task["id"],
+            state="suspended",
+            metadata={CHECKPOINT_METADATA_KEY: checkpoint},
+            include_history=False,
+            include_artifacts=False,
+        )
+        logger.info(f"Task {task['id']} suspended after {len(chunks)} chunk(s)")
+        await self._notify_lifecycle(task["id"], task["context_id"], "suspended", False)
+
+    # -------------------------------------------------------------------------
+    # Event publishing (message/stream)
+    # -------------------------------------------------------------------------
+
+    def _chunk_publisher(
+        self, task: dict[str, Any]
+    ) -> Callable[[Any], Awaitable[None]] | None:
+        """Build a callback publishing each output chunk as an artifact update.
+
+        All chunks of one execution are appended to the same artifact.
+        """
+        event_bus = self.event_bus
+        if event_bus is None:
+            return None
+        artifact_id = str(uuid4())
+        published = 0
+
+        async def publish_chunk(chunk: Any) -> None:
+            nonlocal published
+            if not chunk:
+                return
+            artifact = {
+                "artifact_id": artifact_id,
+                "name": "streaming_response",
+                "parts": [{"kind": "text", "text": str(chunk)}],
+            }
+            await event_bus.publish(
+                task["id"],
+                artifact_update_event(
+                    task["id"], task["context_id"], artifact, append=published > 0
+                ),
+            )
+            published += 1
+
+        return publish_chunk
+
+    @staticmethod
+    def _checkpoint_chunk(chunk: Any) -> Any:
+        """Make an output chunk JSON-serializable for the checkpoint."""
+        normalized = ResultProcessor.normalize_result(chunk)
+        return normalized if isinstance(normalized, (str, dict)) else str(normalized)
+
+    @staticmethod
+    def _restore_message_history(checkpoint: dict[str, Any]) -> list[dict[str, str]]:
+        """Rebuild agent input from a checkpoint.
+
+        Partial output is appended as an assistant turn, so the agent continues
+        from where it was suspended instead of starting over.
+        """
+        message_history = list(checkpoint.get("message_history") or [])
+        partial_text = "".join(
+            chunk
+            for chunk in checkpoint.get("partial_output") or []
+            if isinstance(chunk, str)
+        )
+        if partial_text:
+            message_history.append({"role": "assistant", "content": partial_text})
+        return message_history
+
     def build_message_history(self, history: list[Message]) -> list[dict[str, str]]:
         """Convert A2A protocol messages to chat format for manifest execution.
 
@@ -307,6 +504,9 @@ class ManifestWorker(Worker):
         - Parallel task execution within same context
         - Conversation continuity across multiple tasks
 
+        Earlier tasks come from the history cache where possible; the ones not
+        cached yet are loaded in one batch.
+
         Args:
             task: Current task being executed
 
@@ -322,40 +522,68 @@ class ManifestWorker(Worker):
 
         if reference_task_ids:
             # Strategy 1: Explicit references (A2A refinement pattern)
-            from uuid import UUID
-
-            referenced_messages: list[Message] = []
-            for task_id in reference_task_ids:
-                # Ensure task_id is UUID object
-                task_id_uuid = UUID(task_id) if isinstance(task_id, str) else task_id
-                ref_task = await self.storage.load_task(task_id_uuid)
-                if ref_task and ref_task.get("history"):
-                    referenced_messages.extend(ref_task["history"])
-
-            current_messages = task.get("history", [])
-            all_messages = referenced_messages + current_messages
-
+            previous_ids = [
+                UUID(task_id) if isinstance(task_id, str) else task_id
+                for task_id in reference_task_ids
+            ]
         elif self.manifest.enable_context_based_history:
             # Strategy 2: Context-based history (implicit continuation)
-            # Only enabled if configured in manifest
+            # Only enabled if configured in manifest; the listing is only
+            # used for the task order, so it skips the histories
             tasks_by_context = await self.storage.list_tasks_by_context(
-                task["context_id"]
+                task["context_id"], include_history=False, include_artifacts=False
             )
-            previous_tasks = [t for t in tasks_by_context if t["id"] != task["id"]]
-
-            all_previous_messages: list[Message] = []
-            for prev_task in previous_tasks:
-                history = prev_task.get("history", [])
-                if history:
-                    all_previous_messages.extend(history)
-
-            current_messages = task.get("history", [])
-            all_messages = all_previous_messages + current_messages
+            previous_ids = [t["id"] for t in tasks_by_context if t["id"] != task["id"]]
         else:
             # No context-based history - only use current task messages
-            all_messages = task.get("history", [])
+            previous_ids = []
+
+        message_history = await self._previous_message_history(previous_ids)
+        current_messages = task.get("history", [])
+        if current_messages:
+            message_history += self.build_message_history(current_messages)
+        return message_history
+
+    async def _reduce_history(
+        self, context_id: UUID, message_history: list[ChatMessage]
+    ) -> list[ChatMessage]:
+        """Run the history through the reduction pipeline (window, summary, budget)."""
+        if self.history_reducers is None:
+            self.history_reducers = build_history_reducers(self.manifest, self.storage)
+        for reducer in self.history_reducers:
+            message_history = await reducer.reduce(message_history, context_id)
+        return message_history
+
+    async def _previous_message_history(
+        self, task_ids: list[UUID]
+    ) -> list[ChatMessage]:
+        """Chat-format messages of earlier tasks, in the order given.
+
+        Cached tasks are not loaded again; the others are loaded with one
+        load_tasks() call, and the finished ones among them are cached.
+        """
+        messages_by_task: dict[UUID, list[ChatMessage]] = {}
+        missing: list[UUID] = []
+        for task_id in task_ids:
+            cached = self.history_cache.get(task_id)
+            if cached is None:
+                missing.append(task_id)
+            else:
+                messages_by_task[task_id] = cached
+
+        if missing:
+            for loaded in await self.storage.load_tasks(
+                missing, include_artifacts=False
+            ):
+                messages = self.build_message_history(loaded.get("history") or [])
+                messages_by_task[loaded["id"]] = messages
+                if loaded["status"]["state"] in app_settings.agent.terminal_states:
+                    self.history_cache.put(loaded["id"], loaded["context_id"], messages)
 
-        return self.build_message_history(all_messages) if all_messages else []
+        message_history: list[ChatMessage] = []
+        for task_id in task_ids:
+            message_history.extend(messages_by_task.get(task_id, ()))
+        return message_history
 
     # -------------------------------------------------------------------------
     # Message Normalization
@@ -390,7 +618,12 @@ class ManifestWorker(Worker):
 
         # Update task with state and append agent messages to history
         await self.storage.update_task(
-            task["id"], state=state, new_messages=agent_messages, metadata=metadata
+            task["id"],
+            state=state,
+            new_messages=agent_messages,
+            metadata=metadata,
+            include_history=False,
+            include_artifacts=False,
         )
         await self._notify_lifecycle(task["id"], task["context_id"], state, False)
 
@@ -461,6 +694,8 @@ class ManifestWorker(Worker):
                 new_artifacts=artifacts,
                 new_messages=agent_messages,
                 metadata=additional_metadata,
+                include_history=False,
+                include_artifacts=False,
             )
             await self._notify_lifecycle(task["id"], task["context_id"], state, True)
 
@@ -474,12 +709,16 @@ class ManifestWorker(Worker):
                 state=state,
                 new_messages=error_message,
                 metadata=additional_metadata,
+                include_history=False,
+                include_artifacts=False,
             )
             await self._notify_lifecycle(task["id"], task["context_id"], state, True)
 
         elif state == "canceled":
             # Canceled: State change only, NO new content
-            await self.storage.update_task(task["id"], state=state)
+            await self.storage.update_task(
+                task["id"], state=state, include_history=False, include_artifacts=False
+            )
             await self._notify_lifecycle(task["id"], task["context_id"], state, True)
 
     async def _handle_task_failure(self, task: dict[str, Any], error: str) -> None:
@@ -499,7 +738,11 @@ class ManifestWorker(Worker):
             f"Task execution failed: {error}", task["id"], task["context_id"]
         )
         await self.storage.update_task(
-            task["id"], state="failed", new_messages=error_message
+            task["id"],
+            state="failed",
+            new_messages=error_message,
+            include_history=False,
+            include_artifacts=False,
         )
         await self._notify_lifecycle(task["id"], task["context_id"], "failed", True)
 
@@ -566,6 +809,11 @@ class ManifestWorker(Worker):
             context_id: Context identifier
             artifact: The artifact that was generated
         """
+        if self.event_bus:
+            await self.event_bus.publish(
+                task_id,
+                artifact_update_event(task_id, context_id, artifact, last_chunk=True),
+            )
         if self.lifecycle_notifier:
             try:
                 # Get push manager from lifecycle_notifier's bound instance
@@ -594,6 +842,10 @@ class ManifestWorker(Worker):
             state: New task state
             final: Whether this is a terminal state
         """
+        if self.event_bus:
+            await self.event_bus.publish(
+                task_id, status_update_event(task_id, context_id, state, final)
+            )
         if self.lifecycle_notifier:
             try:
                 result = self.lifecycle_notifier(task_id, context_id, state, final)
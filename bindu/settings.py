@@ -300,7 +300,7 @@ class X402Settings(BaseSettings):
     # Similar to auth's public_endpoints, this defines which JSON-RPC methods need payment
     protected_methods: list[str] = [
         "message/send",  # Creating new tasks requires payment
-        # "message/stream",  # Uncomment if streaming should require payment
+        "message/stream",  # Streaming also creates (and runs) a task
     ]
 
     # Metadata keys
@@ -356,14 +356,27 @@ class AgentSettings(BaseSettings):
     # Maps JSON-RPC method names to task_manager handler method names
     method_handlers: dict[str, str] = {
         "message/send": "send_message",
+        "message/stream": "stream_message",
         "tasks/get": "get_task",
+        "tasks/getMany": "get_tasks",
         "tasks/cancel": "cancel_task",
         "tasks/list": "list_tasks",
         "contexts/list": "list_contexts",
         "contexts/clear": "clear_context",
         "tasks/feedback": "task_feedback",
+        "tasks/resubscribe": "resubscribe_task",
     }
 
+    # JSON-RPC batches on the A2A endpoint: calls of a batch run concurrently,
+    # larger batches are rejected as a whole (0 = batches disabled)
+    max_batch_size: int = Field(default=100, ge=0)
+
+    # Maximum number of task IDs in one tasks/getMany call
+    get_many_max_tasks: int = Field(default=100, ge=1)
+
+    # Cache-Control max-age (seconds) of the agent card and skills endpoints
+    discovery_max_age: int = Field(default=300, ge=0)
+
     # Task State Configuration (A2A Protocol)
     # Non-terminal states: Task is mutable, can receive new messages
     non_terminal_states: frozenset[str] = frozenset(
@@ -471,6 +484,18 @@ CRITICAL
     # Enable/disable structured response system
     enable_structured_responses: bool = True
 
+    # Chat-format history of finished tasks kept by ManifestWorker, so a
+    # conversation turn only converts tasks it has not seen (0 = no cache)
+    history_cache_max_tasks: int = Field(default=10000, ge=0)
+
+    # History reduction before the agent runs (see
+    # bindu/server/workers/helpers/history_reducer.py). Without a message
+    # window, an explicitly configured num_history_sessions keeps that many
+    # turns; otherwise the full history is passed (0 = no window).
+    history_window_messages: int | None = Field(default=None, ge=0)
+    history_max_tokens: int | None = Field(default=None, ge=1)
+    history_chars_per_token: float = Field(default=4.0, gt=0)
+
 
 class AuthSettings(BaseSettings):
     """Authentication and authorization configuration settings.
@@ -512,11 +537,14 @@ class AuthSettings(BaseSettings):
     require_permissions: bool = False
     permissions: dict[str, list[str]] = {
         "message/send": ["agent:write"],
+        "message/stream": ["agent:write"],
         "tasks/get": ["agent:read"],
+        "tasks/getMany": ["agent:read"],
         "tasks/cancel": ["agent:write"],
         "tasks/list": ["agent:read"],
         "contexts/list": ["agent:read"],
         "tasks/feedback": ["agent:write"],
+        "tasks/resubscribe": ["agent:read"],
     }
 
 
@@ -649,9 +677,76 @@ class StorageSettings(BaseSettings):
     postgres_max_retries: int = 3
     postgres_retry_delay: float = 1.0
 
+    # Group commit of task updates (0 = every update_task commits on its own)
+    postgres_write_batch_ms: float = Field(
+        default=0,
+        ge=0,
+        description="Collect task updates for this many ms into one transaction.",
+    )
+    postgres_write_batch_max: int = Field(
+        default=100,
+        ge=1,
+        description="Flush the update batch early once it holds this many updates.",
+    )
+
+    # Range partitioning of the tasks table by created_at (see
+    # bindu/server/storage/partitioning.py)
+    postgres_partition_tasks: bool = False
+    postgres_partition_interval: Literal["day", "week", "month"] = "month"
+    postgres_partition_premake: int = Field(
+        default=3,
+        ge=1,
+        description="Partitions created ahead of the current period.",
+    )
+    postgres_task_retention_days: int | None = Field(
+        default=None,
+        ge=1,
+        description="Detach task partitions older than this (unset = keep all).",
+    )
+    postgres_archive_schema: str | None = Field(
+        default=None,
+        description="Move detached partitions to this schema instead of dropping them.",
+    )
+    postgres_archive_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Child rows of a detached partition deleted per transaction.",
+    )
+    postgres_partition_maintenance_interval: int = Field(
+        default=3600,
+        ge=60,
+        description="Seconds between partition creation/retention runs.",
+    )
+
     # Migration settings
     run_migrations_on_startup: bool = False  # Safer default for production
 
+    # In-memory retention (backend="memory"); unset = keep everything
+    memory_max_tasks: int | None = Field(
+        default=None,
+        ge=1,
+        description="Evict least recently used idle contexts beyond this many tasks.",
+    )
+    memory_max_contexts: int | None = Field(
+        default=None,
+        ge=1,
+        description="Evict least recently used idle contexts beyond this many contexts.",
+    )
+    memory_terminal_task_ttl: int | None = Field(
+        default=None,
+        ge=1,
+        description="Seconds completed/failed/canceled/rejected tasks are kept.",
+    )
+    memory_spill_path: str | None = Field(
+        default=None,
+        description="SQLite file evicted tasks are written to, so they stay readable.",
+    )
+    memory_spill_max_tasks: int = Field(
+        default=100000,
+        ge=1,
+        description="Maximum tasks kept in the spill file (oldest evictions dropped).",
+    )
+
 
 class SchedulerSettings(BaseSettings):
     """Scheduler backend configuration settings.
@@ -659,6 +754,7 @@ class SchedulerSettings(BaseSettings):
     Supports multiple scheduler backends:
     - memory: In-memory scheduler (default, single-process)
     - redis: Redis scheduler (distributed, multi-process)
+    - redis-streams: Redis Streams scheduler (distributed, at-least-once delivery)
 
     Redis settings must be provided via environment variables or config.
     """
@@ -669,7 +765,7 @@ class SchedulerSettings(BaseSettings):
     )
 
     # Scheduler backend selection
-    backend: Literal["memory", "redis"] = Field(
+    backend: Literal["memory", "redis", "redis-streams"] = Field(
         default="memory",
         validation_alias=AliasChoices("backend", "SCHEDULER_TYPE"),
     )
@@ -692,6 +788,99 @@ class SchedulerSettings(BaseSettings):
         description="Timeout in seconds for Redis blpop operations. Higher values reduce API calls but increase task start latency.",
     )
 
+    wire_format: Literal["json", "msgpack"] = Field(
+        default="json",
+        description="Scheduler payload encoding. msgpack is a compact binary format (requires msgpack).",
+    )
+
+    # Redis Streams Configuration (backend="redis-streams")
+    consumer_group: str = "bindu:workers"  # Consumer group shared by all workers
+    read_count: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum stream entries fetched per XREADGROUP/XAUTOCLAIM round trip.",
+    )
+    claim_min_idle_ms: int = Field(
+        default=60000,
+        ge=1000,
+        description="Pending entries idle longer than this are reclaimed from stalled consumers.",
+    )
+    stream_maxlen: int | None = Field(
+        default=None,
+        description="Approximate cap on stream length (XADD MAXLEN ~). Handled entries are deleted anyway; a cap drops undelivered ones. None = unbounded.",
+    )
+
+    # Bounded queue / load shedding (memory backend)
+    max_queue_size: int | None = Field(
+        default=1000,
+        ge=1,
+        description="Maximum buffered tasks in the memory scheduler. message/send is rejected with 503 when full. None = hand tasks directly to the worker (enqueue blocks).",
+    )
+    queue_full_retry_after: int = Field(
+        default=1,
+        ge=1,
+        description="Retry-After (seconds) sent when a task is rejected because the queue is full.",
+    )
+
+    # Priority / fair-share queuing (memory and redis backends)
+    queue_policy: Literal["fifo", "fair"] = Field(
+        default="fifo",
+        description="fifo: strict arrival order. fair: weighted priorities and round-robin across fairness keys.",
+    )
+    fairness_key: Literal["context_id", "client_did", "subject"] = Field(
+        default="context_id",
+        description="What tasks are fair-queued by: context, authenticated client DID or OAuth subject.",
+    )
+    priority_weights: dict[str, int] = Field(
+        default_factory=lambda: {"high": 8, "normal": 4, "low": 1},
+        description="Relative dequeue share per priority level (fair policy).",
+    )
+    max_in_flight_per_key: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum concurrently running tasks per fairness key (fair policy). None = unlimited.",
+    )
+    in_flight_lease_seconds: int = Field(
+        default=3600,
+        ge=1,
+        description="Redis: unacknowledged tasks stop counting against a key's cap after this long.",
+    )
+
+    # Replayable task events (message/stream ids, tasks/resubscribe)
+    event_log: Literal["auto", "memory", "redis", "postgres", "none"] = Field(
+        default="auto",
+        description="Where task stream events are logged for replay. auto: redis with a Redis scheduler, memory otherwise. none: no replay.",
+    )
+    event_log_ttl_seconds: int = Field(
+        default=3600,
+        ge=1,
+        description="Seconds a task's event log is kept after its last event (memory and redis logs).",
+    )
+    event_log_max_events: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum logged events per task; the oldest are dropped first.",
+    )
+
+
+class WorkerSettings(BaseSettings):
+    """Worker execution configuration settings.
+
+    Controls how many task operations a single worker executes at once.
+    Agent calls are I/O-bound, so running several in parallel lets one
+    process serve many requests instead of being capped at 1/latency.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_prefix="WORKER__",
+        extra="allow",
+    )
+
+    # Maximum in-flight task operations per worker (1 = strictly serial).
+    # Once the limit is reached the worker stops pulling from the scheduler.
+    max_concurrency: int = Field(default=1, ge=1)
+
 
 class RetrySettings(BaseSettings):
     """Retry mechanism configuration settings using Tenacity.
@@ -946,6 +1135,7 @@ class Settings(BaseSettings):
     oauth: OAuthSettings = OAuthSettings()
     storage: StorageSettings = StorageSettings()
     scheduler: SchedulerSettings = SchedulerSettings()
+    worker: WorkerSettings = WorkerSettings()
     retry: RetrySettings = RetrySettings()
     negotiation: NegotiationSettings = NegotiationSettings()
     sentry: SentrySettings = SentrySettings()
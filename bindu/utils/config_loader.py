@@ -74,7 +74,7 @@ def create_scheduler_config_from_env(user_config: Dict[str, Any]):
     if "scheduler" in user_config:
         scheduler_dict = user_config["scheduler"]
         scheduler_type = scheduler_dict.get("type")
-        if scheduler_type not in ("redis", "memory"):
+        if scheduler_type not in ("redis", "redis-streams", "memory"):
             logger.warning(f"Invalid scheduler type: {scheduler_type}, using memory")
             scheduler_type = "memory"
         return SchedulerConfig(
@@ -87,7 +87,7 @@ def create_scheduler_config_from_env(user_config: Dict[str, Any]):
     if not scheduler_type:
         return None
 
-    if scheduler_type not in ("redis", "memory"):
+    if scheduler_type not in ("redis", "redis-streams", "memory"):
         logger.warning(f"Invalid scheduler type: {scheduler_type}, using memory")
         scheduler_type = "memory"
 
@@ -95,13 +95,14 @@ def create_scheduler_config_from_env(user_config: Dict[str, Any]):
 
     # Get Redis URL from environment
     redis_url = None
-    if scheduler_type == "redis":
+    if scheduler_type in ("redis", "redis-streams"):
         redis_url = os.getenv("REDIS_URL")
         if redis_url:
             logger.debug("Loaded REDIS_URL from environment")
 
     return SchedulerConfig(
-        type=cast(Literal["redis", "memory"], scheduler_type), redis_url=redis_url
+        type=cast(Literal["redis", "redis-streams", "memory"], scheduler_type),
+        redis_url=redis_url,
     )
 
 
@@ -252,11 +253,11 @@ def load_config_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
         scheduler_type = os.getenv("SCHEDULER_TYPE", "memory")
         if scheduler_type:
             enriched_config["scheduler"] = {"type": scheduler_type}
-            if scheduler_type == "redis":
+            if scheduler_type in ("redis", "redis-streams"):
                 redis_url = os.getenv("REDIS_URL")
                 if not redis_url:
                     raise ValueError(
-                        "REDIS_URL environment variable is required when SCHEDULER_TYPE=redis"
+                        f"REDIS_URL environment variable is required when SCHEDULER_TYPE={scheduler_type}"
                     )
                 enriched_config["scheduler"]["redis_url"] = redis_url
                 logger.debug("Loaded REDIS_URL from environment")
@@ -220,7 +220,11 @@ async def get_tables_in_schema(
 
 
 async def initialize_did_schema(
-    engine: AsyncEngine, schema_name: str, create_tables: bool = True
+    engine: AsyncEngine,
+    schema_name: str,
+    create_tables: bool = True,
+    partition_interval: str | None = None,
+    partition_premake: int = 3,
 ) -> str:
     """Initialize a complete schema for a DID with all necessary tables.
 
@@ -230,6 +234,9 @@ async def initialize_did_schema(
         engine: SQLAlchemy async engine
         schema_name: Sanitized schema name (use sanitize_did_for_schema() to generate)
         create_tables: If True, create all tables in the schema
+        partition_interval: If set ("day", "week" or "month"), range-partition
+            the schema's tasks table by created_at
+        partition_premake: Partitions to create ahead of the current period
 
     Returns:
         The schema name that was created/initialized
@@ -258,6 +265,11 @@ async def initialize_did_schema(
 
             await conn.run_sync(create_tables_sync)
 
+            if partition_interval:
+                from bindu.server.storage.partitioning import partition_tasks_table
+
+                await partition_tasks_table(conn, partition_interval, partition_premake)
+
         if created:
             logger.info(f"Initialized schema '{schema_name}' with all tables")
         else:
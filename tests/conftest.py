@@ -39,7 +39,7 @@ class _SpanCtx:
 
 
 class _Tracer:
-    def start_as_current_span(self, name: str):  # noqa: ARG002
+    def start_as_current_span(self, name: str, **kwargs):  # noqa: ARG002
         return _SpanCtx()
 
     def start_span(self, name: str):  # noqa: ARG002
@@ -56,12 +56,38 @@ class _Status:
         pass
 
 
+class _TraceFlags(int):
+    pass
+
+
+class _SpanContext:
+    def __init__(self, trace_id, span_id, is_remote, trace_flags=0):  # noqa: D401
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.is_remote = is_remote
+        self.trace_flags = trace_flags
+
+
+class _NonRecordingSpan(_Span):
+    def __init__(self, context):  # noqa: D401
+        self._context = context
+
+    def is_recording(self):
+        return False
+
+    def get_span_context(self):
+        return self._context
+
+
 ot_trace.get_current_span = get_current_span  # type: ignore[attr-defined]
 ot_trace.get_tracer = lambda name: _Tracer()  # type: ignore[attr-defined]
 ot_trace.Status = _Status  # type: ignore[attr-defined]
 ot_trace.StatusCode = _StatusCode  # type: ignore[attr-defined]
 ot_trace.Span = _Span  # type: ignore[attr-defined]
 ot_trace.use_span = lambda span: _SpanCtx()  # type: ignore[attr-defined]
+ot_trace.SpanContext = _SpanContext  # type: ignore[attr-defined]
+ot_trace.NonRecordingSpan = _NonRecordingSpan  # type: ignore[attr-defined]
+ot_trace.TraceFlags = _TraceFlags  # type: ignore[attr-defined]
 
 # Build minimal opentelemetry root and metrics stub
 op_root = ModuleType("opentelemetry")
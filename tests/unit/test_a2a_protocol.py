@@ -0,0 +1,170 @@
+"""Unit tests for JSON-RPC batches on the A2A endpoint."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import cast
+from uuid import uuid4
+
+import pytest
+
+from bindu.server.applications import BinduApplication
+from bindu.server.endpoints.a2a_protocol import agent_run_endpoint
+from bindu.settings import app_settings
+
+
+def _make_request(body) -> object:
+    """Create a minimal request whose body is the JSON encoding of ``body``."""
+
+    async def body_method():
+        return json.dumps(body).encode()
+
+    return SimpleNamespace(
+        headers={},
+        client=SimpleNamespace(host="127.0.0.1"),
+        state=SimpleNamespace(),
+        body=body_method,
+    )
+
+
+def _call(method: str, request_id: str | None = None, task_id=None) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id or str(uuid4()),
+        "method": method,
+        "params": {"taskId": str(task_id or uuid4())},
+    }
+
+
+class _TaskManager:
+    """Answers tasks/get with the requested id; the first call waits for the last."""
+
+    def __init__(self, calls: int):
+        self.calls = calls
+        self.started = 0
+        self.all_started = asyncio.Event()
+
+    async def get_task(self, request):
+        self.started += 1
+        if self.started == self.calls:
+            self.all_started.set()
+        await asyncio.wait_for(self.all_started.wait(), timeout=1)
+        return {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "error": {"code": -32001, "message": str(request["params"]["task_id"])},
+        }
+
+
+async def _post(task_manager, body):
+    app = SimpleNamespace(task_manager=task_manager)
+    response = await agent_run_endpoint(
+        cast(BinduApplication, app),
+        _make_request(body),  # type: ignore[arg-type]
+    )
+    return response, json.loads(response.body)
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_calls_concurrently_in_order():
+    """Test that batched calls run concurrently and are answered in order."""
+    request_ids = [str(uuid4()) for _ in range(3)]
+    task_ids = [uuid4() for _ in range(3)]
+    task_manager = _TaskManager(calls=3)
+
+    response, body = await _post(
+        task_manager,
+        [_call("tasks/get", r, t) for r, t in zip(request_ids, task_ids)],
+    )
+
+    assert response.status_code == 200
+    assert [entry["id"] for entry in body] == request_ids
+    assert [entry["error"]["message"] for entry in body] == [
+        str(task_id) for task_id in task_ids
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_errors_per_call():
+    """Test that invalid, streaming and unhandled calls fail without the others."""
+    task_manager = _TaskManager(calls=1)
+    calls = [
+        {"id": "bad", "method": "nope"},
+        _call("tasks/resubscribe"),
+        _call("tasks/pushNotification/get"),
+        _call("tasks/get"),
+    ]
+
+    _, body = await _post(task_manager, calls)
+
+    assert [entry["id"] for entry in body] == [call["id"] for call in calls]
+    assert [entry["error"]["code"] for entry in body] == [
+        -32600,
+        -32600,
+        -32601,
+        -32001,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_size_is_limited(monkeypatch):
+    """Test that empty and oversized batches are rejected as a whole."""
+    monkeypatch.setattr(app_settings.agent, "max_batch_size", 2)
+    task_manager = _TaskManager(calls=3)
+
+    response, body = await _post(task_manager, [_call("tasks/get") for _ in range(3)])
+    assert response.status_code == 400
+    assert body["error"]["code"] == -32600
+    assert task_manager.started == 0
+
+    response, body = await _post(task_manager, [])
+    assert response.status_code == 400
+    assert body["error"]["code"] == -32600
+
+
+@pytest.mark.asyncio
+async def test_batch_omits_notifications():
+    """Test that calls without an id run but are left out of the response."""
+    task_manager = _TaskManager(calls=2)
+    notification = _call("tasks/get")
+    del notification["id"]
+    invalid = {"jsonrpc": "2.0", "method": 1}
+    call = _call("tasks/get")
+
+    _, body = await _post(task_manager, [notification, invalid, call])
+
+    assert task_manager.started == 2
+    assert [entry["id"] for entry in body] == [None, call["id"]]
+    assert [entry["error"]["code"] for entry in body] == [-32600, -32001]
+
+    response = await agent_run_endpoint(
+        cast(BinduApplication, SimpleNamespace(task_manager=_TaskManager(calls=1))),
+        _make_request([notification]),  # type: ignore[arg-type]
+    )
+    assert response.status_code == 204
+    assert response.body == b""
+
+
+@pytest.mark.asyncio
+async def test_batch_sets_retry_after_when_queue_full():
+    """Test that a call refused by a full queue adds Retry-After to the batch."""
+    from bindu.server.endpoints.a2a_protocol import QUEUE_FULL_CODE
+
+    class _FullTaskManager:
+        async def get_task(self, request):
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": QUEUE_FULL_CODE, "message": "Queue is full"},
+            }
+
+    response, body = await _post(_FullTaskManager(), [_call("tasks/get")])
+
+    assert response.status_code == 200
+    assert body[0]["error"]["code"] == QUEUE_FULL_CODE
+    assert response.headers["Retry-After"] == str(
+        app_settings.scheduler.queue_full_retry_after
+    )
+
+    response, _ = await _post(_TaskManager(calls=1), [_call("tasks/get")])
+    assert "Retry-After" not in response.headers
@@ -220,10 +220,15 @@ class TestBinduApplicationLifespan:
 
                     # Test the lifespan function directly
                     lifespan_func = app._create_default_lifespan(mock_manifest)
-                    async with lifespan_func(app):
-                        assert app._storage is not None
-                        assert app._scheduler is not None
-
+                    with patch(
+                        "bindu.penguin.execution.shutdown_process_pool"
+                    ) as mock_shutdown_pool:
+                        async with lifespan_func(app):
+                            assert app._storage is not None
+                            assert app._scheduler is not None
+                            mock_shutdown_pool.assert_not_called()
+
+                    mock_shutdown_pool.assert_called_once_with()
                     mock_create_storage.assert_called_once()
                     mock_close.assert_called_once_with(mock_storage)
 
@@ -0,0 +1,228 @@
+"""Unit tests for the task event bus and streaming through workers."""
+
+import json
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import anyio
+import pytest
+
+from bindu.common.models import AgentManifest
+from bindu.server.events import (
+    InMemoryEventBus,
+    RedisEventBus,
+    create_event_bus,
+    status_update_event,
+)
+from bindu.server.handlers.message_handlers import MessageHandlers
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.scheduler.redis_scheduler import RedisScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.workers.manifest_worker import ManifestWorker
+from tests.utils import ChunkingManifest, create_test_message
+
+
+def _stream_request(message):
+    return {
+        "jsonrpc": "2.0",
+        "id": uuid4(),
+        "method": "message/stream",
+        "params": {
+            "message": message,
+            "configuration": {"accepted_output_modes": ["text/plain"]},
+        },
+    }
+
+
+class TestInMemoryEventBus:
+    """Test in-process publish/subscribe."""
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_task_subscribers_only(self):
+        """Test that events are delivered per task."""
+        task_id, other_id = uuid4(), uuid4()
+        async with InMemoryEventBus() as bus:
+            async with bus.subscribe(task_id) as events:
+                await bus.publish(other_id, {"kind": "ignored"})
+                await bus.publish(task_id, {"kind": "status-update"})
+                with anyio.fail_after(1):
+                    received = await anext(aiter(events))
+
+            assert received == {"kind": "status-update"}
+            assert not bus._subscribers
+            # Nobody listening: dropped silently
+            await bus.publish(task_id, {"kind": "status-update"})
+
+    def test_interrupted_states_end_the_stream(self):
+        """Test that input-required is final for streaming purposes."""
+        task_id, context_id = uuid4(), uuid4()
+
+        assert status_update_event(task_id, context_id, "input-required", False)[
+            "final"
+        ]
+        assert not status_update_event(task_id, context_id, "working", False)["final"]
+
+
+class TestRedisEventBus:
+    """Test the Redis pub/sub event bus with a mocked client."""
+
+    def _bus(self) -> tuple[RedisEventBus, MagicMock]:
+        bus = RedisEventBus(redis_url="redis://localhost:6379/0", subscribe_timeout=1)
+        bus._redis_client = MagicMock()
+        bus._redis_client.publish = AsyncMock()
+        pubsub = MagicMock()
+        pubsub.unsubscribe = AsyncMock()
+        bus._pubsub = pubsub
+        return bus, pubsub
+
+    @pytest.mark.asyncio
+    async def test_publish_serializes_to_task_channel(self):
+        """Test that events are published as JSON on the per-task channel."""
+        bus, _ = self._bus()
+        task_id = uuid4()
+
+        await bus.publish(task_id, {"kind": "status-update", "task_id": task_id})
+
+        channel, payload = bus._redis_client.publish.await_args.args
+        assert channel == f"bindu:tasks:events:{task_id}"
+        assert json.loads(payload) == {"kind": "status-update", "task_id": str(task_id)}
+
+    @pytest.mark.asyncio
+    async def test_subscribe_waits_for_confirmation_and_dispatches(self):
+        """Test the shared-connection subscription lifecycle."""
+        bus, pubsub = self._bus()
+        task_id = uuid4()
+        channel = f"bindu:tasks:events:{task_id}"
+
+        async def confirm(name):
+            bus._dispatch({"type": "subscribe", "channel": name, "data": 1})
+
+        pubsub.subscribe = AsyncMock(side_effect=confirm)
+
+        async with bus.subscribe(task_id) as events:
+            pubsub.subscribe.assert_awaited_once_with(channel)
+            bus._dispatch({"type": "message", "channel": channel, "data": "{bad"})
+            bus._dispatch(
+                {"type": "message", "channel": channel, "data": '{"final": true}'}
+            )
+            with anyio.fail_after(1):
+                received = await anext(aiter(events))
+
+        assert received == {"final": True}
+        pubsub.unsubscribe.assert_awaited_once_with(channel)
+        assert not bus._subscribers
+
+    def test_factory_follows_scheduler_transport(self):
+        """Test that the bus matches the scheduler backend."""
+        redis_scheduler = RedisScheduler(
+            redis_url="redis://localhost:6379/0", queue_name="agent:q"
+        )
+
+        bus = create_event_bus(redis_scheduler)
+
+        assert isinstance(bus, RedisEventBus)
+        assert bus.channel_prefix == "agent:q:events"
+        assert isinstance(create_event_bus(InMemoryScheduler()), InMemoryEventBus)
+
+
+class TestStreamingThroughWorker:
+    """Test message/stream executed by a worker via the scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_stream_relays_worker_events(self, storage: InMemoryStorage):
+        """Test that chunks and status updates reach the SSE response."""
+        async with InMemoryScheduler() as scheduler, InMemoryEventBus() as bus:
+            worker = ManifestWorker(
+                scheduler=scheduler,
+                storage=storage,
+                manifest=cast(AgentManifest, ChunkingManifest()),
+                event_bus=bus,
+            )
+            handlers = MessageHandlers(
+                scheduler=scheduler,
+                storage=storage,
+                event_bus=bus,
+                context_id_parser=lambda c: c,
+            )
+
+            async with worker.run():
+                response = await handlers.stream_message(
+                    _stream_request(create_test_message(text="Hi"))
+                )
+                with anyio.fail_after(2):
+                    frames = [frame async for frame in response.body_iterator]
+
+        events = [json.loads(frame.removeprefix("data: ")) for frame in frames]
+        states = [e["status"]["state"] for e in events if e["kind"] == "status-update"]
+        chunks = [
+            e for e in events if e["kind"] == "artifact-update" and not e["last_chunk"]
+        ]
+
+        assert states == ["submitted", "working", "completed"]
+        assert events[-1]["final"] is True
+        assert [c["artifact"]["parts"][0]["text"] for c in chunks] == ["Hel", "lo", "!"]
+        assert [c["append"] for c in chunks] == [False, True, True]
+        assert len({c["artifact"]["artifact_id"] for c in chunks}) == 1
+
+        task = await storage.load_task(UUID(events[0]["task_id"]))
+        assert task["status"]["state"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_when_task_fails_outside_agent(
+        self, storage: InMemoryStorage
+    ):
+        """Test that a failure before the agent runs still ends the stream."""
+        async with InMemoryScheduler() as scheduler, InMemoryEventBus() as bus:
+            worker = ManifestWorker(
+                scheduler=scheduler,
+                storage=storage,
+                manifest=cast(AgentManifest, ChunkingManifest()),
+                event_bus=bus,
+            )
+            worker._build_complete_message_history = AsyncMock(  # type: ignore[method-assign]
+                side_effect=RuntimeError("history unavailable")
+            )
+            handlers = MessageHandlers(
+                scheduler=scheduler,
+                storage=storage,
+                event_bus=bus,
+                context_id_parser=lambda c: c,
+            )
+
+            async with worker.run():
+                response = await handlers.stream_message(
+                    _stream_request(create_test_message(text="Hi"))
+                )
+                with anyio.fail_after(2):
+                    frames = [frame async for frame in response.body_iterator]
+
+        events = [json.loads(frame.removeprefix("data: ")) for frame in frames]
+        assert [e["status"]["state"] for e in events] == [
+            "submitted",
+            "working",
+            "failed",
+        ]
+        assert events[-1]["final"] is True
+
+    @pytest.mark.asyncio
+    async def test_stream_rejected_when_queue_full(self, storage: InMemoryStorage):
+        """Test that a full queue is reported instead of opening a stream."""
+        async with (
+            InMemoryScheduler(max_queue_size=1) as scheduler,
+            InMemoryEventBus() as bus,
+        ):
+            handlers = MessageHandlers(
+                scheduler=scheduler,
+                storage=storage,
+                event_bus=bus,
+                context_id_parser=lambda c: c,
+            )
+            await handlers.send_message(_stream_request(create_test_message()))
+
+            response = await handlers.stream_message(
+                _stream_request(create_test_message())
+            )
+
+            assert response["error"]["code"] == -32040
+            assert not bus._subscribers
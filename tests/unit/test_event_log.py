@@ -0,0 +1,290 @@
+"""Unit tests for the task event log and tasks/resubscribe."""
+
+import json
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import anyio
+import pytest
+
+from bindu.common.models import AgentManifest
+from bindu.server.events import (
+    InMemoryEventBus,
+    InMemoryEventLog,
+    PostgresEventLog,
+    RedisEventLog,
+    create_event_bus,
+    status_update_event,
+)
+from bindu.server.handlers.message_handlers import MessageHandlers
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.workers.manifest_worker import ManifestWorker
+from bindu.settings import app_settings
+from tests.utils import ChunkingManifest, create_test_message
+
+
+def _parse_frames(frames: list[str]) -> list[tuple[int | None, dict]]:
+    parsed = []
+    for frame in frames:
+        fields = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+        seq = int(fields["id"]) if "id" in fields else None
+        parsed.append((seq, json.loads(fields["data"])))
+    return parsed
+
+
+def _resubscribe_request(task_id, last_event_id=None):
+    params = {"task_id": task_id}
+    if last_event_id is not None:
+        params["last_event_id"] = last_event_id
+    return {
+        "jsonrpc": "2.0",
+        "id": uuid4(),
+        "method": "tasks/resubscribe",
+        "params": params,
+    }
+
+
+def _handlers(storage, bus, scheduler=None) -> MessageHandlers:
+    return MessageHandlers(
+        scheduler=scheduler or MagicMock(),
+        storage=storage,
+        event_bus=bus,
+        context_id_parser=lambda c: c,
+    )
+
+
+class TestInMemoryEventLog:
+    """Test the in-process event log."""
+
+    @pytest.mark.asyncio
+    async def test_sequence_numbers_and_read_after(self):
+        """Test that events are numbered per task and read after an id."""
+        log = InMemoryEventLog()
+        task_id, other_id = uuid4(), uuid4()
+
+        assert await log.append(task_id, {"n": 1}) == 1
+        assert await log.append(other_id, {"n": 1}) == 1
+        assert await log.append(task_id, {"n": 2}) == 2
+
+        assert await log.read(task_id, after=1) == [{"n": 2, "seq": 2}]
+        assert await log.read(uuid4()) == []
+
+    @pytest.mark.asyncio
+    async def test_max_events_and_ttl(self):
+        """Test that old events are capped and idle logs expire."""
+        log = InMemoryEventLog(max_events=2)
+        task_id = uuid4()
+        for n in range(3):
+            await log.append(task_id, {"n": n})
+
+        assert [e["seq"] for e in await log.read(task_id)] == [2, 3]
+
+        log.ttl_seconds = 0
+        await log.append(uuid4(), {"n": 0})
+
+        assert await log.read(task_id) == []
+
+
+class TestEventBusWithLog:
+    """Test that published events are logged and numbered."""
+
+    @pytest.mark.asyncio
+    async def test_publish_assigns_seq(self):
+        """Test that live subscribers and replay see the same sequence ids."""
+        task_id = uuid4()
+        async with InMemoryEventBus(event_log=InMemoryEventLog()) as bus:
+            async with bus.subscribe(task_id) as events:
+                await bus.publish(task_id, {"kind": "status-update"})
+                with anyio.fail_after(1):
+                    live = await anext(aiter(events))
+
+            assert live == {"kind": "status-update", "seq": 1}
+            assert await bus.replay(task_id) == [live]
+
+    @pytest.mark.asyncio
+    async def test_replay_without_log(self):
+        """Test that a bus without log has nothing to replay."""
+        async with InMemoryEventBus() as bus:
+            await bus.publish(uuid4(), {"kind": "status-update"})
+
+            assert await bus.replay(uuid4()) == []
+
+
+class TestResubscribe:
+    """Test tasks/resubscribe replay and live tail."""
+
+    @pytest.mark.asyncio
+    async def test_replays_completed_stream_after_last_event_id(
+        self, storage: InMemoryStorage
+    ):
+        """Test that a reconnect receives exactly the missed events."""
+        async with (
+            InMemoryScheduler() as scheduler,
+            InMemoryEventBus(event_log=InMemoryEventLog()) as bus,
+        ):
+            worker = ManifestWorker(
+                scheduler=scheduler,
+                storage=storage,
+                manifest=cast(AgentManifest, ChunkingManifest()),
+                event_bus=bus,
+            )
+            handlers = _handlers(storage, bus, scheduler)
+            async with worker.run():
+                response = await handlers.stream_message(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": uuid4(),
+                        "method": "message/stream",
+                        "params": {"message": create_test_message(text="Hi")},
+                    }
+                )
+                with anyio.fail_after(2):
+                    streamed = _parse_frames(
+                        [frame async for frame in response.body_iterator]
+                    )
+
+            task_id = UUID(streamed[0][1]["task_id"])
+            response = await handlers.resubscribe_task(
+                _resubscribe_request(task_id, last_event_id=2)
+            )
+            with anyio.fail_after(1):
+                replayed = _parse_frames(
+                    [frame async for frame in response.body_iterator]
+                )
+
+        assert [seq for seq, _ in streamed] == list(range(1, len(streamed) + 1))
+        assert replayed == streamed[2:]
+        assert replayed[-1][1]["final"] is True
+
+    @pytest.mark.asyncio
+    async def test_replays_then_tails_live_events(self, storage: InMemoryStorage):
+        """Test that live events follow the replayed ones until final."""
+        async with InMemoryEventBus(event_log=InMemoryEventLog()) as bus:
+            task = await storage.submit_task(uuid4(), create_test_message())
+            await storage.update_task(task["id"], state="working")
+            for state in ("submitted", "working"):
+                await bus.publish(
+                    task["id"],
+                    status_update_event(task["id"], task["context_id"], state, False),
+                )
+
+            response = await _handlers(storage, bus).resubscribe_task(
+                _resubscribe_request(task["id"], last_event_id=1)
+            )
+            frames = []
+
+            async def collect() -> None:
+                async for frame in response.body_iterator:
+                    frames.append(frame)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(collect)
+                await anyio.sleep(0.05)
+                await bus.publish(
+                    task["id"],
+                    status_update_event(
+                        task["id"], task["context_id"], "completed", True
+                    ),
+                )
+
+            assert not bus._subscribers
+
+        events = _parse_frames(frames)
+        assert [(seq, e["status"]["state"]) for seq, e in events] == [
+            (2, "working"),
+            (3, "completed"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_ended_task_without_log_gets_final_status(
+        self, storage: InMemoryStorage
+    ):
+        """Test that an ended task answers with its final status."""
+        async with InMemoryEventBus() as bus:
+            task = await storage.submit_task(uuid4(), create_test_message())
+            await storage.update_task(task["id"], state="input-required")
+
+            response = await _handlers(storage, bus).resubscribe_task(
+                _resubscribe_request(task["id"])
+            )
+            frames = [frame async for frame in response.body_iterator]
+
+        [(seq, event)] = _parse_frames(frames)
+        assert seq is None
+        assert event["status"]["state"] == "input-required"
+        assert event["final"] is True
+
+    @pytest.mark.asyncio
+    async def test_unknown_task(self, storage: InMemoryStorage):
+        """Test that resubscribing to an unknown task is an error."""
+        async with InMemoryEventBus() as bus:
+            response = await _handlers(storage, bus).resubscribe_task(
+                _resubscribe_request(uuid4())
+            )
+
+            assert response["error"]["code"] == -32001
+            assert not bus._subscribers
+
+
+class TestPersistentEventLogs:
+    """Test the Redis and Postgres event logs with mocked backends."""
+
+    @pytest.mark.asyncio
+    async def test_redis_log_appends_atomically(self):
+        """Test that appends go through the script and reads filter by seq."""
+        log = RedisEventLog(
+            redis_url="redis://localhost:6379/0",
+            key_prefix="agent:q:log",
+            ttl_seconds=60,
+            max_events=5,
+        )
+        log._append = AsyncMock(return_value=4)
+        log._redis_client = MagicMock()
+        log._redis_client.lrange = AsyncMock(
+            return_value=['{"seq":3,"n":3}', '{"seq":4,"n":4}']
+        )
+        task_id = uuid4()
+
+        assert await log.append(task_id, {"n": 4}) == 4
+        assert await log.read(task_id, after=3) == [{"seq": 4, "n": 4}]
+
+        kwargs = log._append.await_args.kwargs
+        key = f"agent:q:log:{task_id}"
+        assert kwargs["keys"] == [f"{key}:seq", key]
+        assert kwargs["args"] == ['{"n": 4}', 5, 60]
+
+    @pytest.mark.asyncio
+    async def test_postgres_log_delegates_to_storage(self):
+        """Test that the Postgres log uses the storage's task_events table."""
+        storage = MagicMock()
+        storage.append_task_event = AsyncMock(side_effect=[7, RuntimeError("down")])
+        storage.load_task_events = AsyncMock(return_value=[{"seq": 7}])
+        log = PostgresEventLog(storage, max_events=100)
+        task_id = uuid4()
+
+        assert await log.append(task_id, {"n": 1}) == 7
+        assert await log.append(task_id, {"n": 2}) is None
+        assert await log.read(task_id, after=6) == [{"seq": 7}]
+        storage.append_task_event.assert_any_await(task_id, {"n": 1}, max_events=100)
+
+
+class TestEventLogFactory:
+    """Test event log selection through the event bus factory."""
+
+    def test_memory_log_by_default(self):
+        """Test that the memory bus logs in memory unless disabled."""
+        bus = create_event_bus(InMemoryScheduler())
+
+        assert isinstance(bus.event_log, InMemoryEventLog)
+
+    def test_disabled_and_invalid_logs(self, monkeypatch):
+        """Test that logging can be disabled and mismatches are rejected."""
+        monkeypatch.setattr(app_settings.scheduler, "event_log", "none")
+        assert create_event_bus(InMemoryScheduler()).event_log is None
+
+        for kind in ("redis", "postgres"):
+            monkeypatch.setattr(app_settings.scheduler, "event_log", kind)
+            with pytest.raises(ValueError):
+                create_event_bus(InMemoryScheduler(), InMemoryStorage())
@@ -0,0 +1,149 @@
+"""Unit tests for off-loop execution of synchronous agent handlers."""
+
+import inspect
+import threading
+import time
+from typing import cast
+from uuid import uuid4
+
+import anyio
+import pytest
+
+from bindu.extensions.did import DIDAgentExtension
+from bindu.penguin.execution import (
+    iterate_sync_generator,
+    run_sync,
+    shutdown_process_pool,
+)
+from bindu.penguin.manifest import create_manifest
+from bindu.server.workers.helpers import ResultProcessor
+from tests.mocks import MockDIDExtension
+
+
+def _count_to(n: int):
+    """Module-level generator so it can be pickled into a process pool."""
+    yield from range(n)
+
+
+def _make_manifest(handler, strategy):
+    return create_manifest(
+        agent_function=handler,
+        id=uuid4(),
+        did_extension=cast(DIDAgentExtension, MockDIDExtension()),
+        name="test-agent",
+        description="Test agent",
+        skills=None,
+        capabilities=None,
+        agent_trust=None,
+        version="1.0.0",
+        url="http://localhost:3773",
+        execution_strategy=strategy,
+    )
+
+
+class TestRunSync:
+    """Test run_sync strategies."""
+
+    @pytest.mark.asyncio
+    async def test_thread_runs_off_event_loop(self):
+        """Test that the thread strategy does not execute on the loop thread."""
+        loop_thread = threading.get_ident()
+        ident = await run_sync(threading.get_ident, strategy="thread")
+        assert ident != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_inline_runs_on_event_loop(self):
+        """Test that the inline strategy executes on the loop thread."""
+        ident = await run_sync(threading.get_ident, strategy="inline")
+        assert ident == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_thread_does_not_block_loop(self):
+        """Test that other coroutines keep running during a blocking call."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await anyio.sleep(0.01)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(ticker)
+            await run_sync(time.sleep, 0.2, strategy="thread")
+            tg.cancel_scope.cancel()
+
+        assert ticks > 5
+
+    @pytest.mark.asyncio
+    async def test_process_strategy(self):
+        """Test that the process strategy returns the function result."""
+        try:
+            assert await run_sync(pow, 2, 10, strategy="process") == 1024
+        finally:
+            shutdown_process_pool()
+
+
+class TestIterateSyncGenerator:
+    """Test bridging sync generators into async iterators."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ["inline", "thread", "process"])
+    async def test_chunks_in_order(self, strategy):
+        """Test that all chunks are yielded in order for every strategy."""
+        try:
+            chunks = [
+                chunk
+                async for chunk in iterate_sync_generator(
+                    _count_to, 5, strategy=strategy
+                )
+            ]
+        finally:
+            shutdown_process_pool()
+        assert chunks == [0, 1, 2, 3, 4]
+
+
+class TestManifestExecutionStrategy:
+    """Test execution_strategy wiring in create_manifest."""
+
+    @pytest.mark.asyncio
+    async def test_sync_function_offloaded(self):
+        """Test that a sync handler becomes an async generator with one result."""
+
+        def handler(messages):
+            return f"thread={threading.get_ident()}"
+
+        manifest = _make_manifest(handler, "thread")
+        raw = manifest.run([])
+        assert inspect.isasyncgen(raw)
+
+        result = await ResultProcessor.collect_results(raw)
+        assert result != f"thread={threading.get_ident()}"
+
+    @pytest.mark.asyncio
+    async def test_sync_generator_offloaded(self):
+        """Test that a sync generator handler is streamed chunk-by-chunk."""
+
+        def handler(messages):
+            yield "a"
+            yield "b"
+
+        manifest = _make_manifest(handler, "thread")
+        raw = manifest.run([])
+        assert inspect.isasyncgen(raw)
+        assert [chunk async for chunk in raw] == ["a", "b"]
+
+    def test_inline_keeps_sync_behaviour(self):
+        """Test that the default strategy still calls the handler directly."""
+
+        def handler(messages):
+            return "done"
+
+        manifest = _make_manifest(handler, "inline")
+        assert manifest.execution_strategy == "inline"
+        assert manifest.run([]) == "done"
+
+    def test_invalid_strategy_rejected(self):
+        """Test that unknown strategies raise ValueError."""
+        with pytest.raises(ValueError, match="execution_strategy"):
+            _make_manifest(lambda messages: "x", "fiber")
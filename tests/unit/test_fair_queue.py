@@ -0,0 +1,281 @@
+"""Unit tests for priority and fair-share queuing."""
+
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import anyio
+import pytest
+from opentelemetry.trace import get_current_span
+
+from bindu.common.models import SchedulerConfig
+from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+from bindu.server.handlers.message_handlers import MessageHandlers
+from bindu.server.scheduler.factory import create_scheduler
+from bindu.server.scheduler.fair_queue import FairQueue, FairSharePolicy
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.scheduler.redis_scheduler import RedisScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from tests.utils import create_test_message
+
+
+def _run_params(context_id=None, **extra) -> TaskSendParams:
+    return cast(
+        TaskSendParams,
+        {
+            "task_id": uuid4(),
+            "context_id": context_id or uuid4(),
+            "message": create_test_message(),
+            **extra,
+        },
+    )
+
+
+class TestFairQueue:
+    """Test the in-memory fair queue."""
+
+    def test_round_robin_across_keys(self):
+        """Test that a bursting key does not starve a key queued later."""
+        queue: FairQueue[str] = FairQueue()
+        for i in range(3):
+            queue.push(f"a{i}", "a")
+        queue.push("b0", "b")
+
+        popped = [queue.pop()[0] for _ in range(4)]
+
+        assert popped == ["a0", "b0", "a1", "a2"]
+        assert queue.pop() is None
+        assert len(queue) == 0
+
+    def test_weighted_priorities(self):
+        """Test that priorities share dequeues by weight without starvation."""
+        queue: FairQueue[str] = FairQueue(
+            FairSharePolicy(priority_weights={"high": 3, "normal": 1, "low": 1})
+        )
+        for i in range(4):
+            queue.push(f"h{i}", "h", "high")
+            queue.push(f"l{i}", "l", "low")
+
+        popped = [queue.pop()[0] for _ in range(5)]
+
+        assert popped.count("l0") == 1
+        assert [item for item in popped if item.startswith("h")] == [
+            "h0",
+            "h1",
+            "h2",
+            "h3",
+        ]
+
+    def test_unknown_priority_uses_default(self):
+        """Test that an unknown priority is queued as normal."""
+        queue: FairQueue[str] = FairQueue()
+        queue.push("x", "k", "urgent")
+
+        assert queue.pop() == ("x", "k")
+
+    def test_per_key_cap_and_release(self):
+        """Test that a capped key is skipped until a slot is released."""
+        queue: FairQueue[str] = FairQueue(FairSharePolicy(max_in_flight_per_key=1))
+        queue.push("a0", "a")
+        queue.push("a1", "a")
+        queue.push("b0", "b")
+
+        assert queue.pop() == ("a0", "a")
+        assert queue.pop() == ("b0", "b")
+        assert queue.pop() is None
+        assert queue.in_flight("a") == 1
+
+        queue.release("a")
+
+        assert queue.pop() == ("a1", "a")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"priority_weights": {"urgent": 1}},
+            {"priority_weights": {"high": 0}},
+            {"max_in_flight_per_key": 0},
+            {"in_flight_lease_seconds": 0},
+        ],
+    )
+    def test_policy_validation(self, kwargs):
+        """Test that invalid policies are rejected."""
+        with pytest.raises(ValueError):
+            FairSharePolicy(**kwargs)
+
+
+class TestInMemoryFairScheduler:
+    """Test InMemoryScheduler with the fair queue policy."""
+
+    @pytest.mark.asyncio
+    async def test_control_operations_first(self):
+        """Test that cancels are served before queued runs."""
+        async with InMemoryScheduler(fair_share=FairSharePolicy()) as scheduler:
+            run_params = _run_params()
+            await scheduler.run_task(run_params)
+            await scheduler.cancel_task(TaskIdParams(task_id=run_params["task_id"]))
+            assert await scheduler.get_queue_length() == 2
+
+            operations = scheduler.receive_task_operations()
+            first = await anext(operations)
+            second = await anext(operations)
+            await operations.aclose()
+
+        assert first["operation"] == "cancel"
+        assert second["operation"] == "run"
+        assert second["_fair_key"] == str(run_params["context_id"])
+
+    @pytest.mark.asyncio
+    async def test_ack_releases_capped_key(self):
+        """Test that a blocked receiver wakes up once the key is acked."""
+        context_id = uuid4()
+        async with InMemoryScheduler(
+            fair_share=FairSharePolicy(max_in_flight_per_key=1)
+        ) as scheduler:
+            await scheduler.run_task(_run_params(context_id))
+            await scheduler.run_task(_run_params(context_id))
+            operations = scheduler.receive_task_operations()
+            first = await anext(operations)
+            received = []
+
+            async def receive() -> None:
+                received.append(await anext(operations))
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(receive)
+                await anyio.sleep(0.05)
+                assert received == []  # Key is at its cap
+                await scheduler.ack_task_operation(first)
+
+            await operations.aclose()
+
+        assert len(received) == 1
+        assert await scheduler.get_queue_length() == 0
+
+    @pytest.mark.asyncio
+    async def test_explicit_fairness_key(self):
+        """Test that params may override the context-based fairness key."""
+        async with InMemoryScheduler(fair_share=FairSharePolicy()) as scheduler:
+            await scheduler.run_task(_run_params(fairness_key="did:bindu:alice"))
+            operations = scheduler.receive_task_operations()
+            operation = await anext(operations)
+            await operations.aclose()
+
+        assert operation["_fair_key"] == "did:bindu:alice"
+
+
+class TestRedisFairScheduler:
+    """Test RedisScheduler with the fair queue policy (mocked client)."""
+
+    def _scheduler(self, **policy) -> tuple[RedisScheduler, MagicMock]:
+        scheduler = RedisScheduler(
+            redis_url="redis://localhost:6379/0",
+            fair_share=FairSharePolicy(**policy),
+        )
+        client = MagicMock()
+        scheduler._redis_client = client
+        scheduler._fair_enqueue = AsyncMock()
+        scheduler._fair_dequeue = AsyncMock()
+        return scheduler, client
+
+    @pytest.mark.asyncio
+    async def test_run_enqueued_by_priority_and_key(self):
+        """Test that run ops carry priority and key, control ops neither."""
+        scheduler, _ = self._scheduler()
+        params = _run_params(priority="high")
+
+        await scheduler.run_task(params)
+        await scheduler.resume_task(TaskIdParams(task_id=params["task_id"]))
+
+        run_args = scheduler._fair_enqueue.await_args_list[0].kwargs["args"]
+        resume_args = scheduler._fair_enqueue.await_args_list[1].kwargs["args"]
+        assert run_args[:3] == ["bindu:tasks:fair", "high", str(params["context_id"])]
+        assert resume_args[:3] == ["bindu:tasks:fair", "", ""]
+
+    @pytest.mark.asyncio
+    async def test_dequeue_sets_lease_and_ack_releases(self):
+        """Test that a fair-queued op is tagged and its lease released on ack."""
+        scheduler, client = self._scheduler(max_in_flight_per_key=2)
+        params = _run_params()
+        payload = scheduler._serialize_task_operation(
+            {"operation": "run", "params": params, "_current_span": get_current_span()}
+        )
+        scheduler._fair_dequeue.return_value = [payload, b"key-1"]
+
+        operations = scheduler.receive_task_operations()
+        operation = await anext(operations)
+        await operations.aclose()
+
+        dequeue_args = scheduler._fair_dequeue.await_args.kwargs["args"]
+        assert dequeue_args[:3] == ["bindu:tasks:fair", 2, 3600]
+        assert operation["_fair_key"] == "key-1"
+        assert operation["_delivery_id"] == dequeue_args[3]
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        client.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        await scheduler.ack_task_operation(operation)
+
+        pipe.zrem.assert_called_once_with(
+            "bindu:tasks:fair:lease:key-1", operation["_delivery_id"]
+        )
+        pipe.execute.assert_awaited_once()
+
+
+class TestFairShareFactory:
+    """Test fair-share configuration through the scheduler factory."""
+
+    @pytest.mark.asyncio
+    async def test_fifo_by_default(self):
+        """Test that the memory scheduler stays FIFO unless configured."""
+        scheduler = await create_scheduler(SchedulerConfig(type="memory"))
+
+        assert scheduler.fair_share is None
+
+    @pytest.mark.asyncio
+    async def test_fair_policy_from_config(self):
+        """Test that config fields build the policy, falling back to settings."""
+        scheduler = await create_scheduler(
+            SchedulerConfig(type="memory", queue_policy="fair", max_in_flight_per_key=3)
+        )
+
+        assert scheduler.fair_share == FairSharePolicy(
+            priority_weights={"high": 8, "normal": 4, "low": 1},
+            max_in_flight_per_key=3,
+        )
+
+
+class TestSendMessageScheduling:
+    """Test that message/send forwards priority and fairness key."""
+
+    @pytest.mark.asyncio
+    async def test_priority_and_fairness_key_forwarded(self, storage: InMemoryStorage):
+        """Test that configuration.priority and the caller key reach the scheduler."""
+        scheduler = MagicMock()
+        scheduler.run_task = AsyncMock()
+        handlers = MessageHandlers(
+            scheduler=scheduler, storage=storage, context_id_parser=lambda c: c
+        )
+        message = create_test_message()
+
+        await handlers.send_message(
+            {
+                "jsonrpc": "2.0",
+                "id": uuid4(),
+                "method": "message/send",
+                "params": {
+                    "message": message,
+                    "configuration": {
+                        "accepted_output_modes": ["text/plain"],
+                        "priority": "low",
+                    },
+                    "_fairness_key": "did:bindu:alice",
+                },
+            }
+        )
+
+        scheduled = scheduler.run_task.await_args.args[0]
+        assert scheduled["priority"] == "low"
+        assert scheduled["fairness_key"] == "did:bindu:alice"
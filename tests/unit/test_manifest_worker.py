@@ -504,3 +504,234 @@ class TestLifecycleNotifications:
 
         # Should have received notifications
         assert len(notifications) > 0
+
+
+class TestHistoryCache:
+    """Test reuse of converted history across conversation turns."""
+
+    @staticmethod
+    async def _finished_task(storage: InMemoryStorage, context_id, text: str):
+        message = create_test_message(text=text, context_id=context_id)
+        task = await storage.submit_task(context_id, message)
+        await storage.update_task(task["id"], state="completed")
+        return task
+
+    @pytest.mark.asyncio
+    async def test_context_history_reuses_finished_tasks(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that finished tasks are converted once and then served from cache."""
+        manifest = MockManifest(agent_fn=MockAgent())
+        manifest.enable_context_based_history = True
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, manifest),
+        )
+        context_id = uuid4()
+        await self._finished_task(storage, context_id, "first")
+        await self._finished_task(storage, context_id, "second")
+        current_msg = create_test_message(text="third", context_id=context_id)
+        current = await storage.submit_task(context_id, current_msg)
+
+        loads = []
+        load_tasks = storage.load_tasks
+
+        async def counting_load_tasks(task_ids, *args, **kwargs):
+            loads.append(list(task_ids))
+            return await load_tasks(task_ids, *args, **kwargs)
+
+        storage.load_tasks = counting_load_tasks
+
+        history = await worker._build_complete_message_history(current)
+        again = await worker._build_complete_message_history(current)
+
+        assert [m["content"] for m in history] == ["first", "second", "third"]
+        assert again == history
+        assert len(loads) == 1 and len(loads[0]) == 2
+        assert len(worker.history_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_cleared_context_is_forgotten(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that referenced tasks of a cleared context are not served from cache."""
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, MockManifest(agent_fn=MockAgent())),
+        )
+        context_id = uuid4()
+        previous = await self._finished_task(storage, context_id, "earlier")
+        message = create_test_message(
+            text="refine", context_id=context_id, reference_task_ids=[previous["id"]]
+        )
+        current = await storage.submit_task(context_id, message)
+
+        history = await worker._build_complete_message_history(current)
+        assert [m["content"] for m in history] == ["earlier", "refine"]
+
+        await storage.clear_context(context_id)
+        worker.history_cache.invalidate_context(context_id)
+
+        history = await worker._build_complete_message_history(current)
+        assert [m["content"] for m in history] == ["refine"]
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used tasks are dropped beyond the limit."""
+        from bindu.server.workers.helpers import HistoryCache
+
+        cache = HistoryCache(max_tasks=2)
+        context_id = uuid4()
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.put(first, context_id, [])
+        cache.put(second, context_id, [])
+        cache.get(first)
+        cache.put(third, context_id, [])
+
+        assert cache.get(second) is None
+        assert cache.get(first) == [] and cache.get(third) == []
+        cache.invalidate_context(context_id)
+        assert len(cache) == 0
+
+
+class TestHistoryReduction:
+    """Test the history reduction pipeline run before the agent."""
+
+    @staticmethod
+    def _messages(count: int) -> list[dict[str, str]]:
+        return [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": f"m{i}"}
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_no_window_by_default(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that the default num_history_sessions does not cut the history."""
+        manifest = MockManifest(agent_fn=MockAgent())
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, manifest),
+        )
+
+        history = await worker._reduce_history(uuid4(), self._messages(30))
+
+        assert len(history) == 30
+
+    @pytest.mark.asyncio
+    async def test_window_keeps_configured_turns(
+        self,
+        storage: InMemoryStorage,
+        scheduler: InMemoryScheduler,
+    ):
+        """Test that an explicit num_history_sessions keeps that many turns."""
+        manifest = MockManifest(agent_fn=MockAgent())
+        manifest.history_window_turns = 2
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, manifest),
+        )
+
+        history = await worker._reduce_history(uuid4(), self._messages(7))
+
+        assert [m["content"] for m in history] == ["m4", "m5", "m6"]
+
+    @pytest.mark.asyncio
+    async def test_token_budget_keeps_newest_messages(self):
+        """Test that the oldest messages are dropped to fit the budget."""
+        from bindu.server.workers.helpers import TokenBudget
+
+        # Each message costs 2 characters + 4 overhead = 6 tokens
+        budget = TokenBudget(max_tokens=13, chars_per_token=1.0)
+        history = await budget.reduce(self._messages(4), uuid4())
+        assert [m["content"] for m in history] == ["m2", "m3"]
+
+        # The current message is kept even if it alone exceeds the budget
+        history = await TokenBudget(max_tokens=1).reduce(self._messages(3), uuid4())
+        assert [m["content"] for m in history] == ["m2"]
+
+    @pytest.mark.asyncio
+    async def test_rolling_summary_is_incremental_and_persisted(
+        self, storage: InMemoryStorage
+    ):
+        """Test that each turn only summarizes the messages that left the window."""
+        from bindu.server.workers.helpers import RollingSummary
+
+        calls = []
+
+        async def summarizer(previous, messages):
+            calls.append((previous, [m["content"] for m in messages]))
+            return (previous or "") + "".join(m["content"] for m in messages)
+
+        reducer = RollingSummary(summarizer, storage, keep_messages=2)
+        context_id = uuid4()
+
+        history = await reducer.reduce(self._messages(4), context_id)
+        assert history[0]["role"] == "system"
+        assert history[0]["content"].endswith("m0m1")
+        assert [m["content"] for m in history[1:]] == ["m2", "m3"]
+
+        history = await reducer.reduce(self._messages(6), context_id)
+        assert history[0]["content"].endswith("m0m1m2m3")
+        assert calls == [(None, ["m0", "m1"]), ("m0m1", ["m2", "m3"])]
+
+        record = await storage.load_history_summary(context_id)
+        assert record["text"] == "m0m1m2m3" and record["covered"] == 4
+
+        # Same history again: the persisted summary is reused as is
+        await reducer.reduce(self._messages(6), context_id)
+        assert len(calls) == 2
+
+        # A history with a different beginning is summarized from scratch
+        other = [{"role": "user", "content": "x"}] + self._messages(4)
+        await reducer.reduce(other, context_id)
+        assert calls[-1] == (None, ["x", "m0", "m1"])
+
+    @pytest.mark.asyncio
+    async def test_sync_summarizer_runs_off_the_event_loop(
+        self, storage: InMemoryStorage
+    ):
+        """Test that a blocking summarizer runs in a worker thread."""
+        import threading
+
+        from bindu.server.workers.helpers import RollingSummary
+
+        threads = []
+
+        def summarizer(previous, messages):
+            threads.append(threading.current_thread())
+            return "summary"
+
+        reducer = RollingSummary(summarizer, storage, keep_messages=2)
+        history = await reducer.reduce(self._messages(4), uuid4())
+
+        assert history[0]["content"].endswith("summary")
+        assert threads and threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test_failing_summarizer_falls_back_to_window(
+        self, storage: InMemoryStorage
+    ):
+        """Test that a summarizer error keeps the turn running with the window."""
+        from bindu.server.workers.helpers import RollingSummary
+
+        def summarizer(previous, messages):
+            raise RuntimeError("model unavailable")
+
+        reducer = RollingSummary(summarizer, storage, keep_messages=2)
+        context_id = uuid4()
+
+        history = await reducer.reduce(self._messages(5), context_id)
+
+        assert [m["content"] for m in history] == ["m3", "m4"]
+        assert await storage.load_history_summary(context_id) is None
@@ -68,6 +68,17 @@ def test_metrics_agent_tasks(metrics):
     )
 
 
+def test_metrics_storage_memory_gauges(metrics):
+    """Test that storage memory stats are exported as gauges."""
+    metrics.set_storage_memory_stats({"tasks": 12, "payload_bytes": 4096})
+
+    output = metrics.generate_prometheus_text()
+
+    assert "# TYPE storage_memory_tasks gauge" in output
+    assert "storage_memory_tasks 12" in output
+    assert "storage_memory_payload_bytes 4096" in output
+
+
 def test_metrics_prometheus_format(metrics):
     """Test Prometheus text format output."""
     metrics.record_http_request("GET", "/health", "200", 0.1)
@@ -0,0 +1,231 @@
+"""Unit tests for range partitioning of the tasks table."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bindu.server.storage.partitioning import (
+    archive_task_partitions,
+    convert_tasks_statement,
+    create_partition_statements,
+    partition_bounds,
+    partition_upper_bound,
+)
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestPartitionBounds:
+    """Test period alignment and partition statements."""
+
+    def test_periods(self):
+        """Test day, week (Monday) and month periods including year end."""
+        moment = _utc(2026, 12, 17, 15, 30)
+
+        assert partition_bounds(moment, "day") == (
+            _utc(2026, 12, 17),
+            _utc(2026, 12, 18),
+        )
+        assert partition_bounds(moment, "week") == (
+            _utc(2026, 12, 14),
+            _utc(2026, 12, 21),
+        )
+        assert partition_bounds(moment, "month") == (
+            _utc(2026, 12, 1),
+            _utc(2027, 1, 1),
+        )
+
+    def test_premade_partitions(self):
+        """Test that the current and next periods get consecutive partitions."""
+        statements = create_partition_statements(_utc(2026, 10, 18), "month", 2)
+
+        assert len(statements) == 3
+        assert "tasks_p20261001 PARTITION OF tasks" in statements[0]
+        assert (
+            "FROM ('2026-11-01T00:00:00+00:00') TO ('2026-12-01T00:00:00+00:00')"
+            in statements[1]
+        )
+        assert "tasks_p20261201" in statements[2]
+
+    def test_conversion_uses_interval(self):
+        """Test that the cutover of the legacy partition follows the interval."""
+        sql = convert_tasks_statement("week")
+
+        assert "date_trunc('week', NOW(), 'UTC') + INTERVAL '1 week'" in sql
+        assert "PARTITION BY RANGE (created_at)" in sql
+
+    def test_upper_bound(self):
+        """Test parsing of pg_get_expr partition bounds."""
+        assert partition_upper_bound(
+            "FOR VALUES FROM (MINVALUE) TO ('2026-11-01 00:00:00+00')"
+        ) == _utc(2026, 11, 1)
+        assert partition_upper_bound("DEFAULT") is None
+
+
+class TestArchivePartitions:
+    """Test detaching of expired partitions."""
+
+    @staticmethod
+    def _engine(partitions, server_version=(16, 2)):
+        listing = MagicMock()
+        rows = []
+        for name, bound in partitions:
+            row = MagicMock(bound=bound)
+            row.name = name  # MagicMock(name=...) names the mock itself
+            rows.append(row)
+        listing.fetchall.return_value = rows
+        batch = MagicMock(rowcount=0)
+        conn = MagicMock()
+        conn.dialect.server_version_info = server_version
+        conn.execute = AsyncMock(side_effect=[listing] + [batch] * 50)
+        conn.execution_options = AsyncMock(return_value=conn)
+        conn.transactions = []
+
+        def _cm(kind):
+            cm = MagicMock()
+
+            async def _enter(*_):
+                conn.transactions.append(kind)
+                return conn
+
+            cm.__aenter__ = _enter
+            cm.__aexit__ = AsyncMock(return_value=None)
+            return cm
+
+        engine = MagicMock()
+        engine.begin = MagicMock(side_effect=lambda: _cm("begin"))
+        engine.connect = MagicMock(side_effect=lambda: _cm("connect"))
+        engine.conn = conn
+        return engine
+
+    @staticmethod
+    def _sql(engine) -> list[str]:
+        return [str(call.args[0]) for call in engine.conn.execute.await_args_list[1:]]
+
+    @pytest.mark.asyncio
+    async def test_drops_only_expired_partitions(self):
+        """Test that partitions ending before the cutoff are detached and dropped."""
+        engine = self._engine(
+            [
+                ("tasks_default", "DEFAULT"),
+                (
+                    "tasks_legacy",
+                    "FOR VALUES FROM (MINVALUE) TO ('2026-09-01 00:00:00+00')",
+                ),
+                (
+                    "tasks_p20261001",
+                    "FOR VALUES FROM ('2026-10-01 00:00:00+00') TO ('2026-11-01 00:00:00+00')",
+                ),
+            ]
+        )
+
+        detached = await archive_task_partitions(engine, _utc(2026, 10, 15))
+
+        assert detached == ["tasks_legacy"]
+        sql = self._sql(engine)
+        # A DEFAULT partition rules out DETACH ... CONCURRENTLY
+        assert sql[0] == 'ALTER TABLE tasks DETACH PARTITION "tasks_legacy"'
+        assert (
+            "DELETE FROM task_messages WHERE ctid IN (SELECT ctid FROM task_messages "
+            'WHERE task_id IN (SELECT id FROM "tasks_legacy") LIMIT 1000)' in sql
+        )
+        assert sql[-1] == 'DROP TABLE "tasks_legacy"'
+
+    @pytest.mark.asyncio
+    async def test_steps_run_in_separate_transactions(self):
+        """Test the concurrent detach outside a transaction and one per batch."""
+        engine = self._engine(
+            [
+                (
+                    "tasks_p20260801",
+                    "FOR VALUES FROM ('2026-08-01 00:00:00+00') TO ('2026-09-01 00:00:00+00')",
+                )
+            ]
+        )
+        batches = [MagicMock(rowcount=2), MagicMock(rowcount=1)]
+        listing = engine.conn.execute.side_effect
+        engine.conn.execute = AsyncMock(
+            side_effect=[next(listing), MagicMock()]
+            + batches
+            + [MagicMock(rowcount=0)] * 10
+        )
+
+        await archive_task_partitions(engine, _utc(2026, 10, 1), batch_size=2)
+
+        sql = self._sql(engine)
+        assert sql[0] == (
+            'ALTER TABLE tasks DETACH PARTITION "tasks_p20260801" CONCURRENTLY'
+        )
+        engine.conn.execution_options.assert_awaited_once_with(
+            isolation_level="AUTOCOMMIT"
+        )
+        assert sum("FROM task_messages" in stmt for stmt in sql) == 2
+        # listing, detach, 2 + 4 batches, drop
+        assert engine.conn.transactions == ["begin", "connect"] + ["begin"] * 7
+
+    @pytest.mark.asyncio
+    async def test_plain_detach_before_postgres_14(self):
+        """Test that older servers fall back to the plain detach."""
+        engine = self._engine(
+            [
+                (
+                    "tasks_p20260801",
+                    "FOR VALUES FROM ('2026-08-01 00:00:00+00') TO ('2026-09-01 00:00:00+00')",
+                )
+            ],
+            server_version=(13, 9),
+        )
+
+        await archive_task_partitions(engine, _utc(2026, 10, 1))
+
+        assert self._sql(engine)[0] == (
+            'ALTER TABLE tasks DETACH PARTITION "tasks_p20260801"'
+        )
+
+    @pytest.mark.asyncio
+    async def test_archives_into_schema(self):
+        """Test that archived partitions keep copies of their tasks' rows."""
+        engine = self._engine(
+            [
+                (
+                    "tasks_p20260801",
+                    "FOR VALUES FROM ('2026-08-01 00:00:00+00') TO ('2026-09-01 00:00:00+00')",
+                )
+            ]
+        )
+
+        await archive_task_partitions(engine, _utc(2026, 10, 1), "bindu_archive")
+
+        sql = self._sql(engine)
+        assert sql[0] == 'CREATE SCHEMA IF NOT EXISTS "bindu_archive"'
+        assert (
+            'CREATE TABLE IF NOT EXISTS "bindu_archive"."tasks_p20260801_task_events" '
+            "(LIKE task_events INCLUDING DEFAULTS)" in sql
+        )
+        assert any(
+            stmt.startswith("WITH batch AS (DELETE FROM task_events")
+            and stmt.endswith(
+                'RETURNING *) INSERT INTO "bindu_archive"."tasks_p20260801_task_events" '
+                "SELECT * FROM batch"
+            )
+            for stmt in sql
+        )
+        assert sql[-1] == 'ALTER TABLE "tasks_p20260801" SET SCHEMA "bindu_archive"'
+
+    @pytest.mark.asyncio
+    async def test_rejects_unsafe_archive_schema(self):
+        """Test that the archive schema name is validated."""
+        engine = self._engine(
+            [
+                (
+                    "tasks_legacy",
+                    "FOR VALUES FROM (MINVALUE) TO ('2026-01-01 00:00:00+00')",
+                )
+            ]
+        )
+
+        with pytest.raises(ValueError):
+            await archive_task_partitions(engine, _utc(2026, 10, 1), 'x"; DROP')
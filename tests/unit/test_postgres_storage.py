@@ -8,6 +8,9 @@ This module tests the PostgreSQL storage backend with focus on:
 - Error scenarios
 """
 
+import asyncio
+
+import anyio
 import pytest
 from datetime import datetime, timezone
 from uuid import uuid4
@@ -223,6 +226,385 @@ class TestPostgresStorageTaskOperations:
         assert isinstance(task["history"], list)
         assert isinstance(task["artifacts"], list)
 
+    @pytest.mark.asyncio
+    async def test_load_history_reads_tail_only(self):
+        """Test that history_length becomes ORDER BY seq DESC LIMIT N."""
+        from sqlalchemy.dialects import postgresql
+
+        storage = PostgresStorage()
+        session = MagicMock()
+        result = MagicMock()
+        result.fetchall.return_value = [
+            MagicMock(message={"n": 3}),
+            MagicMock(message={"n": 2}),
+        ]
+        session.execute = AsyncMock(return_value=result)
+
+        history = await storage._load_history(session, uuid4(), history_length=2)
+
+        assert history == [{"n": 2}, {"n": 3}]
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "FROM task_messages" in sql
+        assert "ORDER BY task_messages.seq DESC" in sql
+        assert "LIMIT" in sql
+
+    @pytest.mark.asyncio
+    async def test_append_rows_numbers_new_items(self):
+        """Test that appended rows end at the task's new count."""
+        from bindu.server.storage.schema import task_messages_table
+
+        session = MagicMock()
+        session.execute = AsyncMock()
+        task_id = uuid4()
+
+        await PostgresStorage._append_rows(
+            session, task_messages_table, "message", task_id, 5, [{"n": 4}, {"n": 5}]
+        )
+
+        params = session.execute.await_args.args[0].compile().params
+        assert [params["seq_m0"], params["seq_m1"]] == [4, 5]
+        assert params["task_id_m0"] == task_id
+
+    @pytest.mark.asyncio
+    async def test_update_task_is_single_statement(self):
+        """Test that a state change is one UPDATE ... RETURNING."""
+        from sqlalchemy.dialects import postgresql
+
+        row = MagicMock()
+        row.id = uuid4()
+        row.state = "working"
+        row.state_timestamp = datetime.now(timezone.utc)
+        row.metadata = {}
+        result = MagicMock()
+        result.first.return_value = row
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        storage = _connected_storage(session)
+
+        task = await storage.update_task(
+            row.id, "working", include_history=False, include_artifacts=False
+        )
+
+        assert task["status"]["state"] == "working"
+        session.execute.assert_awaited_once()
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert sql.startswith("UPDATE tasks") and "RETURNING" in sql
+
+    @pytest.mark.asyncio
+    async def test_update_task_missing_raises_key_error(self):
+        """Test that an UPDATE matching no row means task not found."""
+        result = MagicMock()
+        result.first.return_value = None
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        storage = _connected_storage(session)
+
+        with pytest.raises(KeyError):
+            await storage.update_task(uuid4(), "working")
+        session.execute.assert_awaited_once()
+
+
+class TestPostgresStorageGroupCommit:
+    """Test batching of task updates into one transaction."""
+
+    @staticmethod
+    def _batching_storage(**kwargs):
+        storage = PostgresStorage(**kwargs)
+        storage._engine = MagicMock()
+        storage._session_factory = MagicMock()
+
+        async def write_batch(batch):
+            rows = {}
+            for pending in batch:
+                row = MagicMock()
+                row.id = pending.task_id
+                row.state = pending.state
+                row.state_timestamp = datetime.now(timezone.utc)
+                row.metadata = {}
+                rows[pending.task_id] = row
+            return rows
+
+        storage._write_batch = AsyncMock(side_effect=write_batch)
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_updates_in_window_share_one_batch(self):
+        """Test that concurrent state changes are written together."""
+        storage = self._batching_storage(write_batch_ms=20)
+        task_ids = [uuid4() for _ in range(3)]
+
+        tasks = await asyncio.gather(
+            *(
+                storage.update_task(
+                    task_id, "working", include_history=False, include_artifacts=False
+                )
+                for task_id in task_ids
+            )
+        )
+
+        storage._write_batch.assert_awaited_once()
+        [batch] = storage._write_batch.await_args.args
+        assert [pending.task_id for pending in batch] == task_ids
+        assert [task["status"]["state"] for task in tasks] == ["working"] * 3
+
+    @pytest.mark.asyncio
+    async def test_terminal_state_flushes_immediately(self):
+        """Test that a terminal update does not wait for the window."""
+        storage = self._batching_storage(write_batch_ms=60_000)
+
+        with anyio.fail_after(1):
+            await storage.update_task(
+                uuid4(), "completed", include_history=False, include_artifacts=False
+            )
+
+        storage._write_batch.assert_awaited_once()
+        assert storage._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_missing_task_fails_only_its_caller(self):
+        """Test that a task absent from the UPDATE result raises KeyError."""
+        storage = self._batching_storage(write_batch_ms=10)
+        storage._write_batch = AsyncMock(return_value={})
+
+        with pytest.raises(KeyError):
+            await storage.update_task(
+                uuid4(), "working", include_history=False, include_artifacts=False
+            )
+
+    @pytest.mark.asyncio
+    async def test_batch_statement_merges_updates_per_task(self):
+        """Test that one task's updates become one row of a single UPDATE."""
+        from sqlalchemy.dialects import postgresql
+
+        result = MagicMock()
+        result.fetchall.return_value = []
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        storage = _connected_storage(session)
+        task_id = uuid4()
+
+        await storage._write_batch(
+            [
+                _pending(task_id, "working", metadata={"a": 1}),
+                _pending(task_id, "input-required", metadata={"b": 2}),
+            ]
+        )
+
+        session.execute.assert_awaited_once()
+        compiled = session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+        assert "FROM (VALUES" in str(compiled)
+        assert [v for k, v in compiled.params.items() if k.startswith("param_")] == [
+            task_id,
+            "input-required",
+            {"a": 1, "b": 2},
+            0,
+            0,
+        ]
+
+
+class TestPostgresStorageListing:
+    """Test keyset pagination of tasks and contexts."""
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_page_is_keyset_query(self):
+        """Test that a page seeks past the cursor and fetches one extra row."""
+        from sqlalchemy.dialects import postgresql
+
+        from bindu.server.storage.helpers import decode_cursor, encode_cursor
+
+        now = datetime.now(timezone.utc)
+        rows = []
+        for _ in range(3):
+            row = MagicMock()
+            row.id = uuid4()
+            row.created_at = now
+            rows.append(row)
+        result = MagicMock()
+        result.fetchall.return_value = rows
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        storage = _connected_storage(session)
+
+        page = await storage.list_tasks_page(
+            2, encode_cursor(now, uuid4()), state="completed"
+        )
+
+        # Summaries only: no message or artifact queries
+        session.execute.assert_awaited_once()
+        stmt = session.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "(tasks.created_at, tasks.id) < (" in sql
+        assert "ORDER BY tasks.created_at DESC, tasks.id DESC" in sql
+        assert stmt._limit == 3
+        assert [t["id"] for t in page["tasks"]] == [rows[0].id, rows[1].id]
+        assert page["tasks"][0]["history"] == []
+        assert decode_cursor(page["next_cursor"]) == (now, rows[1].id)
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_page_last_page(self):
+        """Test that a short page has no next cursor."""
+        result = MagicMock()
+        result.fetchall.return_value = []
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        storage = _connected_storage(session)
+
+        page = await storage.list_tasks_page(10)
+
+        assert page == {"tasks": [], "next_cursor": None}
+
+
+class TestPostgresStorageLoadTasks:
+    """Test batched task loading."""
+
+    @pytest.mark.asyncio
+    async def test_load_tasks_uses_one_array_parameter(self):
+        """Test that load_tasks is one = ANY(...) query keeping the given order."""
+        from sqlalchemy.dialects import postgresql
+
+        rows = []
+        for _ in range(2):
+            row = MagicMock()
+            row.id = uuid4()
+            row.state = "completed"
+            row.state_timestamp = datetime.now(timezone.utc)
+            row.metadata = {}
+            rows.append(row)
+        result = MagicMock()
+        result.fetchall.return_value = rows
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        storage = _connected_storage(session)
+
+        tasks = await storage.load_tasks(
+            [rows[1].id, uuid4(), rows[0].id],
+            include_history=False,
+            include_artifacts=False,
+        )
+
+        assert [t["id"] for t in tasks] == [rows[1].id, rows[0].id]
+        session.execute.assert_awaited_once()
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "tasks.id = ANY (CAST(" in sql
+
+    @pytest.mark.asyncio
+    async def test_load_tasks_joins_per_task_history_limits(self):
+        """Test that per-task limits are joined from unnest() in the ranked query."""
+        from sqlalchemy.dialects import postgresql
+
+        row = MagicMock()
+        row.id = uuid4()
+        row.state = "completed"
+        row.state_timestamp = datetime.now(timezone.utc)
+        row.metadata = {}
+        result = MagicMock()
+        result.fetchall.return_value = [row]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        storage = _connected_storage(session)
+
+        await storage.load_tasks(
+            [row.id], history_lengths={row.id: 3}, include_artifacts=False
+        )
+
+        assert session.execute.await_count == 2
+        stmt = session.execute.await_args_list[1].args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "row_number() OVER (PARTITION BY task_messages.task_id" in sql
+        assert "unnest(CAST(" in sql
+        assert "AS limits(task_id, max_messages)" in sql
+        assert "rank <= limits.max_messages" in sql
+
+
+class TestPostgresStorageTransition:
+    """Test compare-and-set state transitions."""
+
+    @pytest.mark.asyncio
+    async def test_transition_is_conditional_update(self):
+        """Test that the transition only matches a task in the expected state."""
+        from sqlalchemy.dialects import postgresql
+
+        result = MagicMock()
+        result.scalar_one_or_none.side_effect = [uuid4(), None]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        storage = _connected_storage(session)
+        task_id = uuid4()
+
+        assert await storage.transition_task_state(task_id, "suspended", "resumed")
+        assert not await storage.transition_task_state(task_id, "suspended", "resumed")
+
+        stmt = session.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE tasks SET state=")
+        assert "WHERE tasks.id = %(id_1)s::UUID AND tasks.state = %(state_1)s" in sql
+        assert "RETURNING tasks.id" in sql
+
+
+class TestPostgresStorageEventLog:
+    """Test the task event log."""
+
+    @pytest.mark.asyncio
+    async def test_append_locks_task_before_allocating_seq(self):
+        """Test that seq is allocated under an advisory lock on the task."""
+        from sqlalchemy.dialects import postgresql
+
+        from bindu.server.storage.postgres_storage import _event_lock_key
+
+        result = MagicMock()
+        result.scalar_one.return_value = 5
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        storage = _connected_storage(session)
+        task_id = uuid4()
+
+        seq = await storage.append_task_event(task_id, {"kind": "status-update"})
+
+        assert seq == 5
+        lock, insert_stmt = [
+            call.args[0].compile(dialect=postgresql.dialect())
+            for call in session.execute.await_args_list
+        ]
+        assert "pg_advisory_xact_lock" in str(lock)
+        assert list(lock.params.values()) == [_event_lock_key(task_id)]
+        assert "max(task_events.seq)" in str(insert_stmt)
+
+
+def _connected_storage(session, **kwargs):
+    """PostgresStorage whose sessions are the given mock."""
+    storage = PostgresStorage(**kwargs)
+    storage._engine = MagicMock()
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=session)
+    session_cm.__aexit__ = AsyncMock(return_value=None)
+    storage._session_factory = MagicMock(return_value=session_cm)
+    transaction = MagicMock()
+    transaction.__aenter__ = AsyncMock()
+    transaction.__aexit__ = AsyncMock(return_value=None)
+    session.begin = MagicMock(return_value=transaction)
+    return storage
+
+
+def _pending(task_id, state, metadata=None):
+    from bindu.server.storage.postgres_storage import _PendingUpdate
+
+    return _PendingUpdate(
+        task_id=task_id,
+        state=state,
+        new_artifacts=[],
+        new_messages=[],
+        metadata=metadata or {},
+        future=MagicMock(),
+    )
+
 
 class TestPostgresStorageRetryLogic:
     """Test PostgresStorage retry logic."""
@@ -177,6 +177,7 @@ class TestRedisSchedulerSerialization:
         mock_span_context = MagicMock()
         mock_span_context.span_id = 0x0123456789ABCDEF
         mock_span_context.trace_id = 0x0123456789ABCDEF0123456789ABCDEF
+        mock_span_context.trace_flags = 1
         mock_span.get_span_context.return_value = mock_span_context
 
         task_op = {
@@ -190,8 +191,9 @@ class TestRedisSchedulerSerialization:
 
         assert data["operation"] == "run"
         assert data["params"]["task_id"] == "test-123"
-        assert "span_id" in data
-        assert "trace_id" in data
+        assert data["traceparent"] == (
+            "00-0123456789abcdef0123456789abcdef-0123456789abcdef-01"
+        )
 
     def test_deserialize_task_operation_run(self, redis_url):
         """Test deserialization of run task operation."""
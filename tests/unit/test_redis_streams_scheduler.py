@@ -0,0 +1,270 @@
+"""Unit tests for RedisStreamsScheduler."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as redis
+
+from bindu.common.models import SchedulerConfig
+from bindu.common.protocol.types import TaskIdParams
+from bindu.server.metrics import PrometheusMetrics
+from bindu.server.scheduler.factory import create_scheduler
+from bindu.server.scheduler.redis_streams_scheduler import RedisStreamsScheduler
+
+
+@pytest.fixture
+def mock_redis_client():
+    """Mock Redis client with stream commands."""
+    client = AsyncMock()
+    client.ping = AsyncMock()
+    client.xgroup_create = AsyncMock()
+    client.xadd = AsyncMock(return_value="1-0")
+    client.xreadgroup = AsyncMock(return_value=[])
+    client.xautoclaim = AsyncMock(return_value=["0-0", [], []])
+    client.xack = AsyncMock(return_value=1)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1, 1])
+    client.pipeline = MagicMock()
+    client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    client.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+    client.xclaim = AsyncMock(return_value=[])
+    client.xlen = AsyncMock(return_value=0)
+    client.xinfo_groups = AsyncMock(return_value=[])
+    client.delete = AsyncMock(return_value=1)
+    client.aclose = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def scheduler(mock_redis_client):
+    """Create a RedisStreamsScheduler with a mocked Redis client."""
+    sched = RedisStreamsScheduler(
+        redis_url="redis://localhost:6379/0", consumer_name="worker-1", read_count=5
+    )
+    sched._redis_client = mock_redis_client
+    return sched
+
+
+def _entry(entry_id: str, task_id) -> tuple[str, dict[str, str]]:
+    payload = json.dumps({"operation": "cancel", "params": {"task_id": str(task_id)}})
+    return entry_id, {"data": payload}
+
+
+class TestRedisStreamsSchedulerLifecycle:
+    """Test connection and consumer group management."""
+
+    @pytest.mark.asyncio
+    async def test_context_manager_creates_group(self, mock_redis_client):
+        """Test that entering the context creates the consumer group."""
+        with patch("redis.asyncio.from_url", return_value=mock_redis_client):
+            scheduler = RedisStreamsScheduler(redis_url="redis://localhost:6379/0")
+            async with scheduler:
+                mock_redis_client.xgroup_create.assert_awaited_once_with(
+                    "bindu:tasks", "bindu:workers", id="0", mkstream=True
+                )
+            mock_redis_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_existing_group_is_reused(self, mock_redis_client):
+        """Test that BUSYGROUP errors are ignored."""
+        mock_redis_client.xgroup_create.side_effect = redis.ResponseError(
+            "BUSYGROUP Consumer Group name already exists"
+        )
+        with patch("redis.asyncio.from_url", return_value=mock_redis_client):
+            async with RedisStreamsScheduler(redis_url="redis://localhost:6379/0"):
+                pass
+
+
+class TestRedisStreamsSchedulerOperations:
+    """Test enqueueing, receiving and acknowledging operations."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_task_uses_xadd(self, scheduler, mock_redis_client):
+        """Test that operations are appended to the stream."""
+        task_id = uuid4()
+        await scheduler.cancel_task(TaskIdParams(task_id=task_id))
+
+        name, fields = mock_redis_client.xadd.call_args.args
+        assert name == "bindu:tasks"
+        data = json.loads(fields["data"])
+        assert data["operation"] == "cancel"
+        assert data["params"]["task_id"] == str(task_id)
+
+    @pytest.mark.asyncio
+    async def test_xadd_respects_maxlen(self, scheduler, mock_redis_client):
+        """Test approximate trimming when stream_maxlen is set."""
+        scheduler.stream_maxlen = 1000
+        await scheduler.cancel_task(TaskIdParams(task_id=uuid4()))
+
+        kwargs = mock_redis_client.xadd.call_args.kwargs
+        assert kwargs == {"maxlen": 1000, "approximate": True}
+
+    @pytest.mark.asyncio
+    async def test_receive_reads_batch_and_tracks_delivery(
+        self, scheduler, mock_redis_client
+    ):
+        """Test that one XREADGROUP round trip yields the whole batch."""
+        ids = [uuid4(), uuid4()]
+        mock_redis_client.xreadgroup.return_value = [
+            ("bindu:tasks", [_entry("1-0", ids[0]), _entry("2-0", ids[1])])
+        ]
+
+        operations = scheduler.receive_task_operations()
+        first = await anext(operations)
+        second = await anext(operations)
+        await operations.aclose()
+
+        mock_redis_client.xreadgroup.assert_awaited_once()
+        call = mock_redis_client.xreadgroup.call_args
+        assert call.args == ("bindu:workers", "worker-1", {"bindu:tasks": ">"})
+        assert call.kwargs["count"] == 5
+
+        assert first["params"]["task_id"] == ids[0]
+        assert first["_delivery_id"] == "1-0"
+        assert second["_delivery_id"] == "2-0"
+        assert scheduler._unacked == {"1-0", "2-0"}
+
+    @pytest.mark.asyncio
+    async def test_fetch_bounded_by_free_slots(self, scheduler, mock_redis_client):
+        """Test that a busy worker does not reserve entries it cannot start."""
+        free = 2
+        scheduler.set_consumer_capacity(lambda: free)
+        mock_redis_client.xreadgroup.return_value = [
+            ("bindu:tasks", [_entry("1-0", uuid4())])
+        ]
+
+        operations = scheduler.receive_task_operations()
+        await anext(operations)
+        assert mock_redis_client.xautoclaim.call_args.kwargs["count"] == 2
+        assert mock_redis_client.xreadgroup.call_args.kwargs["count"] == 2
+
+        free = 1
+        await anext(operations)
+        await operations.aclose()
+        assert mock_redis_client.xreadgroup.call_args.kwargs["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ack_removes_pending_entry(self, scheduler, mock_redis_client):
+        """Test that acknowledging an operation sends XACK and XDEL together."""
+        scheduler._unacked.add("1-0")
+        operation = {"operation": "cancel", "params": {}, "_delivery_id": "1-0"}
+
+        await scheduler.ack_task_operation(operation)
+
+        mock_redis_client.pipeline.assert_called_once_with(transaction=True)
+        pipe = mock_redis_client.pipeline.return_value.__aenter__.return_value
+        pipe.xack.assert_called_once_with("bindu:tasks", "bindu:workers", "1-0")
+        pipe.xdel.assert_called_once_with("bindu:tasks", "1-0")
+        pipe.execute.assert_awaited_once()
+        assert scheduler._unacked == set()
+
+    @pytest.mark.asyncio
+    async def test_stalled_entries_are_reclaimed_first(
+        self, scheduler, mock_redis_client
+    ):
+        """Test that XAUTOCLAIM results are delivered before new entries."""
+        task_id = uuid4()
+        mock_redis_client.xautoclaim.return_value = [
+            "0-0",
+            [_entry("7-0", task_id)],
+            [],
+        ]
+
+        operations = scheduler.receive_task_operations()
+        operation = await anext(operations)
+        await operations.aclose()
+
+        assert operation["_delivery_id"] == "7-0"
+        assert mock_redis_client.xautoclaim.call_args.kwargs["min_idle_time"] == 60000
+        mock_redis_client.xreadgroup.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_malformed_entry_is_dropped(self, scheduler, mock_redis_client):
+        """Test that undecodable entries are acknowledged instead of redelivered."""
+        task_id = uuid4()
+        mock_redis_client.xreadgroup.return_value = [
+            ("bindu:tasks", [("1-0", {"data": "not json"}), _entry("2-0", task_id)])
+        ]
+
+        operations = scheduler.receive_task_operations()
+        operation = await anext(operations)
+        await operations.aclose()
+
+        assert operation["_delivery_id"] == "2-0"
+        pipe = mock_redis_client.pipeline.return_value.__aenter__.return_value
+        pipe.xack.assert_called_once_with("bindu:tasks", "bindu:workers", "1-0")
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_refreshes_unacked_entries(
+        self, scheduler, mock_redis_client
+    ):
+        """Test that in-progress entries are re-claimed with JUSTID."""
+        scheduler._unacked.update({"1-0"})
+        await scheduler._refresh_unacked_entries()
+
+        kwargs = mock_redis_client.xclaim.call_args.kwargs
+        assert kwargs["min_idle_time"] == 0
+        assert kwargs["message_ids"] == ["1-0"]
+        assert kwargs["justid"] is True
+
+
+class TestRedisStreamsSchedulerStats:
+    """Test queue depth and lag reporting."""
+
+    @pytest.mark.asyncio
+    async def test_queue_stats(self, scheduler, mock_redis_client):
+        """Test that queue depth comes from XINFO GROUPS, not XLEN."""
+        mock_redis_client.xlen.return_value = 500
+        mock_redis_client.xinfo_groups.return_value = [
+            {"name": "other", "pending": 99, "lag": 99, "consumers": 9},
+            {"name": "bindu:workers", "pending": 3, "lag": 7, "consumers": 2},
+        ]
+
+        stats = await scheduler.get_queue_stats()
+
+        assert stats == {"length": 10, "pending": 3, "lag": 7, "consumers": 2}
+        assert await scheduler.get_queue_length() == 7
+        mock_redis_client.xlen.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lag_fallback_without_redis7(self, scheduler, mock_redis_client):
+        """Test lag approximation when the server does not report it."""
+        mock_redis_client.xlen.return_value = 10
+        mock_redis_client.xinfo_groups.return_value = [
+            {"name": "bindu:workers", "pending": 4, "lag": None, "consumers": 1}
+        ]
+
+        assert (await scheduler.get_queue_stats())["lag"] == 6
+
+    def test_prometheus_gauges(self):
+        """Test that queue stats are exported as gauges."""
+        metrics = PrometheusMetrics()
+        metrics.set_scheduler_queue_stats({"lag": 7, "pending": 3})
+
+        output = metrics.generate_prometheus_text()
+
+        assert "# TYPE scheduler_queue_lag gauge" in output
+        assert "scheduler_queue_lag 7" in output
+        assert "scheduler_queue_pending 3" in output
+
+
+class TestRedisStreamsFactory:
+    """Test backend selection through create_scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_create_streams_scheduler(self):
+        """Test creating a Redis Streams scheduler from config."""
+        config = SchedulerConfig(
+            type="redis-streams",
+            redis_url="redis://localhost:6379/0",
+            consumer_group="agents",
+            read_count=20,
+        )
+
+        scheduler = await create_scheduler(config)
+
+        assert isinstance(scheduler, RedisStreamsScheduler)
+        assert scheduler.consumer_group == "agents"
+        assert scheduler.read_count == 20
@@ -5,7 +5,12 @@ from uuid import uuid4
 
 import pytest
 
+from bindu.server.handlers.message_handlers import MessageHandlers
+from bindu.server.scheduler import SchedulerQueueFullError
+from bindu.server.scheduler.fair_queue import FairSharePolicy
 from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from tests.utils import assert_task_state, create_test_message
 
 
 @pytest.mark.asyncio
@@ -72,3 +77,67 @@ async def test_scheduler_operations():
         assert received[1]["operation"] == "cancel"
         assert received[2]["operation"] == "pause"
         assert received[3]["operation"] == "resume"
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_rejects_when_full():
+    """Test that run_task fails fast once the buffer is at capacity."""
+    async with InMemoryScheduler(max_queue_size=2) as scheduler:
+        await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+        await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+
+        with pytest.raises(SchedulerQueueFullError):
+            await asyncio.wait_for(
+                scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()}),
+                timeout=1.0,
+            )
+
+        assert await scheduler.get_queue_stats() == {
+            "length": 2,
+            "max_size": 2,
+            "rejected": 1,
+        }
+
+
+@pytest.mark.asyncio
+async def test_bounded_fair_queue_rejects_when_full():
+    """Test that the queue bound also applies to the fair-share policy."""
+    async with InMemoryScheduler(
+        fair_share=FairSharePolicy(), max_queue_size=1
+    ) as scheduler:
+        await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+
+        with pytest.raises(SchedulerQueueFullError):
+            await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+
+        # Control operations are never shed
+        await scheduler.cancel_task({"task_id": uuid4()})
+        assert await scheduler.get_queue_length() == 2
+
+
+@pytest.mark.asyncio
+async def test_send_message_rejected_when_queue_full(storage: InMemoryStorage):
+    """Test that message/send returns QueueFullError and rejects the task."""
+    async with InMemoryScheduler(max_queue_size=1) as scheduler:
+        handlers = MessageHandlers(
+            scheduler=scheduler, storage=storage, context_id_parser=lambda c: c
+        )
+
+        def request():
+            return {
+                "jsonrpc": "2.0",
+                "id": uuid4(),
+                "method": "message/send",
+                "params": {
+                    "message": create_test_message(),
+                    "configuration": {"accepted_output_modes": ["text/plain"]},
+                },
+            }
+
+        accepted = await handlers.send_message(request())
+        rejected = await handlers.send_message(request())
+
+    assert "result" in accepted
+    assert rejected["error"]["code"] == -32040
+    tasks = await storage.list_tasks()
+    assert_task_state(tasks[-1], "rejected")
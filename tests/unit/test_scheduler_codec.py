@@ -0,0 +1,138 @@
+"""Unit tests for the scheduler task operation codec."""
+
+import json
+from uuid import uuid4
+
+import pytest
+
+from bindu.server.scheduler.codec import (
+    MSGPACK_AVAILABLE,
+    TASK_SEND_PARAMS_SCHEMA,
+    UUID_FIELD,
+    UUID_LIST_FIELD,
+    TaskOperationCodec,
+)
+from bindu.server.scheduler.redis_scheduler import RedisScheduler
+
+requires_msgpack = pytest.mark.skipif(
+    not MSGPACK_AVAILABLE, reason="msgpack not installed"
+)
+
+
+def _run_envelope():
+    task_id, context_id = uuid4(), uuid4()
+    uuid_text = str(uuid4())
+    return {
+        "operation": "run",
+        "params": {
+            "task_id": task_id,
+            "context_id": context_id,
+            "message": {
+                "message_id": uuid4(),
+                "task_id": task_id,
+                "context_id": context_id,
+                "reference_task_ids": [uuid4(), uuid4()],
+                "kind": "message",
+                "role": "user",
+                "parts": [{"kind": "text", "text": uuid_text}],
+                "metadata": {"ref": uuid_text},
+            },
+        },
+        "span_id": None,
+        "trace_id": None,
+    }
+
+
+class TestSchemaCompilation:
+    """Test UUID schema compilation from protocol TypedDicts."""
+
+    def test_task_send_params_schema(self):
+        """Test that UUID fields are found, including nested message fields."""
+        assert TASK_SEND_PARAMS_SCHEMA["task_id"] is UUID_FIELD
+        assert TASK_SEND_PARAMS_SCHEMA["context_id"] is UUID_FIELD
+        message = TASK_SEND_PARAMS_SCHEMA["message"]
+        assert message["message_id"] is UUID_FIELD
+        assert message["reference_task_ids"] is UUID_LIST_FIELD
+        # Free-form fields are never visited
+        assert "parts" not in message
+        assert "metadata" not in message
+
+
+class TestTaskOperationCodec:
+    """Test encode/decode round trips."""
+
+    @pytest.mark.parametrize(
+        "wire_format", ["json", pytest.param("msgpack", marks=requires_msgpack)]
+    )
+    def test_round_trip_restores_schema_uuids(self, wire_format):
+        """Test that UUID fields come back as UUIDs."""
+        codec = TaskOperationCodec(wire_format)
+        envelope = _run_envelope()
+
+        decoded = codec.decode(codec.encode(envelope))
+
+        assert decoded == envelope
+
+    def test_json_leaves_text_untouched(self):
+        """Test that UUID-looking text outside schema fields stays a string."""
+        codec = TaskOperationCodec("json")
+        envelope = _run_envelope()
+
+        decoded = codec.decode(codec.encode(envelope))
+
+        message = decoded["params"]["message"]
+        assert isinstance(message["parts"][0]["text"], str)
+        assert isinstance(message["metadata"]["ref"], str)
+
+    def test_json_keeps_invalid_uuid_strings(self):
+        """Test that non-UUID ids are passed through rather than rejected."""
+        codec = TaskOperationCodec("json")
+
+        decoded = codec.decode(
+            json.dumps({"operation": "cancel", "params": {"task_id": "task-1"}})
+        )
+
+        assert decoded["params"]["task_id"] == "task-1"
+
+    @requires_msgpack
+    def test_msgpack_is_more_compact(self):
+        """Test that the binary format is smaller than JSON."""
+        envelope = _run_envelope()
+
+        json_size = len(TaskOperationCodec("json").encode(envelope))
+        msgpack_size = len(TaskOperationCodec("msgpack").encode(envelope))
+
+        assert msgpack_size < json_size
+
+    def test_invalid_payload_raises_value_error(self):
+        """Test that undecodable payloads raise ValueError."""
+        with pytest.raises(ValueError):
+            TaskOperationCodec("json").decode(b"not json")
+
+    def test_unknown_wire_format(self):
+        """Test that unknown wire formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown wire format"):
+            TaskOperationCodec("xml")  # type: ignore[arg-type]
+
+
+class TestRedisSchedulerWireFormat:
+    """Test RedisScheduler integration with the codec."""
+
+    @requires_msgpack
+    def test_msgpack_round_trip(self):
+        """Test that RedisScheduler round-trips operations in msgpack."""
+        scheduler = RedisScheduler(
+            redis_url="redis://localhost:6379/0", wire_format="msgpack"
+        )
+        envelope = _run_envelope()
+        task_op = {
+            "operation": "run",
+            "params": envelope["params"],
+            "_current_span": None,
+        }
+
+        payload = scheduler._serialize_task_operation(task_op)
+        restored = scheduler._deserialize_task_operation(payload)
+
+        assert isinstance(payload, bytes)
+        assert restored["params"] == envelope["params"]
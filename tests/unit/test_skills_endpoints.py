@@ -1,5 +1,6 @@
 """Unit tests for skills endpoints."""
 
+import gzip
 import json
 from types import SimpleNamespace
 from typing import cast
@@ -382,3 +383,77 @@ async def test_skill_documentation_endpoint_with_x402_header():
 
     assert response.status_code == 200
     assert response.headers.get("X-A2A-Extensions") == app_settings.x402.extension_uri
+
+
+@pytest.mark.asyncio
+async def test_skills_list_endpoint_etag_not_modified():
+    """Test that a matching If-None-Match is answered with 304."""
+    app = _make_app_with_skills([{"id": "skill-1", "name": "Test Skill 1"}])
+
+    response = await skills_list_endpoint(
+        cast(BinduApplication, app),
+        _make_request(path="/agent/skills"),  # type: ignore
+    )
+    etag = response.headers["ETag"]
+    assert etag.startswith('"')
+    assert "max-age" in response.headers["Cache-Control"]
+
+    response = await skills_list_endpoint(
+        cast(BinduApplication, app),
+        _make_request(path="/agent/skills", headers={"if-none-match": etag}),  # type: ignore
+    )
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_skills_payloads_rebuilt_on_manifest_change():
+    """Test that replacing the manifest invalidates the cached payloads."""
+    app = _make_app_with_skills([{"id": "skill-1", "name": "Test Skill 1"}])
+    request = _make_request(path="/agent/skills")
+
+    first = await skills_list_endpoint(cast(BinduApplication, app), request)  # type: ignore
+    app.manifest = SimpleNamespace(skills=[{"id": "skill-2", "name": "Other"}])  # type: ignore
+    second = await skills_list_endpoint(cast(BinduApplication, app), request)  # type: ignore
+
+    assert first.headers["ETag"] != second.headers["ETag"]
+    assert json.loads(second.body)["skills"][0]["id"] == "skill-2"
+
+
+@pytest.mark.asyncio
+async def test_skill_documentation_endpoint_gzip_variant():
+    """Test that large payloads are served pre-compressed when accepted."""
+    documentation = "name: big-skill\n" + "description: lots of text\n" * 50
+    app = _make_app_with_skills(
+        [
+            {
+                "id": "big-skill",
+                "name": "Big Skill",
+                "documentation_content": documentation,
+            }
+        ]
+    )
+
+    response = await skill_documentation_endpoint(
+        cast(BinduApplication, app),
+        _make_request(
+            path="/agent/skills/big-skill/documentation",
+            headers={"accept-encoding": "gzip, deflate"},
+        ),  # type: ignore
+    )
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"].endswith('-gzip"')
+    assert gzip.decompress(response.body).decode() == documentation
+
+    identity = await skill_documentation_endpoint(
+        cast(BinduApplication, app),
+        _make_request(
+            path="/agent/skills/big-skill/documentation",
+            headers={"accept-encoding": "gzip;q=0"},
+        ),  # type: ignore
+    )
+    assert "Content-Encoding" not in identity.headers
+    assert identity.body.decode() == documentation
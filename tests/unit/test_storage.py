@@ -197,6 +197,23 @@ class TestContextStorage:
         contexts = await storage.list_contexts()
         assert len(contexts) == 3
 
+    @pytest.mark.asyncio
+    async def test_list_contexts_page(self, storage: InMemoryStorage):
+        """Test that contexts are paged newest first regardless of use."""
+        ctx_ids = [uuid4() for _ in range(3)]
+        for ctx_id in ctx_ids:
+            await storage.submit_task(ctx_id, create_test_message(context_id=ctx_id))
+        # Using the oldest context must not move it in the listing
+        await storage.list_tasks_by_context(ctx_ids[0])
+
+        first = await storage.list_contexts_page(2)
+        rest = await storage.list_contexts_page(2, first["next_cursor"])
+
+        assert [c["context_id"] for c in first["contexts"]] == ctx_ids[:0:-1]
+        assert [c["context_id"] for c in rest["contexts"]] == [ctx_ids[0]]
+        assert first["contexts"][0]["task_count"] == 1
+        assert rest["next_cursor"] is None
+
     @pytest.mark.asyncio
     async def test_clear_context(self, storage: InMemoryStorage):
         """Test clearing a context."""
@@ -384,3 +401,325 @@ class TestDataIntegrity:
         loaded_task = await storage.load_task(task_id)
         # Check if metadata exists and has the custom field
         assert loaded_task is not None
+
+
+class TestCopyOnWriteSnapshots:
+    """Test that reads share stored records instead of deep-copying them."""
+
+    @pytest.mark.asyncio
+    async def test_history_length_slices_shared_messages(
+        self, storage: InMemoryStorage
+    ):
+        """Test that limited reads return the last messages without copying them."""
+        message = create_test_message(text="first")
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(
+            task["id"],
+            "working",
+            new_messages=[create_test_message(text=f"m{i}") for i in range(3)],
+        )
+
+        full = await storage.load_task(task["id"])
+        last_two = await storage.load_task(task["id"], history_length=2)
+
+        assert [m["parts"][0]["text"] for m in last_two["history"]] == ["m1", "m2"]
+        assert last_two["history"][0] is full["history"][2]
+
+    @pytest.mark.asyncio
+    async def test_load_without_history_and_artifacts(self, storage: InMemoryStorage):
+        """Test that state-only loads skip history and artifacts."""
+        message = create_test_message(text="first")
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(
+            task["id"],
+            "working",
+            new_artifacts=[{"artifact_id": uuid4(), "parts": []}],
+        )
+
+        state_only = await storage.load_task(
+            task["id"], include_history=False, include_artifacts=False
+        )
+
+        assert state_only["status"]["state"] == "working"
+        assert state_only["history"] == []
+        assert state_only["artifacts"] == []
+        assert len((await storage.load_task(task["id"]))["artifacts"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_do_not_reach_earlier_snapshots(
+        self, storage: InMemoryStorage
+    ):
+        """Test that updates and caller-side changes leave snapshots intact."""
+        message = create_test_message(text="first")
+        task = await storage.submit_task(message["context_id"], message)
+        message["parts"][0]["text"] = "changed by caller"
+
+        before = await storage.load_task(task["id"])
+        await storage.update_task(
+            task["id"],
+            "completed",
+            new_messages=[create_test_message(text="answer")],
+            metadata={"done": True},
+        )
+
+        assert before["history"][0]["parts"][0]["text"] == "first"
+        assert len(before["history"]) == 1
+        assert before["status"]["state"] == "submitted"
+        assert "metadata" not in before
+
+
+class TestTaskIndexes:
+    """Test the state and recency indexes of InMemoryStorage."""
+
+    @pytest.mark.asyncio
+    async def test_state_counts_follow_transitions(self, storage: InMemoryStorage):
+        """Test that counts move with state changes and context clearing."""
+        tasks = []
+        for _ in range(3):
+            message = create_test_message()
+            tasks.append(await storage.submit_task(message["context_id"], message))
+        await storage.update_task(tasks[0]["id"], "working")
+        await storage.update_task(tasks[1]["id"], "completed")
+
+        assert await storage.count_tasks() == 3
+        assert await storage.count_tasks("submitted") == 1
+        assert await storage.count_tasks("working") == 1
+        assert await storage.count_tasks("completed") == 1
+
+        await storage.clear_context(tasks[0]["context_id"])
+
+        assert await storage.count_tasks("working") == 0
+        assert await storage.count_tasks() == 2
+
+    @pytest.mark.asyncio
+    async def test_list_most_recent(self, storage: InMemoryStorage):
+        """Test that a limited listing returns the latest tasks in order."""
+        ids = []
+        for _ in range(5):
+            message = create_test_message()
+            ids.append(
+                (await storage.submit_task(message["context_id"], message))["id"]
+            )
+
+        recent = await storage.list_tasks(2)
+
+        assert [t["id"] for t in recent] == ids[-2:]
+        assert len(await storage.list_tasks(10)) == 5
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_page_keyset(self, storage: InMemoryStorage):
+        """Test that pages follow the cursor newest first without history."""
+        ids = []
+        for _ in range(5):
+            message = create_test_message()
+            ids.append(
+                (await storage.submit_task(message["context_id"], message))["id"]
+            )
+        await storage.update_task(ids[1], "completed")
+
+        first = await storage.list_tasks_page(2)
+        second = await storage.list_tasks_page(2, first["next_cursor"])
+        last = await storage.list_tasks_page(2, second["next_cursor"])
+
+        assert [t["id"] for t in first["tasks"]] == [ids[4], ids[3]]
+        assert [t["id"] for t in second["tasks"]] == [ids[2], ids[1]]
+        assert [t["id"] for t in last["tasks"]] == [ids[0]]
+        assert last["next_cursor"] is None
+        assert first["tasks"][0]["history"] == []
+
+        completed = await storage.list_tasks_page(10, state="completed")
+        assert [t["id"] for t in completed["tasks"]] == [ids[1]]
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_page_filters(self, storage: InMemoryStorage):
+        """Test context and time range filters and history projection."""
+        message = create_test_message()
+        context_id = message["context_id"]
+        first = await storage.submit_task(context_id, message)
+        other = create_test_message()
+        await storage.submit_task(other["context_id"], other)
+        second_message = create_test_message(context_id=context_id)
+        second = await storage.submit_task(context_id, second_message)
+        record = storage.tasks[second["id"]]
+
+        page = await storage.list_tasks_page(
+            context_id=context_id, include_history=True
+        )
+        assert [t["id"] for t in page["tasks"]] == [second["id"], first["id"]]
+        assert len(page["tasks"][0]["history"]) == 1
+
+        recent = await storage.list_tasks_page(created_after=record.created_at)
+        assert [t["id"] for t in recent["tasks"]] == [second["id"]]
+        older = await storage.list_tasks_page(
+            context_id=context_id, created_before=record.created_at
+        )
+        assert [t["id"] for t in older["tasks"]] == [first["id"]]
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_page_indexes_follow_changes(
+        self, storage: InMemoryStorage
+    ):
+        """Test that the sorted page indexes track state changes and removals."""
+        tasks = []
+        for _ in range(4):
+            message = create_test_message()
+            tasks.append(await storage.submit_task(message["context_id"], message))
+        for task in tasks[:3]:
+            await storage.update_task(task["id"], "completed")
+        await storage.clear_context(tasks[1]["context_id"])
+
+        completed = await storage.list_tasks_page(1, state="completed")
+        rest = await storage.list_tasks_page(
+            10, completed["next_cursor"], state="completed"
+        )
+        assert [t["id"] for t in completed["tasks"]] == [tasks[2]["id"]]
+        assert [t["id"] for t in rest["tasks"]] == [tasks[0]["id"]]
+        assert await storage.count_tasks("submitted") == 1
+
+        everything = await storage.list_tasks_page()
+        assert [t["id"] for t in everything["tasks"]] == [
+            tasks[3]["id"],
+            tasks[2]["id"],
+            tasks[0]["id"],
+        ]
+        contexts = await storage.list_contexts_page()
+        assert tasks[1]["context_id"] not in [
+            c["context_id"] for c in contexts["contexts"]
+        ]
+        assert len(contexts["contexts"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_page_rejects_bad_cursor(self, storage: InMemoryStorage):
+        """Test that a malformed cursor raises ValueError."""
+        with pytest.raises(ValueError):
+            await storage.list_tasks_page(2, "not-a-cursor")
+
+
+class TestRetention:
+    """Test eviction, TTL expiry and the spill tier of InMemoryStorage."""
+
+    async def _finished_task(self, storage: InMemoryStorage, state="completed"):
+        message = create_test_message()
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(task["id"], state)
+        return task
+
+    @pytest.mark.asyncio
+    async def test_lru_idle_contexts_evicted_over_cap(self):
+        """Test that the least recently used idle context goes first."""
+        storage = InMemoryStorage(max_contexts=2)
+        first = await self._finished_task(storage)
+        second = await self._finished_task(storage)
+        await storage.load_task(first["id"])  # first is now most recently used
+
+        await self._finished_task(storage)
+
+        assert await storage.load_task(second["id"]) is None
+        assert await storage.load_task(first["id"]) is not None
+        assert storage.get_memory_stats()["evicted_tasks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_running_contexts_are_not_evicted(self):
+        """Test that contexts with unfinished tasks stay over the cap."""
+        storage = InMemoryStorage(max_tasks=1)
+        running = await self._finished_task(storage, state="working")
+
+        await self._finished_task(storage)
+
+        assert await storage.load_task(running["id"]) is not None
+        assert await storage.count_tasks() == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_contexts_follow_task_states(self):
+        """Test that the eviction candidates track tasks ending and resuming."""
+        storage = InMemoryStorage(max_contexts=2)
+        done = await self._finished_task(storage)
+        running = await self._finished_task(storage, state="working")
+        assert list(storage._idle_contexts) == [done["context_id"]]
+
+        await storage.update_task(done["id"], "working")
+        await storage.update_task(running["id"], "completed")
+        assert list(storage._idle_contexts) == [running["context_id"]]
+
+        await self._finished_task(storage)
+
+        assert await storage.load_task(running["id"]) is None
+        assert await storage.load_task(done["id"]) is not None
+        assert running["context_id"] not in storage._running_counts
+
+    @pytest.mark.asyncio
+    async def test_terminal_tasks_expire(self):
+        """Test that ended tasks are dropped after the TTL."""
+        storage = InMemoryStorage(terminal_task_ttl=0)
+        done = await self._finished_task(storage, state="failed")
+
+        message = create_test_message()
+        await storage.submit_task(message["context_id"], message)
+
+        assert await storage.load_task(done["id"]) is None
+        assert done["context_id"] not in storage.contexts
+        stats = storage.get_memory_stats()
+        assert stats["expired_tasks"] == 1
+        assert stats["tasks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicted_tasks_readable_from_spill(self):
+        """Test that spilled tasks are served and precede live ones in context."""
+        storage = InMemoryStorage(max_contexts=1, spill_path=":memory:")
+        spilled = await self._finished_task(storage)
+        await self._finished_task(storage)
+
+        loaded = await storage.load_task(spilled["id"])
+        assert loaded["id"] == spilled["id"]
+        assert loaded["status"]["state"] == "completed"
+        assert loaded["history"][0]["task_id"] == spilled["id"]
+        assert storage.get_memory_stats()["spilled_tasks"] == 1
+
+        message = create_test_message(context_id=spilled["context_id"])
+        await storage.submit_task(spilled["context_id"], message)
+        context_tasks = await storage.list_tasks_by_context(spilled["context_id"])
+
+        assert [t["id"] for t in context_tasks] == [spilled["id"], message["task_id"]]
+        storage.close()
+
+    @pytest.mark.asyncio
+    async def test_spill_writes_off_the_event_loop(self, tmp_path):
+        """Test that spill I/O runs on the spill thread, in WAL mode."""
+        import threading
+
+        storage = InMemoryStorage(max_contexts=1, spill_path=str(tmp_path / "spill.db"))
+        spill = storage._spill
+        threads = []
+        write = spill._put_many
+
+        def _put_many(tasks, now):
+            threads.append(threading.current_thread())
+            write(tasks, now)
+
+        spill._put_many = _put_many
+        spilled = await self._finished_task(storage)
+        await self._finished_task(storage)
+
+        assert await storage.load_task(spilled["id"]) is not None
+        assert threads and threads[0] is not threading.current_thread()
+        assert (
+            spill._run(
+                lambda: spill._db.execute("PRAGMA journal_mode").fetchone()[0]
+            ).result()
+            == "wal"
+        )
+
+        await storage.clear_context(spilled["context_id"])
+        assert await storage.load_task(spilled["id"]) is None
+        storage.close()
+
+    @pytest.mark.asyncio
+    async def test_payload_bytes_follow_stored_content(self):
+        """Test that the payload gauge grows with content and drops on eviction."""
+        storage = InMemoryStorage(max_contexts=1)
+        await self._finished_task(storage)
+        assert storage.get_memory_stats()["payload_bytes"] > 0
+
+        await storage.clear_all()
+
+        assert storage.get_memory_stats()["payload_bytes"] == 0
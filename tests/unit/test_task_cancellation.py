@@ -0,0 +1,239 @@
+"""Unit tests for interrupting in-flight task execution on cancellation."""
+
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import anyio
+import pytest
+
+from bindu.common.models import AgentManifest
+from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.scheduler.redis_scheduler import RedisScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.workers.manifest_worker import ManifestWorker
+from tests.mocks import MockManifest
+from tests.utils import (
+    assert_task_state,
+    create_test_message,
+    submit_and_schedule,
+    wait_for_state,
+)
+
+
+class SlowManifest(MockManifest):
+    """Manifest whose agent blocks until released by the test."""
+
+    def __init__(self):
+        """Initialize with release/started events."""
+        super().__init__()
+        self.started = anyio.Event()
+        self.release = anyio.Event()
+        self.finished = False
+
+    async def run(self, message_history: list):
+        """Async generator agent that waits for release."""
+        self.started.set()
+        await self.release.wait()
+        self.finished = True
+        yield "Slow result"
+
+
+class TestInFlightCancellation:
+    """Test cancellation of tasks executing on a worker."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_interrupts_running_agent(self, storage: InMemoryStorage):
+        """Test that a running agent is interrupted and the task stays canceled."""
+        async with InMemoryScheduler() as scheduler:
+            manifest = SlowManifest()
+            worker = ManifestWorker(
+                scheduler=scheduler,
+                storage=storage,
+                manifest=cast(AgentManifest, manifest),
+            )
+
+            async with worker.run():
+                task = await submit_and_schedule(storage, scheduler, "Take your time")
+                with anyio.fail_after(1):
+                    await manifest.started.wait()
+
+                # Single slot is busy: the broadcast reaches the worker anyway
+                await scheduler.cancel_task(TaskIdParams(task_id=task["id"]))
+                await wait_for_state(storage, task["id"], "canceled")
+                assert worker.in_flight_count == 0
+
+                manifest.release.set()
+                await anyio.sleep(0.05)
+
+        assert not manifest.finished
+        assert_task_state(await storage.load_task(task["id"]), "canceled")
+
+    @pytest.mark.asyncio
+    async def test_cancel_after_completion_is_ignored(
+        self, storage: InMemoryStorage, scheduler: InMemoryScheduler
+    ):
+        """Test that a late cancel does not overwrite a terminal state."""
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, MockManifest()),
+        )
+        message = create_test_message()
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(task["id"], state="completed")
+
+        await worker.cancel_task(TaskIdParams(task_id=task["id"]))
+
+        assert_task_state(await storage.load_task(task["id"]), "completed")
+
+    @pytest.mark.asyncio
+    async def test_canceled_task_is_not_executed(
+        self, storage: InMemoryStorage, scheduler: InMemoryScheduler
+    ):
+        """Test that a task canceled while queued is skipped."""
+        manifest = SlowManifest()
+        manifest.release.set()
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, manifest),
+        )
+        message = create_test_message()
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(task["id"], state="canceled")
+
+        await worker.run_task(
+            cast(
+                TaskSendParams,
+                {
+                    "task_id": task["id"],
+                    "context_id": task["context_id"],
+                    "message": message,
+                },
+            )
+        )
+
+        assert not manifest.started.is_set()
+        assert_task_state(await storage.load_task(task["id"]), "canceled")
+
+    @pytest.mark.asyncio
+    async def test_result_discarded_when_canceled_during_execution(
+        self, storage: InMemoryStorage, scheduler: InMemoryScheduler
+    ):
+        """Test that a cancellation racing with completion wins."""
+        message = create_test_message()
+        task = await storage.submit_task(message["context_id"], message)
+
+        class RacingManifest(MockManifest):
+            async def run(self, message_history: list):
+                # Simulates the cancel being recorded by another node
+                await storage.update_task(task["id"], state="canceled")
+                yield "Too late"
+
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, RacingManifest()),
+        )
+
+        await worker.run_task(
+            cast(
+                TaskSendParams,
+                {
+                    "task_id": task["id"],
+                    "context_id": task["context_id"],
+                    "message": message,
+                },
+            )
+        )
+
+        loaded = await storage.load_task(task["id"])
+        assert_task_state(loaded, "canceled")
+        assert not loaded.get("artifacts")
+
+    @pytest.mark.asyncio
+    async def test_interrupt_task_unknown_id(
+        self, storage: InMemoryStorage, scheduler: InMemoryScheduler
+    ):
+        """Test that interrupting a task not running here is a no-op."""
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, MockManifest()),
+        )
+
+        assert worker.interrupt_task(uuid4()) is False
+
+
+class TestCancellationBroadcast:
+    """Test scheduler-level cancellation broadcast."""
+
+    @pytest.mark.asyncio
+    async def test_memory_scheduler_notifies_listeners(self):
+        """Test that every listener receives the canceled task id."""
+        task_id = uuid4()
+        async with InMemoryScheduler() as scheduler:
+            received = []
+
+            async def listen() -> None:
+                async for interrupt in scheduler.receive_interrupts():
+                    received.append(interrupt)
+                    return
+
+            async def drain_operations() -> None:
+                async for _ in scheduler.receive_task_operations():
+                    return
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(listen)
+                tg.start_soon(listen)
+                tg.start_soon(drain_operations)
+                await anyio.sleep(0.01)
+                await scheduler.cancel_task(TaskIdParams(task_id=task_id))
+
+            assert received == [("cancel", task_id), ("cancel", task_id)]
+            assert not scheduler._interrupt_listeners
+
+    @pytest.mark.asyncio
+    async def test_redis_cancel_publishes(self):
+        """Test that cancel_task publishes on the cancel channel."""
+        scheduler = RedisScheduler(redis_url="redis://localhost:6379/0")
+        client = AsyncMock()
+        scheduler._redis_client = client
+        task_id = uuid4()
+
+        await scheduler.cancel_task(TaskIdParams(task_id=task_id))
+
+        client.rpush.assert_awaited_once()
+        client.publish.assert_awaited_once_with(
+            "bindu:tasks:interrupts", f"cancel:{task_id}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_redis_receive_interrupts(self):
+        """Test that pub/sub messages are parsed into (kind, task_id)."""
+        task_id = uuid4()
+
+        async def listen():
+            yield {"type": "message", "data": b"cancel:not-a-uuid"}
+            yield {"type": "message", "data": f"cancel:{task_id}".encode()}
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        pubsub.listen = listen
+
+        client = MagicMock()
+        client.pubsub.return_value = pubsub
+        scheduler = RedisScheduler(redis_url="redis://localhost:6379/0")
+        scheduler._redis_client = client
+
+        interrupts = scheduler.receive_interrupts()
+        received = await anext(interrupts)
+        await interrupts.aclose()
+
+        assert received == ("cancel", task_id)
+        pubsub.subscribe.assert_awaited_once_with("bindu:tasks:interrupts")
+        pubsub.aclose.assert_awaited_once()
@@ -8,6 +8,7 @@ from bindu.common.protocol.types import (
     CancelTaskRequest,
     ClearContextsRequest,
     GetTaskRequest,
+    GetTasksRequest,
     ListContextsRequest,
     ListTasksRequest,
     TaskFeedbackRequest,
@@ -15,6 +16,7 @@ from bindu.common.protocol.types import (
 from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
 from bindu.server.storage.memory_storage import InMemoryStorage
 from bindu.server.task_manager import TaskManager
+from bindu.settings import app_settings
 from tests.utils import (
     assert_jsonrpc_error,
     assert_jsonrpc_success,
@@ -112,6 +114,52 @@ async def test_get_task_with_history_limit():
                 assert len(retrieved_task["history"]) <= 5
 
 
+@pytest.mark.asyncio
+async def test_get_many_tasks(monkeypatch):
+    """Test retrieving several tasks in request order with a history limit."""
+    storage = InMemoryStorage()
+    async with InMemoryScheduler() as scheduler:
+        async with TaskManager(
+            scheduler=scheduler, storage=storage, manifest=None
+        ) as tm:
+            task_ids = []
+            for i in range(3):
+                message = create_test_message(text=f"Message {i}")
+                task = await storage.submit_task(message["context_id"], message)
+                await storage.update_task(
+                    task["id"],
+                    state="working",
+                    new_messages=[create_test_message(text="reply")],
+                )
+                task_ids.append(task["id"])
+
+            request: GetTasksRequest = {
+                "jsonrpc": "2.0",
+                "id": uuid4(),
+                "method": "tasks/getMany",
+                "params": {
+                    "task_ids": [task_ids[2], uuid4(), task_ids[0], task_ids[2]],
+                    "history_length": 1,
+                },
+            }
+            response = await tm.get_tasks(request)
+
+            assert_jsonrpc_success(response)
+            tasks = response["result"]
+            assert [task["id"] for task in tasks] == [task_ids[2], task_ids[0]]
+            assert all(len(task["history"]) == 1 for task in tasks)
+
+            request["params"]["history_lengths"] = {task_ids[0]: 2}
+            response = await tm.get_tasks(request)
+            tasks = response["result"]
+            assert [len(task["history"]) for task in tasks] == [1, 2]
+
+            monkeypatch.setattr(app_settings.agent, "get_many_max_tasks", 2)
+            request["params"]["task_ids"] = task_ids
+            response = await tm.get_tasks(request)
+            assert_jsonrpc_error(response, -32001)
+
+
 @pytest.mark.asyncio
 async def test_list_empty_tasks():
     """Test listing tasks when none exist."""
@@ -159,6 +207,38 @@ async def test_list_multiple_tasks():
             assert len(task_list) == 5
 
 
+@pytest.mark.asyncio
+async def test_list_tasks_paged():
+    """Test paging through tasks with a cursor."""
+    storage = InMemoryStorage()
+    async with InMemoryScheduler() as scheduler:
+        async with TaskManager(
+            scheduler=scheduler, storage=storage, manifest=None
+        ) as tm:
+            for i in range(3):
+                message = create_test_message(text=f"Message {i}")
+                await storage.submit_task(message["context_id"], message)
+
+            request: ListTasksRequest = {
+                "jsonrpc": "2.0",
+                "id": uuid4(),
+                "method": "tasks/list",
+                "params": {"page_size": 2},
+            }
+            first = (await tm.list_tasks(request))["result"]
+            request["params"]["cursor"] = first["next_cursor"]
+            second = (await tm.list_tasks(request))["result"]
+
+            assert len(first["tasks"]) == 2
+            assert all(task["history"] == [] for task in first["tasks"])
+            assert len(second["tasks"]) == 1
+            assert second["next_cursor"] is None
+
+            request["params"]["cursor"] = "garbage"
+            response = await tm.list_tasks(request)
+            assert_jsonrpc_error(response, -32001)
+
+
 @pytest.mark.asyncio
 async def test_cancel_nonexistent_task():
     """Test canceling a task that doesn't exist."""
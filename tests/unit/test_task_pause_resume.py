@@ -0,0 +1,247 @@
+"""Unit tests for pausing and resuming tasks with checkpointed execution state."""
+
+import asyncio
+from typing import cast
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import anyio
+import pytest
+
+from bindu.common.models import AgentManifest
+from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.scheduler.redis_scheduler import RedisScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.workers.helpers import ResultProcessor
+from bindu.server.workers.manifest_worker import CHECKPOINT_METADATA_KEY, ManifestWorker
+from tests.mocks import MockManifest
+from tests.utils import (
+    assert_task_state,
+    create_test_message,
+    submit_and_schedule,
+    wait_for_state,
+)
+
+
+class StreamingManifest(MockManifest):
+    """Generator agent that streams in two steps and can continue a turn."""
+
+    def __init__(self):
+        """Initialize with a release event and call log."""
+        super().__init__()
+        self.release = anyio.Event()
+        self.calls: list[list[dict]] = []
+
+    async def run(self, message_history: list):
+        """Yield two chunks, or the rest of the answer when continuing."""
+        self.calls.append(message_history)
+        if message_history and message_history[-1]["role"] == "assistant":
+            yield "Hello, world!"
+            return
+        yield "Hello"
+        await self.release.wait()
+        yield ", "
+        await anyio.sleep_forever()
+
+
+class TestPauseResume:
+    """Test suspending running tasks and resuming them from a checkpoint."""
+
+    @pytest.mark.asyncio
+    async def test_pause_checkpoints_and_resume_continues(
+        self, storage: InMemoryStorage
+    ):
+        """Test pause at a chunk boundary, then resume from the checkpoint."""
+        async with InMemoryScheduler() as scheduler:
+            manifest = StreamingManifest()
+            worker = ManifestWorker(
+                scheduler=scheduler,
+                storage=storage,
+                manifest=cast(AgentManifest, manifest),
+            )
+
+            async with worker.run(), anyio.create_task_group() as tg:
+                task = await submit_and_schedule(storage, scheduler, "Say hello")
+                await wait_for_state(storage, task["id"], "working")
+
+                # The only slot is busy, so the queued op waits; the broadcast doesn't
+                tg.start_soon(scheduler.pause_task, TaskIdParams(task_id=task["id"]))
+                await anyio.sleep(0.01)
+                manifest.release.set()
+                await wait_for_state(storage, task["id"], "suspended")
+                assert worker.in_flight_count == 0
+
+                suspended = await storage.load_task(task["id"])
+                checkpoint = suspended["metadata"][CHECKPOINT_METADATA_KEY]
+                assert checkpoint["partial_output"] == ["Hello", ", "]
+                assert checkpoint["message_history"][-1]["content"] == "Say hello"
+                assert all(m["role"] != "system" for m in checkpoint["message_history"])
+
+                await scheduler.resume_task(TaskIdParams(task_id=task["id"]))
+                await wait_for_state(storage, task["id"], "completed")
+
+        resumed_input = manifest.calls[-1]
+        assert resumed_input[-1] == {"role": "assistant", "content": "Hello, "}
+
+        completed = await storage.load_task(task["id"])
+        assert completed["metadata"][CHECKPOINT_METADATA_KEY] is None
+        assert completed["artifacts"][0]["parts"][0]["text"] == "Hello, world!"
+
+    @pytest.mark.asyncio
+    async def test_pause_before_start_skips_queued_run(
+        self, storage: InMemoryStorage, scheduler: InMemoryScheduler
+    ):
+        """Test that a queued task is suspended and only runs on resume."""
+        manifest = StreamingManifest()
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, manifest),
+        )
+        message = create_test_message()
+        task = await storage.submit_task(message["context_id"], message)
+
+        await worker._handle_pause(TaskIdParams(task_id=task["id"]))
+        assert_task_state(await storage.load_task(task["id"]), "suspended")
+
+        await worker.run_task(
+            cast(
+                TaskSendParams,
+                {
+                    "task_id": task["id"],
+                    "context_id": task["context_id"],
+                    "message": message,
+                },
+            )
+        )
+        assert manifest.calls == []
+        assert_task_state(await storage.load_task(task["id"]), "suspended")
+
+    @pytest.mark.asyncio
+    async def test_resume_ignores_tasks_not_suspended(
+        self, storage: InMemoryStorage, scheduler: InMemoryScheduler
+    ):
+        """Test that resume is a no-op unless the task is suspended."""
+        manifest = StreamingManifest()
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, manifest),
+        )
+        message = create_test_message()
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(task["id"], state="completed")
+
+        await worker._handle_resume(TaskIdParams(task_id=task["id"]))
+
+        assert manifest.calls == []
+        assert_task_state(await storage.load_task(task["id"]), "completed")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_resumes_run_task_once(
+        self, storage: InMemoryStorage, scheduler: InMemoryScheduler
+    ):
+        """Test that only one of two racing resumes claims the suspended task."""
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, MockManifest()),
+        )
+        worker.run_task = AsyncMock()
+        message = create_test_message()
+        task = await storage.submit_task(message["context_id"], message)
+        await storage.update_task(task["id"], state="suspended")
+
+        params = TaskIdParams(task_id=task["id"])
+        await asyncio.gather(
+            worker._handle_resume(params), worker._handle_resume(params)
+        )
+
+        worker.run_task.assert_awaited_once()
+        assert (
+            worker.run_task.await_args.args[0]["message"]["message_id"]
+            == (message["message_id"])
+        )
+        assert_task_state(await storage.load_task(task["id"]), "resumed")
+
+    def test_request_pause_requires_in_flight_task(
+        self, storage: InMemoryStorage, scheduler: InMemoryScheduler
+    ):
+        """Test that pause requests are only recorded for local executions."""
+        worker = ManifestWorker(
+            scheduler=scheduler,
+            storage=storage,
+            manifest=cast(AgentManifest, MockManifest()),
+        )
+        task_id = uuid4()
+
+        assert worker.request_pause(task_id) is False
+        assert not worker.pause_requested(task_id)
+
+
+class TestCollectChunks:
+    """Test checkpoint-aware result collection."""
+
+    @pytest.mark.asyncio
+    async def test_stops_and_closes_generator(self):
+        """Test that collection stops after the requested chunk."""
+        closed = []
+
+        def agent():
+            try:
+                yield "a"
+                yield "b"
+                yield "c"
+            finally:
+                closed.append(True)
+
+        seen = []
+
+        def should_stop() -> bool:
+            seen.append(True)
+            return len(seen) == 2
+
+        chunks, stopped = await ResultProcessor.collect_chunks(agent(), should_stop)
+
+        assert chunks == ["a", "b"]
+        assert stopped is True
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_direct_value_is_not_interruptible(self):
+        """Test that plain return values are collected as a single chunk."""
+        chunks, stopped = await ResultProcessor.collect_chunks("done", lambda: True)
+
+        assert chunks == ["done"]
+        assert stopped is False
+
+
+class TestPauseBroadcast:
+    """Test scheduler broadcast of pause requests."""
+
+    @pytest.mark.asyncio
+    async def test_redis_pause_publishes(self):
+        """Test that pause_task queues the operation and broadcasts it."""
+        scheduler = RedisScheduler(redis_url="redis://localhost:6379/0")
+        client = AsyncMock()
+        scheduler._redis_client = client
+        task_id = uuid4()
+
+        await scheduler.pause_task(TaskIdParams(task_id=task_id))
+
+        client.rpush.assert_awaited_once()
+        client.publish.assert_awaited_once_with(
+            "bindu:tasks:interrupts", f"pause:{task_id}"
+        )
+
+    def test_redis_parse_interrupt(self):
+        """Test parsing of broadcast payloads."""
+        task_id = uuid4()
+
+        assert RedisScheduler._parse_interrupt(f"pause:{task_id}") == (
+            "pause",
+            task_id,
+        )
+        assert RedisScheduler._parse_interrupt(f"stop:{task_id}") is None
+        assert RedisScheduler._parse_interrupt(b"pause:nope") is None
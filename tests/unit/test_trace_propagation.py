@@ -0,0 +1,148 @@
+"""Unit tests for trace context propagation through scheduler payloads."""
+
+import time
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import anyio
+import pytest
+
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.scheduler.redis_scheduler import RedisScheduler
+from bindu.server.scheduler.trace_context import (
+    format_traceparent,
+    parse_traceparent,
+    span_from_traceparent,
+)
+from bindu.server.workers.base import Worker
+
+TRACE_ID = 0x4BF92F3577B34DA6A3CE929D0E0E4736
+SPAN_ID = 0x00F067AA0BA902B7
+TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+def _span(trace_id=TRACE_ID, span_id=SPAN_ID, flags=1):
+    span = MagicMock()
+    span.get_span_context.return_value = MagicMock(
+        trace_id=trace_id, span_id=span_id, trace_flags=flags
+    )
+    return span
+
+
+class TestTraceparent:
+    """Test W3C traceparent formatting and parsing."""
+
+    def test_format(self):
+        """Test formatting a span context."""
+        assert format_traceparent(_span()) == TRACEPARENT
+
+    def test_format_invalid_context(self):
+        """Test that spans without a valid context produce no header."""
+        assert format_traceparent(_span(trace_id=0)) is None
+        assert format_traceparent(object()) is None
+
+    def test_parse(self):
+        """Test parsing a valid header."""
+        assert parse_traceparent(TRACEPARENT) == (TRACE_ID, SPAN_ID, 1)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            "",
+            "garbage",
+            "ff-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01",
+            "00-00000000000000000000000000000000-00f067aa0ba902b7-01",
+            "00-4bf92f3577b34da6a3ce929d0e0e4736-0000000000000000-01",
+            "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01-extra",
+        ],
+    )
+    def test_parse_invalid(self, value):
+        """Test that invalid headers are rejected."""
+        assert parse_traceparent(value) is None
+
+    def test_span_from_traceparent_is_remote_parent(self):
+        """Test that the rebuilt span carries the originating context."""
+        span = span_from_traceparent(TRACEPARENT)
+        context = span.get_span_context()
+
+        assert context.trace_id == TRACE_ID
+        assert context.span_id == SPAN_ID
+        assert context.is_remote is True
+
+
+class TestSchedulerPropagation:
+    """Test that schedulers carry trace context and enqueue time."""
+
+    def test_redis_round_trip_resumes_trace(self):
+        """Test that the worker-side span continues the producer's trace."""
+        scheduler = RedisScheduler(redis_url="redis://localhost:6379/0")
+        enqueued_at = time.time()
+        task_op = {
+            "operation": "cancel",
+            "params": {"task_id": uuid4()},
+            "_current_span": _span(),
+            "_enqueued_at": enqueued_at,
+        }
+
+        restored = scheduler._deserialize_task_operation(
+            scheduler._serialize_task_operation(task_op)
+        )
+
+        context = restored["_current_span"].get_span_context()
+        assert (context.trace_id, context.span_id) == (TRACE_ID, SPAN_ID)
+        assert restored["_enqueued_at"] == enqueued_at
+
+    @pytest.mark.asyncio
+    async def test_memory_scheduler_stamps_enqueue_time(self):
+        """Test that in-memory operations carry their enqueue time."""
+        async with InMemoryScheduler() as scheduler:
+            before = time.time()
+            operations = scheduler.receive_task_operations()
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(scheduler.cancel_task, {"task_id": uuid4()})
+                operation = await anext(operations)
+
+        assert before <= operation["_enqueued_at"] <= time.time()
+
+
+class TestQueueWait:
+    """Test queue wait measurement in the worker."""
+
+    def test_queue_wait_seconds(self):
+        """Test wait computation from the enqueue timestamp."""
+        wait = Worker._queue_wait_seconds({"_enqueued_at": time.time() - 2})
+        assert 2 <= wait < 3
+
+    def test_queue_wait_clamps_clock_skew(self):
+        """Test that enqueue times in the future do not yield negative waits."""
+        assert Worker._queue_wait_seconds({"_enqueued_at": time.time() + 5}) == 0.0
+
+    def test_queue_wait_missing(self):
+        """Test operations without an enqueue timestamp."""
+        assert Worker._queue_wait_seconds({}) is None
+
+    @pytest.mark.asyncio
+    async def test_handle_records_histogram(self):
+        """Test that the worker records queue wait when handling an operation."""
+        worker = MagicMock(spec=Worker)
+        worker._queue_wait_seconds = Worker._queue_wait_seconds
+
+        async def cancel(params):
+            return None
+
+        worker.cancel_task = cancel
+        operation = {
+            "operation": "cancel",
+            "params": {"task_id": uuid4()},
+            "_current_span": _span(),
+            "_enqueued_at": time.time() - 1,
+        }
+
+        with patch("bindu.server.workers.base.queue_wait_histogram") as histogram:
+            await Worker._handle_task_operation(worker, operation)
+
+        value, attributes = histogram.record.call_args.args
+        assert value >= 1
+        assert attributes == {"operation": "cancel"}
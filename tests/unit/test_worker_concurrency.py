@@ -0,0 +1,176 @@
+"""Unit tests for concurrent task execution in the base Worker loop."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+import anyio
+import pytest
+
+from bindu.common.protocol.types import TaskIdParams, TaskSendParams
+from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
+from bindu.server.storage.memory_storage import InMemoryStorage
+from bindu.server.workers.base import Worker
+from tests.utils import wait_for
+
+
+@dataclass
+class BlockingWorker(Worker):
+    """Worker whose run_task blocks until released by the test."""
+
+    release: anyio.Event = field(default_factory=anyio.Event)
+    started: list[UUID] = field(default_factory=list)
+    peak: int = 0
+
+    async def run_task(self, params: TaskSendParams) -> None:
+        """Record start and wait for release."""
+        self.started.append(params["task_id"])
+        self.peak = max(self.peak, self.in_flight_count)
+        await self.release.wait()
+
+    async def cancel_task(self, params: TaskIdParams) -> None:
+        """No-op cancel."""
+
+    def build_message_history(self, history: list[Any]) -> list[Any]:
+        """Return history unchanged."""
+        return history
+
+    def build_artifacts(self, result: Any) -> list[Any]:
+        """Return no artifacts."""
+        return []
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_tasks_concurrently(storage: InMemoryStorage):
+    """Test that up to max_concurrency run operations execute at once."""
+    async with InMemoryScheduler() as scheduler:
+        worker = BlockingWorker(scheduler=scheduler, storage=storage, max_concurrency=3)
+
+        async with worker.run():
+            for _ in range(3):
+                await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+
+            await wait_for(lambda: len(worker.started) == 3)
+            assert worker.peak == 3
+
+            worker.release.set()
+            await wait_for(lambda: worker.in_flight_count == 0)
+
+
+@pytest.mark.asyncio
+async def test_worker_stops_pulling_at_limit(storage: InMemoryStorage):
+    """Test backpressure: no operation is pulled while all slots are busy."""
+    async with InMemoryScheduler() as scheduler:
+        worker = BlockingWorker(scheduler=scheduler, storage=storage, max_concurrency=2)
+
+        async with worker.run():
+            await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+            await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+            await wait_for(lambda: len(worker.started) == 2)
+
+            # Third enqueue cannot be handed over while the worker is saturated
+            with anyio.move_on_after(0.1) as scope:
+                await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+            assert scope.cancelled_caught
+            assert len(worker.started) == 2
+
+            worker.release.set()
+            await wait_for(lambda: worker.in_flight_count == 0)
+
+
+@pytest.mark.asyncio
+async def test_worker_serial_by_default(storage: InMemoryStorage):
+    """Test that the default concurrency keeps execution serial."""
+    async with InMemoryScheduler() as scheduler:
+        worker = BlockingWorker(scheduler=scheduler, storage=storage)
+        assert worker.max_concurrency == 1
+
+        async with worker.run():
+            await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+            await wait_for(lambda: len(worker.started) == 1)
+            assert worker.peak == 1
+
+            worker.release.set()
+            await wait_for(lambda: worker.in_flight_count == 0)
+
+
+@pytest.mark.asyncio
+async def test_worker_acks_handled_operations(storage: InMemoryStorage):
+    """Test that each handled operation is acknowledged to the scheduler."""
+    async with InMemoryScheduler() as scheduler:
+        acked: list[str] = []
+
+        async def ack(task_operation):
+            acked.append(task_operation["operation"])
+
+        scheduler.ack_task_operation = ack  # type: ignore[method-assign]
+        worker = BlockingWorker(scheduler=scheduler, storage=storage)
+        worker.release.set()
+
+        async with worker.run():
+            await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+            await scheduler.cancel_task({"task_id": uuid4()})
+            await wait_for(lambda: len(acked) == 2)
+
+        assert acked == ["run", "cancel"]
+
+
+@pytest.mark.asyncio
+async def test_bounded_queue_accepts_while_saturated(storage: InMemoryStorage):
+    """Test that a buffered queue takes tasks without waiting for a free slot."""
+    async with InMemoryScheduler(max_queue_size=2) as scheduler:
+        worker = BlockingWorker(scheduler=scheduler, storage=storage)
+
+        async with worker.run():
+            await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+            await wait_for(lambda: len(worker.started) == 1)
+
+            # Worker is saturated, but enqueueing returns immediately
+            with anyio.fail_after(0.1):
+                await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+                await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+            assert await scheduler.get_queue_length() == 2
+            assert len(worker.started) == 1
+
+            worker.release.set()
+            await wait_for(lambda: len(worker.started) == 3)
+            await wait_for(lambda: worker.in_flight_count == 0)
+
+
+@pytest.mark.asyncio
+async def test_failing_error_handler_is_contained(storage: InMemoryStorage):
+    """Test that an operation whose failure handling raises spares the others."""
+
+    @dataclass
+    class FailingWorker(BlockingWorker):
+        async def run_task(self, params: TaskSendParams) -> None:
+            if params.get("fail"):
+                raise RuntimeError("agent crashed")
+            await super().run_task(params)
+
+    async with InMemoryScheduler() as scheduler:
+        acked: list[str] = []
+
+        async def ack(task_operation):
+            acked.append(task_operation["operation"])
+
+        scheduler.ack_task_operation = ack  # type: ignore[method-assign]
+        worker = FailingWorker(scheduler=scheduler, storage=storage, max_concurrency=2)
+
+        async def storage_down(*args, **kwargs):
+            raise RuntimeError("storage down")
+
+        storage.load_task = storage_down  # type: ignore[method-assign]
+
+        async with worker.run():
+            await scheduler.run_task({"task_id": uuid4(), "context_id": uuid4()})
+            await wait_for(lambda: len(worker.started) == 1)
+            await scheduler.run_task(
+                {"task_id": uuid4(), "context_id": uuid4(), "fail": True}  # type: ignore[typeddict-unknown-key]
+            )
+            await wait_for(lambda: len(acked) == 1)
+
+            # The blocked task is still running, and the worker keeps pulling
+            assert worker.in_flight_count == 1
+            worker.release.set()
+            await wait_for(lambda: len(acked) == 2)
@@ -135,6 +135,34 @@ class TestX402Middleware:
         call_next.assert_called_once()
         assert response.body == b"ok"
 
+    @pytest.mark.asyncio
+    async def test_dispatch_stream_without_payment(self, middleware):
+        """Test that message/stream cannot run the agent without payment."""
+        body = json.dumps({"method": "message/stream", "params": {}}).encode()
+        call_next = AsyncMock(return_value=Response(content=b"ok"))
+
+        response = await middleware.dispatch(_make_request(body=body), call_next)
+
+        assert response.status_code == 402
+        call_next.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_batch(self, middleware):
+        """Test that batches pass only without payment-protected methods."""
+        call_next = AsyncMock(return_value=Response(content=b"ok"))
+
+        body = json.dumps([{"method": "tasks/get"}, {"method": "tasks/list"}]).encode()
+        response = await middleware.dispatch(_make_request(body=body), call_next)
+        assert response.body == b"ok"
+
+        body = json.dumps(
+            [{"method": "tasks/get"}, {"method": "message/send"}]
+        ).encode()
+        response = await middleware.dispatch(_make_request(body=body), call_next)
+        assert response.status_code == 400
+        assert "message/send" in json.loads(response.body)["error"]["data"]
+        call_next.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_dispatch_invalid_json_body(self, middleware):
         """Test dispatch with invalid JSON body."""
@@ -1,18 +1,25 @@
 """Test utilities for creating test data and assertions."""
 
+import inspect
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, cast
 from uuid import UUID, uuid4
 
+import anyio
+
 from bindu.common.protocol.types import (
     Artifact,
     Context,
     Message,
     Task,
+    TaskSendParams,
     TaskState,
     TaskStatus,
     TextPart,
 )
+from bindu.server.scheduler.base import Scheduler
+from bindu.server.storage.base import Storage
+from tests.mocks import MockManifest
 
 
 def create_test_message(
@@ -198,3 +205,55 @@ def get_deterministic_uuid(seed: int) -> UUID:
     # Create a UUID from a deterministic seed
     hex_str = f"{seed:032x}"
     return UUID(hex_str)
+
+
+class ChunkingManifest(MockManifest):
+    """Generator agent yielding its answer in chunks."""
+
+    async def run(self, message_history: list):
+        """Yield three chunks."""
+        for chunk in ("Hel", "lo", "!"):
+            yield chunk
+
+
+async def wait_for(predicate: Callable[[], Any], timeout: float = 1.0) -> None:
+    """Poll a predicate (sync or async) until it is true, failing after timeout."""
+    with anyio.fail_after(timeout):
+        while True:
+            result = predicate()
+            if inspect.isawaitable(result):
+                result = await result
+            if result:
+                return
+            await anyio.sleep(0.01)
+
+
+async def wait_for_state(
+    storage: Storage, task_id: UUID, state: TaskState, timeout: float = 1.0
+) -> None:
+    """Wait until a stored task reaches the given state."""
+
+    async def reached() -> bool:
+        task = await storage.load_task(task_id)
+        return task is not None and task["status"]["state"] == state
+
+    await wait_for(reached, timeout)
+
+
+async def submit_and_schedule(
+    storage: Storage, scheduler: Scheduler, text: str = "Hello"
+) -> Task:
+    """Submit a task with a test message and schedule its run."""
+    message = create_test_message(text=text)
+    task = await storage.submit_task(message["context_id"], message)
+    await scheduler.run_task(
+        cast(
+            TaskSendParams,
+            {
+                "task_id": task["id"],
+                "context_id": task["context_id"],
+                "message": message,
+            },
+        )
+    )
+    return task